@@ -27,12 +27,13 @@
 from ._version import VERSION
 __version__ = VERSION
 
-from ._pipeline_client import PipelineClient
+from ._pipeline_client import PipelineClient, RequestResult
 from ._match_conditions import MatchConditions
 
 
 __all__ = [
     "PipelineClient",
+    "RequestResult",
     "MatchConditions"
 ]
 
@@ -25,6 +25,10 @@
 # --------------------------------------------------------------------------
 
 import logging
+import sys
+import threading
+import six
+from six.moves import queue
 from .configuration import Configuration
 from .pipeline import Pipeline
 from .pipeline.transport._base import PipelineClientBase
@@ -32,6 +36,8 @@ from .pipeline.policies import (
     ContentDecodePolicy, DistributedTracingPolicy, HttpLoggingPolicy, RequestIdPolicy
 )
 from .pipeline.transport import RequestsTransport
+from .pipeline._tools import close_response
+from .tracing.common import with_current_context
 
 try:
     from typing import TYPE_CHECKING
@@ -49,11 +55,125 @@ if TYPE_CHECKING:
         Optional,
         Callable,
         Iterator,
+        Iterable,
         cast,
     )  # pylint: disable=unused-import
+    from .pipeline import PipelineResponse
+    from .pipeline.transport import HttpRequest
 
 _LOGGER = logging.getLogger(__name__)
 
+_POLL_INTERVAL = 0.5
+
+
+class RequestResult(object):
+    """The outcome of one of the requests sent by "send_requests".
+
+    :ivar request: The request.
+    :vartype request: ~azure.core.pipeline.transport.HttpRequest
+    :ivar response: The response returned by the pipeline, None if an error was raised.
+    :vartype response: ~azure.core.pipeline.PipelineResponse
+    :ivar error: The exception raised by the pipeline for this request, None if it succeeded.
+    :vartype error: Exception
+    """
+
+    def __init__(self, request, response=None, error=None):
+        # type: (HttpRequest, Optional[PipelineResponse], Optional[Exception]) -> None
+        self.request = request
+        self.response = response
+        self.error = error
+
+    def __repr__(self):
+        return "<RequestResult [{}]>".format(
+            self.request if self.error is None else "{}: {!r}".format(self.request, self.error)
+        )
+
+
+def _run_requests(pipeline, requests, lock, results, closed, kwargs):
+    # type: (Pipeline, Iterator[HttpRequest], threading.Lock, queue.Queue, threading.Event, Dict[str, Any]) -> None
+    def put(entry):
+        while not closed.is_set():
+            try:
+                results.put(entry, timeout=_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    while not closed.is_set():
+        try:
+            with lock:
+                request = next(requests)
+        except StopIteration:
+            break
+        except Exception:  # pylint: disable=broad-except
+            put((None, sys.exc_info()))
+            return
+        try:
+            result = RequestResult(request, response=pipeline.run(request, **kwargs))
+        except Exception as err:  # pylint: disable=broad-except
+            result = RequestResult(request, error=err)
+        if not put((result, None)):
+            if result.response is not None:  # Never returned to the caller
+                close_response(result.response)
+            return
+    put((None, None))
+
+
+class _RequestsSender(object):
+    """Run the pipeline for the requests in worker threads, and iterate over the results.
+
+    At most "max_concurrency" results are kept waiting to be consumed, the workers
+    stop sending requests when that many are pending.
+    """
+
+    def __init__(self, pipeline, requests, max_concurrency, kwargs):
+        # type: (Pipeline, Iterable[HttpRequest], int, Dict[str, Any]) -> None
+        try:
+            max_concurrency = min(max_concurrency, len(requests))  # type: ignore
+        except TypeError:
+            pass
+        self._results = queue.Queue(maxsize=max(max_concurrency, 1))  # type: queue.Queue
+        self._closed = threading.Event()
+        self._running = max_concurrency
+        lock = threading.Lock()
+        requests = iter(requests)
+        # Threads must not reference "self", so that an abandoned iterator can be collected
+        for _ in range(max_concurrency):
+            thread = threading.Thread(
+                target=with_current_context(_run_requests),
+                args=(pipeline, requests, lock, self._results, self._closed, kwargs),
+                name="azure-core-send-requests"
+            )
+            thread.daemon = True
+            thread.start()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        # type: () -> RequestResult
+        while self._running:
+            result, exc_info = self._results.get()
+            if result is not None:
+                return result
+            self._running -= 1
+            if exc_info:
+                self.close()
+                six.reraise(*exc_info)
+        raise StopIteration()
+
+    next = __next__  # Python 2 compatibility.
+
+    def close(self):
+        # type: () -> None
+        """Stop sending the requests that have not been sent yet."""
+        self._closed.set()
+        self._running = 0
+
+    def __del__(self):
+        self.close()
+
 
 class PipelineClient(PipelineClientBase):
     """Service client core methods.
@@ -65,6 +185,8 @@ class PipelineClient(PipelineClientBase):
     :keyword Pipeline pipeline: If omitted, a Pipeline object is created and returned.
     :keyword list[HTTPPolicy] policies: If omitted, the standard policies of the configuration object is used.
     :keyword HttpTransport transport: If omitted, RequestsTransport is used for synchronous transport.
+    :keyword ~azure.core.pipeline.PipelineInstrumentation instrumentation: Record latency histograms of the
+     pipeline, and of the default transport.
     :return: A pipeline object.
     :rtype: ~azure.core.pipeline.Pipeline
 
@@ -97,6 +219,57 @@ class PipelineClient(PipelineClientBase):
     def close(self):
         self.__exit__()
 
+    def send_requests(self, requests, **kwargs):
+        # type: (Iterable[HttpRequest], Any) -> Iterator[RequestResult]
+        """Send independent requests concurrently, and iterate over the results in completion order.
+
+        Every request goes through the whole pipeline, in one of "max_concurrency" worker threads
+        sharing the transport. Requests are taken lazily from the iterable. An error raised by the
+        pipeline for a request doesn't stop the others, it is returned in the "error" attribute of
+        its result.
+
+        Sending from several threads requires a thread-safe transport, such as a RequestsTransport
+        with a connection pool: build the client with "use_shared_connection_pool=True", or with
+        "transport=RequestsTransport(connection_pool=pool)". The default RequestsTransport shares a
+        single requests Session, which is not thread-safe: with it, the requests are sent one at a
+        time unless "max_concurrency" is given.
+
+        Closing the returned iterator stops sending the remaining requests.
+
+        :param requests: The requests to send.
+        :type requests: iterable[~azure.core.pipeline.transport.HttpRequest]
+        :keyword int max_concurrency: The maximum number of requests sent at the same time. Defaults to 8
+         with a thread-safe transport, else to 1.
+        :return: An iterator of results, with the response or the error of each request.
+        :rtype: iterator[~azure.core.RequestResult]
+        :raises ValueError: If max_concurrency is more than 1 and the transport is not thread-safe.
+
+        Other keyword arguments are passed to the pipeline for every request (e.g. "stream").
+        """
+        transport = self._pipeline._transport  # pylint: disable=protected-access
+        thread_safe = getattr(transport, "thread_safe", False)
+        max_concurrency = kwargs.pop("max_concurrency", None)
+        if max_concurrency is None:
+            max_concurrency = 8 if thread_safe else 1
+            if not thread_safe:
+                _LOGGER.warning(
+                    "The transport is not thread-safe, send_requests sends one request at a time. Use a "
+                    "RequestsTransport with a connection pool (use_shared_connection_pool=True) to send them "
+                    "concurrently."
+                )
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        if max_concurrency > 1 and not thread_safe:
+            raise ValueError(
+                "send_requests with a max_concurrency of {} requires a thread-safe transport, "
+                "e.g. a RequestsTransport with a connection pool (use_shared_connection_pool=True)".format(
+                    max_concurrency
+                )
+            )
+        # Open the transport now rather than racing to open it from the worker threads
+        transport.open()
+        return _RequestsSender(self._pipeline, requests, max_concurrency, kwargs)
+
     def _build_pipeline(self, config, **kwargs): # pylint: disable=no-self-use
         transport = kwargs.get('transport')
         policies = kwargs.get('policies')
@@ -120,4 +293,4 @@ class PipelineClient(PipelineClientBase):
         if not transport:
             transport = RequestsTransport(**kwargs)
 
-        return Pipeline(transport, policies)
+        return Pipeline(transport, policies, instrumentation=kwargs.get("instrumentation"))
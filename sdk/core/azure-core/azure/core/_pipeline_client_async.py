@@ -24,13 +24,17 @@
 #
 # --------------------------------------------------------------------------
 
+import asyncio
 import logging
+from typing import AsyncIterator
 from .configuration import Configuration
+from ._pipeline_client import RequestResult
 from .pipeline import AsyncPipeline
 from .pipeline.transport._base import PipelineClientBase
 from .pipeline.policies import (
     ContentDecodePolicy, DistributedTracingPolicy, HttpLoggingPolicy, RequestIdPolicy
 )
+from .pipeline._tools_async import asyncio_running
 
 try:
     from typing import TYPE_CHECKING
@@ -48,12 +52,135 @@ if TYPE_CHECKING:
         Optional,
         Callable,
         Iterator,
+        Iterable,
+        AsyncIterable,
         cast,
     )  # pylint: disable=unused-import
+    from .pipeline.transport import HttpRequest
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class _RequestSource:
+    """Hand the requests to the workers, from an iterable or an async iterable."""
+
+    def __init__(self, requests: "Union[Iterable[HttpRequest], AsyncIterable[HttpRequest]]") -> None:
+        if hasattr(requests, "__aiter__"):
+            self._aiter = requests.__aiter__()  # type: ignore
+            self._iter = None
+        else:
+            self._aiter = None
+            self._iter = iter(requests)  # type: ignore
+        self._lock = None  # type: Optional[asyncio.Lock]
+
+    async def next(self) -> "Optional[HttpRequest]":
+        if self._iter is not None:
+            return next(self._iter, None)
+        # An async generator can't be iterated by several tasks at once
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            try:
+                return await self._aiter.__anext__()  # type: ignore
+            except StopAsyncIteration:
+                return None
+
+
+async def _run_requests(
+        pipeline: AsyncPipeline,
+        requests: _RequestSource,
+        results: asyncio.Queue,
+        kwargs: "Dict[str, Any]"
+) -> None:
+    try:
+        while True:
+            request = await requests.next()
+            if request is None:
+                break
+            try:
+                result = RequestResult(request, response=await pipeline.run(request, **kwargs))
+            except asyncio.CancelledError:  # pylint: disable=try-except-raise
+                raise
+            except Exception as err:  # pylint: disable=broad-except
+                result = RequestResult(request, error=err)
+            await results.put((result, None))
+    except asyncio.CancelledError:  # pylint: disable=try-except-raise
+        raise
+    except Exception as err:  # pylint: disable=broad-except
+        await results.put((None, err))
+        return
+    await results.put((None, None))
+
+
+class _AsyncRequestsSender(AsyncIterator[RequestResult]):
+    """Run the pipeline for the requests in concurrent tasks, and iterate over the results.
+
+    At most "max_concurrency" results are kept waiting to be consumed, the tasks
+    stop sending requests when that many are pending. If the running event loop
+    is not asyncio (e.g. trio), the requests are sent one after the other.
+    """
+
+    def __init__(
+            self,
+            pipeline: AsyncPipeline,
+            requests: "Union[Iterable[HttpRequest], AsyncIterable[HttpRequest]]",
+            max_concurrency: int,
+            kwargs: "Dict[str, Any]"
+    ) -> None:
+        try:
+            max_concurrency = min(max_concurrency, len(requests))  # type: ignore
+        except TypeError:
+            pass
+        self._pipeline = pipeline
+        self._requests = _RequestSource(requests)
+        self._max_concurrency = max_concurrency
+        self._kwargs = kwargs
+        self._results = None  # type: Optional[asyncio.Queue]
+        self._tasks = None  # type: Optional[List[asyncio.Future]]
+        self._running = max_concurrency
+
+    async def __anext__(self) -> RequestResult:
+        if self._tasks is None:
+            if not asyncio_running():
+                return await self._send_next()
+            self._results = asyncio.Queue(maxsize=max(self._max_concurrency, 1))
+            self._tasks = [
+                asyncio.ensure_future(_run_requests(self._pipeline, self._requests, self._results, self._kwargs))
+                for _ in range(self._max_concurrency)
+            ]
+        while self._running:
+            result, error = await self._results.get()  # type: ignore
+            if result is not None:
+                return result
+            self._running -= 1
+            if error:
+                self.close()
+                raise error
+        raise StopAsyncIteration()
+
+    async def _send_next(self) -> RequestResult:
+        request = await self._requests.next() if self._running else None
+        if request is None:
+            self._running = 0
+            raise StopAsyncIteration()
+        try:
+            return RequestResult(request, response=await self._pipeline.run(request, **self._kwargs))
+        except Exception as err:  # pylint: disable=broad-except
+            return RequestResult(request, error=err)
+
+    def close(self) -> None:
+        """Stop sending the requests that have not been sent yet."""
+        self._running = 0
+        for task in self._tasks or []:
+            task.cancel()
+
+    def __del__(self):
+        # Not awaited: an abandoned iterator only needs its tasks to stop
+        for task in self.__dict__.get("_tasks") or []:
+            if not task.done():
+                task.cancel()
+
+
 class AsyncPipelineClient(PipelineClientBase):
     """Service client core methods.
 
@@ -64,6 +191,8 @@ class AsyncPipelineClient(PipelineClientBase):
     :keyword Pipeline pipeline: If omitted, a Pipeline object is created and returned.
     :keyword list[HTTPPolicy] policies: If omitted, the standard policies of the configuration object is used.
     :keyword HttpTransport transport: If omitted, RequestsTransport is used for synchronous transport.
+    :keyword ~azure.core.pipeline.PipelineInstrumentation instrumentation: Record latency histograms of the
+     pipeline, and of the default transport.
     :return: An async pipeline object.
     :rtype: ~azure.core.pipeline.AsyncPipeline
 
@@ -96,6 +225,33 @@ class AsyncPipelineClient(PipelineClientBase):
     async def close(self):
         await self._pipeline.__aexit__()
 
+    def send_requests(
+            self,
+            requests: "Union[Iterable[HttpRequest], AsyncIterable[HttpRequest]]",
+            **kwargs: "Any"
+    ) -> AsyncIterator[RequestResult]:
+        """Send independent requests concurrently, and iterate over the results in completion order.
+
+        Every request goes through the whole pipeline, in one of "max_concurrency" tasks sharing
+        the transport and its connection pool. Requests are taken lazily from the (async) iterable.
+        An error raised by the pipeline for a request doesn't stop the others, it is returned in
+        the "error" attribute of its result.
+
+        Closing the returned iterator stops sending the remaining requests.
+
+        :param requests: The requests to send.
+        :type requests: iterable[~azure.core.pipeline.transport.HttpRequest]
+        :keyword int max_concurrency: The maximum number of requests sent at the same time. Defaults to 8.
+        :return: An async iterator of results, with the response or the error of each request.
+        :rtype: AsyncIterator[~azure.core.RequestResult]
+
+        Other keyword arguments are passed to the pipeline for every request (e.g. "stream").
+        """
+        max_concurrency = kwargs.pop("max_concurrency", 8)
+        if max_concurrency < 1:
+            raise ValueError("max_concurrency must be at least 1")
+        return _AsyncRequestsSender(self._pipeline, requests, max_concurrency, kwargs)
+
     def _build_pipeline(self, config, **kwargs): # pylint: disable=no-self-use
         transport = kwargs.get('transport')
         policies = kwargs.get('policies')
@@ -120,4 +276,4 @@ class AsyncPipelineClient(PipelineClientBase):
             from .pipeline.transport import AioHttpTransport
             transport = AioHttpTransport(**kwargs)
 
-        return AsyncPipeline(transport, policies)
+        return AsyncPipeline(transport, policies, instrumentation=kwargs.get("instrumentation"))
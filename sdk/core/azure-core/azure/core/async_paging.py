@@ -23,6 +23,7 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
+import asyncio
 import collections.abc
 import logging
 from typing import (
@@ -35,6 +36,8 @@ from typing import (
     Awaitable,
 )
 
+from .pipeline._tools_async import asyncio_running
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -108,6 +111,83 @@ class AsyncPageIterator(AsyncIterator[AsyncIterator[ReturnType]]):
         return self._current_page
 
 
+async def _fetch_pages(
+        page_iterator: AsyncIterator[AsyncIterator[ReturnType]],
+        pages: asyncio.Queue
+) -> None:
+    try:
+        async for page in page_iterator:
+            items = []
+            async for item in page:
+                items.append(item)
+            await pages.put((items, getattr(page_iterator, "continuation_token", None), None))
+        await pages.put((None, None, None))
+    except asyncio.CancelledError:  # pylint: disable=try-except-raise
+        raise
+    except Exception as err:  # pylint: disable=broad-except
+        await pages.put((None, None, err))
+
+
+class _AsyncPrefetchPageIterator(AsyncIterator[AsyncIterator[ReturnType]]):
+    """Fetch the pages of an async page iterator in a background task, ahead of the consumer.
+
+    At most "prefetch" pages are kept in memory waiting to be consumed. The continuation token
+    is the one of the last page returned to the consumer, other attributes are read from the
+    wrapped page iterator, which is ahead of the consumer.
+
+    Prefetching needs asyncio: in another event loop, such as trio, pages are fetched when
+    requested, as without prefetch.
+
+    :param page_iterator: The async page iterator to get pages from.
+    :param int prefetch: The number of pages to fetch in advance.
+    """
+
+    def __init__(self, page_iterator: AsyncIterator[AsyncIterator[ReturnType]], prefetch: int) -> None:
+        self._page_iterator = page_iterator
+        self.continuation_token = getattr(page_iterator, "continuation_token", None)
+        self._prefetch = prefetch
+        self._pages = None  # type: Optional[asyncio.Queue]
+        self._task = None  # type: Optional[asyncio.Future]
+        self._done = False
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._page_iterator, name)
+
+    async def __anext__(self) -> AsyncIterator[ReturnType]:
+        if self._done:
+            raise StopAsyncIteration("End of paging")
+        if self._pages is None:
+            if not asyncio_running():
+                # Let it raise StopAsyncIteration
+                page = await self._page_iterator.__anext__()
+                self.continuation_token = getattr(self._page_iterator, "continuation_token", None)
+                return page
+            self._pages = asyncio.Queue(maxsize=self._prefetch)
+            self._task = asyncio.ensure_future(_fetch_pages(self._page_iterator, self._pages))
+        page, continuation_token, error = await self._pages.get()
+        if page is None:
+            self._done = True
+            if error:
+                raise error
+            raise StopAsyncIteration("End of paging")
+        self.continuation_token = continuation_token
+        return AsyncList(page)
+
+    def close(self) -> None:
+        """Stop fetching pages in advance."""
+        self._done = True
+        if self._task is not None:
+            self._task.cancel()
+
+    def __del__(self):
+        # Not awaited: an abandoned iterator only needs its task to stop
+        task = self.__dict__.get("_task")
+        if task is not None and not task.done():
+            task.cancel()
+
+
 class AsyncItemPaged(AsyncIterator[ReturnType]):
     def __init__(self, *args, **kwargs) -> None:
         """Return an async iterator of items.
@@ -128,6 +208,7 @@ class AsyncItemPaged(AsyncIterator[ReturnType]):
     def by_page(
         self,
         continuation_token: Optional[str] = None,
+        prefetch: int = 0,
     ) -> AsyncIterator[AsyncIterator[ReturnType]]:
         """Get an async iterator of pages of objects, instead of an async iterator of objects.
 
@@ -135,11 +216,19 @@ class AsyncItemPaged(AsyncIterator[ReturnType]):
             An opaque continuation token. This value can be retrieved from the
             continuation_token field of a previous generator object. If specified,
             this generator will begin returning results from this point.
+        :param int prefetch:
+            The number of pages to fetch in a background task while the current page is
+            processed. Pages are fetched one at a time, and no more than this number of pages
+            is kept in memory. Defaults to 0 (a page is fetched when requested). Only supported
+            with asyncio, other event loops such as trio fetch a page when requested.
         :returns: An async iterator of pages (themselves async iterator of objects)
         """
-        return self._page_iterator_class(
+        page_iterator = self._page_iterator_class(
             *self._args, **self._kwargs, continuation_token=continuation_token
         )
+        if prefetch > 0:
+            return _AsyncPrefetchPageIterator(page_iterator, prefetch)
+        return page_iterator
 
     async def __anext__(self) -> ReturnType:
         if self._page_iterator is None:
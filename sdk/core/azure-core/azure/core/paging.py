@@ -24,7 +24,10 @@
 #
 # --------------------------------------------------------------------------
 import itertools
+import sys
+import threading
 from typing import (  # pylint: disable=unused-import
+    Any,
     Callable,
     Optional,
     TypeVar,
@@ -34,6 +37,9 @@ from typing import (  # pylint: disable=unused-import
 )
 import logging
 
+import six
+from six.moves import queue
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -81,6 +87,94 @@ class PageIterator(Iterator[Iterator[ReturnType]]):
     next = __next__  # Python 2 compatibility.
 
 
+_PREFETCH_POLL_INTERVAL = 0.5
+
+
+def _fetch_pages(page_iterator, pages, closed):
+    # type: (Iterator[Iterator[ReturnType]], queue.Queue, threading.Event) -> None
+    def put(entry):
+        while not closed.is_set():
+            try:
+                pages.put(entry, timeout=_PREFETCH_POLL_INTERVAL)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    while not closed.is_set():
+        try:
+            page = list(next(page_iterator))
+        except StopIteration:
+            put((None, None, None))
+            return
+        except Exception:  # pylint: disable=broad-except
+            put((None, None, sys.exc_info()))
+            return
+        if not put((page, getattr(page_iterator, "continuation_token", None), None)):
+            return
+
+
+class _PrefetchPageIterator(Iterator[Iterator[ReturnType]]):
+    """Fetch the pages of a page iterator in a background thread, ahead of the consumer.
+
+    At most "prefetch" pages are kept in memory waiting to be consumed. The continuation token
+    is the one of the last page returned to the consumer, other attributes are read from the
+    wrapped page iterator, which is ahead of the consumer.
+
+    :param page_iterator: The page iterator to get pages from.
+    :param int prefetch: The number of pages to fetch in advance.
+    """
+
+    def __init__(self, page_iterator, prefetch):
+        # type: (Iterator[Iterator[ReturnType]], int) -> None
+        self._page_iterator = page_iterator
+        self.continuation_token = getattr(page_iterator, "continuation_token", None)
+        self._pages = queue.Queue(maxsize=prefetch)  # type: queue.Queue
+        self._closed = threading.Event()
+        self._done = False
+        # The thread must not reference "self", so that an abandoned iterator can be collected
+        thread = threading.Thread(
+            target=_fetch_pages,
+            args=(page_iterator, self._pages, self._closed),
+            name="azure-core-page-prefetch"
+        )
+        thread.daemon = True
+        thread.start()
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._page_iterator, name)
+
+    def __iter__(self):
+        """Return 'self'."""
+        return self
+
+    def __next__(self):
+        # type: () -> Iterator[ReturnType]
+        if self._done:
+            raise StopIteration("End of paging")
+        page, continuation_token, exc_info = self._pages.get()
+        if page is None:
+            self._done = True
+            if exc_info:
+                six.reraise(*exc_info)
+            raise StopIteration("End of paging")
+        self.continuation_token = continuation_token
+        return iter(page)
+
+    next = __next__  # Python 2 compatibility.
+
+    def close(self):
+        # type: () -> None
+        """Stop fetching pages in advance."""
+        self._closed.set()
+        self._done = True
+
+    def __del__(self):
+        self.close()
+
+
 class ItemPaged(Iterator[ReturnType]):
     def __init__(self, *args, **kwargs):
         """Return an iterator of items.
@@ -95,19 +189,26 @@ class ItemPaged(Iterator[ReturnType]):
             "page_iterator_class", PageIterator
         )
 
-    def by_page(self, continuation_token=None):
-        # type: (Optional[str]) -> Iterator[Iterator[ReturnType]]
+    def by_page(self, continuation_token=None, prefetch=0):
+        # type: (Optional[str], int) -> Iterator[Iterator[ReturnType]]
         """Get an iterator of pages of objects, instead of an iterator of objects.
 
         :param str continuation_token:
             An opaque continuation token. This value can be retrieved from the
             continuation_token field of a previous generator object. If specified,
             this generator will begin returning results from this point.
+        :param int prefetch:
+            The number of pages to fetch in a background thread while the current page is
+            processed. Pages are fetched one at a time, and no more than this number of pages
+            is kept in memory. Defaults to 0 (a page is fetched when requested).
         :returns: An iterator of pages (themselves iterator of objects)
         """
-        return self._page_iterator_class(
+        page_iterator = self._page_iterator_class(
             continuation_token=continuation_token, *self._args, **self._kwargs
         )
+        if prefetch > 0:
+            return _PrefetchPageIterator(page_iterator, prefetch)
+        return page_iterator
 
     def __repr__(self):
         return "<iterator object azure.core.paging.ItemPaged at {}>".format(hex(id(self)))
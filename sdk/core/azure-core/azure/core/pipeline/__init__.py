@@ -176,8 +176,21 @@ class PipelineResponse(Generic[HTTPRequestType, HTTPResponseType]):
 
 
 from ._base import Pipeline  # pylint: disable=wrong-import-position
-
-__all__ = ["Pipeline", "PipelineRequest", "PipelineResponse", "PipelineContext"]
+from ._instrumentation import (  # pylint: disable=wrong-import-position
+    Histogram,
+    PipelineInstrumentation,
+    PrometheusExporter,
+)
+
+__all__ = [
+    "Pipeline",
+    "PipelineRequest",
+    "PipelineResponse",
+    "PipelineContext",
+    "Histogram",
+    "PipelineInstrumentation",
+    "PrometheusExporter",
+]
 
 try:
     from ._base_async import AsyncPipeline  # pylint: disable=unused-import
@@ -33,6 +33,7 @@ from azure.core.pipeline import (
     PipelineContext,
 )
 from azure.core.pipeline.policies import HTTPPolicy, SansIOHTTPPolicy
+from ._instrumentation import _instrument_policies
 from ._tools import await_result as _await_result
 
 HTTPResponseType = TypeVar("HTTPResponseType")
@@ -43,6 +44,51 @@ _LOGGER = logging.getLogger(__name__)
 PoliciesType = List[Union[HTTPPolicy, SansIOHTTPPolicy]]
 
 
+def _implements(policy, hook):
+    # type: (SansIOHTTPPolicy, str) -> bool
+    """Whether a SansIO policy overrides this hook: the others do nothing, and are not called."""
+    if hook in getattr(policy, "__dict__", ()):
+        return True
+    method = getattr(type(policy), hook, None)
+    base = getattr(SansIOHTTPPolicy, hook)
+    return getattr(method, "__func__", method) is not getattr(base, "__func__", base)
+
+
+def _chain_policies(policies, runner_type, fused_runner_type=None):
+    # type: (List[Any], Any, Any) -> List[Any]
+    """Wrap the SansIO policies in runners, and link the nodes.
+
+    With a fused_runner_type, consecutive SansIO policies share a single runner calling their
+    hooks in a loop, unless they handle exceptions: an on_exception hook keeps a runner of its
+    own, so that it sees the exceptions of the policies after it, and only them. Policies
+    without hooks are skipped. Otherwise, each SansIO policy has its own runner.
+    """
+    impl_policies = []  # type: List[Any]
+    fused = []  # type: List[SansIOHTTPPolicy]
+
+    def flush():
+        if len(fused) == 1:
+            impl_policies.append(runner_type(fused[0]))
+        elif fused:
+            impl_policies.append(fused_runner_type(list(fused)))
+        del fused[:]
+
+    for policy in policies:
+        if isinstance(policy, SansIOHTTPPolicy):
+            if fused_runner_type is None or _implements(policy, "on_exception"):
+                flush()
+                impl_policies.append(runner_type(policy))
+            elif _implements(policy, "on_request") or _implements(policy, "on_response"):
+                fused.append(policy)
+        elif policy:
+            flush()
+            impl_policies.append(policy)
+    flush()
+    for index in range(len(impl_policies) - 1):
+        impl_policies[index].next = impl_policies[index + 1]
+    return impl_policies
+
+
 class _SansIOHTTPPolicyRunner(HTTPPolicy, Generic[HTTPRequestType, HTTPResponseType]):
     """Sync implementation of the SansIO policy.
 
@@ -77,6 +123,43 @@ class _SansIOHTTPPolicyRunner(HTTPPolicy, Generic[HTTPRequestType, HTTPResponseT
         return response
 
 
+class _SansIOHTTPPoliciesRunner(HTTPPolicy):
+    """Sync implementation of consecutive SansIO policies, without on_exception hook.
+
+    Calls the on_request hooks in order, sends to the next policy in the chain, and calls the
+    on_response hooks in reverse order, as nested runners would.
+
+    :param policies: The SansIO policies.
+    :type policies: list[~azure.core.pipeline.policies.SansIOHTTPPolicy]
+    """
+
+    def __init__(self, policies):
+        # type: (List[SansIOHTTPPolicy]) -> None
+        super(_SansIOHTTPPoliciesRunner, self).__init__()
+        self._policies = policies
+        self._on_request = [policy for policy in policies if _implements(policy, "on_request")]
+        self._on_response = [policy for policy in reversed(policies) if _implements(policy, "on_response")]
+
+    def send(self, request):
+        # type: (PipelineRequest) -> PipelineResponse
+        """Modifies the request and sends to the next policy in the chain.
+
+        :param request: The PipelineRequest object.
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse object.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        # Same check as await_result, without a call per hook
+        for policy in self._on_request:
+            if hasattr(policy.on_request(request), "__await__"):
+                raise TypeError("Policy {} returned awaitable object in non-async pipeline.".format(policy.on_request))
+        response = self.next.send(request)
+        for policy in self._on_response:
+            if hasattr(policy.on_response(request, response), "__await__"):
+                raise TypeError("Policy {} returned awaitable object in non-async pipeline.".format(policy.on_response))
+        return response
+
+
 class _TransportRunner(HTTPPolicy):
     """Transport runner.
 
@@ -113,6 +196,9 @@ class Pipeline(AbstractContextManager, Generic[HTTPRequestType, HTTPResponseType
 
     :param transport: The Http Transport instance
     :param list policies: List of configured policies.
+    :keyword instrumentation: Record the time spent in each policy, and the number of retries. Give
+     the same instrumentation to the transport to record the phases of the requests.
+    :paramtype instrumentation: ~azure.core.pipeline.PipelineInstrumentation
 
     .. admonition:: Example:
 
@@ -124,20 +210,26 @@ class Pipeline(AbstractContextManager, Generic[HTTPRequestType, HTTPResponseType
             :caption: Builds the pipeline for synchronous transport.
     """
 
-    def __init__(self, transport, policies=None):
-        # type: (HttpTransportType, PoliciesType) -> None
-        self._impl_policies = []  # type: List[HTTPPolicy]
+    def __init__(self, transport, policies=None, **kwargs):
+        # type: (HttpTransportType, PoliciesType, Any) -> None
         self._transport = transport
-
-        for policy in policies or []:
-            if isinstance(policy, SansIOHTTPPolicy):
-                self._impl_policies.append(_SansIOHTTPPolicyRunner(policy))
-            elif policy:
-                self._impl_policies.append(policy)
-        for index in range(len(self._impl_policies) - 1):
-            self._impl_policies[index].next = self._impl_policies[index + 1]
+        self._instrumentation = kwargs.pop("instrumentation", None)
+        # Each policy keeps its own runner when instrumented, to be timed on its own
+        self._impl_policies = _chain_policies(
+            policies or [],
+            _SansIOHTTPPolicyRunner,
+            None if self._instrumentation else _SansIOHTTPPoliciesRunner
+        )  # type: List[HTTPPolicy]
         if self._impl_policies:
             self._impl_policies[-1].next = _TransportRunner(self._transport)
+        if self._instrumentation:
+            self._first_node = _instrument_policies(
+                self._impl_policies + [_TransportRunner(self._transport)], self._instrumentation
+            )  # type: HTTPPolicy
+        elif self._impl_policies:
+            self._first_node = self._impl_policies[0]
+        else:
+            self._first_node = _TransportRunner(self._transport)
 
     def __enter__(self):
         # type: () -> Pipeline
@@ -198,14 +290,12 @@ class Pipeline(AbstractContextManager, Generic[HTTPRequestType, HTTPResponseType
         :return: The PipelineResponse object
         :rtype: ~azure.core.pipeline.PipelineResponse
         """
-        self._prepare_multipart(request)
+        if request.multipart_mixed_info:  # type: ignore
+            self._prepare_multipart(request)
         context = PipelineContext(self._transport, **kwargs)
         pipeline_request = PipelineRequest(
             request, context
         )  # type: PipelineRequest[HTTPRequestType]
-        first_node = (
-            self._impl_policies[0]
-            if self._impl_policies
-            else _TransportRunner(self._transport)
-        )
-        return first_node.send(pipeline_request)  # type: ignore
+        if self._instrumentation:
+            context["instrumentation"] = self._instrumentation
+        return self._first_node.send(pipeline_request)  # type: ignore
@@ -29,6 +29,8 @@ from typing import Any, Union, List, Generic, TypeVar, Dict
 
 from azure.core.pipeline import PipelineRequest, PipelineResponse, PipelineContext
 from azure.core.pipeline.policies import AsyncHTTPPolicy, SansIOHTTPPolicy
+from ._base import _chain_policies, _implements
+from ._instrumentation import PipelineInstrumentation, _instrument_policies, _policy_name, _clock
 from ._tools_async import await_result as _await_result
 
 AsyncHTTPResponseType = TypeVar("AsyncHTTPResponseType")
@@ -89,6 +91,45 @@ class _SansIOAsyncHTTPPolicyRunner(
         return response
 
 
+class _SansIOAsyncHTTPPoliciesRunner(
+    AsyncHTTPPolicy[HTTPRequestType, AsyncHTTPResponseType]
+):  # pylint: disable=unsubscriptable-object
+    """Async implementation of consecutive SansIO policies, without on_exception hook.
+
+    Calls the on_request hooks in order, sends to the next policy in the chain, and calls the
+    on_response hooks in reverse order, as nested runners would.
+
+    :param policies: The SansIO policies.
+    :type policies: list[~azure.core.pipeline.policies.SansIOHTTPPolicy]
+    """
+
+    def __init__(self, policies: List[SansIOHTTPPolicy]) -> None:
+        super(_SansIOAsyncHTTPPoliciesRunner, self).__init__()
+        self._policies = policies
+        self._on_request = [policy for policy in policies if _implements(policy, "on_request")]
+        self._on_response = [policy for policy in reversed(policies) if _implements(policy, "on_response")]
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        """Modifies the request and sends to the next policy in the chain.
+
+        :param request: The PipelineRequest object.
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse object.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        # Hooks are awaited only if they return an awaitable, without a coroutine per call
+        for policy in self._on_request:
+            result = policy.on_request(request)
+            if hasattr(result, "__await__"):
+                await result
+        response = await self.next.send(request)  # type: ignore
+        for policy in self._on_response:
+            result = policy.on_response(request, response)
+            if hasattr(result, "__await__"):
+                await result
+        return response
+
+
 class _AsyncTransportRunner(
     AsyncHTTPPolicy[HTTPRequestType, AsyncHTTPResponseType]
 ):  # pylint: disable=unsubscriptable-object
@@ -118,6 +159,26 @@ class _AsyncTransportRunner(
         )
 
 
+class _AsyncTimedRunner(
+    AsyncHTTPPolicy[HTTPRequestType, AsyncHTTPResponseType]
+):  # pylint: disable=unsubscriptable-object
+    """Records the time spent in a node of the pipeline, and the ones after it."""
+
+    def __init__(self, node, instrumentation: PipelineInstrumentation) -> None:
+        super(_AsyncTimedRunner, self).__init__()
+        self._node = node
+        self._histogram = instrumentation.histogram(
+            PipelineInstrumentation.POLICY_DURATION, policy=_policy_name(node)
+        )
+
+    async def send(self, request):
+        start = _clock()
+        try:
+            return await self._node.send(request)
+        finally:
+            self._histogram.observe(_clock() - start)
+
+
 class AsyncPipeline(
     AbstractAsyncContextManager, Generic[HTTPRequestType, AsyncHTTPResponseType]
 ):
@@ -128,6 +189,9 @@ class AsyncPipeline(
 
     :param transport: The async Http Transport instance.
     :param list policies: List of configured policies.
+    :keyword instrumentation: Record the time spent in each policy, and the number of retries. Give
+     the same instrumentation to the transport to record the phases of the requests.
+    :paramtype instrumentation: ~azure.core.pipeline.PipelineInstrumentation
 
     .. admonition:: Example:
 
@@ -139,19 +203,27 @@ class AsyncPipeline(
             :caption: Builds the async pipeline for asynchronous transport.
     """
 
-    def __init__(self, transport, policies: AsyncPoliciesType = None) -> None:
-        self._impl_policies = []  # type: ImplPoliciesType
+    def __init__(self, transport, policies: AsyncPoliciesType = None, **kwargs) -> None:
         self._transport = transport
-
-        for policy in policies or []:
-            if isinstance(policy, SansIOHTTPPolicy):
-                self._impl_policies.append(_SansIOAsyncHTTPPolicyRunner(policy))
-            elif policy:
-                self._impl_policies.append(policy)
-        for index in range(len(self._impl_policies) - 1):
-            self._impl_policies[index].next = self._impl_policies[index + 1]
+        self._instrumentation = kwargs.pop("instrumentation", None)
+        # Each policy keeps its own runner when instrumented, to be timed on its own
+        self._impl_policies = _chain_policies(
+            policies or [],
+            _SansIOAsyncHTTPPolicyRunner,
+            None if self._instrumentation else _SansIOAsyncHTTPPoliciesRunner
+        )  # type: ImplPoliciesType
         if self._impl_policies:
             self._impl_policies[-1].next = _AsyncTransportRunner(self._transport)
+        if self._instrumentation:
+            self._first_node = _instrument_policies(
+                self._impl_policies + [_AsyncTransportRunner(self._transport)],
+                self._instrumentation,
+                _AsyncTimedRunner,
+            )
+        elif self._impl_policies:
+            self._first_node = self._impl_policies[0]
+        else:
+            self._first_node = _AsyncTransportRunner(self._transport)
 
     async def __aenter__(self) -> "AsyncPipeline":
         await self._transport.__aenter__()
@@ -204,12 +276,10 @@ class AsyncPipeline(
         :return: The PipelineResponse object.
         :rtype: ~azure.core.pipeline.PipelineResponse
         """
-        await self._prepare_multipart(request)
+        if request.multipart_mixed_info:  # type: ignore
+            await self._prepare_multipart(request)
         context = PipelineContext(self._transport, **kwargs)
         pipeline_request = PipelineRequest(request, context)
-        first_node = (
-            self._impl_policies[0]
-            if self._impl_policies
-            else _AsyncTransportRunner(self._transport)
-        )
-        return await first_node.send(pipeline_request)
+        if self._instrumentation:
+            context["instrumentation"] = self._instrumentation
+        return await self._first_node.send(pipeline_request)
@@ -0,0 +1,278 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""Latency instrumentation of the pipelines and transports, with a Prometheus exporter."""
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from .policies import HTTPPolicy
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import
+    from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+    from azure.core.pipeline import PipelineRequest, PipelineResponse
+
+_clock = getattr(time, "perf_counter", time.time)
+
+
+class Histogram(object):
+    """A thread-safe histogram with cumulative buckets, like Prometheus histograms.
+
+    :param buckets: The upper bounds of the buckets, in increasing order. A last bucket
+     without upper bound is always added. Defaults to :attr:`Histogram.DEFAULT_BUCKETS`.
+    :type buckets: list[float]
+    """
+
+    DEFAULT_BUCKETS = (.005, .01, .025, .05, .1, .25, .5, 1.0, 2.5, 5.0, 10.0)
+
+    def __init__(self, buckets=None):
+        # type: (Optional[Iterable[float]]) -> None
+        self._bounds = list(buckets or self.DEFAULT_BUCKETS) + [float("inf")]
+        self._counts = [0] * len(self._bounds)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value):
+        # type: (float) -> None
+        """Record a value."""
+        for index, bound in enumerate(self._bounds):
+            if value <= bound:
+                break
+        with self._lock:
+            self._counts[index] += 1  # pylint: disable=undefined-loop-variable
+            self._sum += value
+
+    @property
+    def count(self):
+        # type: () -> int
+        """The number of recorded values."""
+        return sum(self._counts)
+
+    @property
+    def sum(self):
+        # type: () -> float
+        """The sum of the recorded values."""
+        return self._sum
+
+    def buckets(self):
+        # type: () -> List[Tuple[float, int]]
+        """The upper bound of each bucket, with the number of values lower or equal to it.
+
+        :rtype: list[tuple[float, int]]
+        """
+        with self._lock:
+            counts = list(self._counts)
+        result = []
+        total = 0
+        for bound, count in zip(self._bounds, counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+
+class PipelineInstrumentation(object):
+    """Collects latency histograms of the pipelines and transports using it.
+
+    Give it to a :class:`~azure.core.pipeline.Pipeline` (or to a client, which passes it to its
+    pipeline and transport) to record:
+
+    - "azure_core_policy_duration_seconds": the wall time spent in each policy, including the
+      policies after it and the transport ("policy" label).
+    - "azure_core_transport_phase_seconds": the phases of the requests sent by the transport
+      ("phase" label): "dns" (aiohttp only), "connect" (including DNS and TLS), "tls" (requests only),
+      "ttfb" (time to the response headers) and "body" (time to read the body, if not streamed).
+    - "azure_core_request_retries": the number of retries of each request.
+
+    Nothing is recorded, and pipelines run as usual, if no instrumentation is given.
+
+    :keyword histogram_factory: A callable returning the histogram of a metric, from its name and a
+     dict of labels. The object returned needs an "observe(value)" method. Defaults to :class:`Histogram`.
+    :paramtype histogram_factory: callable
+    """
+
+    POLICY_DURATION = "azure_core_policy_duration_seconds"
+    TRANSPORT_PHASE = "azure_core_transport_phase_seconds"
+    RETRIES = "azure_core_request_retries"
+    RETRIES_BUCKETS = (0, 1, 2, 3, 5, 10)
+
+    def __init__(self, **kwargs):
+        # type: (Any) -> None
+        self._histogram_factory = kwargs.pop("histogram_factory", self._default_histogram)
+        self._histograms = {}  # type: Dict[Tuple[str, Tuple[Tuple[str, str], ...]], Any]
+        self._lock = threading.Lock()
+
+    @classmethod
+    def _default_histogram(cls, name, labels):  # pylint: disable=unused-argument
+        # type: (str, Dict[str, str]) -> Histogram
+        if name == cls.RETRIES:
+            return Histogram(cls.RETRIES_BUCKETS)
+        return Histogram()
+
+    def histogram(self, name, **labels):
+        # type: (str, str) -> Any
+        """Get the histogram of a metric, creating it if necessary.
+
+        :param str name: The name of the metric.
+        :return: The histogram, as returned by "histogram_factory".
+        """
+        key = (name, tuple(sorted(labels.items())))
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            with self._lock:
+                histogram = self._histograms.get(key)
+                if histogram is None:
+                    histogram = self._histograms[key] = self._histogram_factory(name, labels)
+        return histogram
+
+    def observe(self, name, value, **labels):
+        # type: (str, float, str) -> None
+        """Record a value in the histogram of a metric.
+
+        :param str name: The name of the metric.
+        :param float value: The value to record, in seconds for durations.
+        """
+        self.histogram(name, **labels).observe(value)
+
+    def histograms(self):
+        # type: () -> List[Tuple[str, Dict[str, str], Any]]
+        """List the histograms recorded so far.
+
+        :return: A list of (metric name, labels, histogram).
+        :rtype: list[tuple[str, dict[str, str], any]]
+        """
+        with self._lock:
+            items = list(self._histograms.items())
+        return [(name, dict(labels), histogram) for (name, labels), histogram in sorted(items, key=lambda i: i[0])]
+
+    def clear(self):
+        # type: () -> None
+        """Forget every histogram."""
+        with self._lock:
+            self._histograms.clear()
+
+
+def _format_value(value):
+    # type: (float) -> str
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value))
+
+
+def _format_labels(labels):
+    # type: (Dict[str, Any]) -> str
+    if not labels:
+        return ""
+    return "{" + ",".join(
+        '{}="{}"'.format(key, str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n"))
+        for key, value in sorted(labels.items())
+    ) + "}"
+
+
+class PrometheusExporter(object):
+    """Exposes the histograms of a :class:`PipelineInstrumentation` in the Prometheus text format.
+
+    Only histograms with the interface of :class:`Histogram` (a "buckets" method, "sum" and
+    "count" attributes) are exported. The exporter is a WSGI application, which can be served
+    from the process:
+
+    .. code-block:: python
+
+        from wsgiref.simple_server import make_server
+
+        exporter = PrometheusExporter(instrumentation)
+        make_server("", 8000, exporter).serve_forever()
+
+    :param instrumentation: The instrumentation to export.
+    :type instrumentation: ~azure.core.pipeline.PipelineInstrumentation
+    """
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self, instrumentation):
+        # type: (PipelineInstrumentation) -> None
+        self.instrumentation = instrumentation
+
+    def generate(self):
+        # type: () -> str
+        """Get the current values of the histograms, in the Prometheus text format.
+
+        :rtype: str
+        """
+        lines = []  # type: List[str]
+        last_name = None
+        for name, labels, histogram in self.instrumentation.histograms():
+            if not hasattr(histogram, "buckets"):
+                continue
+            if name != last_name:
+                lines.append("# TYPE {} histogram".format(name))
+                last_name = name
+            for bound, count in histogram.buckets():
+                bucket_labels = dict(labels, le=_format_value(bound))
+                lines.append("{}_bucket{} {}".format(name, _format_labels(bucket_labels), count))
+            lines.append("{}_sum{} {}".format(name, _format_labels(labels), _format_value(histogram.sum)))
+            lines.append("{}_count{} {}".format(name, _format_labels(labels), histogram.count))
+        return "\n".join(lines) + "\n"
+
+    def __call__(self, environ, start_response):
+        body = self.generate().encode("utf-8")
+        start_response("200 OK", [("Content-Type", self.CONTENT_TYPE), ("Content-Length", str(len(body)))])
+        return [body]
+
+
+def _policy_name(policy):
+    # type: (Any) -> str
+    policy = getattr(policy, "_policy", policy)  # SansIO runners
+    sender = getattr(policy, "_sender", None)  # Transport runners
+    return (sender or policy).__class__.__name__
+
+
+class _TimedRunner(HTTPPolicy):
+    """Records the time spent in a node of the pipeline, and the ones after it."""
+
+    def __init__(self, node, instrumentation):
+        # type: (HTTPPolicy, PipelineInstrumentation) -> None
+        super(_TimedRunner, self).__init__()
+        self._node = node
+        self._histogram = instrumentation.histogram(
+            PipelineInstrumentation.POLICY_DURATION, policy=_policy_name(node)
+        )
+
+    def send(self, request):
+        # type: (PipelineRequest) -> PipelineResponse
+        start = _clock()
+        try:
+            return self._node.send(request)
+        finally:
+            self._histogram.observe(_clock() - start)
+
+
+def _instrument_policies(policies, instrumentation, runner_type=_TimedRunner):
+    # type: (List[Any], PipelineInstrumentation, Callable) -> Any
+    """Link the nodes of a pipeline through timed runners, and return the first one."""
+    runners = [runner_type(node, instrumentation) for node in policies]
+    for node, runner in zip(policies[:-1], runners[1:]):
+        node.next = runner
+    return runners[0]
@@ -23,6 +23,10 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
 
 def await_result(func, *args, **kwargs):
     """If func returns an awaitable, raise that this runner can't handle it."""
@@ -32,3 +36,16 @@ def await_result(func, *args, **kwargs):
             "Policy {} returned awaitable object in non-async pipeline.".format(func)
         )
     return result
+
+
+def close_response(response):
+    """Release the connection of a pipeline response that won't be returned to the caller.
+
+    Errors are logged, not raised: they must not replace the response the caller gets instead.
+    """
+    close = getattr(response.http_response.internal_response, "close", None)
+    if close:
+        try:
+            close()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.debug("Unable to close an unused response", exc_info=True)
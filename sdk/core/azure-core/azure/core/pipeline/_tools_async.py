@@ -23,6 +23,11 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
+import asyncio
+import logging
+
+_LOGGER = logging.getLogger(__name__)
+
 
 async def await_result(func, *args, **kwargs):
     """If func returns an awaitable, await it."""
@@ -31,3 +36,30 @@ async def await_result(func, *args, **kwargs):
         # type ignore on await: https://github.com/python/mypy/issues/7587
         return await result  # type: ignore
     return result
+
+
+def asyncio_running():
+    """Whether this runs in a running asyncio event loop, rather than in another loop such as trio."""
+    try:
+        return asyncio.get_event_loop().is_running()
+    except RuntimeError:
+        return False
+
+
+async def close_response_async(response):
+    """Release the connection of a pipeline response that won't be returned to the caller.
+
+    Async responses that only support an async close, like the ones of httpx, are closed with "aclose".
+    Errors are logged, not raised: they must not replace the response the caller gets instead.
+    """
+    internal_response = response.http_response.internal_response
+    try:
+        aclose = getattr(internal_response, "aclose", None)
+        if aclose:
+            await aclose()
+            return
+        close = getattr(internal_response, "close", None)
+        if close:
+            await await_result(close)
+    except Exception:  # pylint: disable=broad-except
+        _LOGGER.debug("Unable to close an unused response", exc_info=True)
@@ -29,6 +29,8 @@ from ._authentication import BearerTokenCredentialPolicy, AzureKeyCredentialPoli
 from ._custom_hook import CustomHookPolicy
 from ._redirect import RedirectPolicy
 from ._retry import RetryPolicy, RetryMode
+from ._rate_limit import RateLimitPolicy, RateLimiter
+from ._caching import CachingPolicy, ResponseCache, InMemoryResponseCache, CachedResponse
 from ._distributed_tracing import DistributedTracingPolicy
 from ._universal import (
     HeadersPolicy,
@@ -51,6 +53,12 @@ __all__ = [
     'ContentDecodePolicy',
     'RetryMode',
     'RetryPolicy',
+    'RateLimitPolicy',
+    'RateLimiter',
+    'CachingPolicy',
+    'ResponseCache',
+    'InMemoryResponseCache',
+    'CachedResponse',
     'RedirectPolicy',
     'ProxyPolicy',
     'CustomHookPolicy',
@@ -67,11 +75,15 @@ try:
     from ._authentication_async import AsyncBearerTokenCredentialPolicy
     from ._redirect_async import AsyncRedirectPolicy
     from ._retry_async import AsyncRetryPolicy
+    from ._rate_limit_async import AsyncRateLimitPolicy
+    from ._caching_async import AsyncCachingPolicy
     __all__.extend([
         'AsyncHTTPPolicy',
         'AsyncBearerTokenCredentialPolicy',
         'AsyncRedirectPolicy',
-        'AsyncRetryPolicy'
+        'AsyncRetryPolicy',
+        'AsyncRateLimitPolicy',
+        'AsyncCachingPolicy',
     ])
 except (ImportError, SyntaxError):
     pass  # Async not supported
@@ -3,6 +3,8 @@
 # Licensed under the MIT License. See LICENSE.txt in the project root for
 # license information.
 # -------------------------------------------------------------------------
+import logging
+import threading
 import time
 import six
 
@@ -20,6 +22,7 @@ if TYPE_CHECKING:
     from azure.core.credentials import AccessToken, TokenCredential, AzureKeyCredential
     from azure.core.pipeline import PipelineRequest
 
+_LOGGER = logging.getLogger(__name__)
 
 # pylint:disable=too-few-public-methods
 class _BearerTokenCredentialPolicyBase(object):
@@ -70,16 +73,33 @@ class _BearerTokenCredentialPolicyBase(object):
         # type: () -> bool
         return not self._token or self._token.expires_on - time.time() < 300
 
+    @property
+    def _token_is_usable(self):
+        # type: () -> bool
+        """Whether the current token, even if it should be refreshed, has not expired yet."""
+        return self._token is not None and self._token.expires_on > time.time()
+
 
 class BearerTokenCredentialPolicy(_BearerTokenCredentialPolicyBase, SansIOHTTPPolicy):
     """Adds a bearer token Authorization header to requests.
 
+    Only one thread at a time refreshes the token. While the current token is still valid,
+    other threads keep using it instead of waiting for the refresh to complete.
+
     :param credential: The credential.
     :type credential: ~azure.core.TokenCredential
     :param str scopes: Lets you specify the type of access needed.
+    :keyword bool background_refresh: Refresh a token that is about to expire in a background thread,
+     so that no request waits for it. Defaults to False.
     :raises: :class:`~azure.core.exceptions.ServiceRequestError`
     """
 
+    def __init__(self, credential, *scopes, **kwargs):
+        # type: (TokenCredential, *str, Any) -> None
+        super(BearerTokenCredentialPolicy, self).__init__(credential, *scopes, **kwargs)
+        self._background_refresh = kwargs.pop("background_refresh", False)
+        self._lock = threading.Lock()
+
     def on_request(self, request):
         # type: (PipelineRequest) -> None
         """Adds a bearer token Authorization header to request and sends request to next policy.
@@ -89,9 +109,42 @@ class BearerTokenCredentialPolicy(_BearerTokenCredentialPolicyBase, SansIOHTTPPo
         """
         self._enforce_https(request)
 
-        if self._token is None or self._need_new_token:
-            self._token = self._credential.get_token(*self._scopes)
-        self._update_headers(request.http_request.headers, self._token.token)
+        if self._need_new_token:
+            if self._token_is_usable:
+                self._refresh_token_without_waiting()
+            else:
+                token = self._token
+                with self._lock:
+                    # Another thread may have refreshed the token while we were waiting
+                    if self._token is token or not self._token_is_usable:
+                        self._token = self._credential.get_token(*self._scopes)
+        self._update_headers(request.http_request.headers, self._token.token)  # type: ignore
+
+    def _refresh_token_without_waiting(self):
+        # type: () -> None
+        if not self._lock.acquire(False):
+            return  # another thread is refreshing, the current token is still valid meanwhile
+        if not self._background_refresh:
+            self._refresh_token_and_release()
+            return
+        try:
+            thread = threading.Thread(target=self._refresh_token_and_release, name="azure-core-token-refresh")
+            thread.daemon = True
+            thread.start()
+        except Exception:  # pylint: disable=broad-except
+            self._lock.release()
+            raise
+
+    def _refresh_token_and_release(self):
+        # type: () -> None
+        try:
+            if self._need_new_token:
+                self._token = self._credential.get_token(*self._scopes)
+        except Exception as err:  # pylint: disable=broad-except
+            # The current token is still valid, next requests will try again
+            _LOGGER.warning("Unable to refresh the access token: %s", err)
+        finally:
+            self._lock.release()
 
 
 class AzureKeyCredentialPolicy(SansIOHTTPPolicy):
@@ -4,23 +4,34 @@
 # license information.
 # -------------------------------------------------------------------------
 import asyncio
+import logging
+from typing import Optional
 
 from azure.core.pipeline import PipelineRequest
 from azure.core.pipeline.policies import SansIOHTTPPolicy
 from azure.core.pipeline.policies._authentication import _BearerTokenCredentialPolicyBase
 
+_LOGGER = logging.getLogger(__name__)
+
 
 class AsyncBearerTokenCredentialPolicy(_BearerTokenCredentialPolicyBase, SansIOHTTPPolicy):
     # pylint:disable=too-few-public-methods
     """Adds a bearer token Authorization header to requests.
 
+    Only one coroutine at a time refreshes the token. While the current token is still valid,
+    other coroutines keep using it instead of waiting for the refresh to complete.
+
     :param credential: The credential.
     :type credential: ~azure.core.credentials.TokenCredential
     :param str scopes: Lets you specify the type of access needed.
+    :keyword bool background_refresh: Refresh a token that is about to expire in a background task,
+     so that no request waits for it. Defaults to False.
     """
 
     def __init__(self, credential, *scopes, **kwargs):
         super().__init__(credential, *scopes, **kwargs)
+        self._background_refresh = kwargs.pop("background_refresh", False)
+        self._refresh_task = None  # type: Optional[asyncio.Future]
         self._lock = asyncio.Lock()
 
     async def on_request(self, request: PipelineRequest):  # pylint:disable=invalid-overridden-method
@@ -32,7 +43,27 @@ class AsyncBearerTokenCredentialPolicy(_BearerTokenCredentialPolicyBase, SansIOH
         """
         self._enforce_https(request)
 
+        if self._need_new_token:
+            if self._token_is_usable:
+                if not self._lock.locked():
+                    if not self._background_refresh:
+                        await self._refresh_token()
+                    elif self._refresh_task is None or self._refresh_task.done():
+                        self._refresh_task = asyncio.ensure_future(self._refresh_token())
+            else:
+                token = self._token
+                async with self._lock:
+                    # Another coroutine may have refreshed the token while we were waiting
+                    if self._token is token or not self._token_is_usable:
+                        self._token = await self._credential.get_token(*self._scopes)  # type: ignore
+        self._update_headers(request.http_request.headers, self._token.token)  # type: ignore
+
+    async def _refresh_token(self) -> None:
         async with self._lock:
-            if self._need_new_token:
+            if not self._need_new_token:
+                return
+            try:
                 self._token = await self._credential.get_token(*self._scopes)  # type: ignore
-        self._update_headers(request.http_request.headers, self._token.token)
+            except Exception as err:  # pylint: disable=broad-except
+                # The current token is still valid, next requests will try again
+                _LOGGER.warning("Unable to refresh the access token: %s", err)
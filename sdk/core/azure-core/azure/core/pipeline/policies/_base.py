@@ -87,6 +87,10 @@ class SansIOHTTPPolicy(Generic[HTTPRequestType, HTTPResponseType]):
     and can act either before the request is done, or after.
     You can optionally make these methods coroutines (or return awaitable objects)
     but they will then be tied to AsyncPipeline usage.
+
+    Override only the hooks the policy needs: pipelines don't call the others, and run the
+    hooks of consecutive policies in a single loop. A policy implementing on_exception is
+    run on its own, so that it sees the exceptions raised after it.
     """
 
     def on_request(self, request):
@@ -138,17 +142,25 @@ class RequestHistory(object):
 
     This is used to document requests/responses that resulted in redirected/retried requests.
 
+    The request is recorded as it was sent: method, URL and headers are copied, but the body and
+    files are a reference to the ones of the request, so that retrying a large upload doesn't copy it.
+
     :param http_request: The request.
     :type http_request: ~azure.core.pipeline.transport.HttpRequest
     :param http_response: The HTTP response.
     :type http_response: ~azure.core.pipeline.transport.HttpResponse
     :param Exception error: An error encountered during the request, or None if the response was received successfully.
     :param dict context: The pipeline context.
+    :keyword bool deep_copy: Record a deep copy of the request, body and files included. Defaults to False.
     """
 
-    def __init__(self, http_request, http_response=None, error=None, context=None):
-        # type: (HTTPRequestType, Optional[HTTPResponseType], Exception, Optional[Dict[str, Any]]) -> None
-        self.http_request = copy.deepcopy(http_request)
+    def __init__(self, http_request, http_response=None, error=None, context=None, **kwargs):
+        # type: (HTTPRequestType, Optional[HTTPResponseType], Exception, Optional[Dict[str, Any]], Any) -> None
+        if kwargs.get("deep_copy", False):
+            self.http_request = copy.deepcopy(http_request)
+        else:
+            self.http_request = copy.copy(http_request)
+            self.http_request.headers = http_request.headers.copy()  # type: ignore
         self.http_response = http_response
         self.error = error
         self.context = context
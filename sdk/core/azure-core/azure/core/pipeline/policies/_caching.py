@@ -0,0 +1,318 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""Client side cache of GET responses, revalidated with their ETag."""
+import abc
+import collections
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from azure.core.pipeline import ABC, PipelineResponse
+from ._base import HTTPPolicy
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import
+    from typing import Any, Dict, Optional, Tuple
+    from azure.core.pipeline import PipelineRequest
+    from azure.core.pipeline.transport import HttpRequest
+
+_DEFAULT_KEY_HEADERS = ("Accept", "x-ms-version")
+# Requests with these headers have their own conditional or partial semantics
+_BYPASS_HEADERS = frozenset(["if-match", "if-none-match", "if-modified-since", "if-unmodified-since", "range"])
+
+
+def _get_header(headers, name):
+    # type: (Dict[str, str], str) -> Optional[str]
+    """Case-insensitive lookup in a plain dict."""
+    name = name.lower()
+    for key, value in headers.items():
+        if key.lower() == name:
+            return value
+    return None
+
+
+class CachedResponse(object):
+    """A response stored in a :class:`ResponseCache`.
+
+    :param int status_code: The status code.
+    :param str reason: The reason phrase.
+    :param dict headers: The headers.
+    :param bytes body: The body.
+    :param float expires_on: Time (as time.time()) after which the response must be revalidated.
+    """
+
+    def __init__(self, status_code, reason, headers, body, expires_on):
+        # type: (int, Optional[str], Dict[str, str], bytes, float) -> None
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+        self.expires_on = expires_on
+
+    @property
+    def etag(self):
+        # type: () -> Optional[str]
+        return _get_header(self.headers, "ETag")
+
+    @property
+    def size(self):
+        # type: () -> int
+        """Approximate size in memory, in bytes."""
+        return len(self.body) + sum(len(name) + len(value) for name, value in self.headers.items())
+
+
+class ResponseCache(ABC):
+    """Storage of the :class:`CachingPolicy` and :class:`AsyncCachingPolicy`.
+
+    Implementations must be thread-safe, and should not block: they are used
+    by synchronous and asynchronous pipelines alike.
+    """
+
+    @abc.abstractmethod
+    def get(self, key):
+        # type: (str) -> Optional[CachedResponse]
+        """Get a stored response, or None."""
+
+    @abc.abstractmethod
+    def set(self, key, response):
+        # type: (str, CachedResponse) -> None
+        """Store a response, replacing the one stored for this key if any."""
+
+    @abc.abstractmethod
+    def delete(self, key):
+        # type: (str) -> None
+        """Remove the response stored for this key, if any."""
+
+
+class InMemoryResponseCache(ResponseCache):
+    """A thread-safe in-memory LRU cache, bounded by a number of entries and a size.
+
+    :keyword int max_entries: Maximum number of responses. Defaults to 1000.
+    :keyword int max_bytes: Maximum total size of the responses, in bytes. Larger responses
+     are not stored. Defaults to 16 MiB.
+    """
+
+    def __init__(self, **kwargs):
+        # type: (Any) -> None
+        self.max_entries = kwargs.pop("max_entries", 1000)  # type: int
+        self.max_bytes = kwargs.pop("max_bytes", 16 * 1024 * 1024)  # type: int
+        self._entries = collections.OrderedDict()  # type: collections.OrderedDict
+        self._lock = threading.Lock()
+        self.size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        # type: (str) -> Optional[CachedResponse]
+        with self._lock:
+            response = self._entries.pop(key, None)
+            if response is not None:
+                self._entries[key] = response  # Most recently used
+            return response
+
+    def set(self, key, response):
+        # type: (str, CachedResponse) -> None
+        with self._lock:
+            self._remove(key)
+            if response.size > self.max_bytes:
+                return
+            self._entries[key] = response
+            self.size += response.size
+            while len(self._entries) > self.max_entries or self.size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def delete(self, key):
+        # type: (str) -> None
+        with self._lock:
+            self._remove(key)
+
+    def clear(self):
+        # type: () -> None
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def _remove(self, key):
+        # type: (str) -> None
+        response = self._entries.pop(key, None)
+        if response is not None:
+            self.size -= response.size
+
+
+def _get_ttl(headers, ttl):
+    # type: (Dict[str, str], Optional[float]) -> Optional[float]
+    """Time to live of a response, or None if it must not be stored.
+
+    "no-store" and "no-cache" directives win over the TTL given by the caller, which wins
+    over "max-age".
+    """
+    directives = {}
+    for directive in (_get_header(headers, "Cache-Control") or "").split(","):
+        name, _, value = directive.strip().partition("=")
+        directives[name.lower()] = value.strip('"')
+    if "no-store" in directives:
+        return None
+    if "no-cache" in directives:
+        return 0
+    if ttl is not None:
+        return ttl
+    try:
+        return max(int(directives.get("max-age", 0)), 0)
+    except ValueError:
+        return 0
+
+
+class CachingPolicy(HTTPPolicy):
+    """A policy serving repeated GET requests from a cache.
+
+    Successful GET responses are stored with their ETag. Until its time to live is over, a
+    stored response is served without sending the request. Then the request is sent with
+    If-None-Match, and a 304 (Not Modified) response is served from the cache: the body is
+    not transferred again.
+
+    The time to live comes from the "cache_ttl" keyword (of the policy, or of the operation),
+    or from the "max-age" directive of the response. It defaults to 0: every call is
+    revalidated. "no-store" responses are never stored, "no-cache" ones are always revalidated.
+    GET requests with a Range or a conditional header, and streamed downloads, are not cached.
+
+    This policy should be placed before the retry and authentication policies, so that fresh
+    responses are served without going through them. Responses are keyed by URL and the
+    "cache_key_headers" of the request: don't share a cache between clients using different
+    credentials if responses can be served without revalidation ("cache_ttl" above 0).
+
+    :keyword cache: The storage. Defaults to an :class:`InMemoryResponseCache` of this policy.
+    :paramtype cache: ~azure.core.pipeline.policies.ResponseCache
+    :keyword float cache_ttl: Time to live of the responses, in seconds. Can be passed per operation too.
+    :keyword cache_key_headers: The request headers the response depends on.
+     Defaults to ("Accept", "x-ms-version").
+    :paramtype cache_key_headers: list[str]
+    """
+
+    def __init__(self, **kwargs):
+        # type: (Any) -> None
+        super(CachingPolicy, self).__init__()
+        cache = kwargs.pop("cache", None)
+        self.cache = InMemoryResponseCache() if cache is None else cache  # type: ResponseCache
+        self._ttl = kwargs.pop("cache_ttl", None)  # type: Optional[float]
+        self._key_headers = tuple(kwargs.pop("cache_key_headers", _DEFAULT_KEY_HEADERS))
+
+    def _get_key(self, request):
+        # type: (PipelineRequest) -> Optional[str]
+        """The cache key of the request, or None if it must not be cached."""
+        http_request = request.http_request
+        if http_request.method != "GET" or request.context.options.get("stream"):
+            return None
+        if any(name.lower() in _BYPASS_HEADERS for name in http_request.headers):
+            return None
+        return "\n".join(
+            [http_request.url]
+            + ["{}: {}".format(name, _get_header(http_request.headers, name) or "") for name in self._key_headers]
+        )
+
+    def _prepare(self, request):
+        # type: (PipelineRequest) -> Tuple[Optional[str], Optional[CachedResponse], bool, Optional[float]]
+        """Return the key, the stored response, whether it is fresh, and the TTL of this request.
+
+        A stale response is returned only if it can be revalidated, the request then has an
+        If-None-Match header.
+        """
+        ttl = request.context.options.pop("cache_ttl", self._ttl)
+        key = self._get_key(request)
+        if key is None:
+            return None, None, False, ttl
+        cached = self.cache.get(key)
+        if cached is None:
+            return key, None, False, ttl
+        if cached.expires_on > time.time():
+            return key, cached, True, ttl
+        etag = cached.etag
+        if not etag:
+            return key, None, False, ttl
+        request.http_request.headers["If-None-Match"] = etag
+        return key, cached, False, ttl
+
+    def _from_cache(self, request, cached):
+        # type: (PipelineRequest, CachedResponse) -> PipelineResponse
+        from azure.core.pipeline.transport._cached import CachedHttpResponse
+
+        http_response = CachedHttpResponse(request.http_request, cached)
+        return PipelineResponse(request.http_request, http_response, request.context)
+
+    def _on_response(self, request, response, key, cached, ttl):
+        # type: (PipelineRequest, PipelineResponse, str, Optional[CachedResponse], Optional[float]) -> PipelineResponse
+        """Store the response, or serve the stored one if it wasn't modified."""
+        http_response = response.http_response
+        if cached is not None:
+            request.http_request.headers.pop("If-None-Match", None)
+            if http_response.status_code == 304:
+                headers = dict(cached.headers)
+                headers.update(
+                    (name, value) for name, value in http_response.headers.items() if name.lower() != "content-length"
+                )
+                ttl = _get_ttl(headers, ttl)
+                if ttl is None:
+                    self.cache.delete(key)
+                else:
+                    cached = CachedResponse(cached.status_code, cached.reason, headers, cached.body, time.time() + ttl)
+                    self.cache.set(key, cached)
+                return self._from_cache(request, cached)
+        if http_response.status_code == 200:
+            headers = dict(http_response.headers.items())
+            ttl = _get_ttl(headers, ttl)
+            if ttl is None or (not ttl and not _get_header(headers, "ETag")):
+                self.cache.delete(key)
+            else:
+                self.cache.set(key, CachedResponse(
+                    http_response.status_code,
+                    http_response.reason,
+                    headers,
+                    http_response.body(),
+                    time.time() + ttl
+                ))
+        return response
+
+    def send(self, request):
+        # type: (PipelineRequest) -> PipelineResponse
+        """Serve the request from the cache, or send it to the next policy.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        key, cached, fresh, ttl = self._prepare(request)
+        if key is None:
+            return self.next.send(request)
+        if fresh:
+            return self._from_cache(request, cached)  # type: ignore
+        try:
+            response = self.next.send(request)
+        except Exception:
+            if cached is not None:
+                request.http_request.headers.pop("If-None-Match", None)
+            raise
+        return self._on_response(request, response, key, cached, ttl)
@@ -0,0 +1,80 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+from typing import TYPE_CHECKING
+
+from azure.core.pipeline import PipelineResponse
+from ._base_async import AsyncHTTPPolicy
+from ._caching import CachingPolicy, CachedResponse
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import
+    from azure.core.pipeline import PipelineRequest
+
+
+class AsyncCachingPolicy(CachingPolicy, AsyncHTTPPolicy):
+    """An async policy serving repeated GET requests from a cache.
+
+    Successful GET responses are stored with their ETag. Until its time to live is over, a
+    stored response is served without sending the request. Then the request is sent with
+    If-None-Match, and a 304 (Not Modified) response is served from the cache: the body is
+    not transferred again. Sync and async policies can share the same :class:`ResponseCache`.
+
+    See :class:`CachingPolicy` for the time to live and the requests that are not cached.
+
+    :keyword cache: The storage. Defaults to an :class:`InMemoryResponseCache` of this policy.
+    :paramtype cache: ~azure.core.pipeline.policies.ResponseCache
+    :keyword float cache_ttl: Time to live of the responses, in seconds. Can be passed per operation too.
+    :keyword cache_key_headers: The request headers the response depends on.
+     Defaults to ("Accept", "x-ms-version").
+    :paramtype cache_key_headers: list[str]
+    """
+
+    def _from_cache(self, request: "PipelineRequest", cached: CachedResponse) -> PipelineResponse:
+        from azure.core.pipeline.transport._cached_async import AsyncCachedHttpResponse
+
+        http_response = AsyncCachedHttpResponse(request.http_request, cached)
+        return PipelineResponse(request.http_request, http_response, request.context)
+
+    async def send(self, request: "PipelineRequest") -> PipelineResponse:  # type: ignore # pylint:disable=invalid-overridden-method
+        """Serve the request from the cache, or send it to the next policy.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        key, cached, fresh, ttl = self._prepare(request)
+        if key is None:
+            return await self.next.send(request)
+        if fresh:
+            return self._from_cache(request, cached)  # type: ignore
+        try:
+            response = await self.next.send(request)
+        except Exception:
+            if cached is not None:
+                request.http_request.headers.pop("If-None-Match", None)
+            raise
+        return self._on_response(request, response, key, cached, ttl)
@@ -83,7 +83,7 @@ class DistributedTracingPolicy(SansIOHTTPPolicy):
         # type: (PipelineRequest) -> None
         ctxt = request.context.options
         try:
-            span_impl_type = settings.tracing_implementation()
+            span_impl_type = settings.tracing_implementation.cached()
             if span_impl_type is None:
                 return
 
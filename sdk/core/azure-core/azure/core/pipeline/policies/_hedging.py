@@ -0,0 +1,121 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""Helpers of the hedged requests of the retry policies."""
+import math
+import threading
+from typing import TYPE_CHECKING
+
+from azure.core.pipeline import PipelineContext, PipelineRequest
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import
+    from typing import Any, List, Optional
+
+
+class _LatencyHistogram(object):
+    """Thread-safe latency histogram, with logarithmic buckets.
+
+    Bucket bounds grow by a factor of 2 ** (1 / 4) (about 19%) from 1ms to about 2 minutes,
+    so percentiles are estimated within 19% with a constant memory footprint. Counts are
+    halved once "max_samples" are recorded, so that percentiles follow latency changes.
+
+    :param int max_samples: Number of samples after which older samples weigh half as much.
+    """
+
+    _MIN_LATENCY = 0.001
+    _BUCKETS_PER_DOUBLING = 4
+    _BUCKET_COUNT = 17 * _BUCKETS_PER_DOUBLING + 1
+
+    def __init__(self, max_samples=1000):
+        # type: (int) -> None
+        self._max_samples = max_samples
+        self._counts = [0.0] * self._BUCKET_COUNT  # type: List[float]
+        self._total = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self):
+        # type: () -> float
+        """The (decayed) number of samples."""
+        return self._total
+
+    @classmethod
+    def bucket_bound(cls, index):
+        # type: (int) -> float
+        """The upper bound, in seconds, of the bucket "index"."""
+        return cls._MIN_LATENCY * 2 ** (float(index) / cls._BUCKETS_PER_DOUBLING)
+
+    def record(self, latency):
+        # type: (float) -> None
+        """Record a latency, in seconds."""
+        if latency <= self._MIN_LATENCY:
+            index = 0
+        else:
+            index = int(math.ceil(math.log(latency / self._MIN_LATENCY, 2) * self._BUCKETS_PER_DOUBLING))
+            index = min(index, self._BUCKET_COUNT - 1)
+        with self._lock:
+            if self._total >= self._max_samples:
+                self._counts = [count / 2 for count in self._counts]
+                self._total /= 2
+            self._counts[index] += 1
+            self._total += 1
+
+    def percentile(self, percentile):
+        # type: (float) -> Optional[float]
+        """Estimate a percentile of the recorded latencies, in seconds.
+
+        :param float percentile: The percentile, between 0 and 100.
+        :returns: The upper bound of the bucket holding the percentile, or None if nothing was recorded.
+        """
+        with self._lock:
+            if not self._total:
+                return None
+            rank = self._total * percentile / 100.0
+            seen = 0.0
+            for index, count in enumerate(self._counts):
+                seen += count
+                if count and seen >= rank:
+                    return self.bucket_bound(index)
+        return self.bucket_bound(self._BUCKET_COUNT - 1)
+
+
+def _clone_request(request):
+    # type: (PipelineRequest) -> PipelineRequest
+    """Copy a pipeline request, so that it can be sent concurrently with the original one.
+
+    The body is shared, hedged requests are only sent for methods without side effects.
+    Must be called before the original request goes through the next policies, since
+    policies pop their options from the context.
+    """
+    http_request = request.http_request
+    hedge_http_request = http_request.__class__(
+        http_request.method, http_request.url, headers=http_request.headers, files=http_request.files
+    )
+    hedge_http_request.data = http_request.data
+    context = PipelineContext(request.context.transport, **request.context.options)
+    for key, value in request.context.items():
+        context[key] = value
+    return PipelineRequest(hedge_http_request, context)
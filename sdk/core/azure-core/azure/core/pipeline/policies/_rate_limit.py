@@ -0,0 +1,265 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""Client side rate limiting, adjusted from the throttling responses of the service."""
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+from six.moves.urllib.parse import urlparse
+
+from ._base import HTTPPolicy
+from . import _utils
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import
+    from typing import Any, Dict, Optional
+    from azure.core.pipeline import PipelineRequest, PipelineResponse
+
+_LOGGER = logging.getLogger(__name__)
+
+_clock = getattr(time, "monotonic", time.time)
+
+_THROTTLE_CODES = frozenset([429, 503])
+_REMAINING_HEADER_PREFIX = "x-ms-ratelimit-remaining-"
+
+
+class _AdaptiveTokenBucket(object):
+    """A token bucket whose rate follows an additive increase/multiplicative decrease law.
+
+    The bucket doesn't limit anything until the first throttling response. The rate is then
+    set to a fraction of the observed request rate, and grows back linearly as long as no
+    other throttling response is received.
+    """
+
+    def __init__(self, limiter):
+        # type: (RateLimiter) -> None
+        self._limiter = limiter
+        self._lock = threading.Lock()
+        self.rate = None  # type: Optional[float]
+        self._tokens = 0.0
+        self._last_refill = _clock()
+        self._blocked_until = 0.0
+        self._window_start = self._last_refill
+        self._window_count = 0
+        self._observed_rate = 0.0
+
+    def _refill(self, now):
+        # type: (float) -> None
+        # Tokens don't accumulate while the service asked to wait
+        elapsed = max(now - max(self._last_refill, self._blocked_until), 0)
+        self._last_refill = now
+        if self.rate is None:
+            return
+        self.rate += self._limiter.additive_increase * elapsed
+        if self._limiter.max_rate is not None and self.rate >= self._limiter.max_rate:
+            self.rate = self._limiter.max_rate
+        self._tokens = min(max(self.rate, 1.0), self._tokens + self.rate * elapsed)
+
+    def _count_request(self, now):
+        # type: (float) -> None
+        elapsed = now - self._window_start
+        if elapsed >= 1:
+            self._observed_rate = self._window_count / elapsed
+            self._window_start = now
+            self._window_count = 0
+        self._window_count += 1
+
+    def acquire(self):
+        # type: () -> float
+        """Try to take a token.
+
+        :returns: 0 if the request is admitted, or the time to wait before trying again.
+        """
+        with self._lock:
+            now = _clock()
+            self._refill(now)
+            if now < self._blocked_until:
+                return self._blocked_until - now
+            if self.rate is not None:
+                if self._tokens < 1:
+                    return (1 - self._tokens) / self.rate
+                self._tokens -= 1
+            self._count_request(now)
+            return 0
+
+    def throttled(self, retry_after):
+        # type: (Optional[float]) -> None
+        """Multiplicative decrease, and stop admitting requests for "retry_after" seconds."""
+        with self._lock:
+            now = _clock()
+            self._refill(now)
+            if self.rate is None:
+                current = max(self._observed_rate, self._window_count / max(now - self._window_start, 1.0))
+            else:
+                current = self.rate
+            self.rate = max(self._limiter.min_rate, current * self._limiter.decrease_factor)
+            self._tokens = 0.0
+            if retry_after:
+                self._blocked_until = max(self._blocked_until, now + retry_after)
+            _LOGGER.debug("Throttled, request rate lowered to %.2f/s", self.rate)
+
+    def remaining(self, remaining):
+        # type: (int) -> None
+        """Never burst above the number of requests the service says it still accepts."""
+        with self._lock:
+            self._tokens = min(self._tokens, remaining)
+
+
+class RateLimiter(object):
+    """Request rate limits shared by every pipeline using this object, one per host.
+
+    Until a host answers with a throttling response (429 or 503), requests to this host are
+    not limited. The rate is then lowered to a fraction ("decrease_factor") of the request
+    rate observed so far, requests are held for the duration of the "Retry-After" header, and
+    the rate increases by "additive_increase" requests per second, every second, until the
+    next throttling response. "x-ms-ratelimit-remaining-*" headers cap the burst size.
+
+    Every thread and coroutine using the same limiter shares the same rates. Use
+    :func:`RateLimiter.shared` to get the limiter shared by the whole process.
+
+    :keyword float decrease_factor: Rate multiplier applied on a throttling response. Defaults to 0.5.
+    :keyword float additive_increase: Rate increase per second, in requests per second. Defaults to 1.
+    :keyword float min_rate: Minimum rate, in requests per second. Defaults to 0.1.
+    :keyword float max_rate: Maximum rate, in requests per second. Defaults to None (no limit).
+    """
+
+    _shared = None  # type: Optional[RateLimiter]
+    _shared_lock = threading.Lock()
+
+    def __init__(self, **kwargs):
+        # type: (Any) -> None
+        self.decrease_factor = kwargs.pop("decrease_factor", 0.5)  # type: float
+        self.additive_increase = kwargs.pop("additive_increase", 1.0)  # type: float
+        self.min_rate = kwargs.pop("min_rate", 0.1)  # type: float
+        self.max_rate = kwargs.pop("max_rate", None)  # type: Optional[float]
+        self._buckets = {}  # type: Dict[str, _AdaptiveTokenBucket]
+        self._lock = threading.Lock()
+
+    @classmethod
+    def shared(cls, **kwargs):
+        # type: (Any) -> RateLimiter
+        """Get the limiter shared by the whole process, creating it if necessary.
+
+        Keyword arguments are the ones of :class:`RateLimiter` and are only used by
+        the call that creates the limiter.
+
+        :rtype: ~azure.core.pipeline.policies.RateLimiter
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(**kwargs)
+            return cls._shared
+
+    def _get_bucket(self, key):
+        # type: (str) -> _AdaptiveTokenBucket
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            with self._lock:
+                bucket = self._buckets.setdefault(key, _AdaptiveTokenBucket(self))
+        return bucket
+
+    def get_rate(self, key):
+        # type: (str) -> Optional[float]
+        """Get the current rate of a host, in requests per second.
+
+        :param str key: The host, as "scheme://host:port", or the "rate_limit_key" of the requests.
+        :returns: The rate, or None if requests to this host are not limited.
+        :rtype: float
+        """
+        bucket = self._buckets.get(key)
+        return bucket.rate if bucket else None
+
+
+class RateLimitPolicy(HTTPPolicy):
+    """A policy holding requests to respect the rate limits of the service.
+
+    The rates are adjusted from the throttling responses (429 and 503) of the service, and
+    are shared by every pipeline using the same :class:`RateLimiter`. This policy should be
+    placed after the retry policy, so that every attempt is admitted by the limiter.
+
+    :keyword rate_limiter: The limiter to use. Defaults to the limiter shared by the process.
+    :paramtype rate_limiter: ~azure.core.pipeline.policies.RateLimiter
+    :keyword str rate_limit_key: Share the rates of the requests with the same key (for instance
+     an account name), instead of per host. Can be passed per operation too.
+    """
+
+    def __init__(self, **kwargs):
+        # type: (Any) -> None
+        super(RateLimitPolicy, self).__init__()
+        self.rate_limiter = kwargs.pop("rate_limiter", None) or RateLimiter.shared()
+        self._rate_limit_key = kwargs.pop("rate_limit_key", None)
+
+    def _get_bucket(self, request):
+        # type: (PipelineRequest) -> _AdaptiveTokenBucket
+        context = request.context
+        # Resolved once for all the attempts of the operation: the option is popped by the first one
+        if "rate_limit_key" not in context:
+            context["rate_limit_key"] = context.options.pop("rate_limit_key", self._rate_limit_key)
+        key = context["rate_limit_key"]
+        if key is None:
+            parsed = urlparse(request.http_request.url)
+            key = "{}://{}".format(parsed.scheme, parsed.netloc)
+        return self.rate_limiter._get_bucket(key)  # pylint: disable=protected-access
+
+    @staticmethod
+    def _on_response(bucket, response):
+        # type: (_AdaptiveTokenBucket, PipelineResponse) -> None
+        http_response = response.http_response
+        if http_response.status_code in _THROTTLE_CODES:
+            bucket.throttled(_utils.get_retry_after(response))
+            return
+        remaining = None
+        for header, value in http_response.headers.items():
+            if header.lower().startswith(_REMAINING_HEADER_PREFIX):
+                try:
+                    value = int(value)
+                except ValueError:
+                    continue
+                remaining = value if remaining is None else min(remaining, value)
+        if remaining is not None:
+            if remaining <= 0:
+                bucket.throttled(None)
+            else:
+                bucket.remaining(remaining)
+
+    def send(self, request):
+        # type: (PipelineRequest) -> PipelineResponse
+        """Wait for the request to be admitted, and send it to the next policy.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        bucket = self._get_bucket(request)
+        delay = bucket.acquire()
+        while delay:
+            request.context.transport.sleep(delay)
+            delay = bucket.acquire()
+        response = self.next.send(request)
+        self._on_response(bucket, response)
+        return response
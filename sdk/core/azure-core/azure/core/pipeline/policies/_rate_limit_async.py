@@ -0,0 +1,64 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+from typing import TYPE_CHECKING
+
+from ._base_async import AsyncHTTPPolicy
+from ._rate_limit import RateLimitPolicy
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import
+    from azure.core.pipeline import PipelineRequest, PipelineResponse
+
+
+class AsyncRateLimitPolicy(RateLimitPolicy, AsyncHTTPPolicy):
+    """An async policy holding requests to respect the rate limits of the service.
+
+    The rates are adjusted from the throttling responses (429 and 503) of the service, and
+    are shared by every pipeline (sync or async) using the same :class:`RateLimiter`. This
+    policy should be placed after the retry policy, so that every attempt is admitted by the limiter.
+
+    :keyword rate_limiter: The limiter to use. Defaults to the limiter shared by the process.
+    :paramtype rate_limiter: ~azure.core.pipeline.policies.RateLimiter
+    :keyword str rate_limit_key: Share the rates of the requests with the same key (for instance
+     an account name), instead of per host. Can be passed per operation too.
+    """
+
+    async def send(self, request: "PipelineRequest") -> "PipelineResponse":  # type: ignore # pylint:disable=invalid-overridden-method
+        """Wait for the request to be admitted, and send it to the next policy.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :return: The PipelineResponse.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        bucket = self._get_bucket(request)
+        delay = bucket.acquire()
+        while delay:
+            await request.context.transport.sleep(delay)
+            delay = bucket.acquire()
+        response = await self.next.send(request)
+        self._on_response(bucket, response)
+        return response
@@ -49,6 +49,8 @@ class RedirectPolicy(HTTPPolicy):
 
     :keyword bool permit_redirects: Whether the client allows redirects. Defaults to True.
     :keyword int redirect_max: The maximum allowed redirects. Defaults to 30.
+    :keyword bool history_deep_copy: Record deep copies of the redirected requests (body included) in the
+     history, instead of their method, URL and headers with a reference to the body. Defaults to False.
 
     .. admonition:: Example:
 
@@ -67,6 +69,7 @@ class RedirectPolicy(HTTPPolicy):
     def __init__(self, **kwargs):
         self.allow = kwargs.get('permit_redirects', True)
         self.max_redirects = kwargs.get('redirect_max', 30)
+        self.history_deep_copy = kwargs.get('history_deep_copy', False)
 
         remove_headers = set(kwargs.get('redirect_remove_headers', []))
         self._remove_headers_on_redirect = remove_headers.union(self.REDIRECT_HEADERS_BLACKLIST)
@@ -124,7 +127,9 @@ class RedirectPolicy(HTTPPolicy):
         """
         # TODO: Revise some of the logic here.
         settings['redirects'] -= 1
-        settings['history'].append(RequestHistory(response.http_request, http_response=response.http_response))
+        settings['history'].append(RequestHistory(
+            response.http_request, http_response=response.http_response, deep_copy=self.history_deep_copy
+        ))
 
         redirected = urlparse(redirect_location)
         if not redirected.netloc:
@@ -30,8 +30,13 @@ This module is the requests implementation of Pipeline ABC
 from __future__ import absolute_import  # we have a "requests" module that conflicts with "requests" on Py2.7
 from io import SEEK_SET, UnsupportedOperation
 import logging
+import sys
+import threading
 import time
 from enum import Enum
+
+import six
+from six.moves import queue
 from typing import TYPE_CHECKING, List, Callable, Iterator, Any, Union, Dict, Optional  # pylint: disable=unused-import
 from azure.core.pipeline import PipelineResponse
 from azure.core.exceptions import (
@@ -43,7 +48,10 @@ from azure.core.exceptions import (
     ServiceResponseTimeoutError,
 )
 
+from azure.core.tracing.common import with_current_context
 from ._base import HTTPPolicy, RequestHistory
+from ._hedging import _LatencyHistogram, _clone_request
+from .._tools import close_response
 from . import _utils
 
 
@@ -84,6 +92,17 @@ class RetryPolicy(HTTPPolicy):
 
     :keyword int timeout: Timeout setting for the operation in seconds, default is 604800s (7 days).
 
+    :keyword float retry_hedge_percentile: Enable hedged requests for GET and HEAD: if no response was
+     received after this percentile of the latencies observed by this policy (for instance 95),
+     a duplicate request is sent, and the first response wins. The other request is cancelled,
+     or its response closed. Hedging starts once 20 latencies were observed. Default is None (disabled).
+     The two attempts are sent on two threads at once, through the policies that follow this one:
+     requests are only hedged if the transport is thread-safe (see "thread_safe", for instance a
+     RequestsTransport with a connection pool).
+
+    :keyword bool history_deep_copy: Record deep copies of the retried requests (body included) in the
+     history, instead of their method, URL and headers with a reference to the body. Defaults to False.
+
     .. admonition:: Example:
 
         .. literalinclude:: ../samples/test_example_sync.py
@@ -100,6 +119,8 @@ class RetryPolicy(HTTPPolicy):
     BACKOFF_MAX = 120
     _SAFE_CODES = set(range(506)) - set([408, 429, 500, 502, 503, 504])
     _RETRY_CODES = set(range(999)) - _SAFE_CODES
+    _HEDGE_METHODS = frozenset(['HEAD', 'GET'])
+    _HEDGE_MIN_SAMPLES = 20
 
     def __init__(self, **kwargs):
         self.total_retries = kwargs.pop('retry_total', 10)
@@ -110,6 +131,9 @@ class RetryPolicy(HTTPPolicy):
         self.backoff_max = kwargs.pop('retry_backoff_max', self.BACKOFF_MAX)
         self.retry_mode = kwargs.pop('retry_mode', RetryMode.Exponential)
         self.timeout = kwargs.pop('timeout', 604800)
+        self.hedge_percentile = kwargs.pop('retry_hedge_percentile', None)
+        self.history_deep_copy = kwargs.pop('history_deep_copy', False)
+        self._latency = _LatencyHistogram()
 
         retry_codes = self._RETRY_CODES
         status_codes = kwargs.pop('retry_on_status_codes', [])
@@ -140,6 +164,7 @@ class RetryPolicy(HTTPPolicy):
             'max_backoff': options.pop("retry_backoff_max", self.BACKOFF_MAX),
             'methods': options.pop("retry_on_methods", self._method_whitelist),
             'timeout': options.pop("timeout", self.timeout),
+            'hedge_percentile': options.pop("retry_hedge_percentile", self.hedge_percentile),
             'history': []
         }
 
@@ -318,13 +343,17 @@ class RetryPolicy(HTTPPolicy):
         if error and self._is_connection_error(error):
             # Connect retry?
             settings['connect'] -= 1
-            settings['history'].append(RequestHistory(response.http_request, error=error))
+            settings['history'].append(
+                RequestHistory(response.http_request, error=error, deep_copy=self.history_deep_copy)
+            )
 
         elif error and self._is_read_error(error):
             # Read retry?
             settings['read'] -= 1
             if hasattr(response, 'http_request'):
-                settings['history'].append(RequestHistory(response.http_request, error=error))
+                settings['history'].append(
+                    RequestHistory(response.http_request, error=error, deep_copy=self.history_deep_copy)
+                )
 
         else:
             # Incrementing because of a server error like a 500 in
@@ -335,7 +364,8 @@ class RetryPolicy(HTTPPolicy):
                     settings['history'].append(
                         RequestHistory(
                             response.http_request,
-                            http_response=response.http_response
+                            http_response=response.http_response,
+                            deep_copy=self.history_deep_copy
                         )
                     )
 
@@ -375,6 +405,18 @@ class RetryPolicy(HTTPPolicy):
         if retry_settings['history']:
             context['history'] = retry_settings['history']
 
+    @staticmethod
+    def _record_retries(request, retry_settings):
+        """Record the number of retries, if the pipeline is instrumented.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :param dict retry_settings: The retry settings.
+        """
+        instrumentation = request.context.get('instrumentation')
+        if instrumentation:
+            instrumentation.observe(instrumentation.RETRIES, len(retry_settings['history']))
+
     def _configure_timeout(self, request, absolute_timeout, is_response_error):
         if absolute_timeout <= 0:
             if is_response_error:
@@ -411,6 +453,110 @@ class RetryPolicy(HTTPPolicy):
         retry_settings['body_position'] = body_position
         retry_settings['file_positions'] = file_positions
 
+    def _is_hedgeable(self, settings, request):
+        """Checks if hedging is enabled for this request.
+
+        :param dict settings: The retry settings.
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :rtype: bool
+        """
+        return settings['hedge_percentile'] is not None and \
+            request.http_request.method.upper() in self._HEDGE_METHODS
+
+    def _get_hedge_delay(self, settings):
+        """Get the delay after which a duplicate of the request is sent.
+
+        :param dict settings: The retry settings.
+        :return: The delay in seconds, or None if not enough latencies were observed yet.
+        :rtype: float or None
+        """
+        if self._latency.count < self._HEDGE_MIN_SAMPLES:
+            return None
+        return self._latency.percentile(settings['hedge_percentile'])
+
+    def _send(self, request, settings):
+        """Send one attempt of the request, hedged if configured.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :param dict settings: The retry settings.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        # The attempts run on two threads at once, which the transport must support
+        if not self._is_hedgeable(settings, request) or not getattr(request.context.transport, "thread_safe", False):
+            return self.next.send(request)
+        delay = self._get_hedge_delay(settings)
+        if delay is not None:
+            return self._send_hedged(request, delay)
+        start_time = time.time()
+        response = self.next.send(request)
+        self._latency.record(time.time() - start_time)
+        return response
+
+    def _send_hedged(self, request, delay):
+        """Send the request, and a duplicate if no response was received after "delay" seconds.
+
+        The first response wins, the response of the other request is closed when received.
+        If a request fails while the other one is still running, the other one is awaited.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :param float delay: The delay in seconds.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        results = queue.Queue()  # type: queue.Queue
+        lock = threading.Lock()
+        state = {"done": False}
+        hedge_request = _clone_request(request)
+
+        def attempt(pipeline_request):
+            start_time = time.time()
+            try:
+                response = self.next.send(pipeline_request)
+            except Exception:  # pylint: disable=broad-except
+                results.put((None, sys.exc_info()))
+                return
+            self._latency.record(time.time() - start_time)
+            with lock:
+                lost = state["done"]
+                if not lost:
+                    results.put((response, None))
+            if lost:
+                close_response(response)
+
+        def start(pipeline_request):
+            thread = threading.Thread(target=with_current_context(attempt), args=(pipeline_request,))
+            thread.daemon = True
+            thread.start()
+
+        start(request)
+        running = 1
+        try:
+            result = results.get(timeout=delay)
+        except queue.Empty:
+            _LOGGER.debug("No response after %.3fs, sending a hedged request", delay)
+            start(hedge_request)
+            running += 1
+            result = results.get()
+        running -= 1
+        error = result[1]
+        while result[0] is None and running:
+            result = results.get()
+            running -= 1
+        with lock:
+            state["done"] = True
+            # The other request might have completed in the meantime
+            late_results = []
+            while not results.empty():
+                late_results.append(results.get())
+        for late_response, _ in late_results:
+            if late_response is not None:
+                close_response(late_response)
+        if result[0] is not None:
+            return result[0]
+        six.reraise(*error)
+
     def send(self, request):
         """Sends the PipelineRequest object to the next policy. Uses retry settings if necessary.
 
@@ -433,7 +579,7 @@ class RetryPolicy(HTTPPolicy):
             try:
                 start_time = time.time()
                 self._configure_timeout(request, absolute_timeout, is_response_error)
-                response = self.next.send(request)
+                response = self._send(request, retry_settings)
                 if self.is_retry(retry_settings, response):
                     retry_active = self.increment(retry_settings, response=response)
                     if retry_active:
@@ -455,6 +601,7 @@ class RetryPolicy(HTTPPolicy):
                         else:
                             is_response_error = True
                         continue
+                self._record_retries(request, retry_settings)
                 raise err
             finally:
                 end_time = time.time()
@@ -462,4 +609,5 @@ class RetryPolicy(HTTPPolicy):
                     absolute_timeout -= (end_time - start_time)
 
         self.update_context(response.context, retry_settings)
+        self._record_retries(request, retry_settings)
         return response
@@ -27,6 +27,7 @@
 This module is the requests implementation of Pipeline ABC
 """
 from __future__ import absolute_import  # we have a "requests" module that conflicts with "requests" on Py2.7
+import asyncio
 import logging
 import time
 from typing import TYPE_CHECKING, List, Callable, Iterator, Any, Union, Dict, Optional  # pylint: disable=unused-import
@@ -38,12 +39,13 @@ from azure.core.exceptions import (
 )
 from ._base import HTTPPolicy
 from ._base_async import AsyncHTTPPolicy
+from ._hedging import _clone_request
+from .._tools_async import asyncio_running, close_response_async
 from ._retry import RetryPolicy
 
 _LOGGER = logging.getLogger(__name__)
 
 
-
 class AsyncRetryPolicy(RetryPolicy, AsyncHTTPPolicy):
     """Async flavor of the retry policy.
 
@@ -70,6 +72,11 @@ class AsyncRetryPolicy(RetryPolicy, AsyncHTTPPolicy):
 
     :keyword int retry_backoff_max: The maximum back off time. Default value is 120 seconds (2 minutes).
 
+    :keyword float retry_hedge_percentile: Enable hedged requests for GET and HEAD: if no response was
+     received after this percentile of the latencies observed by this policy (for instance 95),
+     a duplicate request is sent, and the first response wins. The other request is cancelled.
+     Hedging starts once 20 latencies were observed, and requires asyncio. Default is None (disabled).
+
     .. admonition:: Example:
 
         .. literalinclude:: ../samples/test_example_async.py
@@ -123,6 +130,68 @@ class AsyncRetryPolicy(RetryPolicy, AsyncHTTPPolicy):
                 return
         await self._sleep_backoff(settings, transport)
 
+    async def _send(self, request, settings):  # pylint:disable=invalid-overridden-method
+        """Send one attempt of the request, hedged if configured.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :param dict settings: The retry settings.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        if not self._is_hedgeable(settings, request):
+            return await self.next.send(request)
+        delay = self._get_hedge_delay(settings)
+        if delay is not None and asyncio_running():
+            return await self._send_hedged(request, delay)
+        start_time = time.time()
+        response = await self.next.send(request)
+        self._latency.record(time.time() - start_time)
+        return response
+
+    async def _send_hedged(self, request, delay):  # pylint:disable=invalid-overridden-method
+        """Send the request, and a duplicate if no response was received after "delay" seconds.
+
+        The first response wins, and the other request is cancelled.
+        If a request fails while the other one is still running, the other one is awaited.
+
+        :param request: The PipelineRequest object
+        :type request: ~azure.core.pipeline.PipelineRequest
+        :param float delay: The delay in seconds.
+        :rtype: ~azure.core.pipeline.PipelineResponse
+        """
+        hedge_request = _clone_request(request)
+
+        async def attempt(pipeline_request):
+            start_time = time.time()
+            response = await self.next.send(pipeline_request)
+            self._latency.record(time.time() - start_time)
+            return response
+
+        tasks = [asyncio.ensure_future(attempt(request))]
+        winner = None
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if not done:
+                _LOGGER.debug("No response after %.3fs, sending a hedged request", delay)
+                tasks.append(asyncio.ensure_future(attempt(hedge_request)))
+            first_done = None
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if first_done is None:
+                        first_done = task
+                    if not task.exception():
+                        winner = task
+                        return task.result()
+            return first_done.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif task is not winner and not task.cancelled() and not task.exception():
+                    await close_response_async(task.result())
+
     async def send(self, request):  # pylint:disable=invalid-overridden-method
         """Uses the configured retry policy to send the request to the next policy in the pipeline.
 
@@ -145,7 +214,7 @@ class AsyncRetryPolicy(RetryPolicy, AsyncHTTPPolicy):
             try:
                 start_time = time.time()
                 self._configure_timeout(request, absolute_timeout, is_response_error)
-                response = await self.next.send(request)
+                response = await self._send(request, retry_settings)
                 if self.is_retry(retry_settings, response):
                     retry_active = self.increment(retry_settings, response=response)
                     if retry_active:
@@ -167,6 +236,7 @@ class AsyncRetryPolicy(RetryPolicy, AsyncHTTPPolicy):
                         else:
                             is_response_error = True
                         continue
+                self._record_retries(request, retry_settings)
                 raise err
             finally:
                 end_time = time.time()
@@ -174,4 +244,5 @@ class AsyncRetryPolicy(RetryPolicy, AsyncHTTPPolicy):
                     absolute_timeout -= (end_time - start_time)
 
         self.update_context(response.context, retry_settings)
+        self._record_retries(request, retry_settings)
         return response
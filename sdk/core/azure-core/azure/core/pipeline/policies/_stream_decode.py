@@ -0,0 +1,436 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""Incremental JSON/XML decoders, fed with the body of a response chunk by chunk.
+
+Decoders never hold the whole body: the JSON decoder only buffers the text of the
+value being parsed, and arrays (at top level or as a member of the top level object)
+are parsed one element at a time. Elements of the array being "streamed" are not
+kept in the document, they are queued until popped by the caller.
+"""
+import codecs
+import collections
+import json
+import re
+import xml.etree.ElementTree as ET
+from typing import Any, Iterator, Iterable, Optional, Union, IO  # pylint: disable=unused-import
+
+from azure.core.exceptions import DecodeError
+
+_JSON_REGEXP = re.compile(r'^(application|text)/([0-9a-z+.]+\+)?json$')
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_READ_SIZE = 64 * 1024
+
+# States of the JSON decoder
+_VALUE, _FIRST_KEY, _KEY, _COLON, _MEMBER, _MEMBER_SEP, _FIRST_ITEM, _ITEM, _ITEM_SEP, _END = range(10)
+
+
+class _NeedMoreData(Exception):
+    pass
+
+
+class _JsonStreamDecoder(object):
+    """Push JSON decoder.
+
+    :param str items: Name of the top level member whose array elements are streamed
+     instead of being stored in the document. If None and the document is an array,
+     its elements are streamed.
+    :param bool stream_items: If False, nothing is streamed and the whole document is built.
+    """
+
+    def __init__(self, items=None, stream_items=True):
+        # type: (Optional[str], bool) -> None
+        self._items = items
+        self._stream_items = stream_items
+        self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._json_decoder = json.JSONDecoder()
+        self._buffer = u""
+        self._pos = 0
+        self._min_size = 0
+        self._eof = False
+        self._state = _VALUE
+        self._key = None  # type: Optional[str]
+        self._array = None  # type: Optional[list]
+        self._in_member = False
+        self.pending = collections.deque()  # type: collections.deque
+        self.document = None  # type: Any
+
+    def feed(self, data):
+        # type: (Union[bytes, str]) -> None
+        if isinstance(data, bytes):
+            data = self._text_decoder.decode(data)
+        self._buffer = self._buffer[self._pos:] + data
+        self._pos = 0
+        self._run()
+
+    def close(self):
+        # type: () -> None
+        self.feed(self._text_decoder.decode(b"", True))
+        self._eof = True
+        self._run()
+        if self._state != _END:
+            raise ValueError("Unexpected end of JSON document")
+
+    def _run(self):
+        try:
+            while self._step():
+                pass
+        except _NeedMoreData:
+            if self._eof:
+                raise ValueError("Unexpected end of JSON document")
+
+    def _peek(self):
+        # type: () -> str
+        self._pos = _WHITESPACE.match(self._buffer, self._pos).end()
+        if self._pos == len(self._buffer):
+            if self._eof:
+                return u""
+            raise _NeedMoreData()
+        return self._buffer[self._pos]
+
+    def _expect(self, chars):
+        # type: (str) -> str
+        char = self._peek()
+        if not char or char not in chars:
+            raise ValueError("Expecting one of '{}' at position {}, got '{}'".format(chars, self._pos, char))
+        self._pos += 1
+        return char
+
+    def _decode(self):
+        # type: () -> Any
+        self._peek()
+        if not self._eof and len(self._buffer) - self._pos < self._min_size:
+            raise _NeedMoreData()
+        try:
+            value, end = self._json_decoder.raw_decode(self._buffer, self._pos)
+        except ValueError:
+            if self._eof:
+                raise
+            value, end = None, len(self._buffer)
+        if end == len(self._buffer) and not self._eof:
+            # Value might be truncated (or a number might continue): wait for twice as much text,
+            # so that a large value is decoded in linear time
+            self._min_size = 2 * (len(self._buffer) - self._pos)
+            raise _NeedMoreData()
+        self._min_size = 0
+        self._pos = end
+        return value
+
+    def _streamed(self):
+        # type: () -> bool
+        return self._stream_items and self._key == self._items
+
+    def _step(self):  # pylint: disable=too-many-branches,too-many-statements
+        # type: () -> bool
+        state = self._state
+        if state == _VALUE:
+            char = self._peek()
+            if char == u"{":
+                self._pos += 1
+                self.document = {}
+                self._state = _FIRST_KEY
+            elif char == u"[":
+                self._pos += 1
+                self._array = None if self._streamed() else []
+                self.document = self._array
+                self._state = _FIRST_ITEM
+            else:
+                self.document = self._decode()
+                self._state = _END
+        elif state == _FIRST_KEY:
+            if self._peek() == u"}":
+                self._pos += 1
+                self._state = _END
+            else:
+                self._state = _KEY
+        elif state == _KEY:
+            if self._peek() != u'"':
+                raise ValueError("Expecting property name at position {}".format(self._pos))
+            self._key = self._decode()
+            self._state = _COLON
+        elif state == _COLON:
+            self._expect(u":")
+            self._state = _MEMBER
+        elif state == _MEMBER:
+            if self._peek() == u"[":
+                self._pos += 1
+                self._in_member = True
+                if self._streamed():
+                    self._array = None
+                else:
+                    self._array = self.document[self._key] = []
+                self._state = _FIRST_ITEM
+            else:
+                self.document[self._key] = self._decode()
+                self._state = _MEMBER_SEP
+        elif state == _MEMBER_SEP:
+            self._state = _KEY if self._expect(u",}") == u"," else _END
+        elif state == _FIRST_ITEM:
+            if self._peek() == u"]":
+                self._pos += 1
+                self._close_array()
+            else:
+                self._state = _ITEM
+        elif state == _ITEM:
+            item = self._decode()
+            if self._array is None:
+                self.pending.append(item)
+            else:
+                self._array.append(item)
+            self._state = _ITEM_SEP
+        elif state == _ITEM_SEP:
+            if self._expect(u",]") == u",":
+                self._state = _ITEM
+            else:
+                self._close_array()
+        else:
+            if self._peek():
+                raise ValueError("Extra data at position {}".format(self._pos))
+            return False
+        return True
+
+    def _close_array(self):
+        # type: () -> None
+        self._array = None
+        self._state = _MEMBER_SEP if self._in_member else _END
+        self._in_member = False
+
+
+def _local_name(tag):
+    # type: (str) -> str
+    return tag.rsplit("}", 1)[-1]
+
+
+class _XmlStreamDecoder(object):
+    """Push XML decoder.
+
+    :param str items: Tag of the elements to stream. Streamed elements are removed from
+     the document once complete.
+    :param bool stream_items: If False, nothing is streamed and the whole document is built.
+    """
+
+    def __init__(self, items=None, stream_items=True):
+        # type: (Optional[str], bool) -> None
+        self._items = items if stream_items else None
+        self._parser = ET.XMLPullParser(events=("start", "end"))  # nosec
+        self._stack = []  # type: list
+        self._in_item = 0
+        self.pending = collections.deque()  # type: collections.deque
+        self.document = None  # type: Any
+
+    def feed(self, data):
+        # type: (bytes) -> None
+        self._parser.feed(data)
+        self._run()
+
+    def close(self):
+        # type: () -> None
+        self._parser.close()
+        self._run()
+
+    def _run(self):
+        # type: () -> None
+        for event, element in self._parser.read_events():
+            is_item = self._items is not None and _local_name(element.tag) == self._items
+            if event == "start":
+                if self.document is None:
+                    self.document = element
+                self._stack.append(element)
+                if is_item:
+                    self._in_item += 1
+                continue
+            self._stack.pop()
+            if is_item:
+                self._in_item -= 1
+                if not self._in_item:
+                    if self._stack:
+                        self._stack[-1].remove(element)
+                    self.pending.append(element)
+
+
+class _TextStreamDecoder(object):
+    def __init__(self, items=None, stream_items=True):  # pylint: disable=unused-argument
+        self._text_decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        self._parts = []  # type: list
+        self.pending = collections.deque()  # type: collections.deque
+        self.document = None  # type: Optional[str]
+
+    def feed(self, data):
+        # type: (bytes) -> None
+        self._parts.append(self._text_decoder.decode(data))
+
+    def close(self):
+        # type: () -> None
+        self._parts.append(self._text_decoder.decode(b"", True))
+        self.document = u"".join(self._parts)
+
+
+def _get_decoder(mime_type, items=None, stream_items=True):
+    # type: (Optional[str], Optional[str], bool) -> Any
+    if mime_type is None:
+        return _TextStreamDecoder()
+    if _JSON_REGEXP.match(mime_type):
+        return _JsonStreamDecoder(items, stream_items)
+    if "xml" in mime_type:
+        if not hasattr(ET, "XMLPullParser"):
+            raise DecodeError("Incremental XML decoding requires Python 3.4 or later")
+        return _XmlStreamDecoder(items, stream_items)
+    if mime_type.startswith("text/"):
+        return _TextStreamDecoder()
+    raise DecodeError("Cannot deserialize content-type: {}".format(mime_type))
+
+
+class _BodyDecoder(object):
+    """Front of the decoders, which chooses one once the body starts.
+
+    An empty body decodes to None. A body with an XML content type which does not start
+    with a tag is decoded as JSON: the service may send a JSON error with the wrong content type.
+    """
+
+    def __init__(self, mime_type, items=None, stream_items=True):
+        # type: (Optional[str], Optional[str], bool) -> None
+        self._mime_type = mime_type
+        self._items = items
+        self._stream_items = stream_items
+        self._head = b""
+        self._decoder = None  # type: Any
+        self.pending = collections.deque()  # type: collections.deque
+
+    @property
+    def document(self):
+        # type: () -> Any
+        return self._decoder.document if self._decoder else None
+
+    def feed(self, data):
+        # type: (bytes) -> None
+        if self._decoder is not None:
+            self._decoder.feed(data)
+            return
+        self._head += data
+        if not self._head:
+            return
+        mime_type = self._mime_type
+        if mime_type and "xml" in mime_type:
+            start = self._head.lstrip(codecs.BOM_UTF8).lstrip()
+            if not start:
+                return
+            if not start.startswith(b"<"):
+                mime_type = "application/json"
+        self._start(mime_type)
+
+    def _start(self, mime_type):
+        # type: (Optional[str]) -> None
+        self._decoder = _get_decoder(mime_type, self._items, self._stream_items)
+        self.pending = self._decoder.pending
+        head, self._head = self._head, b""
+        self._decoder.feed(head)
+
+    def close(self):
+        # type: () -> None
+        if self._decoder is None:
+            if not self._head:
+                return
+            # Only whitespace
+            self._start(self._mime_type)
+        self._decoder.close()
+
+
+def _decode_error(mime_type, err, response):
+    # type: (Optional[str], Exception, Any) -> DecodeError
+    kind = "XML" if mime_type and "xml" in mime_type else "JSON"
+    return DecodeError(message="{} is invalid: {}".format(kind, err), response=response, error=err)
+
+
+def _iter_chunks(data):
+    # type: (Union[Iterable[bytes], IO]) -> Iterator[bytes]
+    if hasattr(data, "read"):
+        while True:
+            chunk = data.read(_READ_SIZE)  # type: ignore
+            if not chunk:
+                return
+            yield chunk
+    else:
+        for chunk in data:  # type: ignore
+            yield chunk
+
+
+class StreamedItems(object):
+    """Iterates lazily over the elements of a list response, decoding the body as it is read.
+
+    Once the iteration is over, "document" contains the rest of the response: for JSON, the
+    top level object without the streamed array (next link, etc.); for XML, the root element
+    without the streamed elements.
+
+    :param data: The body, as an iterable of bytes or a file-like object.
+    :param str mime_type: The mime type of the body.
+    :param str items: For JSON, the name of the top level member holding the array. If omitted,
+     the body must be an array. For XML, the tag of the elements to yield.
+    :param response: If passed, exceptions will be annotated with that response.
+    """
+
+    def __init__(self, data, mime_type, items=None, response=None):
+        # type: (Union[Iterable[bytes], IO], str, Optional[str], Any) -> None
+        self._chunks = _iter_chunks(data)
+        self._mime_type = mime_type
+        self._response = response
+        self._decoder = _BodyDecoder(mime_type, items)
+        self._closed = False
+
+    @property
+    def document(self):
+        # type: () -> Any
+        return self._decoder.document
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        decoder = self._decoder
+        while not decoder.pending:
+            if self._closed:
+                raise StopIteration()
+            try:
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    self._closed = True
+                    decoder.close()
+                else:
+                    decoder.feed(chunk)
+            except (ValueError, ET.ParseError) as err:
+                raise _decode_error(self._mime_type, err, self._response)
+        return decoder.pending.popleft()
+    next = __next__  # Python 2 compatibility.
+
+
+def deserialize_from_stream(data, mime_type=None, response=None):
+    # type: (Union[Iterable[bytes], IO], Optional[str], Any) -> Any
+    decoder = _BodyDecoder(mime_type, stream_items=False)
+    try:
+        for chunk in _iter_chunks(data):
+            decoder.feed(chunk)
+        decoder.close()
+    except (ValueError, ET.ParseError) as err:
+        raise _decode_error(mime_type, err, response)
+    return decoder.document
@@ -0,0 +1,103 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+import xml.etree.ElementTree as ET
+from typing import Any, AsyncIterable, AsyncIterator, MutableMapping, Optional  # pylint: disable=unused-import
+
+from ._stream_decode import _BodyDecoder, _decode_error
+
+
+class AsyncStreamedItems(AsyncIterator):
+    """Iterates lazily over the elements of a list response, decoding the body as it is read.
+
+    Once the iteration is over, "document" contains the rest of the response: for JSON, the
+    top level object without the streamed array (next link, etc.); for XML, the root element
+    without the streamed elements.
+
+    :param data: The body, as an async iterable of bytes.
+    :param str mime_type: The mime type of the body.
+    :param str items: For JSON, the name of the top level member holding the array. If omitted,
+     the body must be an array. For XML, the tag of the elements to yield.
+    :param response: If passed, exceptions will be annotated with that response.
+    """
+
+    def __init__(
+            self,
+            data: AsyncIterable[bytes],
+            mime_type: str,
+            items: Optional[str] = None,
+            response: Any = None
+    ) -> None:
+        self._chunks = data.__aiter__()
+        self._mime_type = mime_type
+        self._response = response
+        self._decoder = _BodyDecoder(mime_type, items)
+        self._closed = False
+
+    @property
+    def document(self) -> Any:
+        return self._decoder.document
+
+    async def __anext__(self):
+        decoder = self._decoder
+        while not decoder.pending:
+            if self._closed:
+                raise StopAsyncIteration()
+            try:
+                try:
+                    chunk = await self._chunks.__anext__()
+                except StopAsyncIteration:
+                    self._closed = True
+                    decoder.close()
+                else:
+                    decoder.feed(chunk)
+            except (ValueError, ET.ParseError) as err:
+                raise _decode_error(self._mime_type, err, self._response)
+        return decoder.pending.popleft()
+
+
+async def deserialize_from_async_stream(
+        data: AsyncIterable[bytes],
+        mime_type: Optional[str] = None,
+        response: Any = None
+) -> Any:
+    decoder = _BodyDecoder(mime_type, stream_items=False)
+    try:
+        async for chunk in data:
+            decoder.feed(chunk)
+        decoder.close()
+    except (ValueError, ET.ParseError) as err:
+        raise _decode_error(mime_type, err, response)
+    return decoder.document
+
+
+async def set_deserialized_data(
+        context: MutableMapping[str, Any],
+        name: str,
+        data: AsyncIterable[bytes],
+        mime_type: Optional[str],
+        response: Any
+) -> None:
+    context[name] = await deserialize_from_async_stream(data, mime_type, response)
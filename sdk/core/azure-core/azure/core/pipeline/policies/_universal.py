@@ -36,7 +36,7 @@ import types
 import re
 import uuid
 from typing import (Mapping, IO, TypeVar, TYPE_CHECKING, Type, cast, List, Callable, Iterator, # pylint: disable=unused-import
-                    Any, Union, Dict, Optional, AnyStr)
+                    Any, Union, Dict, Optional, AnyStr, Iterable)
 from six.moves import urllib
 
 from azure.core import __version__  as azcore_version
@@ -47,8 +47,10 @@ from azure.core.exceptions import (
 
 from azure.core.pipeline import PipelineRequest, PipelineResponse
 from ._base import SansIOHTTPPolicy
+from ._stream_decode import StreamedItems, deserialize_from_stream
 
 if TYPE_CHECKING:
+    from typing import AsyncIterable  # pylint: disable=ungrouped-imports
     from azure.core.pipeline.transport import HttpResponse, AsyncHttpResponse
 
 _LOGGER = logging.getLogger(__name__)
@@ -440,6 +442,16 @@ class HttpLoggingPolicy(SansIOHTTPPolicy):
 class ContentDecodePolicy(SansIOHTTPPolicy):
     """Policy for decoding unstreamed response content.
 
+    If the "stream_decode" option is True for a call, the body is not loaded in memory, but
+    decoded as it is read from the connection (arrays are decoded one element at a time).
+    This is only supported for JSON, XML and text content, and ignores "response_encoding".
+
+    If the "stream_decode_items" option is set, the body is not even decoded by the policy:
+    the deserialized data is an iterator over the elements of a list, decoded from the connection
+    as the iteration goes (see "iter_items_from_stream"). The option is the name of the top level
+    JSON member holding the array (True if the body is an array), or the tag of the XML elements.
+    The caller must iterate over the elements before the response is closed.
+
     :param response_encoding: The encoding to use if known for this service (will disable auto-detection)
     :type response_encoding: str
     """
@@ -525,6 +537,68 @@ class ContentDecodePolicy(SansIOHTTPPolicy):
             return data_as_str
         raise DecodeError("Cannot deserialize content-type: {}".format(mime_type))
 
+    @classmethod
+    def deserialize_from_stream(
+        cls,  # type: Type[ContentDecodePolicyType]
+        data,  # type: Union[Iterable[bytes], IO, AsyncIterable[bytes]]
+        mime_type=None,  # type: Optional[str]
+        response=None  # type: Optional[Union[HttpResponse, AsyncHttpResponse]]
+    ):
+        """Decode response data according to content-type, reading it chunk by chunk.
+
+        Neither the whole body nor its decoded text is kept in memory. If data is an async
+        iterable (like the result of "stream_download" on an async response), returns an awaitable.
+
+        :param data: The body, as an iterable of bytes or a file-like object.
+        :param str mime_type: The mime type. As mime type, charset is not expected.
+        :param response: If passed, exception will be annotated with that response
+        :raises ~azure.core.exceptions.DecodeError: If deserialization fails
+        :returns: A dict or XML tree, depending of the mime_type
+        """
+        if hasattr(data, '__aiter__'):
+            from ._stream_decode_async import deserialize_from_async_stream
+            return deserialize_from_async_stream(data, mime_type, response)  # type: ignore
+        return deserialize_from_stream(data, mime_type, response)  # type: ignore
+
+    @classmethod
+    def iter_items_from_stream(
+        cls,  # type: Type[ContentDecodePolicyType]
+        data,  # type: Union[Iterable[bytes], IO, AsyncIterable[bytes]]
+        mime_type,  # type: str
+        items=None,  # type: Optional[str]
+        response=None  # type: Optional[Union[HttpResponse, AsyncHttpResponse]]
+    ):
+        """Iterate lazily over the elements of a list, decoding the body as it is read.
+
+        Only the element being decoded is held in memory. Once the iteration is over, the
+        "document" attribute of the returned iterator contains the rest of the response
+        (like the link to the next page). If data is an async iterable, returns an async iterator.
+
+        :param data: The body, as an iterable of bytes or a file-like object.
+        :param str mime_type: The mime type. As mime type, charset is not expected.
+        :param str items: For JSON, the name of the top level member holding the array. If omitted,
+         the body must be an array. For XML, the tag of the elements to yield.
+        :param response: If passed, exception will be annotated with that response
+        :raises ~azure.core.exceptions.DecodeError: If deserialization fails
+        :returns: An iterator of dict or XML elements, depending of the mime_type
+        """
+        if hasattr(data, '__aiter__'):
+            from ._stream_decode_async import AsyncStreamedItems
+            return AsyncStreamedItems(data, mime_type, items, response)  # type: ignore
+        return StreamedItems(data, mime_type, items, response)  # type: ignore
+
+    @staticmethod
+    def _get_mime_type(response):
+        # type: (Union[HttpResponse, AsyncHttpResponse]) -> str
+        # Try to use content-type from headers if available
+        if response.content_type:
+            return response.content_type.split(";")[0].strip().lower()
+        # Ouch, this server did not declare what it sent...
+        # Let's guess it's JSON...
+        # Also, since Autorest was considering that an empty body was a valid JSON,
+        # need that test as well....
+        return "application/json"
+
     @classmethod
     def deserialize_from_http_generics(
         cls,  # type: Type[ContentDecodePolicyType]
@@ -540,15 +614,7 @@ class ContentDecodePolicy(SansIOHTTPPolicy):
         :raises ~azure.core.exceptions.DecodeError: If deserialization fails
         :returns: A dict or XML tree, depending of the mime-type
         """
-        # Try to use content-type from headers if available
-        if response.content_type:
-            mime_type = response.content_type.split(";")[0].strip().lower()
-        # Ouch, this server did not declare what it sent...
-        # Let's guess it's JSON...
-        # Also, since Autorest was considering that an empty body was a valid JSON,
-        # need that test as well....
-        else:
-            mime_type = "application/json"
+        mime_type = cls._get_mime_type(response)
 
         # Rely on transport implementation to give me "text()" decoded correctly
         return cls.deserialize_from_text(response.text(encoding), mime_type, response=response)
@@ -559,6 +625,13 @@ class ContentDecodePolicy(SansIOHTTPPolicy):
         response_encoding = options.pop("response_encoding", self._response_encoding)
         if response_encoding:
             request.context["response_encoding"] = response_encoding
+        items = options.pop("stream_decode_items", None)
+        if options.pop("stream_decode", False) or items is not None:
+            # The transport must not load the body, it will be decoded from the connection
+            options["stream"] = True
+            request.context["stream_decode"] = True
+            if items is not None:
+                request.context["stream_decode_items"] = None if items is True else items
 
     def on_response(self,
         request, # type: PipelineRequest[HTTPRequestType]
@@ -581,9 +654,12 @@ class ContentDecodePolicy(SansIOHTTPPolicy):
         :raises xml.etree.ElementTree.ParseError: If bytes is not valid XML
         :raises ~azure.core.exceptions.DecodeError: If deserialization fails
         """
+        if request.context.get("stream_decode"):
+            return self._deserialize_from_connection(request, response)
+
         # If response was asked as stream, do NOT read anything and quit now
         if response.context.options.get("stream", True):
-            return
+            return None
 
         response_encoding = request.context.get('response_encoding')
 
@@ -591,6 +667,34 @@ class ContentDecodePolicy(SansIOHTTPPolicy):
             response.http_response,
             response_encoding
         )
+        return None
+
+    def _deserialize_from_connection(self, request, response):
+        # type: (PipelineRequest, PipelineResponse) -> Any
+        http_response = response.http_response
+        mime_type = self._get_mime_type(http_response)
+        # Resuming an interrupted download goes straight through the transport
+        transport = request.context.transport
+        is_async = hasattr(transport, "__aenter__")
+        if is_async:
+            from azure.core.pipeline import AsyncPipeline
+            data = http_response.stream_download(AsyncPipeline(transport))
+        else:
+            from azure.core.pipeline import Pipeline
+            data = http_response.stream_download(Pipeline(transport))
+        if "stream_decode_items" in request.context:
+            response.context[self.CONTEXT_NAME] = self.iter_items_from_stream(
+                data,
+                mime_type,
+                items=request.context["stream_decode_items"],
+                response=http_response
+            )
+            return None
+        if is_async:
+            from ._stream_decode_async import set_deserialized_data
+            return set_deserialized_data(response.context, self.CONTEXT_NAME, data, mime_type, http_response)
+        response.context[self.CONTEXT_NAME] = self.deserialize_from_stream(data, mime_type, response=http_response)
+        return None
 
 
 class ProxyPolicy(SansIOHTTPPolicy):
@@ -26,6 +26,7 @@
 
 from ._base import HttpTransport, HttpRequest, HttpResponse
 from ._requests_basic import RequestsTransport, RequestsTransportResponse
+from ._requests_pool import RequestsConnectionPool, ConnectionPoolStatistics
 
 __all__ = [
     'HttpTransport',
@@ -33,10 +34,21 @@ __all__ = [
     'HttpResponse',
     'RequestsTransport',
     'RequestsTransportResponse',
+    'RequestsConnectionPool',
+    'ConnectionPoolStatistics',
 ]
 
 #pylint: disable=unused-import
 
+try:
+    from ._httpx import HttpxTransport, HttpxTransportResponse
+    __all__.extend([
+        'HttpxTransport',
+        'HttpxTransportResponse',
+    ])
+except (ImportError, SyntaxError):
+    pass  # httpx not installed
+
 try:
     from ._base_async import AsyncHttpTransport, AsyncHttpResponse
     from ._requests_asyncio import AsyncioRequestsTransport, AsyncioRequestsTransportResponse
@@ -64,5 +76,14 @@ try:
         ])
     except ImportError:
         pass  # Aiohttp not installed
+
+    try:
+        from ._httpx_async import AsyncHttpxTransport, AsyncHttpxTransportResponse
+        __all__.extend([
+            'AsyncHttpxTransport',
+            'AsyncHttpxTransportResponse',
+        ])
+    except ImportError:
+        pass  # httpx not installed
 except (ImportError, SyntaxError):
     pass  # Asynchronous pipelines not supported.
@@ -27,6 +27,7 @@ from typing import Any, Optional, AsyncIterator as AsyncIteratorType
 from collections.abc import AsyncIterator
 
 import logging
+import time
 import asyncio
 import aiohttp
 
@@ -35,10 +36,10 @@ from requests.exceptions import (
     StreamConsumedError)
 
 from azure.core.configuration import ConnectionConfiguration
-from azure.core.exceptions import ServiceRequestError, ServiceResponseError
+from azure.core.exceptions import HttpResponseError, ServiceRequestError, ServiceResponseError
 from azure.core.pipeline import Pipeline
 
-from ._base import HttpRequest
+from ._base import HttpRequest, _DownloadResumer
 from ._base_async import (
     AsyncHttpTransport,
     AsyncHttpResponse,
@@ -59,6 +60,9 @@ class AioHttpTransport(AsyncHttpTransport):
     :param bool session_owner: Session owner. Defaults True.
 
     :keyword bool use_env_settings: Uses proxy settings from environment. Defaults to True.
+    :keyword instrumentation: Record the phases of the requests ("dns" and "connect" for new
+     connections, if the session is created by the transport, "ttfb" and "body").
+    :paramtype instrumentation: ~azure.core.pipeline.PipelineInstrumentation
 
     .. admonition:: Example:
 
@@ -75,6 +79,7 @@ class AioHttpTransport(AsyncHttpTransport):
         self.session = session
         self.connection_config = ConnectionConfiguration(**kwargs)
         self._use_env_settings = kwargs.pop('use_env_settings', True)
+        self._instrumentation = kwargs.pop('instrumentation', None)
 
     async def __aenter__(self):
         await self.open()
@@ -88,14 +93,42 @@ class AioHttpTransport(AsyncHttpTransport):
         """
         if not self.session and self._session_owner:
             jar = aiohttp.DummyCookieJar()
+            clientsession_kwargs = {}
+            if self._instrumentation:
+                clientsession_kwargs['trace_configs'] = [self._build_trace_config()]
             self.session = aiohttp.ClientSession(
                 loop=self._loop,
                 trust_env=self._use_env_settings,
-                cookie_jar=jar
+                cookie_jar=jar,
+                **clientsession_kwargs
             )
         if self.session is not None:
             await self.session.__aenter__()
 
+    def _build_trace_config(self):
+        """Trace configuration recording the DNS resolution and connection times."""
+        instrumentation = self._instrumentation
+        phase_metric = instrumentation.TRANSPORT_PHASE
+        trace_config = aiohttp.TraceConfig()
+
+        def on_start(name):
+            async def callback(_, trace_config_ctx, __):
+                setattr(trace_config_ctx, name, time.time())
+            return callback
+
+        def on_end(name, phase):
+            async def callback(_, trace_config_ctx, __):
+                start = getattr(trace_config_ctx, name, None)
+                if start is not None:
+                    instrumentation.observe(phase_metric, time.time() - start, phase=phase)
+            return callback
+
+        trace_config.on_dns_resolvehost_start.append(on_start('dns_start'))
+        trace_config.on_dns_resolvehost_end.append(on_end('dns_start', 'dns'))
+        trace_config.on_connection_create_start.append(on_start('connect_start'))
+        trace_config.on_connection_create_end.append(on_end('connect_start', 'connect'))
+        return trace_config
+
     async def close(self):
         """Closes the connection.
         """
@@ -173,6 +206,7 @@ class AioHttpTransport(AsyncHttpTransport):
             timeout = config.pop('connection_timeout', self.connection_config.timeout)
             read_timeout = config.pop('read_timeout', self.connection_config.read_timeout)
             socket_timeout = aiohttp.ClientTimeout(sock_connect=timeout, sock_read=read_timeout)
+            start = time.time()
             result = await self.session.request(
                 request.method,
                 request.url,
@@ -183,8 +217,17 @@ class AioHttpTransport(AsyncHttpTransport):
                 **config
             )
             response = AioHttpTransportResponse(request, result, self.connection_config.data_block_size)
+            if self._instrumentation:
+                headers_received = time.time()
+                self._instrumentation.observe(
+                    self._instrumentation.TRANSPORT_PHASE, headers_received - start, phase="ttfb"
+                )
             if not stream_response:
                 await response.load_body()
+                if self._instrumentation:
+                    self._instrumentation.observe(
+                        self._instrumentation.TRANSPORT_PHASE, time.time() - headers_received, phase="body"
+                    )
         except aiohttp.client_exceptions.ClientResponseError as err:
             raise ServiceResponseError(err, error=err) from err
         except aiohttp.client_exceptions.ClientError as err:
@@ -197,6 +240,10 @@ class AioHttpTransport(AsyncHttpTransport):
 class AioHttpStreamDownloadGenerator(AsyncIterator):
     """Streams the response body data.
 
+    If the connection fails, the download is resumed with a range request for the rest of
+    the body, pinned to the ETag of the response. Attempts and backoff are configured by the
+    "retry_read" and "retry_backoff_*" settings of the RetryPolicy of the pipeline.
+
     :param pipeline: The pipeline object
     :param response: The client response object.
     :param block_size: block size of data sent over connection.
@@ -209,40 +256,33 @@ class AioHttpStreamDownloadGenerator(AsyncIterator):
         self.block_size = response.block_size
         self.content_length = int(response.internal_response.headers.get('Content-Length', 0))
         self.downloaded = 0
+        self._resumer = _DownloadResumer(pipeline, response)
 
     def __len__(self):
         return self.content_length
 
     async def __anext__(self):
-        retry_active = True
-        retry_total = 3
-        retry_interval = 1000
-        while retry_active:
+        while True:
             try:
                 chunk = await self.response.internal_response.content.read(self.block_size)
                 if not chunk:
                     raise _ResponseStopIteration()
-                self.downloaded += self.block_size
+                self.downloaded += len(chunk)
+                self._resumer.received()
                 return chunk
             except _ResponseStopIteration:
                 self.response.internal_response.close()
                 raise StopAsyncIteration()
-            except (ChunkedEncodingError, ConnectionError):
-                retry_total -= 1
-                if retry_total <= 0:
-                    retry_active = False
-                else:
-                    await asyncio.sleep(retry_interval)
-                    headers = {'range': 'bytes=' + str(self.downloaded) + '-'}
-                    resp = await self.pipeline.run(self.request, stream=True, headers=headers)
-                    if resp.http_response.status_code == 416:
-                        raise
-                    chunk = await self.response.internal_response.content.read(self.block_size)
-                    if not chunk:
-                        raise StopAsyncIteration()
-                    self.downloaded += len(chunk)
-                    return chunk
-                continue
+            except (ChunkedEncodingError, ConnectionError,
+                    aiohttp.ClientPayloadError, aiohttp.ClientConnectionError):
+                self.response.internal_response.close()
+                delay = self._resumer.next_delay()
+                if delay is None:
+                    raise
+                _LOGGER.warning("Connection error during download, resuming after %d bytes", self.downloaded)
+                await asyncio.sleep(delay)
+                if not await self._resume():
+                    raise
             except StreamConsumedError:
                 raise
             except Exception as err:
@@ -250,6 +290,21 @@ class AioHttpStreamDownloadGenerator(AsyncIterator):
                 self.response.internal_response.close()
                 raise
 
+    async def _resume(self):
+        request = self._resumer.resume_request(self.downloaded)
+        response = (await self.pipeline.run(request, stream=True)).http_response
+        try:
+            resumed = self._resumer.check_response(response, self.downloaded)
+        except HttpResponseError:
+            response.internal_response.close()
+            raise
+        if not resumed:
+            response.internal_response.close()
+            return False
+        self.response = response
+        return True
+
+
 class AioHttpTransportResponse(AsyncHttpResponse):
     """Methods for accessing response body data.
 
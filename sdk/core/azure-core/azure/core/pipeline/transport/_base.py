@@ -25,16 +25,13 @@
 # --------------------------------------------------------------------------
 from __future__ import absolute_import
 import abc
-from email.message import Message
-
-try:
-    from email import message_from_bytes as message_parser
-except ImportError:  # 2.7
-    from email import message_from_string as message_parser  # type: ignore
-from io import BytesIO
+from io import BytesIO, UnsupportedOperation, SEEK_CUR
 import json
 import logging
+import mmap
 import os
+import re
+from stat import S_ISREG
 import time
 import copy
 
@@ -65,6 +62,7 @@ from typing import (
 
 from six.moves.http_client import HTTPConnection, HTTPResponse as _HTTPResponse
 
+from azure.core.exceptions import HttpResponseError, ResourceModifiedError
 from azure.core.pipeline import (
     ABC,
     AbstractContextManager,
@@ -73,6 +71,7 @@ from azure.core.pipeline import (
     PipelineContext,
 )
 from .._tools import await_result as _await_result
+from . import _multipart
 
 
 if TYPE_CHECKING:
@@ -111,6 +110,131 @@ def _case_insensitive_dict(*args, **kwargs):
         )
 
 
+def _map_file(stream, length=None):
+    # type: (IO, Optional[int]) -> Optional[memoryview]
+    """Memory-map a region of a file, starting at its current position.
+
+    The mapping is read-only and exposed as a memoryview, so it can be sliced and sent by
+    the transports without copying the file in memory. The position of the stream is not
+    modified.
+
+    :param stream: An open file object, with a file descriptor.
+    :param int length: The number of bytes to map. Defaults to the rest of the file.
+    :return: The memoryview, or None if the stream can't be mapped.
+    :rtype: memoryview
+    """
+    # Vendored as "map_stream" by the azure-storage packages, which support older azure-core versions
+    try:
+        fileno = stream.fileno()
+        position = stream.tell()
+        stat = os.fstat(fileno)
+    except (AttributeError, UnsupportedOperation, OSError, ValueError):
+        return None
+    if not S_ISREG(stat.st_mode):  # pipes, sockets, etc. can't be mapped
+        return None
+    size = stat.st_size
+    available = max(size - position, 0)
+    length = available if length is None else min(length, available)
+    if length <= 0:
+        return memoryview(b"")
+    # Offsets of mappings must be aligned on the allocation granularity
+    aligned = position - position % mmap.ALLOCATIONGRANULARITY
+    try:
+        mapped = mmap.mmap(fileno, length + position - aligned, access=mmap.ACCESS_READ, offset=aligned)
+        return memoryview(mapped)[position - aligned:]
+    except (mmap.error, ValueError, OverflowError, TypeError):  # type: ignore
+        return None
+
+
+_CONTENT_RANGE = re.compile(r"bytes (\d+)-(\d+)/")
+
+
+class _DownloadResumer(object):
+    """Resume a streamed download with a range request, after the connection failed.
+
+    Only the downloads of GET requests are resumed: the range request is built from the method,
+    URL and headers of the request, without its body.
+
+    The range starts after the bytes already returned to the caller ("downloaded"), so that
+    nothing is downloaded twice. Range requests are pinned to the ETag of the first response
+    with If-Match: if the resource was modified, ResourceModifiedError is raised rather than
+    mixing two versions of it. The number of consecutive attempts and the backoff between
+    them come from the RetryPolicy of the pipeline ("retry_read", "retry_backoff_factor" and
+    "retry_backoff_max"), or its defaults.
+
+    :param pipeline: The pipeline that sent the request.
+    :param response: The first response.
+    :type response: ~azure.core.pipeline.transport.HttpResponse
+    """
+
+    def __init__(self, pipeline, response):
+        # type: (Any, Any) -> None
+        from azure.core.pipeline.policies import RetryPolicy  # Circular import
+
+        self.request = response.request
+        etag = response.headers.get("ETag")
+        self._etag = etag if etag and not etag.startswith("W/") else None
+        # Offsets can't be computed on a body decompressed by the transport
+        encoding = response.headers.get("Content-Encoding")
+        self._resumable = (not encoding or encoding == "identity") and self.request.method.upper() == "GET"
+        self._start, self._end = 0, None  # type: int, Optional[int]
+        match = _CONTENT_RANGE.match(response.headers.get("Content-Range") or "")
+        if match:
+            self._start, self._end = int(match.group(1)), int(match.group(2))
+        policies = getattr(pipeline, "_impl_policies", [])
+        self._policy = next((p for p in policies if isinstance(p, RetryPolicy)), None) or RetryPolicy()
+        self._settings = self._policy.configure_retries({})
+        self._attempts = self._settings["read"]
+
+    def next_delay(self):
+        # type: () -> Optional[float]
+        """Count an attempt to resume.
+
+        :return: The delay in seconds before the attempt, None if the download can't be resumed.
+        """
+        if not self._resumable or self._attempts <= 0:
+            return None
+        self._attempts -= 1
+        self._settings["history"].append(None)
+        return self._policy.get_backoff_time(self._settings)
+
+    def received(self):
+        # type: () -> None
+        """Data was received, the next errors are counted from scratch."""
+        if self._settings["history"]:
+            self._settings["history"] = []
+            self._attempts = self._settings["read"]
+
+    def resume_request(self, downloaded):
+        # type: (int) -> HttpRequest
+        """Build the range request for the rest of the body."""
+        request = self.request.__class__(self.request.method, self.request.url, headers=self.request.headers)
+        request.headers["Range"] = "bytes={}-{}".format(
+            self._start + downloaded, "" if self._end is None else self._end
+        )
+        if self._etag:
+            request.headers["If-Match"] = self._etag
+        return request
+
+    def check_response(self, response, downloaded):
+        # type: (Any, int) -> bool
+        """Check that the response to the range request continues the download.
+
+        :return: False if the range is not satisfiable (416), the connection error should be raised.
+        :raises ~azure.core.exceptions.HttpResponseError: If the download can't be resumed.
+        """
+        if response.status_code == 206 or (response.status_code == 200 and self._start + downloaded == 0):
+            return True
+        if response.status_code == 416:
+            return False
+        if response.status_code == 412:
+            raise ResourceModifiedError(
+                message="The resource was modified during the download (ETag {})".format(self._etag),
+                response=response
+            )
+        raise HttpResponseError(message="Unable to resume the download", response=response)
+
+
 def _format_url_section(template, **kwargs):
     """String format the template with the kwargs, auto-skip sections of the template that are NOT in the kwargs.
 
@@ -170,6 +294,10 @@ class _HTTPSerializer(HTTPConnection, object):
 
 
 def _serialize_request(http_request):
+    if _multipart.can_serialize_body(http_request.body):
+        return _multipart.serialize_request(
+            http_request.method, http_request.url, http_request.headers, http_request.body
+        )
     serializer = _HTTPSerializer()
     serializer.request(
         method=http_request.method,
@@ -186,6 +314,10 @@ class HttpTransport(
     """An http sender ABC.
     """
 
+    #: Whether "send" can be called from several threads at once
+    #: (hedged requests of the sync RetryPolicy are only sent on such transports).
+    thread_safe = False
+
     @abc.abstractmethod
     def send(self, request, **kwargs):
         # type: (HTTPRequestType, Any) -> HTTPResponseType
@@ -317,8 +449,10 @@ class HttpRequest(object):
     def set_streamed_data_body(self, data):
         """Set a streamable data body.
 
+        Bytes-like objects (like memoryview) are given as-is to the transport, without copy.
+
         :param data: The request field data.
-        :type data: stream or generator or asyncgenerator
+        :type data: stream or generator or asyncgenerator or memoryview
         """
         if not isinstance(data, binary_type) and not any(
             hasattr(data, attr) for attr in ["read", "__iter__", "__aiter__"]
@@ -390,7 +524,8 @@ class HttpRequest(object):
     def set_bytes_body(self, data):
         """Set generic bytes as the body of the request.
 
-        Will set content-length.
+        Will set content-length. Bytes-like objects (bytearray, memoryview, mmap)
+        are given as-is to the transport, without copy.
 
         :param data: The request field data.
         :type data: bytes
@@ -400,6 +535,37 @@ class HttpRequest(object):
         self.data = data
         self.files = None
 
+    def set_file_body(self, stream, length=None):
+        # type: (IO, Optional[int]) -> None
+        """Set a region of a file as the body of the request, starting at its current position.
+
+        The region is memory-mapped and sent by the transport without being read in memory
+        or copied. The buffer of a BytesIO is shared too (it can't be resized while shared), other
+        streams that can't be mapped are read. The position of the stream is moved to the end of
+        the region, like a read would.
+
+        Will set content-length.
+
+        :param stream: A file opened in binary mode.
+        :param int length: The number of bytes to send. Defaults to the rest of the file.
+        """
+        data = _map_file(stream, length)
+        if data is None:
+            getbuffer = getattr(stream, "getbuffer", None)  # BytesIO can be shared without copy
+            if getbuffer is not None:
+                position = stream.tell()
+                data = getbuffer()[position:]
+                if length is not None:
+                    data = data[:length]
+            else:
+                data = stream.read() if length is None else stream.read(length)
+                self.set_bytes_body(data)
+                return
+        stream.seek(len(data), SEEK_CUR)
+        self.headers["Content-Length"] = str(len(data))
+        self.data = data
+        self.files = None
+
     def set_multipart_mixed(self, *requests, **kwargs):
         # type: (HttpRequest, Any) -> None
         """Set the part of a multipart/mixed.
@@ -443,47 +609,23 @@ class HttpRequest(object):
         requests = self.multipart_mixed_info[0]  # type: List[HttpRequest]
         boundary = self.multipart_mixed_info[2]  # type: Optional[str]
 
-        # Update the main request with the body
-        main_message = Message()
-        main_message.add_header("Content-Type", "multipart/mixed")
-        if boundary:
-            main_message.set_boundary(boundary)
-
+        boundary = boundary or _multipart.make_boundary()
+        parts = []
         for req in requests:
-            part_message = Message()
             if req.multipart_mixed_info:
                 content_index = req.prepare_multipart_body(content_index=content_index)
-                part_message.add_header("Content-Type", req.headers['Content-Type'])
-                payload = req.serialize()
-                # We need to remove the ~HTTP/1.1 prefix along with the added content-length
-                payload = payload[payload.index(b'--'):]
+                headers = [("Content-Type", req.headers["Content-Type"])]
             else:
-                part_message.add_header("Content-Type", "application/http")
-                part_message.add_header("Content-Transfer-Encoding", "binary")
-                part_message.add_header("Content-ID", str(content_index))
-                payload = req.serialize()
+                headers = [
+                    ("Content-Type", "application/http"),
+                    ("Content-Transfer-Encoding", "binary"),
+                    ("Content-ID", str(content_index)),
+                ]
                 content_index += 1
-            part_message.set_payload(payload)
-            main_message.attach(part_message)
+            parts.append((headers, req.body if req.multipart_mixed_info else req.serialize()))
 
-        try:
-            from email.policy import HTTP
-
-            full_message = main_message.as_bytes(policy=HTTP)
-            eol = b"\r\n"
-        except ImportError:  # Python 2.7
-            # Right now we decide to not support Python 2.7 on serialization, since
-            # it doesn't serialize a valid HTTP request (and our main scenario Storage refuses it)
-            raise NotImplementedError(
-                "Multipart request are not supported on Python 2.7"
-            )
-            # full_message = main_message.as_string()
-            # eol = b'\n'
-        _, _, body = full_message.split(eol, 2)
-        self.set_bytes_body(body)
-        self.headers["Content-Type"] = (
-            "multipart/mixed; boundary=" + main_message.get_boundary()
-        )
+        self.set_bytes_body(_multipart.build_multipart_body(parts, boundary))
+        self.headers["Content-Type"] = "multipart/mixed; boundary=" + boundary
         return content_index
 
     def serialize(self):
@@ -535,24 +677,26 @@ class _HttpResponseBase(object):
             encoding = "utf-8-sig"
         return self.body().decode(encoding)
 
-    def _decode_parts(self, message, http_response_type, requests):
-        # type: (Message, Type[_HttpResponseBase], List[HttpRequest]) -> List[HttpResponse]
-        """Rebuild an HTTP response from pure string."""
+    def _decode_parts(self, body, boundary, http_response_type, requests):
+        # type: (bytes, str, Type[_HttpResponseBase], List[HttpRequest]) -> List[HttpResponse]
+        """Rebuild the HTTP responses of a multipart body."""
         responses = []
-        for index, raw_reponse in enumerate(message.get_payload()):
-            content_type = raw_reponse.get_content_type()
+        for index, (headers, payload) in enumerate(_multipart.iter_parts(body, boundary)):
+            content_type, part_boundary = _multipart.get_content_type(headers)
             if content_type == "application/http":
                 responses.append(
                     _deserialize_response(
-                        raw_reponse.get_payload(decode=True),
+                        payload,
                         requests[index],
                         http_response_type=http_response_type,
                     )
                 )
-            elif content_type == "multipart/mixed" and requests[index].multipart_mixed_info:
+            elif content_type == "multipart/mixed" and part_boundary and requests[index].multipart_mixed_info:
                 # The message batch contains one or more change sets
                 changeset_requests = requests[index].multipart_mixed_info[0]  # type: ignore
-                changeset_responses = self._decode_parts(raw_reponse, http_response_type, changeset_requests)
+                changeset_responses = self._decode_parts(
+                    payload, part_boundary, http_response_type, changeset_requests
+                )
                 responses.extend(changeset_responses)
             else:
                 raise ValueError(
@@ -570,17 +714,11 @@ class _HttpResponseBase(object):
         if http_response_type is None:
             http_response_type = HttpClientTransportResponse
 
-        body_as_bytes = self.body()
-        # In order to use email.message parser, I need full HTTP bytes. Faking something to make the parser happy
-        http_body = (
-            b"Content-Type: "
-            + self.content_type.encode("ascii")
-            + b"\r\n\r\n"
-            + body_as_bytes
-        )
-        message = message_parser(http_body)  # type: Message
+        boundary = _multipart.get_boundary(self.content_type)
+        if not boundary:
+            raise ValueError("Multipart response has no boundary")
         requests = self.request.multipart_mixed_info[0]  # type: List[HttpRequest]
-        return self._decode_parts(message, http_response_type, requests)
+        return self._decode_parts(self.body(), boundary, http_response_type, requests)
 
 
 class HttpResponse(_HttpResponseBase):  # pylint: disable=abstract-method
@@ -680,6 +818,10 @@ class BytesIOSocket(object):
 def _deserialize_response(
     http_response_as_bytes, http_request, http_response_type=HttpClientTransportResponse
 ):
+    response = _multipart.parse_response(http_response_as_bytes, http_request.method)
+    if response is not None:
+        return http_response_type(http_request, response)
+    # Transfer-encoded response, let http.client decode it
     local_socket = BytesIOSocket(http_response_as_bytes)
     response = _HTTPResponse(local_socket, method=http_request.method)
     response.begin()
@@ -0,0 +1,65 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""Responses served by the CachingPolicy."""
+from typing import TYPE_CHECKING
+
+from ._base import HttpResponse, _case_insensitive_dict
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import
+    from typing import Any, Iterator, Optional
+    from azure.core.pipeline.policies import CachedResponse
+    from ._base import HttpRequest
+
+
+class CachedHttpResponse(HttpResponse):
+    """A response served from the cache.
+
+    :param HttpRequest request: The request.
+    :param CachedResponse cached: The stored response.
+    """
+
+    def __init__(self, request, cached, block_size=None):
+        # type: (HttpRequest, CachedResponse, Optional[int]) -> None
+        super(CachedHttpResponse, self).__init__(request, None, block_size=block_size)
+        self.status_code = cached.status_code
+        self.headers = _case_insensitive_dict(cached.headers)
+        self.reason = cached.reason
+        self.content_type = self.headers.get("Content-Type")
+        self._body = cached.body
+
+    def body(self):
+        # type: () -> bytes
+        return self._body
+
+    def _iter_body(self):
+        # type: () -> Iterator[bytes]
+        for start in range(0, len(self._body), self.block_size):
+            yield self._body[start:start + self.block_size]
+
+    def stream_download(self, pipeline):
+        # type: (Any) -> Iterator[bytes]
+        return self._iter_body()
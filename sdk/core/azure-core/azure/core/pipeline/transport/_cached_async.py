@@ -0,0 +1,61 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""Responses served by the AsyncCachingPolicy."""
+from typing import TYPE_CHECKING, AsyncIterator, Optional
+
+from ._base import _case_insensitive_dict
+from ._base_async import AsyncHttpResponse
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import
+    from azure.core.pipeline.policies import CachedResponse
+    from ._base import HttpRequest
+
+
+class AsyncCachedHttpResponse(AsyncHttpResponse):
+    """A response served from the cache.
+
+    :param HttpRequest request: The request.
+    :param CachedResponse cached: The stored response.
+    """
+
+    def __init__(self, request: "HttpRequest", cached: "CachedResponse", block_size: Optional[int] = None) -> None:
+        super(AsyncCachedHttpResponse, self).__init__(request, None, block_size=block_size)
+        self.status_code = cached.status_code
+        self.headers = _case_insensitive_dict(cached.headers)
+        self.reason = cached.reason
+        self.content_type = self.headers.get("Content-Type")
+        self._body = cached.body
+
+    def body(self) -> bytes:
+        return self._body
+
+    async def _iter_body(self) -> AsyncIterator[bytes]:
+        for start in range(0, len(self._body), self.block_size):
+            yield self._body[start:start + self.block_size]
+
+    def stream_download(self, pipeline) -> AsyncIterator[bytes]:
+        return self._iter_body()
@@ -0,0 +1,334 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+import functools
+import logging
+import threading
+import time
+from http.cookiejar import CookieJar, DefaultCookiePolicy
+from typing import Any, Dict, Iterator, Optional, TypeVar, Union  # pylint: disable=unused-import
+
+import httpx
+
+from azure.core.configuration import ConnectionConfiguration
+from azure.core.exceptions import (
+    HttpResponseError,
+    ServiceRequestError,
+    ServiceResponseError
+)
+from ._base import (
+    HttpRequest,
+    HttpTransport,
+    HttpResponse,
+    _DownloadResumer,
+    _HttpResponseBase
+)
+
+PipelineType = TypeVar("PipelineType")
+
+_LOGGER = logging.getLogger(__name__)
+
+# Errors raised once the request may have been received by the service
+_RESPONSE_ERRORS = (httpx.ReadError, httpx.ReadTimeout, httpx.RemoteProtocolError)
+
+
+def _no_cookies():
+    # type: () -> CookieJar
+    """A cookie jar that never stores cookies, as the other transports."""
+    return CookieJar(policy=DefaultCookiePolicy(allowed_domains=[]))
+
+
+def _client_kwargs(transport):
+    # type: (Any) -> Dict[str, Any]
+    """Keyword arguments of httpx.Client and httpx.AsyncClient, from the transport configuration."""
+    config = transport.connection_config
+    kwargs = {
+        "http2": transport.http2,
+        "verify": config.verify,
+        "cert": config.cert,
+        "trust_env": transport._use_env_settings,  # pylint: disable=protected-access
+        "cookies": _no_cookies(),
+        "follow_redirects": False,
+    }  # type: Dict[str, Any]
+    if transport._max_connections is not None:  # pylint: disable=protected-access
+        kwargs["limits"] = httpx.Limits(max_connections=transport._max_connections)  # pylint: disable=protected-access
+    return kwargs
+
+
+def _check_client_options(config, kwargs):
+    # type: (ConnectionConfiguration, Dict[str, Any]) -> None
+    """Reject per-request options that httpx only supports on the client."""
+    for option, default in (("connection_verify", config.verify), ("connection_cert", config.cert)):
+        if option in kwargs and kwargs.pop(option) != default:
+            raise ValueError("{} can only be set when creating the httpx transport".format(option))
+    if kwargs.pop("proxies", None):
+        raise ValueError("Proxies of the httpx transport must be configured on the httpx client")
+
+
+def _get_timeout(config, kwargs):
+    # type: (ConnectionConfiguration, Dict[str, Any]) -> httpx.Timeout
+    connection_timeout = kwargs.pop("connection_timeout", config.timeout)
+    if isinstance(connection_timeout, tuple):
+        if "read_timeout" in kwargs:
+            raise ValueError("Cannot set tuple connection_timeout and read_timeout together")
+        connection_timeout, read_timeout = connection_timeout
+    else:
+        read_timeout = kwargs.pop("read_timeout", config.read_timeout)
+    return httpx.Timeout(read_timeout, connect=connection_timeout)
+
+
+def _get_content(request, block_size):
+    # type: (HttpRequest, int) -> Dict[str, Any]
+    """The body arguments of httpx build_request."""
+    data = request.data
+    if request.files:
+        return {"files": request.files, "data": data or None}
+    if data is None or isinstance(data, (bytes, str)):
+        return {"content": data}
+    if isinstance(data, dict):
+        return {"data": data}
+    if isinstance(data, (bytearray, memoryview)):
+        # httpx would iterate over the integers of a bytes-like object
+        return {"content": iter([data])}
+    if hasattr(data, "read"):
+        return {"content": iter(functools.partial(data.read, block_size), b"")}
+    return {"content": data}
+
+
+def _map_error(err):
+    # type: (httpx.HTTPError) -> Union[ServiceRequestError, ServiceResponseError]
+    if isinstance(err, _RESPONSE_ERRORS):
+        return ServiceResponseError(err, error=err)
+    return ServiceRequestError(err, error=err)
+
+
+class _HttpxTransportResponseBase(_HttpResponseBase):
+    """Base class for accessing response data.
+
+    :param HttpRequest request: The request.
+    :param httpx_response: The object returned from the HTTP library.
+    :param int block_size: Size in bytes.
+    """
+    def __init__(self, request, httpx_response, block_size=None):
+        super(_HttpxTransportResponseBase, self).__init__(request, httpx_response, block_size=block_size)
+        self.status_code = httpx_response.status_code
+        self.headers = httpx_response.headers
+        self.reason = httpx_response.reason_phrase
+        self.content_type = httpx_response.headers.get('content-type')
+
+    @property
+    def http_version(self):
+        # type: () -> str
+        """The protocol of the response, "HTTP/2" or "HTTP/1.1"."""
+        return self.internal_response.http_version
+
+
+class HttpxStreamDownloadGenerator(object):
+    """Generator for streaming response data.
+
+    If the connection fails, the download is resumed with a range request for the rest of
+    the body, pinned to the ETag of the response. Attempts and backoff are configured by the
+    "retry_read" and "retry_backoff_*" settings of the RetryPolicy of the pipeline.
+
+    :param pipeline: The pipeline object
+    :param response: The response object.
+    """
+    def __init__(self, pipeline, response):
+        self.pipeline = pipeline
+        self.request = response.request
+        self.response = response
+        self.block_size = response.block_size
+        self.iter_bytes_func = response.internal_response.iter_bytes(self.block_size)
+        self.content_length = int(response.headers.get('Content-Length', 0))
+        self.downloaded = 0
+        self._resumer = _DownloadResumer(pipeline, response)
+
+    def __len__(self):
+        return self.content_length
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            try:
+                chunk = next(self.iter_bytes_func)
+                if not chunk:
+                    raise StopIteration()
+                self.downloaded += len(chunk)
+                self._resumer.received()
+                return chunk
+            except StopIteration:
+                self.response.internal_response.close()
+                raise StopIteration()
+            except httpx.TransportError:
+                self.response.internal_response.close()
+                delay = self._resumer.next_delay()
+                if delay is None:
+                    raise
+                _LOGGER.warning("Connection error during download, resuming after %d bytes", self.downloaded)
+                time.sleep(delay)
+                if not self._resume():
+                    raise
+            except httpx.StreamError:
+                raise
+            except Exception as err:
+                _LOGGER.warning("Unable to stream download: %s", err)
+                self.response.internal_response.close()
+                raise
+
+    def _resume(self):
+        request = self._resumer.resume_request(self.downloaded)
+        response = self.pipeline.run(request, stream=True).http_response
+        try:
+            resumed = self._resumer.check_response(response, self.downloaded)
+        except HttpResponseError:
+            response.internal_response.close()
+            raise
+        if not resumed:
+            response.internal_response.close()
+            return False
+        self.response = response
+        self.iter_bytes_func = response.internal_response.iter_bytes(self.block_size)
+        return True
+
+
+class HttpxTransportResponse(HttpResponse, _HttpxTransportResponseBase):
+    """Streaming of data from the response.
+    """
+    def body(self):
+        # type: () -> bytes
+        return self.internal_response.read()
+
+    def stream_download(self, pipeline):
+        # type: (PipelineType) -> Iterator[bytes]
+        """Generator for streaming request body data."""
+        return HttpxStreamDownloadGenerator(pipeline, self)
+
+
+class HttpxTransport(HttpTransport):
+    """Implements an HTTP/2 capable sender with httpx.
+
+    Requests to a host that supports HTTP/2 (negotiated with ALPN over TLS) are multiplexed
+    over a few connections instead of using a connection per request in flight. Other hosts
+    are reached with HTTP/1.1. Unlike RequestsTransport, this transport can be shared by
+    several threads.
+
+    Requires the optional "httpx[http2]" package.
+
+    :keyword httpx.Client client: Client to use instead of the default one. Its own
+     verify, cert, proxy and limits settings are used.
+    :keyword bool client_owner: Decide if the client provided by user is owned by this transport. Default to True.
+    :keyword bool http2: Enable HTTP/2. Defaults to True.
+    :keyword int max_connections: Maximum number of connections of the client. Defaults to the httpx default.
+    :keyword bool use_env_settings: Uses proxy settings from environment. Defaults to True.
+    :keyword instrumentation: Record the phases of the requests ("ttfb" and "body").
+    :paramtype instrumentation: ~azure.core.pipeline.PipelineInstrumentation
+
+    .. admonition:: Example:
+
+        .. literalinclude:: ../samples/test_example_sync.py
+            :start-after: [START httpx]
+            :end-before: [END httpx]
+            :language: python
+            :dedent: 4
+            :caption: Synchronous HTTP/2 transport with httpx.
+    """
+
+    def __init__(self, **kwargs):
+        # type: (Any) -> None
+        self.client = kwargs.pop('client', None)  # type: Optional[httpx.Client]
+        self._client_owner = kwargs.pop('client_owner', True)
+        self.connection_config = ConnectionConfiguration(**kwargs)
+        self.http2 = kwargs.pop('http2', True)
+        self._max_connections = kwargs.pop('max_connections', None)
+        self._use_env_settings = kwargs.pop('use_env_settings', True)
+        self._instrumentation = kwargs.pop('instrumentation', None)
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        # type: () -> HttpxTransport
+        self.open()
+        return self
+
+    def __exit__(self, *args):  # pylint: disable=arguments-differ
+        self.close()
+
+    def open(self):
+        with self._lock:
+            if not self.client and self._client_owner:
+                self.client = httpx.Client(**_client_kwargs(self))
+
+    def close(self):
+        with self._lock:
+            if self._client_owner and self.client:
+                self.client.close()
+                self._client_owner = False
+                self.client = None
+
+    def send(self, request, **kwargs):  # type: ignore
+        # type: (HttpRequest, Any) -> HttpResponse
+        """Send request object according to configuration.
+
+        :param request: The request object to be sent.
+        :type request: ~azure.core.pipeline.transport.HttpRequest
+        :return: An HTTPResponse object.
+        :rtype: ~azure.core.pipeline.transport.HttpResponse
+
+        :keyword bool stream: Defaults to False.
+        :raises ValueError: If connection_verify, connection_cert or proxies are given per request,
+         since httpx only supports them on the client.
+        """
+        self.open()
+        stream = kwargs.pop('stream', False)
+        timeout = _get_timeout(self.connection_config, kwargs)
+        _check_client_options(self.connection_config, kwargs)
+        httpx_request = self.client.build_request(  # type: ignore
+            request.method,
+            request.url,
+            headers=request.headers,
+            timeout=timeout,
+            **_get_content(request, self.connection_config.data_block_size)
+        )
+        try:
+            start = time.time()
+            response = self.client.send(httpx_request, stream=True)  # type: ignore
+            headers_received = time.time()
+            if self._instrumentation:
+                self._instrumentation.observe(
+                    self._instrumentation.TRANSPORT_PHASE, headers_received - start, phase="ttfb"
+                )
+            if not stream:
+                try:
+                    response.read()
+                finally:
+                    response.close()
+                if self._instrumentation:
+                    self._instrumentation.observe(
+                        self._instrumentation.TRANSPORT_PHASE, time.time() - headers_received, phase="body"
+                    )
+        except httpx.HTTPError as err:
+            raise _map_error(err) from err
+        return HttpxTransportResponse(request, response, self.connection_config.data_block_size)
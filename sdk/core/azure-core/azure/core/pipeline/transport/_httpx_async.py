@@ -0,0 +1,290 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+from typing import Any, Dict, Optional, AsyncIterator as AsyncIteratorType
+from collections.abc import AsyncIterator
+
+import logging
+import time
+
+import anyio
+import httpx
+
+from azure.core.configuration import ConnectionConfiguration
+from azure.core.exceptions import HttpResponseError
+from azure.core.pipeline import Pipeline
+
+from ._base import HttpRequest, _DownloadResumer
+from ._base_async import (
+    AsyncHttpTransport,
+    AsyncHttpResponse,
+    _ResponseStopIteration)
+from ._httpx import (
+    _HttpxTransportResponseBase,
+    _check_client_options,
+    _client_kwargs,
+    _get_content,
+    _get_timeout,
+    _map_error,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def _async_chunks(data):
+    """httpx.AsyncClient only sends async iterables: wrap a sync iterable."""
+    for chunk in data:
+        yield chunk
+
+
+class AsyncHttpxTransport(AsyncHttpTransport):
+    """Asynchronous HTTP/2 capable sender with httpx.
+
+    Requests to a host that supports HTTP/2 (negotiated with ALPN over TLS) are multiplexed
+    over a few connections instead of using a connection per request in flight. Other hosts
+    are reached with HTTP/1.1. Works with asyncio and trio.
+
+    Requires the optional "httpx[http2]" package.
+
+    :keyword httpx.AsyncClient client: Client to use instead of the default one. Its own
+     verify, cert, proxy and limits settings are used.
+    :keyword bool client_owner: Decide if the client provided by user is owned by this transport. Default to True.
+    :keyword bool http2: Enable HTTP/2. Defaults to True.
+    :keyword int max_connections: Maximum number of connections of the client. Defaults to the httpx default.
+    :keyword bool use_env_settings: Uses proxy settings from environment. Defaults to True.
+    :keyword instrumentation: Record the phases of the requests ("ttfb" and "body").
+    :paramtype instrumentation: ~azure.core.pipeline.PipelineInstrumentation
+
+    .. admonition:: Example:
+
+        .. literalinclude:: ../samples/test_example_async.py
+            :start-after: [START httpx]
+            :end-before: [END httpx]
+            :language: python
+            :dedent: 4
+            :caption: Asynchronous HTTP/2 transport with httpx.
+    """
+    def __init__(self, **kwargs) -> None:
+        self.client = kwargs.pop('client', None)  # type: Optional[httpx.AsyncClient]
+        self._client_owner = kwargs.pop('client_owner', True)
+        self.connection_config = ConnectionConfiguration(**kwargs)
+        self.http2 = kwargs.pop('http2', True)
+        self._max_connections = kwargs.pop('max_connections', None)
+        self._use_env_settings = kwargs.pop('use_env_settings', True)
+        self._instrumentation = kwargs.pop('instrumentation', None)
+
+    async def __aenter__(self):
+        await self.open()
+        return self
+
+    async def __aexit__(self, *args):  # pylint: disable=arguments-differ
+        await self.close()
+
+    async def open(self):
+        """Opens the connection.
+        """
+        if not self.client and self._client_owner:
+            self.client = httpx.AsyncClient(**_client_kwargs(self))
+
+    async def close(self):
+        """Closes the connection.
+        """
+        if self._client_owner and self.client:
+            await self.client.aclose()
+            self._client_owner = False
+            self.client = None
+
+    async def sleep(self, duration):
+        await anyio.sleep(duration)
+
+    def _get_content(self, request: HttpRequest) -> Dict[str, Any]:
+        content = _get_content(request, self.connection_config.data_block_size)
+        body = content.get("content")
+        if body is not None and not isinstance(body, (bytes, str)) and not hasattr(body, "__aiter__"):
+            content["content"] = _async_chunks(body)
+        return content
+
+    async def send(self, request: HttpRequest, **config: Any) -> Optional[AsyncHttpResponse]:
+        """Send the request using this HTTP sender.
+
+        Will pre-load the body into memory to be available with a sync method.
+        Pass stream=True to avoid this behavior.
+
+        :param request: The HttpRequest object
+        :type request: ~azure.core.pipeline.transport.HttpRequest
+        :param config: Any keyword arguments
+        :return: The AsyncHttpResponse
+        :rtype: ~azure.core.pipeline.transport.AsyncHttpResponse
+
+        :keyword bool stream: Defaults to False.
+        :raises ValueError: If connection_verify, connection_cert or proxies are given per request,
+         since httpx only supports them on the client.
+        """
+        await self.open()
+        stream_response = config.pop("stream", False)
+        timeout = _get_timeout(self.connection_config, config)
+        _check_client_options(self.connection_config, config)
+        httpx_request = self.client.build_request(
+            request.method,
+            request.url,
+            headers=request.headers,
+            timeout=timeout,
+            **self._get_content(request)
+        )
+        try:
+            start = time.time()
+            result = await self.client.send(httpx_request, stream=True)
+            response = AsyncHttpxTransportResponse(request, result, self.connection_config.data_block_size)
+            headers_received = time.time()
+            if self._instrumentation:
+                self._instrumentation.observe(
+                    self._instrumentation.TRANSPORT_PHASE, headers_received - start, phase="ttfb"
+                )
+            if not stream_response:
+                await response.load_body()
+                if self._instrumentation:
+                    self._instrumentation.observe(
+                        self._instrumentation.TRANSPORT_PHASE, time.time() - headers_received, phase="body"
+                    )
+        except httpx.HTTPError as err:
+            raise _map_error(err) from err
+        return response
+
+
+class AsyncHttpxStreamDownloadGenerator(AsyncIterator):
+    """Streams the response body data.
+
+    If the connection fails, the download is resumed with a range request for the rest of
+    the body, pinned to the ETag of the response. Attempts and backoff are configured by the
+    "retry_read" and "retry_backoff_*" settings of the RetryPolicy of the pipeline.
+
+    :param pipeline: The pipeline object
+    :param response: The response object.
+    """
+    def __init__(self, pipeline: Pipeline, response: AsyncHttpResponse) -> None:
+        self.pipeline = pipeline
+        self.request = response.request
+        self.response = response
+        self.block_size = response.block_size
+        self.iter_bytes_func = response.internal_response.aiter_bytes(self.block_size)
+        self.content_length = int(response.headers.get('Content-Length', 0))
+        self.downloaded = 0
+        self._resumer = _DownloadResumer(pipeline, response)
+
+    def __len__(self):
+        return self.content_length
+
+    async def __anext__(self):
+        while True:
+            try:
+                try:
+                    chunk = await self.iter_bytes_func.__anext__()
+                except StopAsyncIteration:
+                    raise _ResponseStopIteration()
+                if not chunk:
+                    raise _ResponseStopIteration()
+                self.downloaded += len(chunk)
+                self._resumer.received()
+                return chunk
+            except _ResponseStopIteration:
+                await self.response.internal_response.aclose()
+                raise StopAsyncIteration()
+            except httpx.TransportError:
+                await self.response.internal_response.aclose()
+                delay = self._resumer.next_delay()
+                if delay is None:
+                    raise
+                _LOGGER.warning("Connection error during download, resuming after %d bytes", self.downloaded)
+                await self.pipeline._transport.sleep(delay)  # pylint: disable=protected-access
+                if not await self._resume():
+                    raise
+            except httpx.StreamError:
+                raise
+            except Exception as err:
+                _LOGGER.warning("Unable to stream download: %s", err)
+                await self.response.internal_response.aclose()
+                raise
+
+    async def _resume(self):
+        request = self._resumer.resume_request(self.downloaded)
+        response = (await self.pipeline.run(request, stream=True)).http_response
+        try:
+            resumed = self._resumer.check_response(response, self.downloaded)
+        except HttpResponseError:
+            await response.internal_response.aclose()
+            raise
+        if not resumed:
+            await response.internal_response.aclose()
+            return False
+        self.response = response
+        self.iter_bytes_func = response.internal_response.aiter_bytes(self.block_size)
+        return True
+
+
+class AsyncHttpxTransportResponse(_HttpxTransportResponseBase, AsyncHttpResponse):
+    """Methods for accessing response body data.
+
+    :param request: The HttpRequest object
+    :type request: ~azure.core.pipeline.transport.HttpRequest
+    :param httpx_response: Returned from httpx.AsyncClient.send().
+    :type httpx_response: httpx.Response
+    :param block_size: block size of data sent over connection.
+    :type block_size: int
+    """
+    def __init__(self, request: HttpRequest, httpx_response: httpx.Response, block_size=None) -> None:
+        super(AsyncHttpxTransportResponse, self).__init__(request, httpx_response, block_size=block_size)
+        self._body = None
+
+    def body(self) -> bytes:
+        """Return the whole body as bytes in memory.
+        """
+        if self._body is None:
+            raise ValueError("Body is not available. Call async method load_body, or do your call with stream=False.")
+        return self._body
+
+    async def load_body(self) -> None:
+        """Load in memory the body, so it could be accessible from sync methods."""
+        try:
+            self._body = await self.internal_response.aread()
+        finally:
+            await self.internal_response.aclose()
+
+    def stream_download(self, pipeline) -> AsyncIteratorType[bytes]:
+        """Generator for streaming response body data.
+
+        :param pipeline: The pipeline object
+        :type pipeline: azure.core.pipeline
+        """
+        return AsyncHttpxStreamDownloadGenerator(pipeline, self)
+
+    def __getstate__(self):
+        # Be sure body is loaded in memory, otherwise not pickable and let it throw
+        self.body()
+
+        state = self.__dict__.copy()
+        # Remove the unpicklable entries.
+        state['internal_response'] = None
+        state['headers'] = dict(self.headers)
+        return state
@@ -0,0 +1,323 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""multipart/mixed batch codec.
+
+Batch bodies are written and read directly as bytes: requests are serialized
+into a single buffer, and responses are split on the boundary and parsed without
+going through the email package or http.client.
+"""
+import uuid
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union  # pylint: disable=unused-import
+
+import six
+
+_CRLF = b"\r\n"
+_METHODS_EXPECTING_BODY = frozenset(["PATCH", "POST", "PUT"])
+# Headers the stdlib HTTPConnection would add, that a batch sub-request must not carry
+_SKIPPED_HEADERS = frozenset(["Host", "Accept-Encoding"])
+# What may follow a boundary on a delimiter line: "--" for the close delimiter, or padding
+_DELIMITER_ENDS = (b"", b"-", b"\r", b"\n", b" ", b"\t")
+
+
+def _to_bytes(value, encoding="latin-1"):
+    # type: (Any, str) -> bytes
+    if isinstance(value, six.binary_type):
+        return value
+    if isinstance(value, six.text_type):
+        return value.encode(encoding)
+    return str(value).encode(encoding)
+
+
+def _check_line(value):
+    # type: (bytes) -> bytes
+    if b"\n" in value or b"\r" in value:
+        raise ValueError("Invalid line break in serialized HTTP request: {!r}".format(value))
+    return value
+
+
+def make_boundary():
+    # type: () -> str
+    """Return a new random boundary.
+
+    :rtype: str
+    """
+    return "batch_{}".format(uuid.uuid4())
+
+
+def can_serialize_body(body):
+    # type: (Any) -> bool
+    """Whether "serialize_request" supports this body.
+
+    Streams and iterables are not supported, since the whole part must be in memory.
+    """
+    return body is None or isinstance(body, (six.binary_type, six.text_type, bytearray, memoryview))
+
+
+def serialize_request(method, url, headers, body=None):
+    # type: (str, str, Any, Optional[Union[bytes, str]]) -> bytes
+    """Serialize a request as an application/http part payload.
+
+    Output is the same as the one of the stdlib HTTPConnection (without the Host and
+    Accept-Encoding headers): Content-Length is added if it is not set, and if the
+    request has a body or the method expects one.
+
+    :param str method: The HTTP method.
+    :param str url: The URL, as it should appear on the request line.
+    :param headers: The headers, as a mapping.
+    :param body: The body, as bytes or text (encoded to latin-1).
+    :rtype: bytes
+    :raises ValueError: If the request line or a header contains a line break.
+    """
+    if isinstance(body, six.text_type):
+        body = body.encode("latin-1")
+    elif body is not None and not isinstance(body, six.binary_type):
+        body = memoryview(body).tobytes()
+    lines = [_check_line(_to_bytes(method, "ascii") + b" " + _to_bytes(url, "ascii") + b" HTTP/1.1")]
+    header_names = frozenset(name.lower() for name in headers)
+    if "content-length" not in header_names and "transfer-encoding" not in header_names:
+        if body is not None:
+            lines.append(b"Content-Length: " + str(len(body)).encode("ascii"))
+        elif method.upper() in _METHODS_EXPECTING_BODY:
+            lines.append(b"Content-Length: 0")
+    for name, value in headers.items():
+        if name in _SKIPPED_HEADERS:
+            continue
+        lines.append(_check_line(_to_bytes(name, "ascii") + b": " + _to_bytes(value)))
+    lines.append(_CRLF)
+    if body is not None:
+        lines[-1] += body
+    return _CRLF.join(lines)
+
+
+def build_multipart_body(parts, boundary):
+    # type: (List[Tuple[List[Tuple[str, str]], bytes]], str) -> bytes
+    """Build a multipart/mixed body.
+
+    :param parts: The parts, as a list of (headers, payload) where headers is a list of
+     (name, value) tuples.
+    :param str boundary: The boundary. It must not appear in any payload.
+    :rtype: bytes
+    """
+    delimiter = b"--" + _to_bytes(boundary, "ascii")
+    chunks = []  # type: List[Any]
+    for headers, payload in parts:
+        chunks.append(delimiter)
+        chunks.append(_CRLF)
+        for name, value in headers:
+            chunks.append(_check_line(_to_bytes(name, "ascii") + b": " + _to_bytes(value)))
+            chunks.append(_CRLF)
+        chunks.append(_CRLF)
+        chunks.append(payload)
+        chunks.append(_CRLF)
+    chunks.append(delimiter)
+    chunks.append(b"--\r\n")
+    return b"".join(chunks)
+
+
+def get_boundary(content_type):
+    # type: (str) -> Optional[str]
+    """Return the boundary parameter of a Content-Type header value, or None.
+
+    :param str content_type: The Content-Type header value.
+    :rtype: str
+    """
+    for param in content_type.split(";")[1:]:
+        name, _, value = param.partition("=")
+        if name.strip().lower() == "boundary":
+            value = value.strip()
+            if len(value) > 1 and value[0] == value[-1] == '"':
+                value = value[1:-1]
+            return value or None
+    return None
+
+
+def _find_delimiter(body, delimiter, start):
+    # type: (bytes, bytes, int) -> int
+    """Index of the next delimiter line at or after start, or -1."""
+    while True:
+        index = body.find(delimiter, start)
+        if index < 0:
+            return -1
+        end = index + len(delimiter)
+        at_line_start = index == 0 or body[index - 1:index] == b"\n"
+        if at_line_start and body[end:end + 1] in _DELIMITER_ENDS:
+            return index
+        start = index + 1
+
+
+def _parse_headers(lines):
+    # type: (List[bytes]) -> List[Tuple[str, str]]
+    headers = []  # type: List[Tuple[str, str]]
+    for line in lines:
+        if line[:1] in (b" ", b"\t") and headers:
+            # Obsolete line folding
+            name, value = headers[-1]
+            headers[-1] = (name, value + " " + line.strip().decode("latin-1"))
+            continue
+        name, sep, value = line.partition(b":")
+        if not sep:
+            raise ValueError("Invalid header line in multipart body: {!r}".format(line))
+        headers.append((name.strip().decode("latin-1"), value.strip().decode("latin-1")))
+    return headers
+
+
+def _split_head(data, start=0, length=None):
+    # type: (bytes, int, Optional[int]) -> Tuple[List[bytes], int]
+    """Read header lines from start up to the first empty line, or up to length.
+
+    Accepts both CRLF and LF line endings. Return the lines, and the index just after the
+    empty line (or length).
+    """
+    lines = []
+    pos = start
+    if length is None:
+        length = len(data)
+    while pos < length:
+        end = data.find(b"\n", pos, length)
+        if end < 0:
+            end = length
+        line = data[pos:end]
+        pos = end + 1
+        if line.endswith(b"\r"):
+            line = line[:-1]
+        if not line:
+            return lines, min(pos, length)
+        lines.append(line)
+    return lines, length
+
+
+def iter_parts(body, boundary):
+    # type: (bytes, str) -> Iterator[Tuple[List[Tuple[str, str]], bytes]]
+    """Split a multipart body, yielding the parts lazily.
+
+    Preamble and epilogue are ignored, and the line break before a delimiter belongs
+    to the delimiter (RFC 2046). Line endings may be either CRLF or LF.
+
+    :param bytes body: The multipart body.
+    :param str boundary: The boundary.
+    :return: An iterator of (headers, payload) where headers is a list of (name, value) tuples.
+    :raises ValueError: If a part header is invalid.
+    """
+    delimiter = b"--" + _to_bytes(boundary, "ascii")
+    index = _find_delimiter(body, delimiter, 0)
+    while index >= 0:
+        after = index + len(delimiter)
+        if body[after:after + 2] == b"--":
+            return
+        line_end = body.find(b"\n", after)
+        if line_end < 0:
+            return
+        start = line_end + 1
+        index = _find_delimiter(body, delimiter, start)
+        end = len(body) if index < 0 else index
+        if index >= 0 and body[end - 1:end] == b"\n":
+            end -= 1
+            if end > start and body[end - 1:end] == b"\r":
+                end -= 1
+        lines, payload_start = _split_head(body, start, end)
+        yield _parse_headers(lines), body[payload_start:end]
+
+
+def get_content_type(headers):
+    # type: (List[Tuple[str, str]]) -> Tuple[str, Optional[str]]
+    """Return the lower case mime type of a part, and its boundary if any.
+
+    As in the email package, a part without Content-Type is text/plain.
+    """
+    for name, value in headers:
+        if name.lower() == "content-type":
+            return value.split(";", 1)[0].strip().lower(), get_boundary(value)
+    return "text/plain", None
+
+
+class BytesHTTPResponse(object):
+    """A parsed application/http part, with the subset of the http.client response API
+    used by HttpClientTransportResponse.
+
+    :param int status: The status code.
+    :param str reason: The reason phrase.
+    :param headers: The headers, as a list of (name, value) tuples.
+    :param bytes body: The body.
+    """
+
+    def __init__(self, status, reason, headers, body):
+        # type: (int, str, List[Tuple[str, str]], bytes) -> None
+        self.status = status
+        self.reason = reason
+        self.version = 11
+        self._headers = headers
+        self._body = body
+
+    def getheaders(self):
+        # type: () -> List[Tuple[str, str]]
+        return list(self._headers)
+
+    def getheader(self, name, default=None):
+        # type: (str, Optional[str]) -> Optional[str]
+        values = [value for key, value in self._headers if key.lower() == name.lower()]
+        return ", ".join(values) if values else default
+
+    def read(self, amt=None):
+        # type: (Optional[int]) -> bytes
+        if amt is None:
+            data, self._body = self._body, b""
+        else:
+            data, self._body = self._body[:amt], self._body[amt:]
+        return data
+
+
+def parse_response(data, method=None):
+    # type: (bytes, Optional[str]) -> Optional[BytesHTTPResponse]
+    """Parse an application/http part payload.
+
+    Return None if the response uses a transfer encoding, which this parser does not decode.
+
+    :param bytes data: The payload.
+    :param str method: The method of the request, a HEAD response having no body.
+    :rtype: BytesHTTPResponse
+    :raises ValueError: If the status line is invalid.
+    """
+    lines, body_start = _split_head(data)
+    if not lines:
+        raise ValueError("Empty HTTP response in multipart body")
+    status_line = lines[0].split(None, 2)
+    if len(status_line) < 2 or not status_line[0].startswith(b"HTTP/") or not status_line[1].isdigit():
+        raise ValueError("Invalid HTTP status line in multipart body: {!r}".format(lines[0]))
+    status = int(status_line[1])
+    reason = status_line[2].strip().decode("latin-1") if len(status_line) > 2 else ""
+    headers = _parse_headers(lines[1:])
+
+    length = None  # type: Optional[int]
+    for name, value in headers:
+        name = name.lower()
+        if name == "transfer-encoding":
+            return None
+        if name == "content-length" and value.isdigit():
+            length = int(value)
+    if status in (204, 304) or 100 <= status < 200 or (method and method.upper() == "HEAD"):
+        length = 0
+    body = data[body_start:] if length is None else data[body_start:body_start + length]
+    return BytesHTTPResponse(status, reason, headers, body)
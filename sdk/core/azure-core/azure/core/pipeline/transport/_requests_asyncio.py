@@ -33,11 +33,12 @@ import urllib3 # type: ignore
 import requests
 
 from azure.core.exceptions import (
+    HttpResponseError,
     ServiceRequestError,
     ServiceResponseError
 )
 from azure.core.pipeline import Pipeline
-from ._base import HttpRequest
+from ._base import HttpRequest, _DownloadResumer
 from ._base_async import (
     AsyncHttpResponse,
     _ResponseStopIteration,
@@ -136,6 +137,10 @@ class AsyncioRequestsTransport(RequestsAsyncTransportBase):
 class AsyncioStreamDownloadGenerator(AsyncIterator):
     """Streams the response body data.
 
+    If the connection fails, the download is resumed with a range request for the rest of
+    the body, pinned to the ETag of the response. Attempts and backoff are configured by the
+    "retry_read" and "retry_backoff_*" settings of the RetryPolicy of the pipeline.
+
     :param pipeline: The pipeline object
     :param response: The response object.
     :param generator iter_content_func: Iterator for response data.
@@ -149,16 +154,14 @@ class AsyncioStreamDownloadGenerator(AsyncIterator):
         self.iter_content_func = self.response.internal_response.iter_content(self.block_size)
         self.content_length = int(response.headers.get('Content-Length', 0))
         self.downloaded = 0
+        self._resumer = _DownloadResumer(pipeline, response)
 
     def __len__(self):
         return self.content_length
 
     async def __anext__(self):
         loop = _get_running_loop()
-        retry_active = True
-        retry_total = 3
-        retry_interval = 1000
-        while retry_active:
+        while True:
             try:
                 chunk = await loop.run_in_executor(
                     None,
@@ -167,32 +170,22 @@ class AsyncioStreamDownloadGenerator(AsyncIterator):
                 )
                 if not chunk:
                     raise _ResponseStopIteration()
-                self.downloaded += self.block_size
+                self.downloaded += len(chunk)
+                self._resumer.received()
                 return chunk
             except _ResponseStopIteration:
                 self.response.internal_response.close()
                 raise StopAsyncIteration()
             except (requests.exceptions.ChunkedEncodingError,
                     requests.exceptions.ConnectionError):
-                retry_total -= 1
-                if retry_total <= 0:
-                    retry_active = False
-                else:
-                    await asyncio.sleep(retry_interval)
-                    headers = {'range': 'bytes=' + str(self.downloaded) + '-'}
-                    resp = self.pipeline.run(self.request, stream=True, headers=headers)
-                    if resp.status_code == 416:
-                        raise
-                    chunk = await loop.run_in_executor(
-                        None,
-                        _iterate_response_content,
-                        self.iter_content_func,
-                    )
-                    if not chunk:
-                        raise StopIteration()
-                    self.downloaded += len(chunk)
-                    return chunk
-                continue
+                self.response.internal_response.close()
+                delay = self._resumer.next_delay()
+                if delay is None:
+                    raise
+                _LOGGER.warning("Connection error during download, resuming after %d bytes", self.downloaded)
+                await asyncio.sleep(delay)
+                if not await self._resume():
+                    raise
             except requests.exceptions.StreamConsumedError:
                 raise
             except Exception as err:
@@ -200,6 +193,21 @@ class AsyncioStreamDownloadGenerator(AsyncIterator):
                 self.response.internal_response.close()
                 raise
 
+    async def _resume(self):
+        request = self._resumer.resume_request(self.downloaded)
+        response = (await self.pipeline.run(request, stream=True)).http_response
+        try:
+            resumed = self._resumer.check_response(response, self.downloaded)
+        except HttpResponseError:
+            response.internal_response.close()
+            raise
+        if not resumed:
+            response.internal_response.close()
+            return False
+        self.response = response
+        self.iter_content_func = response.internal_response.iter_content(self.block_size)
+        return True
+
 
 class AsyncioRequestsTransportResponse(AsyncHttpResponse, RequestsTransportResponse): # type: ignore
     """Asynchronous streaming of data from the response.
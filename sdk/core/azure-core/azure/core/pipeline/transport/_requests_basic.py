@@ -33,6 +33,7 @@ import requests
 
 from azure.core.configuration import ConnectionConfiguration
 from azure.core.exceptions import (
+    HttpResponseError,
     ServiceRequestError,
     ServiceResponseError
 )
@@ -41,8 +42,10 @@ from . import HttpRequest # pylint: disable=unused-import
 from ._base import (
     HttpTransport,
     HttpResponse,
+    _DownloadResumer,
     _HttpResponseBase
 )
+from ._requests_pool import RequestsConnectionPool, _TimedHTTPAdapter
 
 PipelineType = TypeVar("PipelineType")
 
@@ -96,6 +99,10 @@ class _RequestsTransportResponseBase(_HttpResponseBase):
 class StreamDownloadGenerator(object):
     """Generator for streaming response data.
 
+    If the connection fails, the download is resumed with a range request for the rest of
+    the body, pinned to the ETag of the response. Attempts and backoff are configured by the
+    "retry_read" and "retry_backoff_*" settings of the RetryPolicy of the pipeline.
+
     :param pipeline: The pipeline object
     :param response: The response object.
     """
@@ -107,6 +114,7 @@ class StreamDownloadGenerator(object):
         self.iter_content_func = self.response.internal_response.iter_content(self.block_size)
         self.content_length = int(response.headers.get('Content-Length', 0))
         self.downloaded = 0
+        self._resumer = _DownloadResumer(pipeline, response)
 
     def __len__(self):
         return self.content_length
@@ -115,36 +123,27 @@ class StreamDownloadGenerator(object):
         return self
 
     def __next__(self):
-        retry_active = True
-        retry_total = 3
-        retry_interval = 1000
-        while retry_active:
+        while True:
             try:
                 chunk = next(self.iter_content_func)
                 if not chunk:
                     raise StopIteration()
-                self.downloaded += self.block_size
+                self.downloaded += len(chunk)
+                self._resumer.received()
                 return chunk
             except StopIteration:
                 self.response.internal_response.close()
                 raise StopIteration()
             except (requests.exceptions.ChunkedEncodingError,
                     requests.exceptions.ConnectionError):
-                retry_total -= 1
-                if retry_total <= 0:
-                    retry_active = False
-                else:
-                    time.sleep(retry_interval)
-                    headers = {'range': 'bytes=' + str(self.downloaded) + '-'}
-                    resp = self.pipeline.run(self.request, stream=True, headers=headers)
-                    if resp.http_response.status_code == 416:
-                        raise
-                    chunk = next(self.iter_content_func)
-                    if not chunk:
-                        raise StopIteration()
-                    self.downloaded += len(chunk)
-                    return chunk
-                continue
+                self.response.internal_response.close()
+                delay = self._resumer.next_delay()
+                if delay is None:
+                    raise
+                _LOGGER.warning("Connection error during download, resuming after %d bytes", self.downloaded)
+                time.sleep(delay)
+                if not self._resume():
+                    raise
             except requests.exceptions.StreamConsumedError:
                 raise
             except Exception as err:
@@ -153,6 +152,21 @@ class StreamDownloadGenerator(object):
                 raise
     next = __next__  # Python 2 compatibility.
 
+    def _resume(self):
+        request = self._resumer.resume_request(self.downloaded)
+        response = self.pipeline.run(request, stream=True).http_response
+        try:
+            resumed = self._resumer.check_response(response, self.downloaded)
+        except HttpResponseError:
+            response.internal_response.close()
+            raise
+        if not resumed:
+            response.internal_response.close()
+            return False
+        self.response = response
+        self.iter_content_func = response.internal_response.iter_content(self.block_size)
+        return True
+
 
 class RequestsTransportResponse(HttpResponse, _RequestsTransportResponseBase):
     """Streaming of data from the response.
@@ -168,7 +182,8 @@ class RequestsTransport(HttpTransport):
 
     Since requests team recommends to use one session per requests, you should
     not consider this class as thread-safe, since it will use one Session
-    per instance.
+    per instance. To share connections between transports used on different
+    threads, give each of them the same :class:`RequestsConnectionPool`.
 
     In this simple implementation:
     - You provide the configured session if you want to, or a basic session is created.
@@ -177,6 +192,13 @@ class RequestsTransport(HttpTransport):
     :keyword requests.Session session: Request session to use instead of the default one.
     :keyword bool session_owner: Decide if the session provided by user is owned by this transport. Default to True.
     :keyword bool use_env_settings: Uses proxy settings from environment. Defaults to True.
+    :keyword connection_pool: Connection pool to mount on the session instead of a dedicated one.
+    :paramtype connection_pool: ~azure.core.pipeline.transport.RequestsConnectionPool
+    :keyword bool use_shared_connection_pool: Use the connection pool shared by the whole process,
+     see :func:`RequestsConnectionPool.shared`. Defaults to False.
+    :keyword instrumentation: Record the phases of the requests ("connect" and "tls" for new
+     connections, unless a connection pool is given, "ttfb" and "body").
+    :paramtype instrumentation: ~azure.core.pipeline.PipelineInstrumentation
 
     .. admonition:: Example:
 
@@ -196,6 +218,20 @@ class RequestsTransport(HttpTransport):
         self._session_owner = kwargs.get('session_owner', True)
         self.connection_config = ConnectionConfiguration(**kwargs)
         self._use_env_settings = kwargs.pop('use_env_settings', True)
+        self.connection_pool = kwargs.pop('connection_pool', None)  # type: Optional[RequestsConnectionPool]
+        if not self.connection_pool and kwargs.pop('use_shared_connection_pool', False):
+            self.connection_pool = RequestsConnectionPool.shared()
+        self._instrumentation = kwargs.pop('instrumentation', None)
+
+    @property
+    def thread_safe(self):
+        # type: () -> bool
+        """Whether "send" can be called from several threads at once.
+
+        True with a connection pool, whose adapter is thread-safe: the session is then only
+        used to merge the settings of the requests.
+        """
+        return self.connection_pool is not None
 
     def __enter__(self):
         # type: () -> RequestsTransport
@@ -212,8 +248,16 @@ class RequestsTransport(HttpTransport):
         This is initialization I want to do once only on a session.
         """
         session.trust_env = self._use_env_settings
+        if self.connection_pool:
+            self.connection_pool.mount(session, self._protocols)
+            return
         disable_retries = Retry(total=False, redirect=False, raise_on_status=False)
-        adapter = requests.adapters.HTTPAdapter(max_retries=disable_retries)
+        if self._instrumentation:
+            adapter = _TimedHTTPAdapter(
+                self._instrumentation, max_retries=disable_retries
+            )  # type: requests.adapters.HTTPAdapter
+        else:
+            adapter = requests.adapters.HTTPAdapter(max_retries=disable_retries)
         for p in self._protocols:
             session.mount(p, adapter)
 
@@ -256,6 +300,11 @@ class RequestsTransport(HttpTransport):
             else:
                 read_timeout = kwargs.pop('read_timeout', self.connection_config.read_timeout)
                 timeout = (connection_timeout, read_timeout)
+            if self._instrumentation:
+                # Read the body separately, to time it
+                stream = kwargs.pop('stream', False)
+                kwargs['stream'] = True
+                start = time.time()
             response = self.session.request(  # type: ignore
                 request.method,
                 request.url,
@@ -267,6 +316,8 @@ class RequestsTransport(HttpTransport):
                 cert=kwargs.pop('connection_cert', self.connection_config.cert),
                 allow_redirects=False,
                 **kwargs)
+            if self._instrumentation:
+                self._record_phases(response, start, stream)
 
         except (urllib3.exceptions.NewConnectionError, urllib3.exceptions.ConnectTimeoutError) as err:
             error = ServiceRequestError(err, error=err)
@@ -283,3 +334,13 @@ class RequestsTransport(HttpTransport):
         if error:
             raise error
         return RequestsTransportResponse(request, response, self.connection_config.data_block_size)
+
+    def _record_phases(self, response, start, stream):
+        # type: (requests.Response, float, bool) -> None
+        """Record the time to the response headers, and read the body unless streamed."""
+        phase_metric = self._instrumentation.TRANSPORT_PHASE
+        headers_received = time.time()
+        self._instrumentation.observe(phase_metric, headers_received - start, phase="ttfb")
+        if not stream:
+            response.content  # pylint: disable=pointless-statement
+            self._instrumentation.observe(phase_metric, time.time() - headers_received, phase="body")
@@ -0,0 +1,311 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""A connection pool that can be shared by several RequestsTransport instances.
+
+A "requests.Session" is not thread-safe, but the urllib3 pool manager behind
+its HTTPAdapter is. This module provides an adapter that can be mounted on many
+sessions at once, so that every transport (and every thread) of the process
+reuses the same sockets, while each transport keeps its own session state.
+"""
+from __future__ import absolute_import
+import logging
+import threading
+import time
+from typing import Any, Dict, Optional  # pylint: disable=unused-import
+
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool  # type: ignore
+from urllib3.util.retry import Retry  # type: ignore
+import requests
+
+_LOGGER = logging.getLogger(__name__)
+
+_clock = getattr(time, "monotonic", time.time)
+
+
+class ConnectionPoolStatistics(object):
+    """Snapshot of the usage counters of a connection pool.
+
+    :ivar int hits: Number of requests served by an already opened connection.
+    :ivar int misses: Number of requests that had to open a new connection.
+    :ivar int waits: Number of requests that found every connection of the host busy.
+    :ivar float wait_time: Total time in seconds spent waiting for a connection.
+    :ivar int evictions: Number of idle connections closed because of "idle_timeout".
+    """
+
+    def __init__(self, hits=0, misses=0, waits=0, wait_time=0.0, evictions=0):
+        # type: (int, int, int, float, int) -> None
+        self.hits = hits
+        self.misses = misses
+        self.waits = waits
+        self.wait_time = wait_time
+        self.evictions = evictions
+
+    def __add__(self, other):
+        # type: (ConnectionPoolStatistics) -> ConnectionPoolStatistics
+        return ConnectionPoolStatistics(
+            self.hits + other.hits,
+            self.misses + other.misses,
+            self.waits + other.waits,
+            self.wait_time + other.wait_time,
+            self.evictions + other.evictions,
+        )
+
+    def __repr__(self):
+        return "ConnectionPoolStatistics(hits={}, misses={}, waits={}, wait_time={:.3f}, evictions={})".format(
+            self.hits, self.misses, self.waits, self.wait_time, self.evictions
+        )
+
+
+class _InstrumentedPoolMixin(object):
+    """Records hit/miss/wait statistics and evicts idle connections of a urllib3 pool.
+
+    The "_azure_pool" class attribute is set by the RequestsConnectionPool that
+    created the concrete pool class.
+    """
+
+    _azure_pool = None  # type: RequestsConnectionPool
+
+    def _get_conn(self, timeout=None):
+        exhausted = self.pool is not None and self.pool.empty()  # type: ignore
+        start = _clock()
+        conn = super(_InstrumentedPoolMixin, self)._get_conn(timeout=timeout)  # type: ignore
+        waited = _clock() - start if exhausted else 0.0
+
+        evicted = False
+        last_used = getattr(conn, "_azure_last_used", None)
+        idle_timeout = self._azure_pool.idle_timeout
+        if last_used is not None and idle_timeout is not None and _clock() - last_used > idle_timeout:
+            _LOGGER.debug("Closing connection to %s idle for more than %s seconds", self.host, idle_timeout)  # type: ignore
+            conn.close()
+            evicted = True
+        reused = last_used is not None and getattr(conn, "sock", None) is not None
+        self._azure_pool._record(self._azure_key, reused, exhausted, waited, evicted)  # pylint: disable=protected-access
+        return conn
+
+    def _put_conn(self, conn):
+        if conn is not None:
+            conn._azure_last_used = _clock()  # pylint: disable=protected-access
+        super(_InstrumentedPoolMixin, self)._put_conn(conn)  # type: ignore
+
+    @property
+    def _azure_key(self):
+        return "{}://{}:{}".format(self.scheme, self.host, self.port)  # type: ignore
+
+
+class _SharedHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter owned by a RequestsConnectionPool.
+
+    Sessions mounting this adapter do not own it: closing a session must not
+    close the sockets other sessions are still using.
+    """
+
+    def __init__(self, pool, **kwargs):
+        # type: (RequestsConnectionPool, Any) -> None
+        self._azure_pool = pool
+        self._proxy_lock = threading.Lock()
+        super(_SharedHTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        super(_SharedHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._azure_pool._pool_classes  # pylint: disable=protected-access
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        with self._proxy_lock:
+            manager = super(_SharedHTTPAdapter, self).proxy_manager_for(proxy, **proxy_kwargs)
+        if not proxy.lower().startswith("socks"):
+            manager.pool_classes_by_scheme = self._azure_pool._pool_classes  # pylint: disable=protected-access
+        return manager
+
+    def close(self):
+        """Sessions can't close a shared adapter, use RequestsConnectionPool.close instead."""
+
+    def _close(self):
+        super(_SharedHTTPAdapter, self).close()
+
+
+def _timed_pool_classes(instrumentation):
+    # type: (Any) -> Dict[str, type]
+    """urllib3 pool classes recording how long it takes to open connections.
+
+    "connect" is the time to get a connected socket (DNS and TCP, and TLS for HTTPS),
+    "tls" the time of the TLS handshake.
+    """
+    phase_metric = instrumentation.TRANSPORT_PHASE
+
+    def timed_connection(connection_cls, tls):
+        def _new_conn(self):
+            start = _clock()
+            try:
+                return connection_cls._new_conn(self)  # pylint: disable=protected-access
+            finally:
+                self._azure_socket_time = _clock() - start  # pylint: disable=protected-access
+
+        def connect(self):
+            self._azure_socket_time = None  # pylint: disable=protected-access
+            start = _clock()
+            connection_cls.connect(self)
+            elapsed = _clock() - start
+            instrumentation.observe(phase_metric, elapsed, phase="connect")
+            if tls and self._azure_socket_time is not None:  # pylint: disable=protected-access
+                instrumentation.observe(phase_metric, elapsed - self._azure_socket_time, phase="tls")
+
+        return type(connection_cls.__name__, (connection_cls,), {"_new_conn": _new_conn, "connect": connect})
+
+    return {
+        "http": type("HTTPConnectionPool", (HTTPConnectionPool,), {
+            "ConnectionCls": timed_connection(HTTPConnectionPool.ConnectionCls, False)
+        }),
+        "https": type("HTTPSConnectionPool", (HTTPSConnectionPool,), {
+            "ConnectionCls": timed_connection(HTTPSConnectionPool.ConnectionCls, True)
+        }),
+    }
+
+
+class _TimedHTTPAdapter(requests.adapters.HTTPAdapter):
+    """HTTPAdapter recording the connection phases in a PipelineInstrumentation."""
+
+    def __init__(self, instrumentation, **kwargs):
+        # type: (Any, Any) -> None
+        self._azure_pool_classes = _timed_pool_classes(instrumentation)
+        super(_TimedHTTPAdapter, self).__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):  # pylint: disable=arguments-differ
+        super(_TimedHTTPAdapter, self).init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = self._azure_pool_classes
+
+
+class RequestsConnectionPool(object):
+    """A thread-safe HTTP connection pool that can be shared by several RequestsTransport.
+
+    Every transport given the same pool keeps its own session, but all of them
+    reuse the same sockets. Use :func:`RequestsConnectionPool.shared` to get the
+    pool shared by the whole process.
+
+    :keyword int pool_connections: Number of hosts to keep a pool for. Defaults to 10.
+    :keyword int pool_maxsize: Number of connections to keep open per host. Defaults to 10.
+    :keyword bool pool_block: Whether to wait for a free connection of the host instead of
+     opening a connection that won't be kept once done. Defaults to False.
+    :keyword float idle_timeout: Close connections that stayed idle longer than this value in
+     seconds, instead of reusing them. Defaults to None (never evict).
+    """
+
+    _shared = None  # type: Optional[RequestsConnectionPool]
+    _shared_lock = threading.Lock()
+
+    def __init__(self, **kwargs):
+        # type: (Any) -> None
+        self.pool_connections = kwargs.pop("pool_connections", requests.adapters.DEFAULT_POOLSIZE)
+        self.pool_maxsize = kwargs.pop("pool_maxsize", requests.adapters.DEFAULT_POOLSIZE)
+        self.pool_block = kwargs.pop("pool_block", requests.adapters.DEFAULT_POOLBLOCK)
+        self.idle_timeout = kwargs.pop("idle_timeout", None)  # type: Optional[float]
+        self._lock = threading.Lock()
+        self._statistics = {}  # type: Dict[str, ConnectionPoolStatistics]
+        self._pool_classes = {
+            "http": type("HTTPConnectionPool", (_InstrumentedPoolMixin, HTTPConnectionPool), {"_azure_pool": self}),
+            "https": type("HTTPSConnectionPool", (_InstrumentedPoolMixin, HTTPSConnectionPool), {"_azure_pool": self}),
+        }
+        disable_retries = Retry(total=False, redirect=False, raise_on_status=False)
+        self.adapter = _SharedHTTPAdapter(
+            self,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=disable_retries,
+        )
+
+    @classmethod
+    def shared(cls, **kwargs):
+        # type: (Any) -> RequestsConnectionPool
+        """Get the pool shared by the whole process, creating it if necessary.
+
+        Keyword arguments are the ones of :class:`RequestsConnectionPool` and are only
+        used by the call that creates the pool.
+
+        :rtype: ~azure.core.pipeline.transport.RequestsConnectionPool
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls(**kwargs)
+            return cls._shared
+
+    def _record(self, key, reused, exhausted, waited, evicted):
+        # type: (str, bool, bool, float, bool) -> None
+        with self._lock:
+            stats = self._statistics.setdefault(key, ConnectionPoolStatistics())
+            if reused:
+                stats.hits += 1
+            else:
+                stats.misses += 1
+            if exhausted:
+                stats.waits += 1
+                stats.wait_time += waited
+            if evicted:
+                stats.evictions += 1
+
+    def statistics(self, host=None):
+        # type: (Optional[str]) -> ConnectionPoolStatistics
+        """Get a snapshot of the usage counters.
+
+        :param str host: Only return counters for this host, as "scheme://host:port".
+         If omitted, counters of every host are summed.
+        :rtype: ~azure.core.pipeline.transport.ConnectionPoolStatistics
+        """
+        with self._lock:
+            if host is not None:
+                return self._statistics.get(host, ConnectionPoolStatistics()) + ConnectionPoolStatistics()
+            total = ConnectionPoolStatistics()
+            for stats in self._statistics.values():
+                total += stats
+            return total
+
+    def hosts(self):
+        # type: () -> list
+        """List the hosts, as "scheme://host:port", the pool has been used for."""
+        with self._lock:
+            return list(self._statistics)
+
+    def reset_statistics(self):
+        # type: () -> None
+        """Reset every usage counter to zero."""
+        with self._lock:
+            self._statistics.clear()
+
+    def mount(self, session, protocols=("http://", "https://")):
+        # type: (requests.Session, Any) -> None
+        """Mount this pool on a requests session.
+
+        :param requests.Session session: The session to configure.
+        """
+        for protocol in protocols:
+            session.mount(protocol, self.adapter)
+
+    def close(self):
+        # type: () -> None
+        """Close every connection of the pool.
+
+        The pool can still be used afterwards, new connections are opened on demand.
+        """
+        self.adapter._close()  # pylint: disable=protected-access
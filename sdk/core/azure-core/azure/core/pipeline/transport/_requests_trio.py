@@ -33,11 +33,12 @@ import urllib3
 import requests
 
 from azure.core.exceptions import (
+    HttpResponseError,
     ServiceRequestError,
     ServiceResponseError
 )
 from azure.core.pipeline import Pipeline
-from ._base import HttpRequest
+from ._base import HttpRequest, _DownloadResumer
 from ._base_async import (
     AsyncHttpResponse,
     _ResponseStopIteration,
@@ -52,6 +53,10 @@ _LOGGER = logging.getLogger(__name__)
 class TrioStreamDownloadGenerator(AsyncIterator):
     """Generator for streaming response data.
 
+    If the connection fails, the download is resumed with a range request for the rest of
+    the body, pinned to the ETag of the response. Attempts and backoff are configured by the
+    "retry_read" and "retry_backoff_*" settings of the RetryPolicy of the pipeline.
+
     :param pipeline: The pipeline object
     :param response: The response object.
     """
@@ -63,14 +68,13 @@ class TrioStreamDownloadGenerator(AsyncIterator):
         self.iter_content_func = self.response.internal_response.iter_content(self.block_size)
         self.content_length = int(response.headers.get('Content-Length', 0))
         self.downloaded = 0
+        self._resumer = _DownloadResumer(pipeline, response)
 
     def __len__(self):
         return self.content_length
 
     async def __anext__(self):
-        retry_active = True
-        retry_total = 3
-        while retry_active:
+        while True:
             try:
                 try:
                     chunk = await trio.to_thread.run_sync(
@@ -84,37 +88,22 @@ class TrioStreamDownloadGenerator(AsyncIterator):
                     )
                 if not chunk:
                     raise _ResponseStopIteration()
-                self.downloaded += self.block_size
+                self.downloaded += len(chunk)
+                self._resumer.received()
                 return chunk
             except _ResponseStopIteration:
                 self.response.internal_response.close()
                 raise StopAsyncIteration()
             except (requests.exceptions.ChunkedEncodingError,
                     requests.exceptions.ConnectionError):
-                retry_total -= 1
-                if retry_total <= 0:
-                    retry_active = False
-                else:
-                    await trio.sleep(1000)
-                    headers = {'range': 'bytes=' + str(self.downloaded) + '-'}
-                    resp = self.pipeline.run(self.request, stream=True, headers=headers)
-                    if resp.status_code == 416:
-                        raise
-                    try:
-                        chunk = await trio.to_thread.run_sync(
-                            _iterate_response_content,
-                            self.iter_content_func,
-                        )
-                    except AttributeError:  # trio < 0.12.1
-                        chunk = await trio.run_sync_in_worker_thread(  # pylint: disable=no-member
-                            _iterate_response_content,
-                            self.iter_content_func,
-                        )
-                    if not chunk:
-                        raise StopIteration()
-                    self.downloaded += len(chunk)
-                    return chunk
-                continue
+                self.response.internal_response.close()
+                delay = self._resumer.next_delay()
+                if delay is None:
+                    raise
+                _LOGGER.warning("Connection error during download, resuming after %d bytes", self.downloaded)
+                await trio.sleep(delay)
+                if not await self._resume():
+                    raise
             except requests.exceptions.StreamConsumedError:
                 raise
             except Exception as err:
@@ -122,6 +111,21 @@ class TrioStreamDownloadGenerator(AsyncIterator):
                 self.response.internal_response.close()
                 raise
 
+    async def _resume(self):
+        request = self._resumer.resume_request(self.downloaded)
+        response = (await self.pipeline.run(request, stream=True)).http_response
+        try:
+            resumed = self._resumer.check_response(response, self.downloaded)
+        except HttpResponseError:
+            response.internal_response.close()
+            raise
+        if not resumed:
+            response.internal_response.close()
+            return False
+        self.response = response
+        self.iter_content_func = response.internal_response.iter_content(self.block_size)
+        return True
+
 class TrioRequestsTransportResponse(AsyncHttpResponse, RequestsTransportResponse):  # type: ignore
     """Asynchronous streaming of data from the response.
     """
@@ -26,10 +26,12 @@
 import sys
 
 from ._poller import LROPoller, NoPolling, PollingMethod
-__all__ = ['LROPoller', 'NoPolling', 'PollingMethod']
+from ._scheduler import LROPollScheduler
+__all__ = ['LROPoller', 'NoPolling', 'PollingMethod', 'LROPollScheduler']
 
 #pylint: disable=unused-import
 if sys.version_info >= (3, 5, 2):
     # Not executed on old Python, no syntax error
     from ._async_poller import AsyncNoPolling, AsyncPollingMethod, async_poller, AsyncLROPoller
-    __all__ += ['AsyncNoPolling', 'AsyncPollingMethod', 'async_poller', 'AsyncLROPoller']
+    from ._async_scheduler import AsyncLROPollScheduler
+    __all__ += ['AsyncNoPolling', 'AsyncPollingMethod', 'async_poller', 'AsyncLROPoller', 'AsyncLROPollScheduler']
@@ -23,10 +23,12 @@
 # IN THE SOFTWARE.
 #
 # --------------------------------------------------------------------------
+import asyncio
 from collections.abc import Awaitable
-from typing import Callable, Any, Tuple, Generic, TypeVar, Generator
+from typing import Callable, Any, Tuple, Generic, TypeVar, Generator, Optional
 
 from ._poller import NoPolling as _NoPolling
+from ._async_scheduler import AsyncLROPollScheduler
 
 
 PollingReturnType = TypeVar("PollingReturnType")
@@ -107,6 +109,9 @@ class AsyncLROPoller(Generic[PollingReturnType], Awaitable):
     :type deserialization_callback: callable or msrest.serialization.Model
     :param polling_method: The polling strategy to adopt
     :type polling_method: ~azure.core.polling.AsyncPollingMethod
+
+    If a default :class:`~azure.core.polling.AsyncLROPollScheduler` is set, and the polling method
+    supports it, the operation is polled by the scheduler instead of its own loop.
     """
 
     def __init__(
@@ -177,9 +182,41 @@ class AsyncLROPoller(Generic[PollingReturnType], Awaitable):
 
         :raises ~azure.core.exceptions.HttpResponseError: Server problem with the query.
         """
-        await self._polling_method.run()
+        scheduler = AsyncLROPollScheduler.get_default()
+        can_poll_step = getattr(self._polling_method, "_can_poll_step", None)
+        if scheduler is not None and can_poll_step and can_poll_step() and not self._polling_method.finished():
+            await self._wait_scheduled(scheduler)
+        else:
+            await self._polling_method.run()
         self._done = True
 
+    async def _wait_scheduled(self, scheduler: AsyncLROPollScheduler) -> None:
+        # pylint: disable=protected-access
+        polling_method = self._polling_method
+        completed = asyncio.get_event_loop().create_future()
+
+        async def step() -> Optional[float]:
+            if completed.done():  # Waiter was cancelled
+                return None
+            try:
+                finished = await polling_method._poll_step()  # type: ignore
+            except Exception as err:  # pylint: disable=broad-except
+                if not completed.done():  # Not cancelled during the poll
+                    completed.set_exception(err)
+                return None
+            if completed.done():
+                return None
+            if not finished:
+                return polling_method._extract_delay()  # type: ignore
+            completed.set_result(None)
+            return None
+
+        scheduler.schedule(step, polling_method._extract_delay(), completed)  # type: ignore
+        try:
+            await completed
+        finally:
+            completed.cancel()
+
     def done(self) -> bool:
         """Check status of the long running operation.
 
@@ -0,0 +1,137 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""An asyncio poll scheduler limiting the number of concurrent status requests."""
+import asyncio
+import logging
+import weakref
+from typing import Awaitable, Callable, Optional, Set  # pylint: disable=unused-import
+
+_LOGGER = logging.getLogger(__name__)
+
+AsyncPollStep = Callable[[], Awaitable[Optional[float]]]
+
+
+class AsyncLROPollScheduler(object):
+    """Drives the polling of many async long running operations.
+
+    Operations waiting for their next poll are timers of the event loop, instead of
+    coroutines sleeping in their own "run" loop, and at most "max_concurrency" status
+    requests are sent at the same time, on each event loop.
+
+    Only polling methods that support being polled one step at a time (like
+    :class:`~azure.core.polling.async_base_polling.AsyncLROBasePolling`) are scheduled,
+    other pollers keep running their own loop.
+
+    :param int max_concurrency: The maximum number of status requests in flight. Defaults to 16.
+
+    .. code-block:: python
+
+        from azure.core.polling import AsyncLROPollScheduler
+
+        AsyncLROPollScheduler.set_default(AsyncLROPollScheduler(max_concurrency=32))
+    """
+
+    _default = None  # type: Optional[AsyncLROPollScheduler]
+
+    def __init__(self, max_concurrency: int = 16) -> None:
+        self._max_concurrency = max_concurrency
+        # A semaphore belongs to the loop it was first awaited on
+        self._semaphores = weakref.WeakKeyDictionary()  # type: weakref.WeakKeyDictionary
+        self._handles = set()  # type: Set[asyncio.Handle]
+        self._running = 0
+        self._closed = False
+
+    @classmethod
+    def set_default(cls, scheduler: Optional["AsyncLROPollScheduler"]) -> None:
+        """Set the scheduler used by the async pollers of the process.
+
+        :param scheduler: The scheduler to use, or None to let every poller run its own loop again.
+        :type scheduler: ~azure.core.polling.AsyncLROPollScheduler
+        """
+        cls._default = scheduler
+
+    @classmethod
+    def get_default(cls) -> Optional["AsyncLROPollScheduler"]:
+        """Get the scheduler used by the async pollers of the process, if any.
+
+        :rtype: ~azure.core.polling.AsyncLROPollScheduler
+        """
+        return cls._default
+
+    def __len__(self) -> int:
+        """The number of operations waiting for their next poll, or being polled."""
+        return len(self._handles) + self._running
+
+    def schedule(
+        self, step: AsyncPollStep, delay: Optional[float], waiter: Optional["asyncio.Future"] = None
+    ) -> None:
+        """Await "step" in "delay" seconds, on the running event loop.
+
+        "step" returns the delay before it should be awaited again, or None once done.
+
+        :param step: The coroutine function to call.
+        :param float delay: The delay in seconds.
+        :param waiter: The future of the operation, failed with the error raised while polling, if any.
+        :type waiter: ~asyncio.Future
+        """
+        if self._closed:
+            raise ValueError("This scheduler is closed.")
+        loop = asyncio.get_event_loop()
+        handle = None  # type: Optional[asyncio.Handle]
+
+        def _start():
+            self._handles.discard(handle)
+            self._running += 1
+            asyncio.ensure_future(self._run(step, waiter))
+
+        handle = loop.call_later(delay or 0, _start)
+        self._handles.add(handle)
+
+    async def _run(self, step: AsyncPollStep, waiter: Optional["asyncio.Future"]) -> None:
+        loop = asyncio.get_event_loop()
+        semaphore = self._semaphores.get(loop)
+        if semaphore is None:
+            semaphore = self._semaphores[loop] = asyncio.Semaphore(self._max_concurrency)
+        try:
+            async with semaphore:
+                delay = await step()
+        except Exception as err:  # pylint: disable=broad-except
+            if waiter is None:
+                _LOGGER.exception("Unexpected error while polling a long running operation")
+            elif not waiter.done():
+                waiter.set_exception(err)
+            delay = None
+        finally:
+            self._running -= 1
+        if delay is not None and not self._closed:
+            self.schedule(step, delay, waiter)
+
+    def close(self) -> None:
+        """Stop polling. Operations that are still scheduled will never complete."""
+        self._closed = True
+        for handle in self._handles:
+            handle.cancel()
+        self._handles.clear()
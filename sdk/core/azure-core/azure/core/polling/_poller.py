@@ -34,6 +34,7 @@ except ImportError:
 from typing import TYPE_CHECKING, TypeVar, Generic
 from azure.core.tracing.decorator import distributed_trace
 from azure.core.tracing.common import with_current_context
+from ._scheduler import LROPollScheduler
 
 if TYPE_CHECKING:
     from typing import Any, Callable, Union, List, Optional, Tuple
@@ -149,6 +150,9 @@ class LROPoller(Generic[PollingReturnType]):
     :type deserialization_callback: callable or msrest.serialization.Model
     :param polling_method: The polling strategy to adopt
     :type polling_method: ~azure.core.polling.PollingMethod
+
+    If a default :class:`~azure.core.polling.LROPollScheduler` is set, and the polling method
+    supports it, the operation is polled by the scheduler instead of a dedicated thread.
     """
 
     def __init__(self, client, initial_response, deserialization_callback, polling_method):
@@ -168,14 +172,24 @@ class LROPoller(Generic[PollingReturnType]):
         # Prepare thread execution
         self._thread = None
         self._done = None
+        self._completed = None  # type: Optional[threading.Event]
         self._exception = None
         if not self._polling_method.finished():
             self._done = threading.Event()
-            self._thread = threading.Thread(
-                target=with_current_context(self._start),
-                name="LROPoller({})".format(uuid.uuid4()))
-            self._thread.daemon = True
-            self._thread.start()
+            scheduler = LROPollScheduler.get_default()
+            can_poll_step = getattr(self._polling_method, "_can_poll_step", None)
+            if scheduler is not None and can_poll_step and can_poll_step():
+                self._completed = threading.Event()
+                scheduler.schedule(
+                    with_current_context(self._poll_step),
+                    self._polling_method._extract_delay()  # type: ignore # pylint: disable=protected-access
+                )
+            else:
+                self._thread = threading.Thread(
+                    target=with_current_context(self._start),
+                    name="LROPoller({})".format(uuid.uuid4()))
+                self._thread.daemon = True
+                self._thread.start()
 
     def _start(self):
         """Start the long running operation.
@@ -192,6 +206,29 @@ class LROPoller(Generic[PollingReturnType]):
         finally:
             self._done.set()
 
+        self._run_callbacks()
+
+    def _poll_step(self):
+        # type: () -> Optional[float]
+        """Poll the operation once, on behalf of a LROPollScheduler.
+
+        :returns: The delay before the next step, or None if the operation is complete.
+        """
+        # pylint: disable=protected-access
+        try:
+            if not self._polling_method._poll_step():  # type: ignore
+                return self._polling_method._extract_delay()  # type: ignore
+        except Exception as err:  # pylint: disable=broad-except
+            self._exception = err
+        self._done.set()  # type: ignore
+        try:
+            self._run_callbacks()
+        finally:
+            self._completed.set()  # type: ignore
+        return None
+
+    def _run_callbacks(self):
+        # type: () -> None
         callbacks, self._callbacks = self._callbacks, []
         while callbacks:
             for call in callbacks:
@@ -253,9 +290,12 @@ class LROPoller(Generic[PollingReturnType]):
          operation to complete (in seconds).
         :raises ~azure.core.exceptions.HttpResponseError: Server problem with the query.
         """
-        if self._thread is None:
+        if self._completed is not None:
+            self._completed.wait(timeout=timeout)
+        elif self._thread is None:
             return
-        self._thread.join(timeout=timeout)
+        else:
+            self._thread.join(timeout=timeout)
         try:
             # Let's handle possible None in forgiveness here
             # https://github.com/python/mypy/issues/8165
@@ -270,6 +310,8 @@ class LROPoller(Generic[PollingReturnType]):
         :returns: 'True' if the process has completed, else 'False'.
         :rtype: bool
         """
+        if self._completed is not None:
+            return self._completed.is_set()
         return self._thread is None or not self._thread.is_alive()
 
     def add_done_callback(self, func):
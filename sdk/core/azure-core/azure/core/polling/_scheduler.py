@@ -0,0 +1,161 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""A poll scheduler driving many long running operations from a few threads."""
+import heapq
+import itertools
+import logging
+import threading
+import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # pylint: disable=unused-import
+    from typing import Callable, List, Optional, Tuple
+
+_LOGGER = logging.getLogger(__name__)
+
+_clock = getattr(time, "monotonic", time.time)
+
+
+class LROPollScheduler(object):
+    """Drives the polling of many long running operations from a small pool of threads.
+
+    Instead of one thread sleeping between two status requests per operation, operations
+    waiting for their next poll are kept in a heap ordered by deadline (from the "Retry-After"
+    of their last response). A single dispatcher thread hands the operations that are due to
+    a pool of "max_workers" threads, so the number of threads doesn't grow with the number
+    of operations in flight.
+
+    Only polling methods that support being polled one step at a time (like
+    :class:`~azure.core.polling.base_polling.LROBasePolling`) are scheduled, other pollers
+    keep using a dedicated thread.
+
+    :param int max_workers: The number of threads sending status requests. Defaults to 4.
+
+    .. code-block:: python
+
+        from azure.core.polling import LROPollScheduler
+
+        # Every LROPoller created from now on is driven by this scheduler
+        LROPollScheduler.set_default(LROPollScheduler(max_workers=8))
+    """
+
+    _default = None  # type: Optional[LROPollScheduler]
+
+    def __init__(self, max_workers=4):
+        # type: (int) -> None
+        from concurrent.futures import ThreadPoolExecutor  # Not available on Python 2.7 without "futures"
+
+        self._heap = []  # type: List[Tuple[float, int, Callable[[], Optional[float]]]]
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        self._dispatcher = None  # type: Optional[threading.Thread]
+        self._running = 0
+        self._closed = False
+
+    @classmethod
+    def set_default(cls, scheduler):
+        # type: (Optional[LROPollScheduler]) -> None
+        """Set the scheduler used by the pollers of the process.
+
+        :param scheduler: The scheduler to use, or None to use a thread per poller again.
+        :type scheduler: ~azure.core.polling.LROPollScheduler
+        """
+        cls._default = scheduler
+
+    @classmethod
+    def get_default(cls):
+        # type: () -> Optional[LROPollScheduler]
+        """Get the scheduler used by the pollers of the process, if any.
+
+        :rtype: ~azure.core.polling.LROPollScheduler
+        """
+        return cls._default
+
+    def __len__(self):
+        """The number of operations waiting for their next poll, or being polled."""
+        with self._condition:
+            return len(self._heap) + self._running
+
+    def schedule(self, step, delay):
+        # type: (Callable[[], Optional[float]], Optional[float]) -> None
+        """Call "step" in "delay" seconds.
+
+        "step" returns the delay before it should be called again, or None once done.
+
+        :param callable step: The step to call.
+        :param float delay: The delay in seconds.
+        """
+        with self._condition:
+            if self._closed:
+                raise ValueError("This scheduler is closed.")
+            heapq.heappush(self._heap, (_clock() + (delay or 0), next(self._counter), step))
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(target=self._dispatch, name="LROPollScheduler")
+                self._dispatcher.daemon = True
+                self._dispatcher.start()
+            self._condition.notify()
+
+    def _dispatch(self):
+        # type: () -> None
+        while True:
+            with self._condition:
+                while not self._closed:
+                    if self._heap:
+                        timeout = self._heap[0][0] - _clock()
+                        if timeout <= 0:
+                            break
+                    else:
+                        timeout = None
+                    self._condition.wait(timeout)
+                if self._closed:
+                    return
+                _, _, step = heapq.heappop(self._heap)
+                self._running += 1
+            self._executor.submit(self._run, step)
+
+    def _run(self, step):
+        # type: (Callable[[], Optional[float]]) -> None
+        try:
+            delay = step()
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected error while polling a long running operation")
+            delay = None
+        with self._condition:
+            self._running -= 1
+            if delay is not None and not self._closed:
+                heapq.heappush(self._heap, (_clock() + delay, next(self._counter), step))
+                self._condition.notify()
+
+    def close(self):
+        # type: () -> None
+        """Stop polling. Operations that are still scheduled will never complete."""
+        with self._condition:
+            self._closed = True
+            self._heap = []
+            self._condition.notify()
+        self._executor.shutdown(wait=False)
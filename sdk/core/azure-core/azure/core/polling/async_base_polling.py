@@ -43,24 +43,8 @@ class AsyncLROBasePolling(LROBasePolling):
     async def run(self):  # pylint:disable=invalid-overridden-method
         try:
             await self._poll()
-        except BadStatus as err:
-            self._status = "Failed"
-            raise HttpResponseError(
-                response=self._pipeline_response.http_response, error=err
-            )
-
-        except BadResponse as err:
-            self._status = "Failed"
-            raise HttpResponseError(
-                response=self._pipeline_response.http_response,
-                message=str(err),
-                error=err,
-            )
-
-        except OperationFailed as err:
-            raise HttpResponseError(
-                response=self._pipeline_response.http_response, error=err
-            )
+        except (BadStatus, BadResponse, OperationFailed) as err:
+            self._raise_http_response_error(err)
 
     async def _poll(self):  # pylint:disable=invalid-overridden-method
         """Poll status of operation so long as operation is incomplete and
@@ -77,6 +61,13 @@ class AsyncLROBasePolling(LROBasePolling):
             await self._delay()
             await self.update_status()
 
+        await self._finish()
+
+    async def _finish(self):  # pylint:disable=invalid-overridden-method
+        """Check the final status, and get the final resource if necessary.
+
+        :raises: OperationFailed if operation status 'Failed' or 'Canceled'.
+        """
         if _failed(self.status()):
             raise OperationFailed("Operation failed or canceled")
 
@@ -85,6 +76,30 @@ class AsyncLROBasePolling(LROBasePolling):
             self._pipeline_response = await self.request_status(final_get_url)
             _raise_if_bad_http_status_and_method(self._pipeline_response.http_response)
 
+    def _can_poll_step(self):
+        cls = type(self)
+        return cls.run is AsyncLROBasePolling.run and cls._poll is AsyncLROBasePolling._poll
+
+    async def _poll_step(self):  # pylint:disable=invalid-overridden-method
+        """Update the status of the operation once, without waiting.
+
+        Used by :class:`~azure.core.polling.AsyncLROPollScheduler`, "_extract_delay" gives
+        the delay before the next step.
+
+        :returns: True if the operation is finished, and the final resource was retrieved.
+        :raises: ~azure.core.exceptions.HttpResponseError
+        """
+        try:
+            if not self.finished():
+                await self.update_status()
+                if not self.finished():
+                    return False
+            await self._finish()
+            return True
+        except (BadStatus, BadResponse, OperationFailed) as err:
+            self._raise_http_response_error(err)
+            raise  # Not reached, make pylint happy
+
     async def _sleep(self, delay):  # pylint:disable=invalid-overridden-method
         await self._transport.sleep(delay)
 
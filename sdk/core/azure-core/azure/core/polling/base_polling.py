@@ -475,13 +475,18 @@ class LROBasePolling(PollingMethod):
     def run(self):
         try:
             self._poll()
-        except BadStatus as err:
+        except (BadStatus, BadResponse, OperationFailed) as err:
+            self._raise_http_response_error(err)
+
+    def _raise_http_response_error(self, err):
+        # type: (Exception) -> None
+        if isinstance(err, BadStatus):
             self._status = "Failed"
             raise HttpResponseError(
                 response=self._pipeline_response.http_response, error=err
             )
 
-        except BadResponse as err:
+        if isinstance(err, BadResponse):
             self._status = "Failed"
             raise HttpResponseError(
                 response=self._pipeline_response.http_response,
@@ -489,10 +494,9 @@ class LROBasePolling(PollingMethod):
                 error=err,
             )
 
-        except OperationFailed as err:
-            raise HttpResponseError(
-                response=self._pipeline_response.http_response, error=err
-            )
+        raise HttpResponseError(
+            response=self._pipeline_response.http_response, error=err
+        )
 
     def _poll(self):
         """Poll status of operation so long as operation is incomplete and
@@ -509,6 +513,13 @@ class LROBasePolling(PollingMethod):
             self._delay()
             self.update_status()
 
+        self._finish()
+
+    def _finish(self):
+        """Check the final status, and get the final resource if necessary.
+
+        :raises: OperationFailed if operation status 'Failed' or 'Canceled'.
+        """
         if _failed(self.status()):
             raise OperationFailed("Operation failed or canceled")
 
@@ -517,6 +528,36 @@ class LROBasePolling(PollingMethod):
             self._pipeline_response = self.request_status(final_get_url)
             _raise_if_bad_http_status_and_method(self._pipeline_response.http_response)
 
+    def _can_poll_step(self):
+        # type: () -> bool
+        """Whether "_poll_step" can be used instead of "run".
+
+        Subclasses customizing the polling loop must keep running it.
+        """
+        cls = type(self)
+        return cls.run is LROBasePolling.run and cls._poll is LROBasePolling._poll  # type: ignore
+
+    def _poll_step(self):
+        # type: () -> bool
+        """Update the status of the operation once, without waiting.
+
+        Used by :class:`~azure.core.polling.LROPollScheduler` to poll many operations
+        from a few threads, "_extract_delay" gives the delay before the next step.
+
+        :returns: True if the operation is finished, and the final resource was retrieved.
+        :raises: ~azure.core.exceptions.HttpResponseError
+        """
+        try:
+            if not self.finished():
+                self.update_status()
+                if not self.finished():
+                    return False
+            self._finish()
+            return True
+        except (BadStatus, BadResponse, OperationFailed) as err:
+            self._raise_http_response_error(err)
+            raise  # Not reached, make pylint happy
+
     def _parse_resource(self, pipeline_response):
         # type: (PipelineResponseType) -> Optional[Any]
         """Assuming this response is a resource, use the deserialization callback to parse it.
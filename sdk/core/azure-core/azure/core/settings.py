@@ -35,7 +35,7 @@ import six
 from azure.core.tracing import AbstractSpan
 
 try:
-    from typing import Type, Optional, Dict, Callable, cast, TYPE_CHECKING
+    from typing import Type, Optional, Dict, Callable, Tuple, cast, TYPE_CHECKING
 except ImportError:
     TYPE_CHECKING = False
 
@@ -212,6 +212,7 @@ class PrioritizedSetting(object):
         self._default = default
         self._convert = convert if convert else lambda x: x
         self._user_value = _Unset
+        self._cache = None  # type: Optional[Tuple[Tuple[Optional[str], int], Any]]
 
     def __repr__(self):
         # type () -> str
@@ -251,6 +252,28 @@ class PrioritizedSetting(object):
 
         raise RuntimeError("No configured value found for setting %r" % self._name)
 
+    def cached(self):
+        # type: () -> Any
+        """Return the setting value, computed again only if it may have changed.
+
+        For hot paths, where the lookup of the environment variable and the conversion are
+        too slow. The value is computed again after a call to ``set_value`` or ``unset_value``,
+        when the environment variable of the setting changes, or when a module is imported (the
+        conversion may depend on it). Settings with a system hook are not cached.
+
+        :returns: the value of the setting
+        :raises: RuntimeError
+        """
+        if self._system_hook:
+            return self()
+        key = (os.environ.get(self._env_var) if self._env_var else None, len(sys.modules))
+        cache = self._cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        value = self()
+        self._cache = (key, value)
+        return value
+
     def __get__(self, instance, owner):
         return self
 
@@ -270,11 +293,13 @@ class PrioritizedSetting(object):
 
         """
         self._user_value = value
+        self._cache = None
 
     def unset_value(self):
         # () -> None
         """Unset the previous user value such that the priority is reset."""
         self._user_value = _Unset
+        self._cache = None
 
     @property
     def env_var(self):
@@ -66,13 +66,17 @@ def distributed_trace_async(  # pylint:disable=function-redefined
     def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
         @functools.wraps(func)
         async def wrapper_use_tracer(*args: Any, **kwargs: Any) -> T:
-            merge_span = kwargs.pop("merge_span", False)
-            passed_in_parent = kwargs.pop("parent_span", None)
-
-            span_impl_type = settings.tracing_implementation()
+            span_impl_type = settings.tracing_implementation.cached()
             if span_impl_type is None:
+                # Tracing is disabled: only remove the tracing keywords, if any
+                if "merge_span" in kwargs or "parent_span" in kwargs:
+                    kwargs.pop("merge_span", None)
+                    kwargs.pop("parent_span", None)
                 return await func(*args, **kwargs)
 
+            merge_span = kwargs.pop("merge_span", False)
+            passed_in_parent = kwargs.pop("parent_span", None)
+
             # Merge span is parameter is set, but only if no explicit parent are passed
             if merge_span and not passed_in_parent:
                 return await func(*args, **kwargs)
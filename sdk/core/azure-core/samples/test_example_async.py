@@ -88,6 +88,18 @@ async def test_example_aiohttp():
     assert isinstance(response.http_response.status_code, int)
 
 
+@pytest.mark.asyncio
+async def test_example_httpx():
+    # [START httpx]
+    from azure.core.pipeline.transport import AsyncHttpxTransport
+
+    async with AsyncPipelineClient("https://bing.com", transport=AsyncHttpxTransport()) as client:
+        response = await client._pipeline.run(client.get("/"))
+    # [END httpx]
+    assert client._pipeline._transport.client is None
+    assert isinstance(response.http_response.status_code, int)
+
+
 @pytest.mark.asyncio
 async def test_example_async_pipeline():
     # [START build_async_pipeline]
@@ -51,6 +51,17 @@ def test_example_requests():
     assert isinstance(response.http_response.status_code, int)
 
 
+def test_example_httpx():
+    # [START httpx]
+    from azure.core.pipeline.transport import HttpxTransport
+
+    with PipelineClient("https://bing.com", transport=HttpxTransport()) as client:
+        response = client._pipeline.run(client.get("/"))
+    # [END httpx]
+    assert client._pipeline._transport.client is None
+    assert isinstance(response.http_response.status_code, int)
+
+
 def test_example_pipeline():
     # [START build_pipeline]
     from azure.core.pipeline import Pipeline
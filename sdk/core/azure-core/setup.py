@@ -73,5 +73,6 @@ setup(
         ":python_version<'3.0'": ['azure-nspkg'],
         ":python_version<'3.4'": ['enum34>=1.0.4'],
         ":python_version<'3.5'": ['typing'],
+        "http2": ["httpx[http2]; python_version>='3.6'"],
     }
 )
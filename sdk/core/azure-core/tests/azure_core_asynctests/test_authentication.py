@@ -9,7 +9,7 @@ from unittest.mock import Mock
 
 from azure.core.credentials import AccessToken
 from azure.core.exceptions import AzureError, ServiceRequestError
-from azure.core.pipeline import AsyncPipeline
+from azure.core.pipeline import AsyncPipeline, PipelineContext, PipelineRequest
 from azure.core.pipeline.policies import AsyncBearerTokenCredentialPolicy, SansIOHTTPPolicy
 from azure.core.pipeline.transport import HttpRequest
 import pytest
@@ -156,6 +156,55 @@ async def test_context_unmodified_by_default():
     await pipeline.run(HttpRequest("GET", "https://secure"))
 
 
+@pytest.mark.asyncio
+async def test_bearer_policy_single_flight_refresh():
+    """While a token is being refreshed, other coroutines should keep using the still-valid token"""
+    expiring_token = AccessToken("old", time.time() + 60)
+    fresh_token = AccessToken("new", time.time() + 3600)
+    release_refresh = asyncio.Event()
+    get_token_calls = 0
+
+    async def get_token(*_, **__):
+        nonlocal get_token_calls
+        get_token_calls += 1
+        await release_refresh.wait()
+        return fresh_token
+
+    policy = AsyncBearerTokenCredentialPolicy(Mock(get_token=get_token), "scope")
+    policy._token = expiring_token
+
+    refreshing = asyncio.ensure_future(policy.on_request(PipelineRequest(HttpRequest("GET", "https://spam.eggs"), PipelineContext(None))))
+    await asyncio.sleep(0)
+    assert get_token_calls == 1
+
+    # the refresh is in progress: this request shouldn't wait nor call get_token again
+    request = HttpRequest("GET", "https://spam.eggs")
+    await policy.on_request(PipelineRequest(request, PipelineContext(None)))
+    assert request.headers["Authorization"] == "Bearer old"
+
+    release_refresh.set()
+    await refreshing
+    assert get_token_calls == 1
+    assert policy._token is fresh_token
+
+
+@pytest.mark.asyncio
+async def test_bearer_policy_background_refresh():
+    """With background_refresh, a token about to expire should be refreshed in a background task"""
+    expiring_token = AccessToken("old", time.time() + 60)
+    fresh_token = AccessToken("new", time.time() + 3600)
+    credential = Mock(get_token=lambda *_, **__: get_completed_future(fresh_token))
+    policy = AsyncBearerTokenCredentialPolicy(credential, "scope", background_refresh=True)
+    policy._token = expiring_token
+
+    request = HttpRequest("GET", "https://spam.eggs")
+    await policy.on_request(PipelineRequest(request, PipelineContext(None)))
+    assert request.headers["Authorization"] == "Bearer old"
+
+    await policy._refresh_task
+    assert policy._token is fresh_token
+
+
 def get_completed_future(result=None):
     fut = asyncio.Future()
     fut.set_result(result)
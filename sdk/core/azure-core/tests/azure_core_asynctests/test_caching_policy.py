@@ -0,0 +1,63 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Tests for the async caching policy."""
+import pytest
+from azure.core.pipeline import AsyncPipeline
+from azure.core.pipeline.policies import AsyncCachingPolicy, InMemoryResponseCache
+from azure.core.pipeline.transport import (
+    HttpRequest,
+    HttpResponse,
+    AsyncHttpTransport,
+)
+
+
+class MockTransport(AsyncHttpTransport):
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.sent = []
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+    async def close(self):
+        pass
+    async def open(self):
+        pass
+
+    async def send(self, request, **kwargs):  # type: (PipelineRequest, Any) -> PipelineResponse
+        self.sent.append(dict(request.headers))
+        status, headers, body = self._responses.pop(0)
+        response = HttpResponse(request, None)
+        response.status_code = status
+        response.headers = headers
+        response.body = lambda: body
+        return response
+
+
+@pytest.mark.asyncio
+async def test_not_modified_served_from_cache():
+    cache = InMemoryResponseCache()
+    transport = MockTransport([
+        (200, {"ETag": '"1"'}, b"value"),
+        (304, {"ETag": '"1"'}, b""),
+    ])
+    pipeline = AsyncPipeline(transport, [AsyncCachingPolicy(cache=cache)])
+    request = HttpRequest("GET", "https://example.org/setting")
+
+    assert (await pipeline.run(request)).http_response.body() == b"value"
+    response = (await pipeline.run(request)).http_response
+    assert transport.sent[1]["If-None-Match"] == '"1"'
+    assert response.status_code == 200
+    assert response.body() == b"value"
+    assert b"".join([chunk async for chunk in response.stream_download(pipeline)]) == b"value"
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_ttl():
+    transport = MockTransport([(200, {}, b"value")])
+    pipeline = AsyncPipeline(transport, [AsyncCachingPolicy()])
+    for _ in range(3):
+        response = await pipeline.run(HttpRequest("GET", "https://example.org/setting"), cache_ttl=60)
+        assert response.http_response.body() == b"value"
+    assert len(transport.sent) == 1
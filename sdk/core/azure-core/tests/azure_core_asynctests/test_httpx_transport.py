@@ -0,0 +1,82 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+import asyncio
+import pickle
+
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+from azure.core.exceptions import ServiceRequestError
+from azure.core.pipeline import AsyncPipeline
+from azure.core.pipeline.transport import HttpRequest, AsyncHttpxTransport
+
+from h2_server import H2Server
+
+
+@pytest.fixture
+def h2_server():
+    server = H2Server()
+    try:
+        yield server
+    finally:
+        server.close()
+
+
+def _h2_transport(**kwargs):
+    # Cleartext HTTP/2 needs prior knowledge, TLS connections negotiate it
+    return AsyncHttpxTransport(client=httpx.AsyncClient(http1=False, http2=True), **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_are_multiplexed(h2_server):
+    async with AsyncPipeline(_h2_transport()) as pipeline:
+        responses = await asyncio.gather(*[
+            pipeline.run(HttpRequest("GET", h2_server.url + "/delay/200")) for _ in range(50)
+        ])
+
+    assert [r.http_response.body() for r in responses] == [b"ok"] * 50
+    assert responses[0].http_response.http_version == "HTTP/2"
+    assert h2_server.connections == 1
+    assert h2_server.max_active == 50
+
+
+@pytest.mark.asyncio
+async def test_bodies_and_stream_download(h2_server):
+    async with AsyncPipeline(_h2_transport(connection_data_block_size=1000)) as pipeline:
+        request = HttpRequest("POST", h2_server.url + "/echo")
+        request.set_bytes_body(memoryview(b"abcdef")[1:4])
+        response = (await pipeline.run(request)).http_response
+        assert response.body() == b"bcd"
+
+        response = (await pipeline.run(HttpRequest("GET", h2_server.url + "/delay/1"))).http_response
+        assert pickle.loads(pickle.dumps(response)).body() == b"ok"
+
+        request = HttpRequest("POST", h2_server.url + "/echo")
+        request.set_streamed_data_body(iter([b"ab", b"cd"]))
+        assert (await pipeline.run(request)).http_response.body() == b"abcd"
+
+        response = (await pipeline.run(HttpRequest("GET", h2_server.url + "/bytes/100000"), stream=True)).http_response
+        chunks = [chunk async for chunk in response.stream_download(pipeline)]
+    assert sum(len(chunk) for chunk in chunks) == 100000
+    assert max(len(chunk) for chunk in chunks) <= 1000
+
+
+@pytest.mark.asyncio
+async def test_client_options():
+    async with AsyncHttpxTransport() as transport:
+        with pytest.raises(ValueError):
+            await transport.send(HttpRequest("GET", "http://127.0.0.1:1"), proxies={"http": "http://proxy"})
+        with pytest.raises(ServiceRequestError):
+            await transport.send(HttpRequest("GET", "http://127.0.0.1:1"))
+
+
+@pytest.mark.trio
+async def test_trio(h2_server):
+    async with _h2_transport() as transport:
+        response = await transport.send(HttpRequest("GET", h2_server.url + "/delay/1"))
+    assert response.body() == b"ok"
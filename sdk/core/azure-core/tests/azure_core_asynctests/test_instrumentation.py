@@ -0,0 +1,94 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+import threading
+
+from six.moves import BaseHTTPServer, socketserver
+import pytest
+
+from azure.core import AsyncPipelineClient
+from azure.core.pipeline import AsyncPipeline, PipelineInstrumentation
+from azure.core.pipeline.policies import HeadersPolicy, AsyncRetryPolicy
+from azure.core.pipeline.transport import HttpRequest, HttpResponse, AsyncHttpTransport
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def server_url():
+    server = _Server(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        yield "http://127.0.0.1:{}".format(server.server_address[1])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class MockTransport(AsyncHttpTransport):
+    def __init__(self, statuses):
+        self._statuses = list(statuses)
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+    async def close(self):
+        pass
+    async def open(self):
+        pass
+
+    async def send(self, request, **kwargs):
+        response = HttpResponse(request, None)
+        response.status_code = self._statuses.pop(0)
+        return response
+
+
+def _get(instrumentation, name, **labels):
+    for metric, metric_labels, histogram in instrumentation.histograms():
+        if metric == name and metric_labels == labels:
+            return histogram
+    return None
+
+
+@pytest.mark.asyncio
+async def test_pipeline_instrumentation():
+    instrumentation = PipelineInstrumentation()
+    policies = [HeadersPolicy(), AsyncRetryPolicy(retry_backoff_factor=0)]
+    pipeline = AsyncPipeline(MockTransport([500, 200]), policies, instrumentation=instrumentation)
+    await pipeline.run(HttpRequest("GET", "https://example.org"))
+
+    assert _get(instrumentation, PipelineInstrumentation.POLICY_DURATION, policy="HeadersPolicy").count == 1
+    assert _get(instrumentation, PipelineInstrumentation.POLICY_DURATION, policy="AsyncRetryPolicy").count == 1
+    assert _get(instrumentation, PipelineInstrumentation.POLICY_DURATION, policy="MockTransport").count == 2
+    assert _get(instrumentation, PipelineInstrumentation.RETRIES).sum == 1
+
+
+@pytest.mark.asyncio
+async def test_aiohttp_transport_phases(server_url):
+    instrumentation = PipelineInstrumentation()
+    async with AsyncPipelineClient(server_url, instrumentation=instrumentation) as client:
+        for _ in range(2):
+            response = await client._pipeline.run(client.get("/"))
+            assert response.http_response.body() == b"ok"
+
+    phase = PipelineInstrumentation.TRANSPORT_PHASE
+    assert _get(instrumentation, phase, phase="connect").count == 1
+    assert _get(instrumentation, phase, phase="ttfb").count == 2
+    assert _get(instrumentation, phase, phase="body").count == 2
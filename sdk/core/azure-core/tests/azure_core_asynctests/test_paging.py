@@ -29,6 +29,7 @@ from typing import AsyncIterator, TypeVar, List
 from azure.core.async_paging import AsyncItemPaged, AsyncList
 
 import pytest
+import trio
 
 
 T = TypeVar("T")
@@ -120,3 +121,70 @@ class TestPaging:
         result_iterated = await _as_list(pager)
 
         assert len(result_iterated) == 0
+
+    @pytest.mark.asyncio
+    async def test_by_page_prefetch(self):
+        fetched = []
+
+        async def get_next(continuation_token=None):
+            page = int(continuation_token or 0)
+            fetched.append(page)
+            return {
+                'nextLink': str(page + 1) if page < 4 else None,
+                'value': ['value{}.0'.format(page), 'value{}.1'.format(page)]
+            }
+
+        async def extract_data(response):
+            return response['nextLink'], AsyncList(response['value'])
+
+        pager = AsyncItemPaged(get_next, extract_data).by_page(prefetch=2)
+        page = await pager.__anext__()
+        assert await _as_list(page) == ['value0.0', 'value0.1']
+        assert pager.continuation_token == '1'
+        # the next pages were fetched while the first one was processed
+        assert fetched == [0, 1, 2]
+
+        pages = [await _as_list(page) for page in await _as_list(pager)]
+        assert pages == [['value{}.0'.format(i), 'value{}.1'.format(i)] for i in range(1, 5)]
+        assert pager.continuation_token is None
+
+    @pytest.mark.asyncio
+    async def test_by_page_prefetch_error(self):
+        async def get_next(continuation_token=None):
+            if continuation_token:
+                raise ValueError("page2")
+            return {'nextLink': 'page2', 'value': ['value1.0']}
+
+        async def extract_data(response):
+            return response['nextLink'], AsyncList(response['value'])
+
+        pager = AsyncItemPaged(get_next, extract_data).by_page(prefetch=1)
+        assert await _as_list(await pager.__anext__()) == ['value1.0']
+        with pytest.raises(ValueError):
+            await pager.__anext__()
+        with pytest.raises(StopAsyncIteration):
+            await pager.__anext__()
+
+    def test_by_page_prefetch_trio(self):
+        fetched = []
+
+        async def get_next(continuation_token=None):
+            page = int(continuation_token or 0)
+            fetched.append(page)
+            return {
+                'nextLink': str(page + 1) if page < 2 else None,
+                'value': ['value{}'.format(page)]
+            }
+
+        async def extract_data(response):
+            return response['nextLink'], AsyncList(response['value'])
+
+        async def consume():
+            pager = AsyncItemPaged(get_next, extract_data).by_page(prefetch=2)
+            first = await _as_list(await pager.__anext__())
+            # Without asyncio, pages are fetched when requested
+            assert fetched == [0]
+            assert pager.continuation_token == '1'
+            return [first] + [await _as_list(page) for page in await _as_list(pager)]
+
+        assert trio.run(consume) == [['value0'], ['value1'], ['value2']]
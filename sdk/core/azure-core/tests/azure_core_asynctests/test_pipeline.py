@@ -84,6 +84,41 @@ async def test_sans_io_exception():
         await pipeline.run(req)
 
 
+@pytest.mark.asyncio
+async def test_sans_io_hooks():
+    calls = []
+
+    class SyncHooks(SansIOHTTPPolicy):
+        def on_request(self, request):
+            calls.append("sync.on_request")
+
+        def on_response(self, request, response):
+            calls.append("sync.on_response")
+
+    class AsyncHooks(SansIOHTTPPolicy):
+        async def on_request(self, request):
+            calls.append("async.on_request")
+
+        async def on_response(self, request, response):
+            calls.append("async.on_response")
+
+    class Sender(AsyncHttpTransport):
+        async def __aexit__(self, *args):
+            pass
+        async def open(self):
+            pass
+        async def close(self):
+            pass
+        async def send(self, request, **kwargs):
+            return "response"
+
+    pipeline = AsyncPipeline(Sender(), [SyncHooks(), SansIOHTTPPolicy(), AsyncHooks()])
+    assert len(pipeline._impl_policies) == 1
+
+    assert (await pipeline.run(HttpRequest("GET", "/"))).http_response == "response"
+    assert calls == ["sync.on_request", "async.on_request", "async.on_response", "sync.on_response"]
+
+
 @pytest.mark.asyncio
 async def test_basic_aiohttp():
 
@@ -204,4 +239,61 @@ async def test_retry_without_http_response():
     policies = [AsyncRetryPolicy(), NaughtyPolicy()]
     pipeline = AsyncPipeline(policies=policies, transport=None)
     with pytest.raises(AzureError):
-        await pipeline.run(HttpRequest('GET', url='https://foo.bar'))
\ No newline at end of file
+        await pipeline.run(HttpRequest('GET', url='https://foo.bar'))
+
+@pytest.mark.asyncio
+async def test_stream_decode_async():
+    from azure.core.pipeline.policies import ContentDecodePolicy
+    from azure.core.pipeline.transport import AsyncHttpResponse
+
+    body = b'{"value": [{"name": "a"}, {"name": "b"}], "nextLink": "next"}'
+
+    class AsyncStream(object):
+        def __init__(self):
+            self._chunks = iter([body[i:i + 5] for i in range(0, len(body), 5)])
+
+        def __aiter__(self):
+            return self
+
+        async def __anext__(self):
+            try:
+                return next(self._chunks)
+            except StopIteration:
+                raise StopAsyncIteration()
+
+    items = ContentDecodePolicy.iter_items_from_stream(AsyncStream(), "application/json", items="value")
+    assert [item["name"] async for item in items] == ["a", "b"]
+    assert items.document == {"nextLink": "next"}
+
+    class MockResponse(AsyncHttpResponse):
+        def __init__(self, request):
+            super(MockResponse, self).__init__(request, None)
+            self.status_code = 200
+            self.headers = {}
+            self.content_type = "application/json"
+
+        def body(self):
+            raise AssertionError("Body should not be loaded")
+
+        def stream_download(self, pipeline):
+            return AsyncStream()
+
+    class MockTransport(AsyncHttpTransport):
+        async def __aexit__(self, exc_type, exc_value, traceback):
+            pass
+        async def send(self, request, **kwargs):
+            assert kwargs == {"stream": True}
+            return MockResponse(request)
+        async def open(self):
+            pass
+        async def close(self):
+            pass
+
+    pipeline = AsyncPipeline(MockTransport(), [ContentDecodePolicy()])
+    response = await pipeline.run(HttpRequest("GET", "http://127.0.0.1/"), stream_decode=True)
+    assert response.context["deserialized_data"]["value"] == [{"name": "a"}, {"name": "b"}]
+
+    response = await pipeline.run(HttpRequest("GET", "http://127.0.0.1/"), stream_decode_items="value")
+    items = response.context["deserialized_data"]
+    assert [item["name"] async for item in items] == ["a", "b"]
+    assert items.document == {"nextLink": "next"}
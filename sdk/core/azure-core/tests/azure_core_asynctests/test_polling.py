@@ -197,3 +197,134 @@ async def test_broken_poller(client):
     with pytest.raises(ValueError) as excinfo:
         await poller.result()
     assert "Something bad happened" in str(excinfo.value)
+
+
+class PollingSteps(PollingTwoSteps):
+    """Steppable polling method, finished after "steps" status updates."""
+    def __init__(self, steps=2, error=None):
+        super(PollingSteps, self).__init__(sleep=0)
+        self._steps = steps
+        self._error = error
+        self.polls = 0
+
+    def _can_poll_step(self):
+        return True
+
+    def _extract_delay(self):
+        return 0.01
+
+    async def _poll_step(self):
+        self.polls += 1
+        await asyncio.sleep(0)
+        if self._error and self.polls == self._steps:
+            raise self._error
+        if self.polls == self._steps:
+            self._finished = True
+        return self._finished
+
+    async def run(self):
+        raise AssertionError("A scheduled poller must not call run")
+
+
+@pytest.mark.asyncio
+async def test_poller_with_scheduler(client):
+    scheduler = AsyncLROPollScheduler(max_concurrency=2)
+    AsyncLROPollScheduler.set_default(scheduler)
+    try:
+        methods = [PollingSteps(steps=3) for _ in range(10)]
+        pollers = [AsyncLROPoller(client, "Initial response", lambda r: "Treated: " + r, m) for m in methods]
+        results = await asyncio.gather(*(poller.result() for poller in pollers))
+        assert results == ["Treated: Initial response"] * 10
+        assert all(poller.done() for poller in pollers)
+        assert all(m.polls == 3 for m in methods)
+        assert len(scheduler) == 0
+    finally:
+        AsyncLROPollScheduler.set_default(None)
+        scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_poller_with_scheduler_error(client):
+    scheduler = AsyncLROPollScheduler()
+    AsyncLROPollScheduler.set_default(scheduler)
+    try:
+        method = PollingSteps(error=ValueError("Something bad happened"))
+        poller = AsyncLROPoller(client, "Initial response", lambda r: r, method)
+        with pytest.raises(ValueError) as excinfo:
+            await poller.result()
+        assert "Something bad happened" in str(excinfo.value)
+    finally:
+        AsyncLROPollScheduler.set_default(None)
+        scheduler.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("error", [None, ValueError("Something bad happened")])
+async def test_poller_with_scheduler_cancelled_during_poll(client, caplog, error):
+    polling = asyncio.Event()
+    release = asyncio.Event()
+
+    class SlowPollingSteps(PollingSteps):
+        async def _poll_step(self):
+            polling.set()
+            await release.wait()
+            if error:
+                raise error
+            self._finished = True
+            return True
+
+    scheduler = AsyncLROPollScheduler()
+    AsyncLROPollScheduler.set_default(scheduler)
+    try:
+        poller = AsyncLROPoller(client, "Initial response", lambda r: r, SlowPollingSteps())
+        waiter = asyncio.ensure_future(poller.result())
+        await polling.wait()
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+        # The poll completes after its waiter is gone
+        release.set()
+        while len(scheduler):
+            await asyncio.sleep(0.01)
+        assert "Unexpected error" not in caplog.text
+    finally:
+        AsyncLROPollScheduler.set_default(None)
+        scheduler.close()
+
+
+def test_poller_with_scheduler_on_successive_loops(client):
+    scheduler = AsyncLROPollScheduler(max_concurrency=1)
+    AsyncLROPollScheduler.set_default(scheduler)
+
+    async def poll_all():
+        pollers = [AsyncLROPoller(client, "Initial response", lambda r: r, PollingSteps()) for _ in range(3)]
+        return await asyncio.wait_for(asyncio.gather(*(poller.result() for poller in pollers)), 5)
+
+    try:
+        for _ in range(2):
+            loop = asyncio.new_event_loop()
+            try:
+                assert loop.run_until_complete(poll_all()) == ["Initial response"] * 3
+            finally:
+                loop.close()
+    finally:
+        AsyncLROPollScheduler.set_default(None)
+        scheduler.close()
+
+
+@pytest.mark.asyncio
+async def test_scheduler_error_fails_waiter():
+    scheduler = AsyncLROPollScheduler()
+    waiter = asyncio.get_event_loop().create_future()
+
+    async def step():
+        raise ValueError("Something bad happened")
+
+    try:
+        scheduler.schedule(step, 0, waiter)
+        with pytest.raises(ValueError) as excinfo:
+            await asyncio.wait_for(waiter, 5)
+        assert "Something bad happened" in str(excinfo.value)
+        assert len(scheduler) == 0
+    finally:
+        scheduler.close()
@@ -0,0 +1,52 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Tests for the async rate limit policy."""
+import asyncio
+import time
+
+import pytest
+from azure.core.pipeline import AsyncPipeline
+from azure.core.pipeline.policies import AsyncRateLimitPolicy, RateLimiter
+from azure.core.pipeline.transport import (
+    HttpRequest,
+    HttpResponse,
+    AsyncHttpTransport,
+)
+
+
+class MockTransport(AsyncHttpTransport):
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.sent = []
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+    async def close(self):
+        pass
+    async def open(self):
+        pass
+
+    async def send(self, request, **kwargs):  # type: (PipelineRequest, Any) -> PipelineResponse
+        self.sent.append(time.time())
+        status, headers = self._responses.pop(0) if self._responses else (200, {})
+        response = HttpResponse(request, None)
+        response.status_code = status
+        response.headers = headers
+        return response
+
+
+@pytest.mark.asyncio
+async def test_throttled_with_retry_after():
+    limiter = RateLimiter(min_rate=10)
+    transport = MockTransport([(503, {"Retry-After": "1"})])
+    pipeline = AsyncPipeline(transport, [AsyncRateLimitPolicy(rate_limiter=limiter)])
+
+    response = await pipeline.run(HttpRequest("GET", "https://example.org/path"))
+    assert response.http_response.status_code == 503
+    assert limiter.get_rate("https://example.org") == 10
+
+    # Concurrent coroutines are all held, then admitted at the limiter rate
+    await asyncio.gather(*(pipeline.run(HttpRequest("GET", "https://example.org/path")) for _ in range(3)))
+    assert min(transport.sent[1:]) - transport.sent[0] >= 0.9
+    assert max(transport.sent[1:]) - min(transport.sent[1:]) >= 0.15
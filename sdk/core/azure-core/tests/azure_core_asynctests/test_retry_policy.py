@@ -244,3 +244,72 @@ async def test_retry_timeout():
     with pytest.raises(ServiceResponseTimeoutError):
         await pipeline.run(http_request)
 
+
+@pytest.mark.asyncio
+async def test_hedged_request():
+    class MockTransport(AsyncHttpTransport):
+        def __init__(self):
+            self._count = 0
+            self.slow = False
+            self.cancelled = False
+        async def __aexit__(self, exc_type, exc_val, exc_tb):
+            pass
+        async def close(self):
+            pass
+        async def open(self):
+            pass
+
+        async def send(self, request, **kwargs):  # type: (PipelineRequest, Any) -> PipelineResponse
+            self._count += 1
+            if self.slow:
+                self.slow = False
+                try:
+                    await asyncio.sleep(1)
+                except asyncio.CancelledError:
+                    self.cancelled = True
+                    raise
+            else:
+                await asyncio.sleep(0.01)
+            response = HttpResponse(request, None)
+            response.status_code = 200
+            return response
+
+    transport = MockTransport()
+    pipeline = AsyncPipeline(transport, [AsyncRetryPolicy(retry_hedge_percentile=95)])
+    for _ in range(AsyncRetryPolicy._HEDGE_MIN_SAMPLES):
+        await pipeline.run(HttpRequest('GET', 'http://127.0.0.1/'))
+    assert transport._count == AsyncRetryPolicy._HEDGE_MIN_SAMPLES
+
+    transport.slow = True
+    start = time.time()
+    response = await pipeline.run(HttpRequest('GET', 'http://127.0.0.1/'))
+    assert response.http_response.status_code == 200
+    assert time.time() - start < 0.5
+    assert transport._count == AsyncRetryPolicy._HEDGE_MIN_SAMPLES + 2
+    await asyncio.sleep(0)
+    assert transport.cancelled
+
+
+@pytest.mark.asyncio
+async def test_close_unused_async_response():
+    from azure.core.pipeline._tools_async import close_response_async
+
+    class AsyncOnlyResponse(object):
+        """Like an httpx response of an async client, which can't be closed synchronously."""
+        def __init__(self):
+            self.closed = False
+        def close(self):
+            raise RuntimeError("Attempted to call an sync close on an async stream")
+        async def aclose(self):
+            self.closed = True
+
+    class BrokenResponse(object):
+        def close(self):
+            raise RuntimeError("Connection reset")
+
+    internal_response = AsyncOnlyResponse()
+    await close_response_async(PipelineResponse(None, HttpResponse(None, internal_response), None))
+    assert internal_response.closed
+
+    # Errors while closing a response nobody uses are not raised
+    await close_response_async(PipelineResponse(None, HttpResponse(None, BrokenResponse()), None))
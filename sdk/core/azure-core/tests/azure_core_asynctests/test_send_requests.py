@@ -0,0 +1,128 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+import asyncio
+import threading
+import time
+
+from six.moves import BaseHTTPServer, socketserver
+import pytest
+
+from azure.core import AsyncPipelineClient
+from azure.core.exceptions import ServiceRequestError
+from azure.core.pipeline.policies import SansIOHTTPPolicy
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    active = 0
+    max_active = 0
+    lock = threading.Lock()
+
+    def do_GET(self):
+        with _Handler.lock:
+            _Handler.active += 1
+            _Handler.max_active = max(_Handler.max_active, _Handler.active)
+        # The path is the delay of the response in milliseconds
+        time.sleep(int(self.path.strip("/")) / 1000.0)
+        with _Handler.lock:
+            _Handler.active -= 1
+        body = self.path.encode("ascii")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def server_url():
+    _Handler.active = _Handler.max_active = 0
+    server = _Server(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        yield "http://127.0.0.1:{}".format(server.server_address[1])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class FailingPolicy(SansIOHTTPPolicy):
+    def on_request(self, request):
+        if request.http_request.url.endswith("/13"):
+            raise ServiceRequestError("failed")
+
+
+@pytest.mark.asyncio
+async def test_send_requests_completion_order(server_url):
+    async with AsyncPipelineClient(server_url, policies=[FailingPolicy()]) as client:
+        requests = [client.get("/{}".format(delay)) for delay in (400, 13, 200, 0)]
+        results = [result async for result in client.send_requests(requests, max_concurrency=4)]
+
+    paths = [result.request.url.rsplit("/", 1)[1] for result in results]
+    assert sorted(paths[:2]) == ["0", "13"]
+    assert paths[2:] == ["200", "400"]
+    for result in results:
+        if result.request.url.endswith("/13"):
+            assert isinstance(result.error, ServiceRequestError)
+            assert result.response is None
+        else:
+            assert result.error is None
+            assert result.response.http_response.text() == "/" + result.request.url.rsplit("/", 1)[1]
+    assert _Handler.max_active >= 2
+
+
+@pytest.mark.asyncio
+async def test_send_requests_async_iterable(server_url):
+    async def requests():
+        for _ in range(12):
+            await asyncio.sleep(0)
+            yield client.get("/20")
+
+    async with AsyncPipelineClient(server_url) as client:
+        results = [result async for result in client.send_requests(requests(), max_concurrency=3)]
+
+    assert len(results) == 12
+    assert all(result.response.http_response.status_code == 200 for result in results)
+    assert _Handler.max_active <= 3
+
+
+@pytest.mark.asyncio
+async def test_send_requests_close_stops_sending(server_url):
+    sent = []
+
+    def requests():
+        for _ in range(50):
+            sent.append(None)
+            yield client.get("/10")
+
+    async with AsyncPipelineClient(server_url) as client:
+        results = client.send_requests(requests(), max_concurrency=2)
+        assert (await results.__anext__()).error is None
+        results.close()
+        await asyncio.sleep(0.2)
+        assert len(sent) < 10
+        assert [result async for result in results] == []
+
+
+@pytest.mark.asyncio
+async def test_send_requests_iteration_error(server_url):
+    def requests():
+        yield client.get("/0")
+        raise ValueError("bad request")
+
+    async with AsyncPipelineClient(server_url) as client:
+        with pytest.raises(ValueError):
+            async for _ in client.send_requests(requests(), max_concurrency=1):
+                pass
+        assert [result async for result in client.send_requests([])] == []
@@ -2,16 +2,84 @@
 # Copyright (c) Microsoft Corporation.
 # Licensed under the MIT License.
 # ------------------------------------
+import threading
+
+from six.moves import BaseHTTPServer, socketserver
+from azure.core.exceptions import ResourceModifiedError
+from azure.core.pipeline.policies import AsyncRetryPolicy
 from azure.core.pipeline.transport import (
     HttpRequest,
     AsyncHttpResponse,
     AsyncHttpTransport,
+    AioHttpTransport,
 )
 from azure.core.pipeline import AsyncPipeline
 from azure.core.pipeline.transport._aiohttp import AioHttpStreamDownloadGenerator
 from unittest import mock
 import pytest
 
+
+_BODY = bytes(bytearray(range(256))) * 1000
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    etag = '"v1"'
+    truncate = 1
+    received = []
+
+    def do_GET(self):
+        range_header = self.headers.get("Range")
+        if_match = self.headers.get("If-Match")
+        _Handler.received.append((range_header, if_match))
+        if if_match and if_match != _Handler.etag:
+            self.send_response(412)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        start, end = 0, len(_BODY) - 1
+        if range_header:
+            first, last = range_header[len("bytes="):].split("-")
+            start, end = int(first), int(last) if last else end
+        body = _BODY[start:end + 1]
+        self.send_response(206 if range_header else 200)
+        self.send_header("ETag", _Handler.etag)
+        self.send_header("Content-Length", str(len(body)))
+        if range_header:
+            self.send_header("Content-Range", "bytes {}-{}/{}".format(start, end, len(_BODY)))
+        self.end_headers()
+        if _Handler.truncate:
+            # Drop the connection in the middle of the body
+            _Handler.truncate -= 1
+            self.wfile.write(body[:len(body) // 2])
+            self.wfile.flush()
+            self.close_connection = True
+            return
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def server_url():
+    _Handler.etag = '"v1"'
+    _Handler.truncate = 1
+    _Handler.received = []
+    server = _Server(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        yield "http://127.0.0.1:{}".format(server.server_address[1])
+    finally:
+        server.shutdown()
+        server.server_close()
+
 @pytest.mark.asyncio
 async def test_connection_error_response():
     class MockTransport(AsyncHttpTransport):
@@ -29,6 +97,8 @@ async def test_connection_error_response():
             request = HttpRequest('GET', 'http://127.0.0.1/')
             response = AsyncHttpResponse(request, None)
             response.status_code = 200
+            # The download continues with the body of the new response
+            response.internal_response = mock.Mock(content=mock.Mock(read=AsyncMock(return_value=b"")))
             return response
 
     class MockContent():
@@ -79,6 +149,7 @@ async def test_connection_error_416():
             request = HttpRequest('GET', 'http://127.0.0.1/')
             response = AsyncHttpResponse(request, None)
             response.status_code = 416
+            response.internal_response = mock.Mock()
             return response
 
     class MockContent():
@@ -105,3 +176,41 @@ async def test_connection_error_416():
     with mock.patch('asyncio.sleep', new_callable=AsyncMock):
         with pytest.raises(ConnectionError):
             await stream.__anext__()
+
+
+async def _download(url, headers=None, new_etag=None):
+    async with AsyncPipeline(AioHttpTransport(), [AsyncRetryPolicy()]) as pipeline:
+        response = (await pipeline.run(HttpRequest("GET", url, headers=headers), stream=True)).http_response
+        stream = response.stream_download(pipeline)
+        chunks = []
+        async for chunk in stream:
+            chunks.append(chunk)
+            if new_etag:  # The resource is modified during the download
+                _Handler.etag = new_etag
+        return b"".join(chunks), stream
+
+
+@pytest.mark.asyncio
+async def test_resume_download(server_url):
+    data, stream = await _download(server_url)
+    assert data == _BODY
+    assert stream.downloaded == len(_BODY)
+    (first_range, _), (resume_range, if_match) = _Handler.received
+    assert first_range is None
+    assert 0 < int(resume_range[6:-1]) <= len(_BODY) // 2
+    assert if_match == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_resume_range_download(server_url):
+    data, _ = await _download(server_url, headers={"Range": "bytes=1000-150999"})
+    assert data == _BODY[1000:151000]
+    resume_range = _Handler.received[1][0]
+    assert resume_range.startswith("bytes=") and resume_range.endswith("-150999")
+
+
+@pytest.mark.asyncio
+async def test_resume_download_modified(server_url):
+    with pytest.raises(ResourceModifiedError):
+        await _download(server_url, new_etag='"v2"')
+
@@ -27,6 +27,20 @@ def fake_span():
     settings.tracing_implementation.set_value(FakeSpan)
 
 
+@pytest.mark.asyncio
+async def test_tracing_disabled_removes_keywords():
+    @distributed_trace_async
+    async def get_kwargs(**kwargs):
+        return kwargs
+
+    settings.tracing_implementation.set_value(None)
+    try:
+        assert await get_kwargs(merge_span=True, parent_span=None, other=1) == {"other": 1}
+        assert await get_kwargs() == {}
+    finally:
+        settings.tracing_implementation.set_value(FakeSpan)
+
+
 class MockClient:
     @distributed_trace
     def __init__(self, policies=None, assert_current_span=False):
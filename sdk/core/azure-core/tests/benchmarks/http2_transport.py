@@ -0,0 +1,82 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+"""Compare AioHttpTransport (HTTP/1.1) with AsyncHttpxTransport (HTTP/2) on many small concurrent requests.
+
+Both servers are local and answer after the same delay, so the difference comes from
+connection usage: HTTP/1.1 needs a connection per request in flight (bounded by the pool
+limit), HTTP/2 multiplexes them over one connection.
+
+Usage: python tests/benchmarks/http2_transport.py [requests] [delay_ms]
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+
+import httpx
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from azure.core.pipeline import AsyncPipeline  # pylint: disable=wrong-import-position
+from azure.core.pipeline.transport import (  # pylint: disable=wrong-import-position
+    AioHttpTransport,
+    AsyncHttpxTransport,
+    HttpRequest,
+)
+from h2_server import H2Server  # pylint: disable=wrong-import-position
+
+
+class Http1Server(object):
+    def __init__(self):
+        self.connections = set()
+        self._loop = asyncio.new_event_loop()
+        app = web.Application()
+        app.router.add_get("/delay/{ms}", self._delay)
+        self._runner = web.AppRunner(app)
+        self._loop.run_until_complete(self._runner.setup())
+        site = web.TCPSite(self._runner, "127.0.0.1", 0)
+        self._loop.run_until_complete(site.start())
+        self.url = "http://127.0.0.1:{}".format(site._server.sockets[0].getsockname()[1])
+        threading.Thread(target=self._loop.run_forever, daemon=True).start()
+
+    async def _delay(self, request):
+        self.connections.add(request.transport.get_extra_info("peername"))
+        await asyncio.sleep(int(request.match_info["ms"]) / 1000.0)
+        return web.Response(body=b"ok")
+
+
+async def run(transport, url, count, delay):
+    async with AsyncPipeline(transport) as pipeline:
+        # Warm up
+        await pipeline.run(HttpRequest("GET", "{}/delay/0".format(url)))
+        start = time.time()
+        await asyncio.gather(*[
+            pipeline.run(HttpRequest("GET", "{}/delay/{}".format(url, delay))) for _ in range(count)
+        ])
+        return time.time() - start
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1000
+    delay = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+
+    http1 = Http1Server()
+    elapsed = asyncio.run(run(AioHttpTransport(), http1.url, count, delay))
+    print("AioHttpTransport HTTP/1.1: {:.2f}s, {:.0f} requests/s, {} connections".format(
+        elapsed, count / elapsed, len(http1.connections)))
+
+    http2 = H2Server()
+    transport = AsyncHttpxTransport(client=httpx.AsyncClient(http1=False, http2=True))
+    elapsed = asyncio.run(run(transport, http2.url, count, delay))
+    print("AsyncHttpxTransport HTTP/2: {:.2f}s, {:.0f} requests/s, {} connections".format(
+        elapsed, count / elapsed, http2.connections))
+    http2.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+"""Measure the Python overhead of the pipeline, per policy, on tiny requests.
+
+The transport returns a canned response, so the times are only those of the pipeline and
+its policies. The overhead of a policy is the time of a pipeline with only this policy, minus
+the time of an empty pipeline. The default policies of PipelineClient are measured, alone and
+together, then the cost of the pipeline itself: SansIO policies with an empty on_request hook,
+and without any hook.
+
+Usage: python tests/benchmarks/pipeline_overhead.py [calls]
+"""
+import sys
+import timeit
+
+from azure.core.pipeline import Pipeline
+from azure.core.pipeline.policies import (
+    SansIOHTTPPolicy,
+    ContentDecodePolicy,
+    CustomHookPolicy,
+    DistributedTracingPolicy,
+    HeadersPolicy,
+    HttpLoggingPolicy,
+    NetworkTraceLoggingPolicy,
+    ProxyPolicy,
+    RedirectPolicy,
+    RequestIdPolicy,
+    RetryPolicy,
+    UserAgentPolicy,
+)
+from azure.core.pipeline.transport import HttpRequest, HttpResponse, HttpTransport
+
+
+class NoopTransport(HttpTransport):
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send(self, request, **kwargs):
+        response = HttpResponse(request, None)
+        response.status_code = 200
+        response.headers = {}
+        return response
+
+
+class EmptyRequestHook(SansIOHTTPPolicy):
+    def on_request(self, request):
+        pass
+
+
+def default_policies():
+    return [
+        RequestIdPolicy(),
+        HeadersPolicy(),
+        UserAgentPolicy(),
+        ProxyPolicy(),
+        ContentDecodePolicy(),
+        RedirectPolicy(),
+        RetryPolicy(),
+        CustomHookPolicy(),
+        NetworkTraceLoggingPolicy(),
+        DistributedTracingPolicy(),
+        HttpLoggingPolicy(),
+    ]
+
+
+def per_call(policies, calls):
+    pipeline = Pipeline(NoopTransport(), policies)
+    request = HttpRequest("GET", "https://example.org/")
+    pipeline.run(request)
+    return min(timeit.repeat(lambda: pipeline.run(request), number=calls, repeat=5)) / calls * 1e6
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+
+    empty = per_call([], calls)
+    print("{:<28}{:>8.2f} us/call".format("Empty pipeline", empty))
+    for policy in default_policies():
+        overhead = per_call([policy], calls) - empty
+        print("{:<28}{:>+8.2f} us/call".format(policy.__class__.__name__, overhead))
+    total = per_call(default_policies(), calls)
+    print("{:<28}{:>8.2f} us/call ({:+.2f} us/call over the empty pipeline)".format(
+        "Default policies", total, total - empty))
+    for name, policy_type in (("10 empty on_request hooks", EmptyRequestHook), ("10 policies without hook", SansIOHTTPPolicy)):
+        overhead = per_call([policy_type() for _ in range(10)], calls) - empty
+        print("{:<28}{:>+8.2f} us/call".format(name, overhead))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+"""Measure the overhead of distributed_trace and distributed_trace_async when tracing is disabled.
+
+Compares a plain method with the decorated one, and the lookup of the tracing setting with
+its cached value.
+
+Usage: python tests/benchmarks/tracing_decorator.py [calls]
+"""
+import asyncio
+import sys
+import timeit
+
+from azure.core.settings import settings
+from azure.core.tracing.decorator import distributed_trace
+from azure.core.tracing.decorator_async import distributed_trace_async
+
+
+class Client(object):
+    def get_secret(self, name, **kwargs):
+        return name
+
+    @distributed_trace
+    def traced_get_secret(self, name, **kwargs):
+        return name
+
+    async def get_secret_async(self, name, **kwargs):
+        return name
+
+    @distributed_trace_async
+    async def traced_get_secret_async(self, name, **kwargs):
+        return name
+
+
+def per_call(func, calls):
+    return min(timeit.repeat(func, number=calls, repeat=5)) / calls * 1e6
+
+
+def per_async_call(func, calls):
+    async def run():
+        for _ in range(calls):
+            await func("name")
+
+    def measure():
+        loop = asyncio.new_event_loop()
+        try:
+            loop.run_until_complete(run())
+        finally:
+            loop.close()
+
+    return min(timeit.repeat(measure, number=1, repeat=5)) / calls * 1e6
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    client = Client()
+
+    print("{:<40}{:>8.3f} us/call".format("settings.tracing_implementation()",
+                                          per_call(settings.tracing_implementation, calls)))
+    print("{:<40}{:>8.3f} us/call".format("settings.tracing_implementation.cached()",
+                                          per_call(settings.tracing_implementation.cached, calls)))
+
+    plain = per_call(lambda: client.get_secret("name"), calls)
+    traced = per_call(lambda: client.traced_get_secret("name"), calls)
+    print("{:<40}{:>8.3f} us/call (+{:.3f})".format("distributed_trace", traced, traced - plain))
+
+    plain = per_async_call(client.get_secret_async, calls)
+    traced = per_async_call(client.traced_get_secret_async, calls)
+    print("{:<40}{:>8.3f} us/call (+{:.3f})".format("distributed_trace_async", traced, traced - plain))
+
+
+if __name__ == "__main__":
+    main()
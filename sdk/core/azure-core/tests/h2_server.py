@@ -0,0 +1,131 @@
+# --------------------------------------------------------------------------
+#
+# Copyright (c) Microsoft Corporation. All rights reserved.
+#
+# The MIT License (MIT)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the ""Software""), to
+# deal in the Software without restriction, including without limitation the
+# rights to use, copy, modify, merge, publish, distribute, sublicense, and/or
+# sell copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in
+# all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED *AS IS*, WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING
+# FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS
+# IN THE SOFTWARE.
+#
+# --------------------------------------------------------------------------
+"""Local HTTP/2 server (cleartext, prior knowledge) for the httpx transport tests.
+
+Routes:
+- "/delay/<ms>": answers "ok" after this delay.
+- "/echo": answers with the request body.
+- "/bytes/<n>": answers n bytes.
+"""
+import asyncio
+import threading
+
+import h2.config
+import h2.connection
+import h2.events
+
+
+class _H2Protocol(asyncio.Protocol):
+    def __init__(self, server):
+        self._server = server
+        self._conn = h2.connection.H2Connection(config=h2.config.H2Configuration(client_side=False))
+        self._transport = None
+        self._requests = {}
+        self._pending = {}
+
+    def connection_made(self, transport):
+        self._transport = transport
+        self._server.connections += 1
+        self._conn.initiate_connection()
+        transport.write(self._conn.data_to_send())
+
+    def data_received(self, data):
+        for event in self._conn.receive_data(data):
+            if isinstance(event, h2.events.RequestReceived):
+                self._requests[event.stream_id] = (dict(event.headers), [])
+            elif isinstance(event, h2.events.DataReceived):
+                self._requests[event.stream_id][1].append(event.data)
+                self._conn.acknowledge_received_data(event.flow_controlled_length, event.stream_id)
+            elif isinstance(event, h2.events.StreamEnded):
+                asyncio.ensure_future(self._respond(event.stream_id))
+            elif isinstance(event, h2.events.WindowUpdated):
+                self._send_pending()
+        self._transport.write(self._conn.data_to_send())
+
+    async def _respond(self, stream_id):
+        headers, body = self._requests.pop(stream_id)
+        path = headers[b":path"].decode()
+        self._server.active += 1
+        self._server.max_active = max(self._server.max_active, self._server.active)
+        try:
+            if path.startswith("/delay/"):
+                await asyncio.sleep(int(path.split("/")[2]) / 1000.0)
+                content = b"ok"
+            elif path == "/echo":
+                content = b"".join(body)
+            else:
+                content = b"x" * int(path.split("/")[2])
+        finally:
+            self._server.active -= 1
+        self._conn.send_headers(stream_id, [
+            (":status", "200"),
+            ("content-length", str(len(content))),
+            ("content-type", "application/octet-stream"),
+        ])
+        self._pending[stream_id] = content
+        self._send_pending()
+        self._transport.write(self._conn.data_to_send())
+
+    def _send_pending(self):
+        for stream_id, content in list(self._pending.items()):
+            size = min(self._conn.local_flow_control_window(stream_id), self._conn.max_outbound_frame_size)
+            while content and size > 0:
+                self._conn.send_data(stream_id, content[:size])
+                content = content[size:]
+                size = min(self._conn.local_flow_control_window(stream_id), self._conn.max_outbound_frame_size)
+            if content:
+                self._pending[stream_id] = content
+            else:
+                del self._pending[stream_id]
+                self._conn.end_stream(stream_id)
+
+
+class H2Server(object):
+    """An HTTP/2 server running its own event loop in a daemon thread.
+
+    :ivar int connections: Number of connections accepted.
+    :ivar int max_active: Maximum number of requests processed at the same time.
+    """
+
+    def __init__(self):
+        self.connections = 0
+        self.active = 0
+        self.max_active = 0
+        self._loop = asyncio.new_event_loop()
+        self._server = self._loop.run_until_complete(
+            self._loop.create_server(lambda: _H2Protocol(self), "127.0.0.1", 0)
+        )
+        self.url = "http://127.0.0.1:{}".format(self._server.sockets[0].getsockname()[1])
+        self._thread = threading.Thread(target=self._loop.run_forever)
+        self._thread.daemon = True
+        self._thread.start()
+
+    def close(self):
+        def stop():
+            self._server.close()
+            self._loop.stop()
+        self._loop.call_soon_threadsafe(stop)
+        self._thread.join()
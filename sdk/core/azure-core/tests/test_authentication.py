@@ -8,7 +8,7 @@ import time
 import azure.core
 from azure.core.credentials import AccessToken, AzureKeyCredential
 from azure.core.exceptions import ServiceRequestError
-from azure.core.pipeline import Pipeline
+from azure.core.pipeline import Pipeline, PipelineContext, PipelineRequest
 from azure.core.pipeline.policies import BearerTokenCredentialPolicy, SansIOHTTPPolicy, AzureKeyCredentialPolicy
 from azure.core.pipeline.transport import HttpRequest
 
@@ -190,3 +190,69 @@ def test_azure_key_credential_updates():
     api_key = "new"
     credential.update(api_key)
     assert credential.key == api_key
+
+
+def test_bearer_policy_single_flight_refresh():
+    """While a token is being refreshed, other threads should keep using the still-valid token"""
+    import threading
+
+    expiring_token = AccessToken("old", time.time() + 60)
+    fresh_token = AccessToken("new", time.time() + 3600)
+    refresh_started = threading.Event()
+    release_refresh = threading.Event()
+
+    def get_token(*_, **__):
+        refresh_started.set()
+        release_refresh.wait(5)
+        return fresh_token
+
+    credential = Mock(get_token=Mock(side_effect=get_token))
+    policy = BearerTokenCredentialPolicy(credential, "scope")
+    policy._token = expiring_token
+
+    refreshing = threading.Thread(target=lambda: policy.on_request(PipelineRequest(HttpRequest("GET", "https://spam.eggs"), PipelineContext(None))))
+    refreshing.start()
+    assert refresh_started.wait(5)
+
+    # the refresh is in progress: this request shouldn't wait nor call get_token again
+    request = HttpRequest("GET", "https://spam.eggs")
+    policy.on_request(PipelineRequest(request, PipelineContext(None)))
+    assert request.headers["Authorization"] == "Bearer old"
+
+    release_refresh.set()
+    refreshing.join(5)
+    assert credential.get_token.call_count == 1
+    assert policy._token is fresh_token
+
+
+def test_bearer_policy_background_refresh():
+    """With background_refresh, a token about to expire should be refreshed in a background thread"""
+    expiring_token = AccessToken("old", time.time() + 60)
+    fresh_token = AccessToken("new", time.time() + 3600)
+    credential = Mock(get_token=Mock(return_value=fresh_token))
+    policy = BearerTokenCredentialPolicy(credential, "scope", background_refresh=True)
+    policy._token = expiring_token
+
+    request = HttpRequest("GET", "https://spam.eggs")
+    policy.on_request(PipelineRequest(request, PipelineContext(None)))
+
+    # the lock is held until the background refresh is done
+    with policy._lock:
+        assert policy._token is fresh_token
+    assert credential.get_token.call_count == 1
+
+
+def test_bearer_policy_refresh_failure_keeps_valid_token():
+    """A failed refresh shouldn't fail the request while the current token is still valid"""
+    expiring_token = AccessToken("old", time.time() + 60)
+    credential = Mock(get_token=Mock(side_effect=ValueError("identity endpoint unavailable")))
+    policy = BearerTokenCredentialPolicy(credential, "scope")
+    policy._token = expiring_token
+
+    request = HttpRequest("GET", "https://spam.eggs")
+    policy.on_request(PipelineRequest(request, PipelineContext(None)))
+    assert request.headers["Authorization"] == "Bearer old"
+
+    policy._token = AccessToken("old", time.time() - 1)
+    with pytest.raises(ValueError):
+        policy.on_request(PipelineRequest(request, PipelineContext(None)))
@@ -1085,6 +1085,95 @@ def test_recursive_multipart_receive():
     assert internal_response0.status_code == 400
 
 
+def test_multipart_send_preserves_sub_request_body():
+    req0 = HttpRequest("POST", "/table", headers={"Content-Type": "application/json"})
+    req0.set_bytes_body(b'{"a":\n"b"}\r\n')
+    req1 = HttpRequest("POST", "/table")
+
+    # Same serialization as the stdlib HTTPConnection
+    from azure.core.pipeline.transport._base import _HTTPSerializer
+    for req in (req0, req1):
+        serializer = _HTTPSerializer()
+        serializer.request(method=req.method, url=req.url, body=req.body, headers=req.headers)
+        assert req.serialize() == serializer.buffer
+
+    request = HttpRequest("POST", "http://account.table.core.windows.net/$batch")
+    request.set_multipart_mixed(req0, req1)
+    assert request.prepare_multipart_body() == 2
+
+    boundary = request.headers["Content-Type"].split("boundary=")[1]
+    assert request.body == (
+        "--{0}\r\n"
+        "Content-Type: application/http\r\n"
+        "Content-Transfer-Encoding: binary\r\n"
+        "Content-ID: 0\r\n"
+        "\r\n"
+        "POST /table HTTP/1.1\r\n"
+        "Content-Type: application/json\r\n"
+        "Content-Length: 12\r\n"
+        "\r\n"
+        '{{"a":\n"b"}}\r\n'
+        "\r\n"
+        "--{0}\r\n"
+        "Content-Type: application/http\r\n"
+        "Content-Transfer-Encoding: binary\r\n"
+        "Content-ID: 1\r\n"
+        "\r\n"
+        "POST /table HTTP/1.1\r\n"
+        "Content-Length: 0\r\n"
+        "\r\n"
+        "\r\n"
+        "--{0}--\r\n"
+    ).format(boundary).encode()
+
+
+def test_multipart_receive_preamble_and_lf():
+    req0 = HttpRequest("HEAD", "/container0/blob0")
+    req1 = HttpRequest("GET", "/container0/blob1")
+    req2 = HttpRequest("GET", "/container0/blob2")
+
+    request = HttpRequest("POST", "http://account.blob.core.windows.net/?comp=batch")
+    request.set_multipart_mixed(req0, req1, req2)
+    body_as_bytes = (
+        b"This is a preamble, with --batch in it\n"
+        b"--batch\n"
+        b"Content-Type: application/http\n"
+        b"\n"
+        b"HTTP/1.1 200 OK\n"
+        b"Content-Length: 10\n"
+        b"\n"
+        b"\n"
+        b"--batch\n"
+        b"Content-Type: Application/HTTP; charset=utf-8\n"
+        b"\n"
+        b"HTTP/1.1 200 OK\n"
+        b"Content-Length: 5\n"
+        b"x-ms-folded: one\n"
+        b" two\n"
+        b"\n"
+        b"--batched\n--batchy\n"
+        b"--batch\r\n"
+        b"Content-Type: application/http\r\n"
+        b"\r\n"
+        b"HTTP/1.1 200 OK\r\n"
+        b"Transfer-Encoding: chunked\r\n"
+        b"\r\n"
+        b"3\r\nabc\r\n0\r\n\r\n"
+        b"\r\n"
+        b"--batch--\r\n"
+        b"Epilogue\r\n"
+    )
+
+    response = MockResponse(request, body_as_bytes, 'multipart/mixed; boundary="batch"')
+    res0, res1, res2 = response.parts()
+
+    assert res0.request is req0
+    assert res0.body() == b""
+    assert res1.headers["x-ms-folded"] == "one two"
+    assert res1.body() == b"--bat"
+    assert res2.body() == b"abc"
+
+
 def test_close_unopened_transport():
     transport = RequestsTransport()
     transport.close()
@@ -1119,3 +1208,44 @@ def test_conflict_timeout(caplog):
     with pytest.raises(ValueError):
         with Pipeline(transport) as pipeline:
             pipeline.run(request, connection_timeout=(100, 100), read_timeout = 100)
+
+def test_set_file_body_is_memory_mapped(tmp_path):
+    path = tmp_path / "body.bin"
+    content = bytes(bytearray(range(256))) * 300
+    path.write_bytes(content)
+
+    with open(str(path), "rb") as stream:
+        stream.seek(70000)
+        request = HttpRequest("PUT", "http://127.0.0.1/")
+        request.set_file_body(stream, 1000)
+        assert isinstance(request.data, memoryview)
+        assert request.data.tobytes() == content[70000:71000]
+        assert request.headers["Content-Length"] == "1000"
+        assert stream.tell() == 71000
+
+        request.set_file_body(stream)
+        assert request.data.tobytes() == content[71000:]
+        assert stream.tell() == len(content)
+
+def test_set_file_body_bytesio_and_streams():
+    from io import BytesIO
+
+    stream = BytesIO(b"0123456789")
+    stream.seek(2)
+    request = HttpRequest("PUT", "http://127.0.0.1/")
+    request.set_file_body(stream, 5)
+    assert isinstance(request.data, memoryview)
+    assert request.data.tobytes() == b"23456"
+    assert stream.tell() == 7
+    request.data.release()
+
+    class Unmappable(object):
+        def __init__(self, data):
+            self._stream = BytesIO(data)
+
+        def read(self, size=-1):
+            return self._stream.read(size)
+
+    request.set_file_body(Unmappable(b"abcdef"), 4)
+    assert request.data == b"abcd"
+    assert request.headers["Content-Length"] == "4"
@@ -0,0 +1,142 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Tests for the caching policy."""
+from azure.core.pipeline import Pipeline
+from azure.core.pipeline.policies import CachingPolicy, CachedResponse, InMemoryResponseCache
+from azure.core.pipeline.transport import (
+    HttpRequest,
+    HttpResponse,
+    HttpTransport,
+)
+
+
+class MockResponse(HttpResponse):
+    def __init__(self, request, status, headers, body):
+        super(MockResponse, self).__init__(request, None)
+        self.status_code = status
+        self.headers = headers
+        self._body = body
+
+    def body(self):
+        return self._body
+
+
+class MockTransport(HttpTransport):
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.sent = []
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+    def close(self):
+        pass
+    def open(self):
+        pass
+
+    def send(self, request, **kwargs):  # type: (PipelineRequest, Any) -> PipelineResponse
+        self.sent.append(dict(request.headers))
+        status, headers, body = self._responses.pop(0)
+        return MockResponse(request, status, headers, body)
+
+
+def test_not_modified_served_from_cache():
+    transport = MockTransport([
+        (200, {"ETag": '"1"', "Content-Type": "application/json"}, b'{"value": 1}'),
+        (304, {"ETag": '"1"', "x-ms-request-id": "2"}, b""),
+        (200, {"ETag": '"2"'}, b'{"value": 2}'),
+        (304, {}, b""),
+    ])
+    pipeline = Pipeline(transport, [CachingPolicy()])
+    request = HttpRequest("GET", "https://example.org/setting")
+
+    assert pipeline.run(request).http_response.body() == b'{"value": 1}'
+    assert "If-None-Match" not in transport.sent[0]
+
+    response = pipeline.run(request).http_response
+    assert transport.sent[1]["If-None-Match"] == '"1"'
+    assert "If-None-Match" not in request.headers
+    assert response.status_code == 200
+    assert response.text() == '{"value": 1}'
+    assert response.headers["content-type"] == "application/json"
+    assert response.headers["x-ms-request-id"] == "2"
+
+    # Modified: the new version is stored
+    assert pipeline.run(request).http_response.body() == b'{"value": 2}'
+    assert transport.sent[2]["If-None-Match"] == '"1"'
+    assert pipeline.run(request).http_response.body() == b'{"value": 2}'
+    assert transport.sent[3]["If-None-Match"] == '"2"'
+
+
+def test_ttl():
+    transport = MockTransport([
+        (200, {"ETag": '"1"'}, b"policy ttl"),
+        (200, {"ETag": '"1"', "Cache-Control": "max-age=60"}, b"max-age"),
+        (200, {"ETag": '"1"', "Cache-Control": "max-age=60, no-store"}, b"no-store"),
+        (200, {}, b"no-store"),
+        (200, {}, b"operation ttl"),
+    ])
+    pipeline = Pipeline(transport, [CachingPolicy(cache_ttl=60)])
+    for _ in range(3):
+        assert pipeline.run(HttpRequest("GET", "https://example.org/1")).http_response.body() == b"policy ttl"
+    assert len(transport.sent) == 1
+
+    pipeline = Pipeline(transport, [CachingPolicy()])
+    for _ in range(2):
+        assert pipeline.run(HttpRequest("GET", "https://example.org/2")).http_response.body() == b"max-age"
+    assert len(transport.sent) == 2
+
+    for _ in range(2):
+        pipeline.run(HttpRequest("GET", "https://example.org/3"))
+    assert len(transport.sent) == 4
+    assert "If-None-Match" not in transport.sent[3]
+
+    for _ in range(2):
+        response = pipeline.run(HttpRequest("GET", "https://example.org/4"), cache_ttl=60).http_response
+        assert response.body() == b"operation ttl"
+    assert len(transport.sent) == 5
+
+
+def test_not_cached():
+    transport = MockTransport([(200, {"ETag": '"1"'}, b"")] * 4)
+    pipeline = Pipeline(transport, [CachingPolicy(cache_ttl=60)])
+
+    pipeline.run(HttpRequest("PUT", "https://example.org/1"))
+    pipeline.run(HttpRequest("GET", "https://example.org/1", headers={"Range": "bytes=0-1"}))
+    pipeline.run(HttpRequest("GET", "https://example.org/1"), stream=True)
+    pipeline.run(HttpRequest("GET", "https://example.org/1", headers={"If-None-Match": "*"}))
+    assert len(transport.sent) == 4
+    assert transport.sent[3]["If-None-Match"] == "*"
+
+
+def test_key_headers():
+    transport = MockTransport([(200, {"ETag": '"1"'}, b"v1"), (200, {"ETag": '"2"'}, b"v2")])
+    pipeline = Pipeline(transport, [CachingPolicy(cache_ttl=60)])
+    for _ in range(2):
+        for version in ("v1", "v2"):
+            response = pipeline.run(HttpRequest("GET", "https://example.org/1", headers={"x-ms-version": version}))
+            assert response.http_response.body() == version.encode()
+    assert len(transport.sent) == 2
+
+
+def test_lru_bounds():
+    def cached(size):
+        return CachedResponse(200, "OK", {}, b"x" * size, 0)
+
+    cache = InMemoryResponseCache(max_entries=2, max_bytes=100)
+    cache.set("a", cached(10))
+    cache.set("b", cached(10))
+    assert cache.get("a") is not None
+    cache.set("c", cached(10))
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+    cache.set("d", cached(85))
+    assert cache.get("a") is None
+    assert cache.get("c") is not None
+    assert cache.size == 95
+
+    cache.set("e", cached(101))
+    assert cache.get("e") is None
+    cache.delete("d")
+    assert cache.size == 10
@@ -0,0 +1,112 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+import threading
+import time
+
+from six.moves import BaseHTTPServer, socketserver
+import pytest
+
+from azure.core.pipeline import Pipeline
+from azure.core.pipeline.transport import (
+    HttpRequest,
+    RequestsTransport,
+    RequestsConnectionPool,
+    ConnectionPoolStatistics,
+)
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def server_url():
+    server = _Server(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        yield "http://127.0.0.1:{}".format(server.server_address[1])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_statistics_add():
+    total = ConnectionPoolStatistics(1, 2, 3, 0.5, 4) + ConnectionPoolStatistics(1, 1, 1, 0.5, 1)
+    assert (total.hits, total.misses, total.waits, total.wait_time, total.evictions) == (2, 3, 4, 1.0, 5)
+
+
+def test_pool_shared_between_transports(server_url):
+    pool = RequestsConnectionPool()
+    for _ in range(3):
+        with Pipeline(RequestsTransport(connection_pool=pool)) as pipeline:
+            response = pipeline.run(HttpRequest("GET", server_url))
+            assert response.http_response.status_code == 200
+
+    # Closing the transports must not close the shared sockets
+    stats = pool.statistics()
+    assert stats.misses == 1
+    assert stats.hits == 2
+    assert pool.hosts() == [server_url]
+
+    pool.close()
+    pool.reset_statistics()
+    assert pool.statistics().hits == 0
+
+
+def test_pool_idle_eviction(server_url):
+    pool = RequestsConnectionPool(idle_timeout=0.01)
+    transport = RequestsTransport(connection_pool=pool)
+    with Pipeline(transport) as pipeline:
+        pipeline.run(HttpRequest("GET", server_url))
+        time.sleep(0.05)
+        pipeline.run(HttpRequest("GET", server_url))
+
+    stats = pool.statistics()
+    assert stats.evictions == 1
+    assert stats.hits == 0
+    assert stats.misses == 2
+
+
+def test_pool_used_from_threads(server_url):
+    pool = RequestsConnectionPool(pool_maxsize=2, pool_block=True)
+
+    def worker():
+        with Pipeline(RequestsTransport(connection_pool=pool)) as pipeline:
+            for _ in range(5):
+                pipeline.run(HttpRequest("GET", server_url))
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = pool.statistics()
+    assert stats.hits + stats.misses == 20
+    assert stats.misses <= 2
+
+
+def test_shared_pool_is_process_wide():
+    first = RequestsTransport(use_shared_connection_pool=True)
+    second = RequestsTransport(use_shared_connection_pool=True)
+    assert first.connection_pool is RequestsConnectionPool.shared()
+    assert first.connection_pool is second.connection_pool
+    assert RequestsTransport().connection_pool is None
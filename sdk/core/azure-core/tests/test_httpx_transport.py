@@ -0,0 +1,109 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+import threading
+
+from six.moves import BaseHTTPServer, socketserver
+import pytest
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+from azure.core.exceptions import ServiceRequestError
+from azure.core.pipeline import Pipeline
+from azure.core.pipeline.transport import HttpRequest, HttpxTransport
+
+from h2_server import H2Server
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def h2_server():
+    server = H2Server()
+    try:
+        yield server
+    finally:
+        server.close()
+
+
+def _h2_transport(**kwargs):
+    # Cleartext HTTP/2 needs prior knowledge, TLS connections negotiate it
+    return HttpxTransport(client=httpx.Client(http1=False, http2=True), **kwargs)
+
+
+def test_requests_from_threads_are_multiplexed(h2_server):
+    results = []
+    with Pipeline(_h2_transport()) as pipeline:
+        def worker():
+            response = pipeline.run(HttpRequest("GET", h2_server.url + "/delay/200")).http_response
+            results.append((response.status_code, response.text(), response.http_version))
+
+        threads = [threading.Thread(target=worker) for _ in range(20)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+    assert results == [(200, "ok", "HTTP/2")] * 20
+    assert h2_server.connections == 1
+    assert h2_server.max_active > 1
+
+
+def test_bytes_like_and_stream_bodies(h2_server):
+    with Pipeline(_h2_transport()) as pipeline:
+        request = HttpRequest("POST", h2_server.url + "/echo")
+        request.set_bytes_body(memoryview(b"abcdef")[1:4])
+        assert pipeline.run(request).http_response.body() == b"bcd"
+
+        request = HttpRequest("POST", h2_server.url + "/echo")
+        request.set_streamed_data_body(iter([b"ab", b"cd"]))
+        assert pipeline.run(request).http_response.body() == b"abcd"
+
+
+def test_stream_download(h2_server):
+    with Pipeline(_h2_transport(connection_data_block_size=1000)) as pipeline:
+        response = pipeline.run(HttpRequest("GET", h2_server.url + "/bytes/100000"), stream=True).http_response
+        chunks = list(response.stream_download(pipeline))
+    assert sum(len(chunk) for chunk in chunks) == 100000
+    assert max(len(chunk) for chunk in chunks) <= 1000
+
+
+def test_http1_server():
+    server = _Server(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        with HttpxTransport() as transport:
+            response = transport.send(HttpRequest("GET", "http://127.0.0.1:{}".format(server.server_address[1])))
+        assert response.body() == b"ok"
+        assert response.http_version == "HTTP/1.1"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_client_options():
+    with HttpxTransport() as transport:
+        with pytest.raises(ValueError):
+            transport.send(HttpRequest("GET", "http://127.0.0.1:1"), connection_verify=False)
+        with pytest.raises(ServiceRequestError):
+            transport.send(HttpRequest("GET", "http://127.0.0.1:1"))
@@ -0,0 +1,152 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See LICENSE.txt in the project root for
+# license information.
+# -------------------------------------------------------------------------
+import threading
+
+from six.moves import BaseHTTPServer, socketserver
+import pytest
+
+from azure.core import PipelineClient
+from azure.core.pipeline import Pipeline, PipelineInstrumentation, PrometheusExporter, Histogram
+from azure.core.pipeline.policies import HeadersPolicy, RetryPolicy
+from azure.core.pipeline.transport import HttpRequest, HttpResponse, HttpTransport
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+class _Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+@pytest.fixture
+def server_url():
+    server = _Server(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    try:
+        yield "http://127.0.0.1:{}".format(server.server_address[1])
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+class MockTransport(HttpTransport):
+    def __init__(self, statuses):
+        self._statuses = list(statuses)
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+    def close(self):
+        pass
+    def open(self):
+        pass
+
+    def send(self, request, **kwargs):
+        response = HttpResponse(request, None)
+        response.status_code = self._statuses.pop(0)
+        return response
+
+
+def _get(instrumentation, name, **labels):
+    for metric, metric_labels, histogram in instrumentation.histograms():
+        if metric == name and metric_labels == labels:
+            return histogram
+    return None
+
+
+def test_histogram():
+    histogram = Histogram([0.1, 1])
+    for value in (0.05, 0.5, 0.5, 5):
+        histogram.observe(value)
+    assert histogram.buckets() == [(0.1, 1), (1, 3), (float("inf"), 4)]
+    assert histogram.count == 4
+    assert histogram.sum == 6.05
+
+
+def test_pipeline_instrumentation():
+    instrumentation = PipelineInstrumentation()
+    policies = [HeadersPolicy(), RetryPolicy(retry_backoff_factor=0)]
+    pipeline = Pipeline(MockTransport([500, 200, 200]), policies, instrumentation=instrumentation)
+    pipeline.run(HttpRequest("GET", "https://example.org"))
+    pipeline.run(HttpRequest("GET", "https://example.org"))
+
+    assert _get(instrumentation, PipelineInstrumentation.POLICY_DURATION, policy="HeadersPolicy").count == 2
+    assert _get(instrumentation, PipelineInstrumentation.POLICY_DURATION, policy="RetryPolicy").count == 2
+    assert _get(instrumentation, PipelineInstrumentation.POLICY_DURATION, policy="MockTransport").count == 3
+    retries = _get(instrumentation, PipelineInstrumentation.RETRIES)
+    assert retries.count == 2
+    assert retries.sum == 1
+
+
+def test_not_instrumented():
+    pipeline = Pipeline(MockTransport([200]), [HeadersPolicy()])
+    response = pipeline.run(HttpRequest("GET", "https://example.org"))
+    assert "instrumentation" not in response.context
+
+
+def test_prometheus_exporter():
+    instrumentation = PipelineInstrumentation()
+    instrumentation.observe(PipelineInstrumentation.POLICY_DURATION, 0.2, policy="RetryPolicy")
+    instrumentation.observe(PipelineInstrumentation.RETRIES, 1)
+    instrumentation.observe("custom", 1, policy='a"b')
+    exporter = PrometheusExporter(instrumentation)
+    text = exporter.generate()
+    lines = text.splitlines()
+    assert "# TYPE azure_core_policy_duration_seconds histogram" in lines
+    assert 'azure_core_policy_duration_seconds_bucket{le="0.1",policy="RetryPolicy"} 0' in lines
+    assert 'azure_core_policy_duration_seconds_bucket{le="0.25",policy="RetryPolicy"} 1' in lines
+    assert 'azure_core_policy_duration_seconds_bucket{le="+Inf",policy="RetryPolicy"} 1' in lines
+    assert 'azure_core_policy_duration_seconds_count{policy="RetryPolicy"} 1' in lines
+    assert "azure_core_request_retries_sum 1.0" in lines
+    assert 'custom_count{policy="a\\"b"} 1' in lines
+
+    status = []
+    body = exporter({}, lambda code, headers: status.append(code))
+    assert status == ["200 OK"]
+    assert body == [text.encode("utf-8")]
+
+
+def test_pluggable_histograms():
+    created = []
+
+    class Recorder(object):
+        def __init__(self, name, labels):
+            self.values = []
+            created.append((name, labels, self))
+        def observe(self, value):
+            self.values.append(value)
+
+    instrumentation = PipelineInstrumentation(histogram_factory=Recorder)
+    pipeline = Pipeline(MockTransport([200]), [HeadersPolicy()], instrumentation=instrumentation)
+    pipeline.run(HttpRequest("GET", "https://example.org"))
+    assert sorted(labels["policy"] for _, labels, _ in created) == ["HeadersPolicy", "MockTransport"]
+    assert all(len(recorder.values) == 1 for _, _, recorder in created)
+    # Not exported, no "buckets"
+    assert PrometheusExporter(instrumentation).generate() == "\n"
+
+
+def test_requests_transport_phases(server_url):
+    instrumentation = PipelineInstrumentation()
+    with PipelineClient(server_url, instrumentation=instrumentation) as client:
+        for _ in range(2):
+            response = client._pipeline.run(client.get("/"))
+            assert response.http_response.body() == b"ok"
+
+    phase = PipelineInstrumentation.TRANSPORT_PHASE
+    assert _get(instrumentation, phase, phase="connect").count == 1
+    assert _get(instrumentation, phase, phase="ttfb").count == 2
+    assert _get(instrumentation, phase, phase="body").count == 2
+    assert _get(instrumentation, PipelineInstrumentation.POLICY_DURATION, policy="RequestsTransport").count == 2
@@ -142,3 +142,46 @@ class TestPaging(object):
         pager = ItemPaged(get_next, extract_data)
         output = repr(pager)
         assert output.startswith('<iterator object azure.core.paging.ItemPaged at')
+
+    def test_by_page_prefetch(self):
+        import threading
+        fetched = []
+        consumer_ready = threading.Event()
+
+        def get_next(continuation_token=None):
+            page = int(continuation_token or 0)
+            fetched.append(page)
+            if page == 1:
+                # the second page is fetched while the first one is processed
+                assert consumer_ready.wait(5)
+            return {
+                'nextLink': str(page + 1) if page < 4 else None,
+                'value': ['value{}.0'.format(page), 'value{}.1'.format(page)]
+            }
+
+        def extract_data(response):
+            return response['nextLink'], iter(response['value'])
+
+        pager = ItemPaged(get_next, extract_data).by_page(prefetch=2)
+        assert list(next(pager)) == ['value0.0', 'value0.1']
+        assert pager.continuation_token == '1'
+        consumer_ready.set()
+        assert [list(page) for page in pager] == [['value{}.0'.format(i), 'value{}.1'.format(i)] for i in range(1, 5)]
+        assert pager.continuation_token is None
+        assert fetched == [0, 1, 2, 3, 4]
+
+    def test_by_page_prefetch_error(self):
+        def get_next(continuation_token=None):
+            if continuation_token:
+                raise ValueError("page2")
+            return {'nextLink': 'page2', 'value': ['value1.0']}
+
+        def extract_data(response):
+            return response['nextLink'], iter(response['value'])
+
+        pager = ItemPaged(get_next, extract_data).by_page(prefetch=1)
+        assert list(next(pager)) == ['value1.0']
+        with pytest.raises(ValueError):
+            next(pager)
+        with pytest.raises(StopIteration):
+            next(pager)
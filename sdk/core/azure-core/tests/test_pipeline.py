@@ -113,6 +113,72 @@ def test_sans_io_exception():
     with pytest.raises(NotImplementedError):
         pipeline.run(req)
 
+
+@pytest.mark.filterwarnings("ignore:coroutine:RuntimeWarning")
+def test_sans_io_hooks():
+    calls = []
+
+    class Recorder(SansIOHTTPPolicy):
+        def __init__(self, name):
+            self.name = name
+
+        def on_request(self, request):
+            calls.append(self.name + ".on_request")
+            if request.context.options.get("fail_in") == self.name:
+                raise ValueError(self.name)
+
+        def on_response(self, request, response):
+            calls.append(self.name + ".on_response")
+
+    class RequestOnly(Recorder):
+        on_response = SansIOHTTPPolicy.on_response
+
+    class Handler(Recorder):
+        def on_exception(self, request):
+            calls.append(self.name + ".on_exception")
+            return False
+
+    class Sender(HttpTransport):
+        def __exit__(self, *args):
+            pass
+        def open(self):
+            pass
+        def close(self):
+            pass
+        def send(self, request, **kwargs):
+            if kwargs.get("fail_in") == "transport":
+                raise ValueError("transport")
+            return "response"
+
+    policies = [Recorder("a"), SansIOHTTPPolicy(), RequestOnly("b"), Handler("c"), Recorder("d"), RequestOnly("e")]
+    pipeline = Pipeline(Sender(), policies)
+    # a and b run in a single runner, c has its own to handle exceptions
+    assert len(pipeline._impl_policies) == 3
+
+    assert pipeline.run(HttpRequest("GET", "/")).http_response == "response"
+    assert calls == [
+        "a.on_request", "b.on_request", "c.on_request", "d.on_request", "e.on_request",
+        "d.on_response", "c.on_response", "a.on_response"
+    ]
+
+    for fail_in, expected in (
+        ("transport", ["a", "b", "c", "d", "e", "c.on_exception"]),
+        ("e", ["a", "b", "c", "d", "e", "c.on_exception"]),
+        ("b", ["a", "b"]),
+    ):
+        del calls[:]
+        with pytest.raises(ValueError):
+            pipeline.run(HttpRequest("GET", "/"), fail_in=fail_in)
+        assert calls == [call if "." in call else call + ".on_request" for call in expected]
+
+    class AsyncHook(SansIOHTTPPolicy):
+        async def on_request(self, request):
+            pass
+
+    pipeline = Pipeline(Sender(), [Recorder("a"), AsyncHook()])
+    with pytest.raises(TypeError):
+        pipeline.run(HttpRequest("GET", "/"))
+
 class TestRequestsTransport(unittest.TestCase):
 
     def test_basic_requests(self):
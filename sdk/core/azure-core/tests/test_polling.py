@@ -221,3 +221,63 @@ def test_broken_poller(client):
     with pytest.raises(ValueError) as excinfo:
         poller.result()
     assert "Something bad happened" in str(excinfo.value)
+
+
+class PollingSteps(PollingTwoSteps):
+    """Steppable polling method, finished after "steps" status updates."""
+    def __init__(self, steps=2, error=None):
+        super(PollingSteps, self).__init__(sleep=0)
+        self._steps = steps
+        self._error = error
+        self.polls = 0
+
+    def _can_poll_step(self):
+        return True
+
+    def _extract_delay(self):
+        return 0.01
+
+    def _poll_step(self):
+        self.polls += 1
+        if self._error and self.polls == self._steps:
+            raise self._error
+        if self.polls == self._steps:
+            self._finished = True
+        return self._finished
+
+    def run(self):
+        raise AssertionError("A scheduled poller must not call run")
+
+
+def test_poller_with_scheduler(client):
+    scheduler = LROPollScheduler(max_workers=2)
+    LROPollScheduler.set_default(scheduler)
+    try:
+        methods = [PollingSteps(steps=3) for _ in range(20)]
+        done_cb = mock.MagicMock()
+        pollers = [LROPoller(client, "Initial response", lambda r: "Treated: " + r, m) for m in methods]
+        for poller in pollers:
+            poller.add_done_callback(done_cb)
+        for poller in pollers:
+            assert poller.result(timeout=5) == "Treated: Initial response"
+            assert poller.done()
+        assert all(m.polls == 3 for m in methods)
+        assert done_cb.call_count == 20
+        assert len(scheduler) == 0
+    finally:
+        LROPollScheduler.set_default(None)
+        scheduler.close()
+
+
+def test_poller_with_scheduler_error(client):
+    scheduler = LROPollScheduler()
+    LROPollScheduler.set_default(scheduler)
+    try:
+        method = PollingSteps(error=ValueError("Something bad happened"))
+        poller = LROPoller(client, "Initial response", lambda r: r, method)
+        with pytest.raises(ValueError) as excinfo:
+            poller.result()
+        assert "Something bad happened" in str(excinfo.value)
+    finally:
+        LROPollScheduler.set_default(None)
+        scheduler.close()
@@ -0,0 +1,89 @@
+# ------------------------------------
+# Copyright (c) Microsoft Corporation.
+# Licensed under the MIT License.
+# ------------------------------------
+"""Tests for the rate limit policy."""
+import time
+
+from azure.core.pipeline import Pipeline
+from azure.core.pipeline.policies import RateLimitPolicy, RateLimiter
+from azure.core.pipeline.transport import (
+    HttpRequest,
+    HttpResponse,
+    HttpTransport,
+)
+
+
+class MockTransport(HttpTransport):
+    def __init__(self, responses):
+        self._responses = list(responses)
+        self.sent = []
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+    def close(self):
+        pass
+    def open(self):
+        pass
+
+    def send(self, request, **kwargs):  # type: (PipelineRequest, Any) -> PipelineResponse
+        self.sent.append(time.time())
+        status, headers = self._responses.pop(0) if self._responses else (200, {})
+        response = HttpResponse(request, None)
+        response.status_code = status
+        response.headers = headers
+        return response
+
+
+def test_not_limited_until_throttled():
+    limiter = RateLimiter()
+    transport = MockTransport([])
+    pipeline = Pipeline(transport, [RateLimitPolicy(rate_limiter=limiter)])
+    start = time.time()
+    for _ in range(50):
+        pipeline.run(HttpRequest("GET", "https://example.org/path"))
+    assert time.time() - start < 0.5
+    assert limiter.get_rate("https://example.org") is None
+
+
+def test_throttled_with_retry_after():
+    limiter = RateLimiter(min_rate=10)
+    transport = MockTransport([(429, {"Retry-After": "1"})])
+    first = Pipeline(transport, [RateLimitPolicy(rate_limiter=limiter)])
+    second = Pipeline(transport, [RateLimitPolicy(rate_limiter=limiter)])
+
+    response = first.run(HttpRequest("GET", "https://example.org/path"))
+    assert response.http_response.status_code == 429
+    assert limiter.get_rate("https://example.org") == 10
+
+    # Another pipeline using the same limiter is held too, other hosts are not
+    second.run(HttpRequest("GET", "https://other.org/path"))
+    assert transport.sent[1] - transport.sent[0] < 0.5
+    second.run(HttpRequest("GET", "https://example.org/path"))
+    assert transport.sent[2] - transport.sent[0] >= 0.9
+
+
+def test_rate_limit_key_and_remaining_header():
+    limiter = RateLimiter(min_rate=5)
+    transport = MockTransport([(200, {"x-ms-ratelimit-remaining-subscription-reads": "0"})])
+    pipeline = Pipeline(transport, [RateLimitPolicy(rate_limiter=limiter, rate_limit_key="account")])
+    pipeline.run(HttpRequest("GET", "https://example.org/path"))
+    assert limiter.get_rate("account") == 5
+    assert limiter.get_rate("https://example.org") is None
+
+    # Burst is over, next requests are spaced by 1 / rate
+    pipeline.run(HttpRequest("GET", "https://example.org/path"))
+    pipeline.run(HttpRequest("GET", "https://example.org/path"))
+    assert transport.sent[2] - transport.sent[1] >= 0.15
+
+
+def test_rate_limit_key_on_retries():
+    from azure.core.pipeline.policies import RetryPolicy
+    limiter = RateLimiter(min_rate=10)
+    transport = MockTransport([(429, {"Retry-After": "0"}), (429, {"Retry-After": "0"})])
+    pipeline = Pipeline(transport, [RetryPolicy(), RateLimitPolicy(rate_limiter=limiter)])
+    response = pipeline.run(HttpRequest("GET", "https://example.org/path"), rate_limit_key="account")
+    assert response.http_response.status_code == 200
+    assert len(transport.sent) == 3
+    # The retries were admitted by the bucket of the operation's key, not the one of the host
+    assert limiter.get_rate("account") is not None
+    assert limiter.get_rate("https://example.org") is None
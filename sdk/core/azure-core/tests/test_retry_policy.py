@@ -236,3 +236,70 @@ def test_retry_timeout():
     with pytest.raises(ServiceResponseTimeoutError):
         pipeline.run(http_request)
 
+
+def test_latency_histogram():
+    from azure.core.pipeline.policies._hedging import _LatencyHistogram
+    histogram = _LatencyHistogram()
+    assert histogram.percentile(50) is None
+    for _ in range(90):
+        histogram.record(0.01)
+    for _ in range(10):
+        histogram.record(1)
+    assert 0.01 <= histogram.percentile(50) < 0.012
+    assert 1 <= histogram.percentile(95) < 1.2
+    assert histogram.count == 100
+
+def test_hedged_request():
+    class MockTransport(HttpTransport):
+        thread_safe = True
+
+        def __init__(self):
+            self._count = 0
+            self.slow = False
+        def __exit__(self, exc_type, exc_val, exc_tb):
+            pass
+        def close(self):
+            pass
+        def open(self):
+            pass
+
+        def send(self, request, **kwargs):  # type: (PipelineRequest, Any) -> PipelineResponse
+            self._count += 1
+            if self.slow:
+                self.slow = False
+                time.sleep(1)
+            else:
+                time.sleep(0.01)
+            response = HttpResponse(request, None)
+            response.status_code = 200
+            return response
+
+    transport = MockTransport()
+    pipeline = Pipeline(transport, [RetryPolicy(retry_hedge_percentile=95)])
+    for _ in range(RetryPolicy._HEDGE_MIN_SAMPLES):
+        pipeline.run(HttpRequest('GET', 'http://127.0.0.1/'))
+    assert transport._count == RetryPolicy._HEDGE_MIN_SAMPLES
+
+    transport.slow = True
+    start = time.time()
+    response = pipeline.run(HttpRequest('GET', 'http://127.0.0.1/'))
+    assert response.http_response.status_code == 200
+    assert time.time() - start < 0.5
+    assert transport._count == RetryPolicy._HEDGE_MIN_SAMPLES + 2
+
+    # Not hedged: method with side effects
+    transport.slow = True
+    pipeline.run(HttpRequest('PUT', 'http://127.0.0.1/'))
+    assert transport._count == RetryPolicy._HEDGE_MIN_SAMPLES + 3
+
+    # Not hedged: the transport can't send from two threads at once
+    transport.thread_safe = False
+    transport.slow = True
+    pipeline.run(HttpRequest('GET', 'http://127.0.0.1/'))
+    assert transport._count == RetryPolicy._HEDGE_MIN_SAMPLES + 4
+
+
+def test_requests_transport_thread_safe():
+    from azure.core.pipeline.transport import RequestsConnectionPool, RequestsTransport
+    assert not RequestsTransport().thread_safe
+    assert RequestsTransport(connection_pool=RequestsConnectionPool()).thread_safe
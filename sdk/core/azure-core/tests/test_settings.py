@@ -117,6 +117,47 @@ class TestPrioritizedSetting(object):
 
         del os.environ["AZURE_FOO"]
 
+    def test_cached(self):
+        converted = []
+
+        def convert(value):
+            converted.append(value)
+            return value
+
+        ps = m.PrioritizedSetting("foo", env_var="AZURE_FOO", convert=convert, default=10)
+        assert ps.cached() == 10
+        assert ps.cached() == 10
+        assert converted == [10]
+
+        ps.set_value(40)
+        assert ps.cached() == 40
+        ps.unset_value()
+        assert ps.cached() == 10
+
+        os.environ["AZURE_FOO"] = "30"
+        try:
+            assert ps.cached() == "30"
+            # A change in place of the value is seen too
+            os.environ["AZURE_FOO"] = "31"
+            assert ps.cached() == "31"
+        finally:
+            del os.environ["AZURE_FOO"]
+        assert ps.cached() == 10
+
+        # The conversion may depend on the imported modules
+        sys.modules["azure_foo_module"] = sys
+        try:
+            ps.cached()
+        finally:
+            del sys.modules["azure_foo_module"]
+        assert converted == [10, 40, 10, "30", "31", 10, 10]
+
+    def test_cached_system_hook(self):
+        values = iter([20, 21])
+        ps = m.PrioritizedSetting("foo", system_hook=lambda: next(values))
+        assert ps.cached() == 20
+        assert ps.cached() == 21
+
     def test___str__(self):
         ps = m.PrioritizedSetting("foo")
         assert str(ps) == "PrioritizedSetting(%r)" % "foo"
@@ -88,6 +88,19 @@ def random_function():
     pass
 
 
+def test_tracing_disabled_removes_keywords():
+    @distributed_trace
+    def get_kwargs(**kwargs):
+        return kwargs
+
+    settings.tracing_implementation.set_value(None)
+    try:
+        assert get_kwargs(merge_span=True, parent_span=None, other=1) == {"other": 1}
+        assert get_kwargs() == {}
+    finally:
+        settings.tracing_implementation.set_value(FakeSpan)
+
+
 def test_get_function_and_class_name():
     client = MockClient()
     assert common.get_function_and_class_name(client.get_foo, client) == "MockClient.get_foo"
@@ -26,6 +26,7 @@
 #--------------------------------------------------------------------------
 import logging
 import pickle
+import sys
 try:
     from unittest import mock
 except ImportError:
@@ -114,6 +115,23 @@ def test_request_history_type_error():
     assert request_history.http_request.url == request.url
     assert request_history.http_request.method == request.method
 
+def test_request_history_shares_body():
+    body = bytearray(b"x" * 1024)
+    request = HttpRequest('PUT', 'http://127.0.0.1/', {'user-agent': 'test_request_history'})
+    request.set_bytes_body(body)
+    request_history = RequestHistory(request)
+    assert request_history.http_request.data is body
+
+    # The record is a snapshot of what was sent
+    request.url = 'http://127.0.0.1/redirected'
+    request.headers['user-agent'] = 'changed'
+    assert request_history.http_request.url == 'http://127.0.0.1/'
+    assert request_history.http_request.headers['user-agent'] == 'test_request_history'
+
+    request_history = RequestHistory(request, deep_copy=True)
+    assert request_history.http_request.data == body
+    assert request_history.http_request.data is not body
+
 @mock.patch('azure.core.pipeline.policies._universal._LOGGER')
 def test_no_log(mock_http_logger):
     universal_request = HttpRequest('GET', 'http://127.0.0.1/')
@@ -325,6 +343,112 @@ def test_raw_deserializer():
     assert response.context["response_encoding"] == "utf-8-sig"
     del request.context['response_encoding']
 
+
+def _chunked(data, size=3):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+def test_stream_deserializer():
+    body = u'\ufeff{"value": [{"name": "a", "size": 12}, {"name": "é", "tags": [1, 2.5, null]}], "nextLink": "next"}'.encode("utf-8")
+    for size in (1, 2, 7, len(body)):
+        result = ContentDecodePolicy.deserialize_from_stream(_chunked(body, size), "application/json")
+        assert result == {"value": [{"name": "a", "size": 12}, {"name": u"é", "tags": [1, 2.5, None]}], "nextLink": "next"}
+
+        items = ContentDecodePolicy.iter_items_from_stream(_chunked(body, size), "application/json", items="value")
+        assert list(items) == [{"name": "a", "size": 12}, {"name": u"é", "tags": [1, 2.5, None]}]
+        assert items.document == {"nextLink": "next"}
+
+    assert list(ContentDecodePolicy.iter_items_from_stream(_chunked(b'[1, 22, 333] '), "application/json")) == [1, 22, 333]
+    assert list(ContentDecodePolicy.iter_items_from_stream(_chunked(b'[]'), "application/json")) == []
+    assert ContentDecodePolicy.deserialize_from_stream(_chunked(b'12345'), "application/json") == 12345
+    assert ContentDecodePolicy.deserialize_from_stream(_chunked(b'{}'), "application/json") == {}
+    assert ContentDecodePolicy.deserialize_from_stream(_chunked(b'I am groot'), "text/plain") == "I am groot"
+
+    # Like deserialize_from_text, an empty body (202, 204...) is None
+    assert ContentDecodePolicy.deserialize_from_text(b'', "application/json") is None
+    assert ContentDecodePolicy.deserialize_from_stream([], "application/json") is None
+    assert ContentDecodePolicy.deserialize_from_stream([b'', b''], "application/xml") is None
+    items = ContentDecodePolicy.iter_items_from_stream([b''], "application/json", items="value")
+    assert list(items) == []
+    assert items.document is None
+
+    for invalid in (b'{"value": [1, 2', b'{"value" 1}', b'[1, 2] 3', b'{{gibberish}}'):
+        with pytest.raises(DecodeError):
+            ContentDecodePolicy.deserialize_from_stream(_chunked(invalid), "application/json")
+        with pytest.raises(DecodeError):
+            list(ContentDecodePolicy.iter_items_from_stream(_chunked(invalid), "application/json", items="value"))
+
+
+@pytest.mark.skipif(sys.version_info < (3, 4), reason="Incremental XML decoding requires XMLPullParser")
+def test_stream_deserializer_xml():
+    body = (
+        b'<?xml version="1.0" encoding="utf-8"?><EnumerationResults><Blobs>'
+        b'<Blob><Name>a</Name></Blob><Blob><Name>b</Name></Blob>'
+        b'</Blobs><NextMarker>marker</NextMarker></EnumerationResults>'
+    )
+    result = ContentDecodePolicy.deserialize_from_stream(_chunked(body), "application/xml")
+    assert [blob.find("Name").text for blob in result.iter("Blob")] == ["a", "b"]
+
+    items = ContentDecodePolicy.iter_items_from_stream(_chunked(body), "application/xml", items="Blob")
+    assert [blob.find("Name").text for blob in items] == ["a", "b"]
+    assert items.document.find("NextMarker").text == "marker"
+    assert items.document.find("Blobs").find("Blob") is None
+
+    with pytest.raises(DecodeError):
+        ContentDecodePolicy.deserialize_from_stream(_chunked(b'<groot>'), "application/xml")
+
+    # JSON sent with an XML content type, as deserialize_from_text accepts it
+    body = b' {"error": {"code": "InternalError"}}'
+    assert ContentDecodePolicy.deserialize_from_text(body, "application/xml") == {"error": {"code": "InternalError"}}
+    assert ContentDecodePolicy.deserialize_from_stream(_chunked(body), "application/xml") == {"error": {"code": "InternalError"}}
+    with pytest.raises(DecodeError):
+        ContentDecodePolicy.deserialize_from_stream(_chunked(b'groot'), "application/xml")
+
+
+def test_stream_decode_option():
+    class MockResponse(HttpResponse):
+        def __init__(self, body, content_type):
+            super(MockResponse, self).__init__(None, None)
+            self._body = body
+            self.content_type = content_type
+
+        def body(self):
+            raise AssertionError("Body should not be loaded")
+
+        def stream_download(self, pipeline):
+            return iter(_chunked(self._body))
+
+    policy = ContentDecodePolicy()
+    request = PipelineRequest(HttpRequest('GET', 'http://127.0.0.1/'), PipelineContext(mock.Mock(spec=["__enter__", "__exit__", "send"]), stream_decode=True))
+    policy.on_request(request)
+    assert request.context.options == {"stream": True}
+
+    response = PipelineResponse(request.http_request, MockResponse(b'{"success": true}', "application/json"), request.context)
+    policy.on_response(request, response)
+    assert response.context["deserialized_data"] == {"success": True}
+
+    response = PipelineResponse(request.http_request, MockResponse(b'', "application/json"), request.context)
+    policy.on_response(request, response)
+    assert response.context["deserialized_data"] is None
+
+    # The elements are decoded lazily, as the caller iterates
+    request = PipelineRequest(HttpRequest('GET', 'http://127.0.0.1/'), PipelineContext(mock.Mock(spec=["__enter__", "__exit__", "send"]), stream_decode_items="value"))
+    policy.on_request(request)
+    assert request.context.options == {"stream": True}
+    response = PipelineResponse(request.http_request, MockResponse(b'{"value": [1, 2, 3], "nextLink": "next"}', "application/json"), request.context)
+    policy.on_response(request, response)
+    items = response.context["deserialized_data"]
+    assert next(items) == 1
+    assert items.document == {}
+    assert list(items) == [2, 3]
+    assert items.document == {"nextLink": "next"}
+
+    request = PipelineRequest(HttpRequest('GET', 'http://127.0.0.1/'), PipelineContext(mock.Mock(spec=["__enter__", "__exit__", "send"]), stream_decode_items=True))
+    policy.on_request(request)
+    response = PipelineResponse(request.http_request, MockResponse(b'[{"a": 1}, {"b": 2}]', "application/json"), request.context)
+    policy.on_response(request, response)
+    assert list(response.context["deserialized_data"]) == [{"a": 1}, {"b": 2}]
+
 def test_http_logger():
 
     class MockHandler(logging.Handler):
@@ -12,6 +12,7 @@ from ._container_client import ContainerClient
 from ._blob_service_client import BlobServiceClient
 from ._lease import BlobLeaseClient
 from ._download import StorageStreamDownloader
+from ._blob_reader import BlobReader
 from ._quick_query_helper import BlobQueryReader
 from ._shared_access_signature import generate_account_sas, generate_container_sas, generate_blob_sas
 from ._shared.policies import ExponentialRetry, LinearRetry
@@ -55,7 +56,8 @@ from ._models import (
     DelimitedJSON,
     DelimitedTextDialect,
     ObjectReplicationPolicy,
-    ObjectReplicationRule
+    ObjectReplicationRule,
+    TransferSummary
 )
 
 __version__ = VERSION
@@ -207,6 +209,7 @@ __all__ = [
     'ResourceTypes',
     'AccountSasPermissions',
     'StorageStreamDownloader',
+    'BlobReader',
     'CustomerProvidedEncryptionKey',
     'RehydratePriority',
     'generate_account_sas',
@@ -219,5 +222,6 @@ __all__ = [
     'DelimitedTextDialect',
     'BlobQueryReader',
     'ObjectReplicationPolicy',
-    'ObjectReplicationRule'
+    'ObjectReplicationRule',
+    'TransferSummary'
 ]
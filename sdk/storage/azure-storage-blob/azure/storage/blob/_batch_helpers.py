@@ -0,0 +1,106 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+from concurrent import futures
+from itertools import islice
+import time
+from typing import (  # pylint: disable=unused-import
+    Any, Callable, Iterable, Iterator, List, Tuple, TypeVar,
+    TYPE_CHECKING
+)
+
+from azure.core.tracing.common import with_current_context
+
+if TYPE_CHECKING:
+    from azure.core.pipeline.transport import HttpResponse  # pylint: disable=ungrouped-imports
+    T = TypeVar('T')
+
+
+# The service rejects batches of more than 256 sub-requests
+MAX_BATCH_SIZE = 256
+# Sub-requests failing with these status codes are sent again in a later batch
+RETRYABLE_STATUS_CODES = frozenset([408, 429, 500, 502, 503, 504])
+
+
+def get_bulk_batch_options(kwargs):
+    # type: (dict) -> Tuple[int, int, int, float]
+    batch_size = kwargs.pop('batch_size', MAX_BATCH_SIZE)
+    if not 1 <= batch_size <= MAX_BATCH_SIZE:
+        raise ValueError("batch_size must be between 1 and {}.".format(MAX_BATCH_SIZE))
+    max_concurrency = kwargs.pop('max_concurrency', 4)
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+    max_retries = kwargs.pop('max_retries', 3)
+    retry_backoff = kwargs.pop('retry_backoff', 0.8)
+    kwargs['raise_on_any_failure'] = False
+    return batch_size, max_concurrency, max_retries, retry_backoff
+
+
+def chunk_blobs(blobs, batch_size):
+    # type: (Iterable[T], int) -> Iterator[List[T]]
+    """Split the blobs into lists of at most batch_size items, without reading them all upfront."""
+    blobs = iter(blobs)
+    chunk = list(islice(blobs, batch_size))
+    while chunk:
+        yield chunk
+        chunk = list(islice(blobs, batch_size))
+
+
+def get_retry_indexes(pending, responses):
+    # type: (List[int], List[HttpResponse]) -> List[int]
+    return [index for index, response in zip(pending, responses) if response.status_code in RETRYABLE_STATUS_CODES]
+
+
+def send_batch_with_retries(send_batch, chunk, max_retries, retry_backoff):
+    # type: (Callable[[List[T]], List[HttpResponse]], List[T], int, float) -> List[Tuple[T, HttpResponse]]
+    """Send one batch, then send again only the sub-requests that failed with a transient error."""
+    responses = [None] * len(chunk)  # type: List[Any]
+    pending = list(range(len(chunk)))
+    for attempt in range(max_retries + 1):
+        if attempt:
+            time.sleep(retry_backoff * 2 ** (attempt - 1))
+        sub_responses = send_batch([chunk[index] for index in pending])
+        for index, response in zip(pending, sub_responses):
+            responses[index] = response
+        pending = get_retry_indexes(pending, sub_responses)
+        if not pending:
+            break
+    return list(zip(chunk, responses))
+
+
+def bulk_batch_send(send_batch, blobs, batch_size, max_concurrency, max_retries, retry_backoff):
+    # type: (Callable[[List[T]], List[HttpResponse]], Iterable[T], int, int, int, float) -> Iterator[Tuple[T, HttpResponse]]
+    """Send the blobs in batches, up to max_concurrency at a time, and yield (blob, sub-response) pairs.
+
+    The results of a batch are yielded in the order of its blobs, as soon as the batch is done.
+    Batches complete in any order.
+    """
+    chunks = chunk_blobs(blobs, batch_size)
+    if max_concurrency == 1:
+        for chunk in chunks:
+            for result in send_batch_with_retries(send_batch, chunk, max_retries, retry_backoff):
+                yield result
+        return
+
+    def send(chunk):
+        return send_batch_with_retries(send_batch, chunk, max_retries, retry_backoff)
+
+    executor = futures.ThreadPoolExecutor(max_concurrency)
+    running = set(executor.submit(with_current_context(send), chunk) for chunk in islice(chunks, max_concurrency))
+    try:
+        while running:
+            done, running = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                results = future.result()
+                # Keep the workers busy while the results are consumed
+                for chunk in islice(chunks, 1):
+                    running.add(executor.submit(with_current_context(send), chunk))
+                for result in results:
+                    yield result
+    finally:
+        for future in running:
+            future.cancel()
+        executor.shutdown(wait=True)
@@ -51,9 +51,11 @@ from ._quick_query_helper import BlobQueryReader
 from ._upload_helpers import (
     upload_block_blob,
     upload_append_blob,
-    upload_page_blob)
+    upload_page_blob,
+    UploadJournal)
 from ._models import BlobType, BlobBlock, BlobProperties
 from ._download import StorageStreamDownloader
+from ._blob_reader import BlobReader, DOWNLOAD_KEYWORDS, READER_KEYWORDS
 from ._lease import BlobLeaseClient, get_access_conditions
 
 if TYPE_CHECKING:
@@ -111,6 +113,10 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
         the exceeded part will be downloaded in chunks (could be parallel). Defaults to 32*1024*1024, or 32MB.
     :keyword int max_chunk_get_size: The maximum chunk size used for downloading a blob. Defaults to 4*1024*1024,
         or 4MB.
+    :keyword executor: A long-lived thread pool running the parallel uploads and downloads (max_concurrency
+        above 1) of this client and of the clients it creates, instead of a new pool for each transfer. It is not
+        shut down by the client. Don't transfer blobs from tasks running in this pool: they could wait for each other.
+    :paramtype executor: ~concurrent.futures.ThreadPoolExecutor
 
     .. admonition:: Example:
 
@@ -373,6 +379,19 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
         kwargs['blob_settings'] = self._config
         kwargs['max_concurrency'] = max_concurrency
         kwargs['encryption_options'] = encryption_options
+        journal_path = kwargs.pop('journal_path', None)
+        if journal_path is not None:
+            if blob_type != BlobType.BlockBlob:
+                raise ValueError("Resumable uploads are only supported for block blobs.")
+            if self.require_encryption or self.key_encryption_key is not None:
+                raise ValueError("Resumable uploads are not supported with client side encryption.")
+            if length is None or not hasattr(stream, 'seek') or hasattr(stream, 'seekable') and not stream.seekable():
+                raise ValueError("Resumable uploads require a seekable stream and its length.")
+            kwargs['journal'] = UploadJournal(
+                journal_path,
+                '/'.join([self.primary_hostname, self.container_name, self.blob_name]),
+                length,
+                self._config.max_block_size)
         if blob_type == BlobType.BlockBlob:
             kwargs['client'] = self._client.block_blob
             kwargs['data'] = data
@@ -472,6 +491,16 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
         :keyword int max_concurrency:
             Maximum number of parallel connections to use when the blob size exceeds
             64MB.
+        :keyword executor:
+            The thread pool running the parallel uploads. Defaults to the executor of the client, if any,
+            otherwise a pool of max_concurrency threads is created for this upload.
+        :paramtype executor: ~concurrent.futures.ThreadPoolExecutor
+        :keyword str journal_path:
+            Makes the upload of a block blob resumable. The blocks staged are recorded in this local
+            file, with the MD5 of their content. When the upload is started again after a failure, with
+            the same journal, only the blocks which are not staged yet are uploaded. The journal is
+            deleted once the upload is committed. It requires a seekable stream of known length, and is
+            not supported with client side encryption.
         :keyword ~azure.storage.blob.CustomerProvidedEncryptionKey cpk:
             Encrypts the data on the service-side with the given key.
             Use of customer-provided keys must be done over HTTPS.
@@ -503,6 +532,7 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
                 :dedent: 12
                 :caption: Upload a blob to the container.
         """
+        kwargs.setdefault('executor', self._config.executor)
         options = self._upload_blob_options(
             data,
             blob_type=blob_type,
@@ -617,6 +647,10 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
             a secure connection must be established to transfer the key.
         :keyword int max_concurrency:
             The number of parallel connections with which to download.
+        :keyword executor:
+            The thread pool running the parallel downloads of readinto. Defaults to the executor of the
+            client, if any, otherwise a pool of max_concurrency threads is created for each download.
+        :paramtype executor: ~concurrent.futures.ThreadPoolExecutor
         :keyword str encoding:
             Encoding to decode the downloaded bytes. Default is None, i.e. no decoding.
         :keyword int timeout:
@@ -635,12 +669,105 @@ class BlobClient(StorageAccountHostsMixin):  # pylint: disable=too-many-public-m
                 :dedent: 12
                 :caption: Download a blob.
         """
+        kwargs.setdefault('executor', self._config.executor)
         options = self._download_blob_options(
             offset=offset,
             length=length,
             **kwargs)
         return StorageStreamDownloader(**options)
 
+    @distributed_trace
+    def download_blob_to_path(self, file_path, offset=None, length=None, **kwargs):
+        # type: (str, Optional[int], Optional[int], **Any) -> BlobProperties
+        """Downloads a blob to a file, created or overwritten.
+
+        The file is first allocated to the size of the download, then each chunk is written at
+        its offset with a positional write, so that parallel chunks are written without waiting
+        for each other. All the keyword arguments of :func:`download_blob` are accepted, except encoding.
+
+        :param str file_path:
+            The path of the file to download to.
+        :param int offset:
+            Start of byte range to use for downloading a section of the blob.
+            Must be set if length is provided.
+        :param int length:
+            Number of bytes to read from the stream. This is optional, but
+            should be supplied for optimal performance.
+        :keyword int max_concurrency:
+            The number of parallel connections with which to download.
+        :keyword executor:
+            The thread pool running the parallel downloads. Defaults to the executor of the client, if any,
+            otherwise a pool of max_concurrency threads is created for this download.
+        :paramtype executor: ~concurrent.futures.ThreadPoolExecutor
+        :returns: The properties of the downloaded blob.
+        :rtype: ~azure.storage.blob.BlobProperties
+        """
+        downloader = self.download_blob(offset=offset, length=length, **kwargs)
+        downloader._readinto_path(file_path)  # pylint: disable=protected-access
+        return downloader.properties
+
+    @distributed_trace
+    def open_read(self, **kwargs):
+        # type: (**Any) -> BlobReader
+        """Opens the blob as a read-only, seekable file object, which serves reads with
+        ranged downloads of the blob. Only the parts of the blob which are read are downloaded.
+
+        The blocks read are kept in an LRU cache, and sequential reads download the following
+        blocks ahead, on a window which grows with each sequential read. Every download is pinned
+        to the ETag of the blob when it is opened: if the blob is then modified, reads raise
+        :class:`~azure.core.exceptions.ResourceModifiedError`.
+
+        :keyword int block_size:
+            The size of the blocks downloaded and cached. Defaults to max_chunk_get_size
+            of the client configuration.
+        :keyword int cache_size:
+            The size in bytes of the block cache. Defaults to 64 MiB.
+        :keyword int max_read_ahead:
+            The largest number of bytes downloaded ahead of sequential reads. Set to 0 to
+            disable read-ahead. Defaults to 8 blocks.
+        :keyword str version_id:
+            The version id parameter is an opaque DateTime
+            value that, when present, specifies the version of the blob to open.
+        :keyword bool validate_content:
+            If true, calculates an MD5 hash for each range downloaded. This is primarily
+            valuable for detecting bitflips on the wire if using http instead of https,
+            as https (the default), will already validate.
+        :keyword lease:
+            Required if the blob has an active lease. Value can be a BlobLeaseClient object
+            or the lease ID as a string.
+        :paramtype lease: ~azure.storage.blob.BlobLeaseClient or str
+        :keyword ~datetime.datetime if_modified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to open the blob only
+            if the resource has been modified since the specified time.
+        :keyword ~datetime.datetime if_unmodified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to open the blob only if
+            the resource has not been modified since the specified date/time.
+        :keyword str etag:
+            An ETag value, or the wildcard character (*). Used to check if the resource has changed,
+            and act according to the condition specified by the `match_condition` parameter.
+        :keyword ~azure.core.MatchConditions match_condition:
+            The match condition to use upon the etag.
+        :keyword ~azure.storage.blob.CustomerProvidedEncryptionKey cpk:
+            Encrypts the data on the service-side with the given key.
+            Use of customer-provided keys must be done over HTTPS.
+            As the encryption key itself is provided in the request,
+            a secure connection must be established to transfer the key.
+        :keyword int timeout:
+            The timeout parameter is expressed in seconds, for each request.
+        :returns: A seekable file object.
+        :rtype: ~azure.storage.blob.BlobReader
+        """
+        reader_options = {key: kwargs.pop(key) for key in READER_KEYWORDS if key in kwargs}
+        properties = self.get_blob_properties(**kwargs)
+        reader_options.update((key, kwargs[key]) for key in DOWNLOAD_KEYWORDS if key in kwargs)
+        return BlobReader(self, properties, **reader_options)
+
     def _quick_query_options(self, query_expression,
                              **kwargs):
         # type: (str, **Any) -> Dict[str, Any]
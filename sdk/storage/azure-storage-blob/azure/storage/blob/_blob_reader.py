@@ -0,0 +1,234 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+from collections import OrderedDict
+import io
+from typing import (  # pylint: disable=unused-import
+    Any, Dict, List, Optional, Tuple,
+    TYPE_CHECKING
+)
+
+from azure.core import MatchConditions
+
+if TYPE_CHECKING:
+    from ._blob_client import BlobClient
+    from ._models import BlobProperties
+
+
+# The keywords of open_read which configure the reader, and those which also apply to the ranged downloads
+READER_KEYWORDS = ('block_size', 'cache_size', 'max_read_ahead', 'validate_content')
+DOWNLOAD_KEYWORDS = ('lease', 'cpk', 'timeout', 'version_id')
+
+
+def get_blob_reader_options(kwargs, config):
+    # type: (Dict[str, Any], Any) -> Tuple[Dict[str, Any], Dict[str, Any]]
+    """Split the keywords of open_read into the options of the reader and those of the downloads."""
+    block_size = kwargs.pop('block_size', config.max_chunk_get_size)
+    if block_size < 1:
+        raise ValueError("block_size must be at least 1.")
+    cache_size = kwargs.pop('cache_size', 64 * 1024 * 1024)
+    max_read_ahead = kwargs.pop('max_read_ahead', 8 * block_size)
+    if cache_size < 0 or max_read_ahead < 0:
+        raise ValueError("cache_size and max_read_ahead must not be negative.")
+    download_options = {key: kwargs.pop(key) for key in DOWNLOAD_KEYWORDS if key in kwargs}
+    download_options['validate_content'] = kwargs.pop('validate_content', False)
+    reader_options = {
+        'block_size': block_size,
+        'cache_blocks': cache_size // block_size,
+        'max_read_ahead_blocks': max_read_ahead // block_size,
+    }
+    return reader_options, download_options
+
+
+class BlobReaderBase(object):  # pylint: disable=too-many-instance-attributes
+    """The block cache and read-ahead bookkeeping shared by the sync and async readers.
+
+    The blob is read in blocks of block_size bytes, kept in an LRU cache of cache_blocks blocks.
+    A read fetches the blocks it is missing, with one ranged GET per run of adjacent missing
+    blocks. When a sequential read misses the cache, it also fetches the following blocks, on a
+    window which doubles with each miss up to max_read_ahead_blocks. A random read resets it.
+    """
+
+    def __init__(self, client, properties, block_size, cache_blocks, max_read_ahead_blocks, download_options):
+        # type: (Any, BlobProperties, int, int, int, Dict[str, Any]) -> None
+        self.name = properties.name
+        self.size = properties.size
+        self.etag = properties.etag
+        self._client = client
+        self._block_size = block_size
+        self._cache_blocks = cache_blocks
+        self._max_read_ahead_blocks = max_read_ahead_blocks
+        # Every download is pinned to the etag seen on open, so that the reads are
+        # consistent: they fail instead of mixing two versions of the blob.
+        self._download_options = dict(download_options, etag=self.etag, match_condition=MatchConditions.IfNotModified)
+        self._cache = OrderedDict()  # type: OrderedDict
+        self._position = 0
+        self._last_read_end = None  # type: Optional[int]
+        self._read_ahead_blocks = 0
+        self._closed = False
+
+    def _check_open(self):
+        if self._closed:
+            raise ValueError("I/O operation on closed file.")
+
+    def _seek(self, offset, whence):
+        # type: (int, int) -> int
+        self._check_open()
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self.size + offset
+        else:
+            raise ValueError("Invalid whence ({}, should be 0, 1 or 2).".format(whence))
+        if position < 0:
+            raise ValueError("Negative seek position {}.".format(position))
+        self._position = position
+        return position
+
+    def _get_read_size(self, size):
+        # type: (Optional[int]) -> int
+        self._check_open()
+        remaining = max(self.size - self._position, 0)
+        if size is None or size < 0:
+            return remaining
+        return min(size, remaining)
+
+    def _plan_fetches(self, length):
+        # type: (int) -> List[Tuple[int, int]]
+        """The (first block, block count) runs to download before copying length bytes from the position."""
+        first = self._position // self._block_size
+        last = (self._position + length - 1) // self._block_size
+        sequential = self._position == self._last_read_end
+        self._last_read_end = self._position + length
+        if not sequential:
+            self._read_ahead_blocks = 0
+        if all(index in self._cache for index in range(first, last + 1)):
+            return []
+        if sequential:
+            self._read_ahead_blocks = min(max(self._read_ahead_blocks * 2, 1), self._max_read_ahead_blocks)
+        # Never read ahead more than the cache can hold next to the blocks of this read
+        read_ahead = min(self._read_ahead_blocks, max(self._cache_blocks - (last - first + 1), 0))
+        last_block = (self.size - 1) // self._block_size
+        runs = []  # type: List[Tuple[int, int]]
+        for index in range(first, min(last + read_ahead, last_block) + 1):
+            if index in self._cache:
+                continue
+            if runs and runs[-1][0] + runs[-1][1] == index:
+                runs[-1] = (runs[-1][0], runs[-1][1] + 1)
+            else:
+                runs.append((index, 1))
+        return runs
+
+    def _get_range(self, run):
+        # type: (Tuple[int, int]) -> Tuple[int, int]
+        offset = run[0] * self._block_size
+        return offset, min(run[1] * self._block_size, self.size - offset)
+
+    def _store(self, run, data):
+        # type: (Tuple[int, int], bytes) -> None
+        """Split a downloaded run into blocks, and add them to the cache.
+
+        The cache is trimmed once the read is copied, so that it keeps the blocks of this read until then.
+        """
+        for count in range(run[1]):
+            self._cache[run[0] + count] = data[count * self._block_size:(count + 1) * self._block_size]
+
+    def _copy_blocks(self, buffer, length):
+        # type: (Any, int) -> int
+        """Copy length bytes from the position into the buffer, from the cached blocks."""
+        view = memoryview(buffer)
+        copied = 0
+        while copied < length:
+            index, start = divmod(self._position, self._block_size)
+            # Most recently used last
+            block = self._cache.pop(index)
+            self._cache[index] = block
+            count = min(len(block) - start, length - copied)
+            view[copied:copied + count] = memoryview(block)[start:start + count]
+            copied += count
+            self._position += count
+        while len(self._cache) > self._cache_blocks:
+            self._cache.popitem(last=False)
+        return copied
+
+    def _close(self):
+        self._cache.clear()
+        self._closed = True
+
+
+class BlobReader(BlobReaderBase, io.RawIOBase):
+    """A read-only, seekable file object over a blob, returned by
+    :func:`~azure.storage.blob.BlobClient.open_read`.
+
+    Reads are served with ranged downloads of the blob, through an LRU cache of blocks.
+    Sequential reads fetch the following blocks ahead. Every download is pinned to the
+    ETag of the blob when it was opened: if the blob is modified, reads raise
+    :class:`~azure.core.exceptions.ResourceModifiedError`.
+    Wrap it in :class:`io.BufferedReader` to make many small reads cheaper.
+    A BlobReader must not be shared between threads.
+
+    :ivar str name:
+        The name of the blob.
+    :ivar int size:
+        The size of the blob.
+    :ivar str etag:
+        The ETag of the blob the reads are pinned to.
+    """
+
+    def __init__(self, client, properties, **kwargs):
+        # type: (BlobClient, BlobProperties, **Any) -> None
+        reader_options, download_options = get_blob_reader_options(kwargs, client._config)  # pylint: disable=protected-access
+        super(BlobReader, self).__init__(client, properties, download_options=download_options, **reader_options)
+
+    def readable(self):
+        # type: () -> bool
+        self._check_open()
+        return True
+
+    def seekable(self):
+        # type: () -> bool
+        self._check_open()
+        return True
+
+    def tell(self):
+        # type: () -> int
+        self._check_open()
+        return self._position
+
+    def seek(self, offset, whence=io.SEEK_SET):
+        # type: (int, int) -> int
+        return self._seek(offset, whence)
+
+    def readinto(self, buffer):
+        # type: (Any) -> int
+        length = self._get_read_size(len(memoryview(buffer)))
+        if not length:
+            return 0
+        for run in self._plan_fetches(length):
+            offset, count = self._get_range(run)
+            data = self._client.download_blob(offset=offset, length=count, **self._download_options).readall()
+            self._store(run, data)
+        return self._copy_blocks(buffer, length)
+
+    def readall(self):
+        # type: () -> bytes
+        return self.read()
+
+    def read(self, size=-1):
+        # type: (Optional[int]) -> bytes
+        buffer = bytearray(self._get_read_size(size))
+        return bytes(buffer[:self.readinto(buffer)])
+
+    @property
+    def closed(self):
+        # type: () -> bool
+        return self._closed
+
+    def close(self):
+        # type: () -> None
+        self._close()
@@ -88,6 +88,10 @@ class BlobServiceClient(StorageAccountHostsMixin):
         the exceeded part will be downloaded in chunks (could be parallel). Defaults to 32*1024*1024, or 32MB.
     :keyword int max_chunk_get_size: The maximum chunk size used for downloading a blob. Defaults to 4*1024*1024,
         or 4MB.
+    :keyword executor: A long-lived thread pool running the parallel uploads and downloads (max_concurrency
+        above 1) of this client and of the clients it creates, instead of a new pool for each transfer. It is not
+        shut down by the client. Don't transfer blobs from tasks running in this pool: they could wait for each other.
+    :paramtype executor: ~concurrent.futures.ThreadPoolExecutor
 
     .. admonition:: Example:
 
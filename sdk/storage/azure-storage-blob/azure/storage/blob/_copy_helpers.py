@@ -0,0 +1,380 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+from concurrent import futures
+from itertools import islice
+from math import ceil
+import os
+import threading
+import time
+import uuid
+try:
+    from urllib.parse import parse_qs, urlparse
+except ImportError:
+    from urlparse import parse_qs, urlparse  # type: ignore
+from typing import (  # pylint: disable=unused-import
+    Any, Callable, Dict, Iterable, List, Optional, Tuple,
+    TYPE_CHECKING
+)
+
+from azure.core.exceptions import (
+    HttpResponseError, ResourceNotFoundError, ServiceRequestError, ServiceResponseError)
+from azure.core.tracing.common import with_current_context
+
+from ._batch_helpers import RETRYABLE_STATUS_CODES
+from ._directory_helpers import ConcurrencyBudget
+from ._models import BlobBlock, BlobProperties, TransferSummary
+from ._shared.uploads import _upload_in_parallel
+
+if TYPE_CHECKING:
+    from ._container_client import ContainerClient
+    from ._models import CopyProperties
+
+
+# Up to this number of pending copies under a prefix, they are polled one by one instead of with a listing
+MAX_POLLED_ONE_BY_ONE = 16
+# A listing polling copies stops after this number of blobs per copy, the copies not found are polled one by one
+MAX_LISTED_PER_COPY = 10
+
+
+def get_copy_options(kwargs):
+    # type: (Dict[str, Any]) -> Dict[str, Any]
+    options = {
+        'max_concurrency': kwargs.pop('max_concurrency', 16),
+        'block_copy_threshold': kwargs.pop('block_copy_threshold', 256 * 1024 * 1024),
+        'block_size': kwargs.pop('block_size', 64 * 1024 * 1024),
+        'max_retries': kwargs.pop('max_retries', 3),
+        'retry_backoff': kwargs.pop('retry_backoff', 0.8),
+        'poll_interval': kwargs.pop('poll_interval', 2.0),
+        'progress_hook': kwargs.pop('progress_hook', None),
+    }
+    if options['max_concurrency'] < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+    if options['block_size'] < 1:
+        raise ValueError("block_size must be at least 1.")
+    return options
+
+
+def is_transient(error):
+    # type: (Exception) -> bool
+    if isinstance(error, (ServiceRequestError, ServiceResponseError)):
+        return True
+    return isinstance(error, HttpResponseError) and error.status_code in RETRYABLE_STATUS_CODES
+
+
+def get_poll_groups(names):
+    # type: (List[str]) -> List[Tuple[Optional[str], List[str]]]
+    """Group the names of the pending copies by their first directory, with the prefix to list them under.
+
+    The prefix is None for the groups to poll one by one: the small groups, and the names without a
+    common prefix, so that a listing never covers the whole container.
+    """
+    groups = {}  # type: Dict[str, List[str]]
+    for name in names:
+        directory = name.split('/', 1)[0] + '/' if '/' in name else ''
+        groups.setdefault(directory, []).append(name)
+    poll_groups = []
+    for _, group in sorted(groups.items()):
+        prefix = os.path.commonprefix(group) if len(group) > MAX_POLLED_ONE_BY_ONE else None
+        poll_groups.append((prefix or None, group))
+    return poll_groups
+
+
+def has_sas(url):
+    # type: (str) -> bool
+    """Whether a URL carries a SAS, the only credential Put Block From URL reads its source with."""
+    return 'sig' in parse_qs(urlparse(url).query)
+
+
+def get_block_ranges(size, block_size):
+    # type: (int, int) -> List[Tuple[int, int]]
+    """The (offset, length) of the blocks of a blob of this size."""
+    return [(offset, min(block_size, size - offset)) for offset in range(0, size, block_size)]
+
+
+class CopyFailedError(HttpResponseError):
+    """A copy which the service reports as failed or aborted."""
+
+
+class PendingCopy(object):
+    """A copy started on the service, until its status is success, failed or aborted."""
+
+    def __init__(self, item, attempt, copy_id):
+        self.item = item
+        self.attempt = attempt
+        self.copy_id = copy_id
+
+
+class BulkCopy(object):  # pylint: disable=too-many-instance-attributes
+    """Copy blobs to a container with server side copies, on one concurrency budget.
+
+    The blobs of block_copy_threshold bytes or more are copied by staging their blocks from the
+    URL of the source, in parallel on as many of the free connections as they can use, if that URL
+    has a SAS. The other blobs are copied by the service, and each of their copies holds a connection until it completes,
+    so that the number of copies pending on the service is bounded too. The pending copies are polled
+    together every poll_interval seconds. Transient errors and failed copies are retried.
+    """
+
+    def __init__(self, container, destination_name, **kwargs):
+        # type: (ContainerClient, Callable[[BlobProperties], str], **Any) -> None
+        self.container = container
+        self.destination_name = destination_name
+        self.max_concurrency = kwargs.pop('max_concurrency')
+        self.block_copy_threshold = kwargs.pop('block_copy_threshold')
+        self.block_size = kwargs.pop('block_size')
+        self.max_retries = kwargs.pop('max_retries')
+        self.retry_backoff = kwargs.pop('retry_backoff')
+        self.poll_interval = kwargs.pop('poll_interval')
+        self.progress_hook = kwargs.pop('progress_hook')
+        self.options = kwargs
+        self.budget = ConcurrencyBudget(self.max_concurrency)
+        self.pending = {}  # type: Dict[str, PendingCopy]
+        self.summary = TransferSummary()
+        self._lock = threading.Lock()
+        self._start = time.time()
+
+    def _update(self, name, size=None, error=None):
+        with self._lock:
+            if error is not None:
+                self.summary.failures[name] = error
+            else:
+                self.summary.files_transferred += 1
+                self.summary.bytes_transferred += size
+            self.summary.elapsed = time.time() - self._start
+            if self.progress_hook:
+                self.progress_hook(self.summary)
+
+    def _get_retry_delay(self, error, attempt):
+        # type: (Exception, int) -> Optional[float]
+        """The delay before retrying after this error, None if it must not be retried."""
+        if attempt >= self.max_retries or not (isinstance(error, CopyFailedError) or is_transient(error)):
+            return None
+        return self.retry_backoff * 2 ** attempt
+
+    def _copies_blocks(self, blob, source_url):
+        # type: (BlobProperties, str) -> bool
+        """Whether a blob is copied by blocks. Without a SAS in the source URL, as with a shared key
+        or an OAuth credential, the service can't read the source blocks: the service copies the blob.
+        """
+        return blob.size >= self.block_copy_threshold and has_sas(source_url)
+
+    def _get_connections(self, blob, source_url):
+        # type: (BlobProperties, str) -> int
+        if not self._copies_blocks(blob, source_url):
+            return 1
+        return max(int(ceil(blob.size / float(self.block_size))), 1)
+
+    def _get_poll_timeout(self, last_poll):
+        # type: (float) -> Optional[float]
+        if not self.pending:
+            return None
+        return max(last_poll + self.poll_interval - time.time(), 0)
+
+    def run(self, source_container, blobs):
+        # type: (ContainerClient, Iterable[Any]) -> TransferSummary
+        config = self.container._config  # pylint: disable=protected-access
+        executor = config.executor or futures.ThreadPoolExecutor(self.max_concurrency)
+        copies_executor = futures.ThreadPoolExecutor(self.max_concurrency)
+        items = ((blob, source_container.get_blob_client(blob)) for blob in blobs)
+
+        def submit(item, attempt=0):
+            return copies_executor.submit(with_current_context(self._copy_blob), item, executor, attempt)
+
+        try:
+            # Keep a bounded number of blobs queued, the listing may be large
+            running = set(submit(item) for item in islice(items, self.max_concurrency * 2))
+            last_poll = time.time()
+            while running or self.pending:
+                timeout = self._get_poll_timeout(last_poll)
+                if running:
+                    done, running = futures.wait(running, timeout=timeout, return_when=futures.FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                    for item in islice(items, len(done)):
+                        running.add(submit(item))
+                else:
+                    time.sleep(timeout)
+                if self._get_poll_timeout(last_poll) == 0:
+                    for item, attempt in self._poll():
+                        running.add(submit(item, attempt))
+                    last_poll = time.time()
+        finally:
+            copies_executor.shutdown(wait=True)
+            if executor is not config.executor:
+                executor.shutdown(wait=False)
+        self.summary.elapsed = time.time() - self._start
+        return self.summary
+
+    def _copy_blob(self, item, executor, attempt):
+        blob, source = item
+        name = source.blob_name
+        try:
+            if not isinstance(blob, BlobProperties):
+                blob = source.get_blob_properties(timeout=self.options.get('timeout'))
+                item = blob, source
+            name = self.destination_name(blob)
+        except Exception as error:  # pylint: disable=broad-except
+            self._update(name, error=error)
+            return
+        while True:
+            try:
+                if self._start_copy(item, name, executor, attempt):
+                    # The copy is pending on the service, and completed by _poll
+                    return
+            except Exception as error:  # pylint: disable=broad-except
+                delay = self._get_retry_delay(error, attempt)
+                if delay is None:
+                    self._update(name, error=error)
+                    return
+                time.sleep(delay)
+                attempt += 1
+                continue
+            self._update(name, size=blob.size)
+            return
+
+    def _start_copy(self, item, name, executor, attempt):
+        """Copy a blob, return whether the copy is still pending on the service."""
+        blob, source = item
+        connections = self.budget.acquire(self._get_connections(blob, source.url))
+        try:
+            if self._copies_blocks(blob, source.url):
+                self._copy_blocks(blob, source.url, name, connections, executor)
+                return False
+            copy = self.container.get_blob_client(name).start_copy_from_url(source.url, **self.options)
+            if copy['copy_status'] != 'pending':
+                return False
+            with self._lock:
+                self.pending[name] = PendingCopy(item, attempt, copy['copy_id'])
+            # The connection is released once the copy completes
+            connections = 0
+            return True
+        finally:
+            self.budget.release(connections)
+
+    def _stage_block(self, client, source_url, block):
+        block_id, offset, length = block
+        attempt = 0
+        while True:
+            try:
+                client.stage_block_from_url(
+                    block_id, source_url, source_offset=offset, source_length=length,
+                    timeout=self.options.get('timeout'))
+                return block_id
+            except Exception as error:  # pylint: disable=broad-except
+                if attempt >= self.max_retries or not is_transient(error):
+                    raise
+                time.sleep(self.retry_backoff * 2 ** attempt)
+                attempt += 1
+
+    def _get_blocks(self, blob):
+        # type: (BlobProperties) -> List[Tuple[str, int, int]]
+        # The block IDs are unique to this copy, the blocks staged by other copies are not committed
+        copy_id = uuid.uuid4().hex
+        return [('{}-{:05d}'.format(copy_id, index), offset, length)
+                for index, (offset, length) in enumerate(get_block_ranges(blob.size, self.block_size))]
+
+    def _get_commit_options(self, blob):
+        # type: (BlobProperties) -> Dict[str, Any]
+        options = dict(self.options)
+        options.setdefault('content_settings', blob.content_settings)
+        options.setdefault('metadata', blob.metadata)
+        return options
+
+    def _copy_blocks(self, blob, source_url, name, connections, executor):
+        client = self.container.get_blob_client(name)
+        blocks = self._get_blocks(blob)
+
+        def stage_block(block):
+            return self._stage_block(client, source_url, block)
+
+        if connections > 1:
+            _upload_in_parallel(executor, connections, stage_block, iter(blocks))
+        else:
+            for block in blocks:
+                stage_block(block)
+        client.commit_block_list(
+            [BlobBlock(block_id) for block_id, _, _ in blocks], **self._get_commit_options(blob))
+
+    def _list_copies(self, prefix, names, copies):
+        # type: (str, List[str], Dict[str, CopyProperties]) -> List[str]
+        """Add the copies listed under the prefix to copies, return the names left to poll one by one.
+
+        The listing stops once all the copies are found, or after MAX_LISTED_PER_COPY blobs per copy.
+        """
+        wanted = set(names)
+        max_listed = len(names) * MAX_LISTED_PER_COPY
+        blobs = self.container.list_blobs(
+            name_starts_with=prefix, include=['copy'], results_per_page=min(max_listed, 5000),
+            timeout=self.options.get('timeout'))
+        for listed, blob in enumerate(blobs, 1):
+            if blob.name in wanted:
+                copies[blob.name] = blob.copy
+                wanted.discard(blob.name)
+                if not wanted:
+                    break
+            if listed >= max_listed:
+                return sorted(wanted)
+        # The copies which were not listed have been deleted
+        return []
+
+    def _get_copies(self, names):
+        # type: (List[str]) -> Dict[str, CopyProperties]
+        """The copy properties of the destination blobs, by name. The deleted blobs are missing."""
+        copies = {}  # type: Dict[str, CopyProperties]
+        polled = []
+        for prefix, group in get_poll_groups(names):
+            if prefix is None:
+                polled.extend(group)
+            else:
+                # The blob batch does not support Get Blob Properties, list the blobs under their common prefix
+                polled.extend(self._list_copies(prefix, group, copies))
+        for name in polled:
+            try:
+                copies[name] = self.container.get_blob_client(name).get_blob_properties(
+                    timeout=self.options.get('timeout')).copy
+            except ResourceNotFoundError:
+                pass
+        return copies
+
+    def _complete(self, name, pending_copy, copy):
+        # type: (str, PendingCopy, Optional[CopyProperties]) -> Optional[Tuple[Any, int]]
+        """Record the outcome of a copy which is no longer pending, return it with its attempt to retry it."""
+        if copy is None:
+            self._update(name, error=ResourceNotFoundError("The destination blob was deleted during the copy."))
+        elif copy.id != pending_copy.copy_id:
+            self._update(name, error=HttpResponseError("The copy was replaced by another copy to the blob."))
+        elif copy.status == 'success':
+            self._update(name, size=pending_copy.item[0].size)
+        else:
+            error = CopyFailedError("The copy is {}: {}".format(copy.status, copy.status_description))
+            if self._get_retry_delay(error, pending_copy.attempt) is not None:
+                return pending_copy.item, pending_copy.attempt + 1
+            self._update(name, error=error)
+        return None
+
+    def _poll(self):
+        # type: () -> List[Tuple[Any, int]]
+        """Update the status of the pending copies, return the copies to retry with their attempt."""
+        with self._lock:
+            pending = dict(self.pending)
+        try:
+            copies = self._get_copies(list(pending))
+        except Exception as error:  # pylint: disable=broad-except
+            if not is_transient(error):
+                raise
+            return []
+        retries = []
+        for name, pending_copy in pending.items():
+            copy = copies.get(name)
+            if copy is not None and copy.id == pending_copy.copy_id and copy.status == 'pending':
+                continue
+            with self._lock:
+                del self.pending[name]
+            self.budget.release(1)
+            retry = self._complete(name, pending_copy, copy)
+            if retry:
+                retries.append(retry)
+        return retries
@@ -0,0 +1,270 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import calendar
+from concurrent import futures
+import errno
+import hashlib
+from itertools import islice
+from math import ceil
+import os
+import threading
+import time
+from typing import (  # pylint: disable=unused-import
+    Any, Callable, Dict, Iterator, Optional, Tuple,
+    TYPE_CHECKING
+)
+
+from azure.core.tracing.common import with_current_context
+
+from ._models import ContentSettings, TransferSummary
+
+if TYPE_CHECKING:
+    from ._container_client import ContainerClient
+    from ._models import BlobProperties
+
+
+SKIP_UNCHANGED_VALUES = (None, 'size', 'last_modified', 'md5')
+
+
+def get_directory_options(kwargs):
+    # type: (Dict[str, Any]) -> Tuple[int, Optional[str], Optional[Callable]]
+    max_concurrency = kwargs.pop('max_concurrency', 4)
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1.")
+    skip_unchanged = kwargs.pop('skip_unchanged', 'last_modified')
+    if skip_unchanged not in SKIP_UNCHANGED_VALUES:
+        raise ValueError("skip_unchanged must be one of {}.".format(SKIP_UNCHANGED_VALUES))
+    return max_concurrency, skip_unchanged, kwargs.pop('progress_hook', None)
+
+
+def iter_directory(source):
+    # type: (str) -> Iterator[Tuple[str, str]]
+    """Yield the path of each file of the directory tree, and its relative path with "/" separators."""
+    for root, dirs, files in os.walk(source):
+        dirs.sort()
+        for name in sorted(files):
+            path = os.path.join(root, name)
+            yield path, os.path.relpath(path, source).replace(os.sep, '/')
+
+
+def get_download_path(destination, name):
+    # type: (str, str) -> str
+    """The local path of a blob, refusing the names which would be written outside of the destination."""
+    path = os.path.normpath(os.path.join(destination, *name.split('/')))
+    root = os.path.normpath(destination)
+    if os.path.isabs(name) or not path.startswith(os.path.join(root, '')):
+        raise ValueError("The blob name {} is outside of the destination directory.".format(name))
+    return path
+
+
+def make_parent_directory(path):
+    # type: (str) -> None
+    try:
+        os.makedirs(os.path.dirname(path))
+    except OSError as error:
+        if error.errno != errno.EEXIST:
+            raise
+
+
+def get_file_md5(path):
+    # type: (str) -> bytes
+    md5 = hashlib.md5()
+    with open(path, 'rb') as stream:
+        for block in iter(lambda: stream.read(4 * 1024 * 1024), b''):
+            md5.update(block)
+    return md5.digest()
+
+
+def get_timestamp(value):
+    # type: (Any) -> float
+    return calendar.timegm(value.utctimetuple())
+
+
+def is_unchanged(path, blob, skip_unchanged, newer_side, file_md5=None):
+    # type: (str, Optional[BlobProperties], Optional[str], str, Optional[bytes]) -> bool
+    """Whether the local file and the blob have the same content, according to skip_unchanged.
+
+    With 'last_modified', the side the data is copied to (newer_side, 'blob' or 'file')
+    must have been modified last. With 'md5', file_md5 is the MD5 of the file if it is
+    already known.
+    """
+    if not skip_unchanged or blob is None:
+        return False
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return False
+    if stat.st_size != blob.size:
+        return False
+    if skip_unchanged == 'last_modified':
+        if newer_side == 'blob':
+            return get_timestamp(blob.last_modified) >= int(stat.st_mtime)
+        return int(stat.st_mtime) >= get_timestamp(blob.last_modified)
+    if skip_unchanged == 'md5':
+        content_md5 = blob.content_settings.content_md5
+        return bool(content_md5) and bytes(content_md5) == (file_md5 or get_file_md5(path))
+    return True
+
+
+def get_chunk_count(size, single_size, chunk_size):
+    # type: (int, int, int) -> int
+    """The number of connections a transfer of this size can use."""
+    if size <= single_size:
+        return 1
+    return int(ceil(size / float(chunk_size)))
+
+
+class ConcurrencyBudget(object):
+    """The connections shared by the transfers of the files and of their chunks."""
+
+    def __init__(self, size):
+        # type: (int) -> None
+        self._available = size
+        self._condition = threading.Condition()
+
+    def acquire(self, wanted):
+        # type: (int) -> int
+        """Wait for a connection, then take up to wanted of the available ones. Return how many were taken."""
+        with self._condition:
+            while not self._available:
+                self._condition.wait()
+            granted = min(wanted, self._available)
+            self._available -= granted
+            return granted
+
+    def release(self, count):
+        # type: (int) -> None
+        with self._condition:
+            self._available += count
+            self._condition.notify_all()
+
+
+class DirectoryTransfer(object):  # pylint: disable=too-many-instance-attributes
+    """Upload or download the files of a directory tree, on one concurrency budget.
+
+    Up to max_concurrency files are transferred at a time. A file whose size calls for
+    chunks takes as many of the free connections as it can use, and transfers its chunks
+    in parallel on them.
+    """
+
+    def __init__(self, container, max_concurrency, skip_unchanged, progress_hook, **kwargs):
+        # type: (ContainerClient, int, Optional[str], Optional[Callable], **Any) -> None
+        self.container = container
+        self.max_concurrency = max_concurrency
+        self.skip_unchanged = skip_unchanged
+        self.progress_hook = progress_hook
+        self.options = kwargs
+        self.budget = ConcurrencyBudget(max_concurrency)
+        self.summary = TransferSummary()
+        self._lock = threading.Lock()
+        self._start = time.time()
+
+    def _update(self, name, size=None, skipped=False, error=None):
+        with self._lock:
+            if error is not None:
+                self.summary.failures[name] = error
+            elif skipped:
+                self.summary.files_skipped += 1
+            else:
+                self.summary.files_transferred += 1
+                self.summary.bytes_transferred += size
+            self.summary.elapsed = time.time() - self._start
+            if self.progress_hook:
+                self.progress_hook(self.summary)
+
+    def _run(self, transfer, items):
+        # type: (Callable, Iterator[Any]) -> TransferSummary
+        config = self.container._config  # pylint: disable=protected-access
+        executor = config.executor or futures.ThreadPoolExecutor(self.max_concurrency)
+        files_executor = futures.ThreadPoolExecutor(self.max_concurrency)
+        try:
+            # Keep a bounded number of files queued, the tree may be large
+            running = set(
+                files_executor.submit(with_current_context(transfer), item, executor)
+                for item in islice(items, self.max_concurrency * 2)
+            )
+            while running:
+                done, running = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+                for future in done:
+                    future.result()
+                for item in islice(items, len(done)):
+                    running.add(files_executor.submit(with_current_context(transfer), item, executor))
+        finally:
+            files_executor.shutdown(wait=True)
+            if executor is not config.executor:
+                executor.shutdown(wait=False)
+        self.summary.elapsed = time.time() - self._start
+        return self.summary
+
+    def upload(self, source, name_starts_with):
+        # type: (str, str) -> TransferSummary
+        blobs = {}  # type: Dict[str, BlobProperties]
+        if self.skip_unchanged:
+            blobs = {b.name: b for b in self.container.list_blobs(name_starts_with=name_starts_with or None)}
+        items = ((path, name_starts_with + name, blobs.get(name_starts_with + name))
+                 for path, name in iter_directory(source))
+        return self._run(self._upload_file, items)
+
+    def _upload_file(self, item, executor):
+        path, name, blob = item
+        try:
+            # Read the file once, to compare it and to store its MD5
+            file_md5 = get_file_md5(path) if self.skip_unchanged == 'md5' else None
+            if is_unchanged(path, blob, self.skip_unchanged, 'blob', file_md5):
+                self._update(path, skipped=True)
+                return
+            config = self.container._config  # pylint: disable=protected-access
+            size = os.path.getsize(path)
+            options = dict(self.options)
+            if file_md5 and 'content_settings' not in options:
+                # Stored with the blob, so that the next upload can compare it
+                options['content_settings'] = ContentSettings(content_md5=bytearray(file_md5))
+            connections = self.budget.acquire(
+                get_chunk_count(size, config.max_single_put_size, config.max_block_size))
+            try:
+                with open(path, 'rb') as data:
+                    self.container.get_blob_client(name).upload_blob(
+                        data, length=size, max_concurrency=connections, executor=executor, **options)
+            finally:
+                self.budget.release(connections)
+        except Exception as error:  # pylint: disable=broad-except
+            self._update(path, error=error)
+            return
+        self._update(path, size=size)
+
+    def download(self, destination, name_starts_with):
+        # type: (str, str) -> TransferSummary
+        items = ((blob, blob.name[len(name_starts_with):].lstrip('/'), destination)
+                 for blob in self.container.list_blobs(name_starts_with=name_starts_with or None))
+        # Names ending with "/" are directory markers
+        items = (item for item in items if item[1] and not item[1].endswith('/'))
+        return self._run(self._download_file, items)
+
+    def _download_file(self, item, executor):
+        blob, name, destination = item
+        try:
+            path = get_download_path(destination, name)
+            if is_unchanged(path, blob, self.skip_unchanged, 'file'):
+                self._update(blob.name, skipped=True)
+                return
+            config = self.container._config  # pylint: disable=protected-access
+            make_parent_directory(path)
+            connections = self.budget.acquire(
+                get_chunk_count(blob.size, config.max_single_get_size, config.max_chunk_get_size))
+            try:
+                with open(path, 'wb') as stream:
+                    self.container.download_blob(
+                        blob, max_concurrency=connections, executor=executor, **self.options).readinto(stream)
+            finally:
+                self.budget.release(connections)
+            # The next download can compare the modification times
+            timestamp = get_timestamp(blob.last_modified)
+            os.utime(path, (timestamp, timestamp))
+        except Exception as error:  # pylint: disable=broad-except
+            self._update(blob.name, error=error)
+            return
+        self._update(blob.name, size=blob.size)
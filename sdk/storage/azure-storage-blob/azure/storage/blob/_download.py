@@ -7,7 +7,12 @@
 import sys
 import threading
 import warnings
+from collections import deque
+from concurrent import futures
 from io import BytesIO
+from itertools import islice
+import mmap
+import os
 
 from azure.core.exceptions import HttpResponseError
 from azure.core.tracing.common import with_current_context
@@ -63,6 +68,92 @@ def process_content(data, start_offset, end_offset, encryption):
     return content
 
 
+class _FileWriter(object):
+    """Writes a download to a file preallocated to its size, each chunk at its offset.
+
+    Positional writes don't move a shared file position, so that chunks downloaded in
+    parallel are written without a lock. Where os.pwrite is not available, the file is
+    mapped in memory instead.
+    """
+
+    def __init__(self, path, size):
+        self.size = size
+        self._position = 0
+        self._mmap = None
+        self._file = open(path, 'w+b')
+        try:
+            self._file.truncate(size)
+            if size and hasattr(os, 'posix_fallocate'):
+                try:
+                    os.posix_fallocate(self._file.fileno(), 0, size)
+                except OSError:
+                    # Not supported by the file system, the file stays sparse
+                    pass
+            if size and not hasattr(os, 'pwrite'):
+                self._mmap = mmap.mmap(self._file.fileno(), size)
+        except BaseException:
+            self._file.close()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def tell(self):
+        return self._position
+
+    def write(self, data):
+        self.write_at(data, self._position)
+        self._position += len(data)
+
+    def write_at(self, data, offset):
+        # Empty page blob chunks are created at the chunk size, even past the end of the blob
+        length = max(min(len(data), self.size - offset), 0)
+        if self._mmap is not None:
+            self._mmap[offset:offset + length] = data if length == len(data) else data[:length]
+            return
+        view = memoryview(data)[:length]
+        while view:
+            written = os.pwrite(self._file.fileno(), view, offset)  # pylint: disable=no-member
+            view = view[written:]
+            offset += written
+
+    def close(self):
+        if self._mmap is not None:
+            self._mmap.close()
+        self._file.close()
+
+
+def _download_in_parallel(executor, max_concurrency, downloader):
+    """Download the chunks, max_concurrency at a time.
+
+    The executor is shared with other transfers: it is left running. Without one, an executor is
+    created for this download only.
+    """
+    owned = executor is None
+    if owned:
+        executor = futures.ThreadPoolExecutor(max_concurrency)
+    offsets = downloader.get_chunk_offsets()
+    process_chunk = with_current_context(downloader.process_chunk)
+    running = set(executor.submit(process_chunk, offset) for offset in islice(offsets, max_concurrency))
+    try:
+        while running:
+            done, running = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+            for future in done:
+                future.result()
+            for offset in islice(offsets, len(done)):
+                running.add(executor.submit(process_chunk, offset))
+    finally:
+        # On failure, the chunks still running must not write to the stream once it is closed
+        for future in running:
+            future.cancel()
+        futures.wait(running)
+        if owned:
+            executor.shutdown(wait=False)
+
+
 class _ChunkDownloader(object):  # pylint: disable=too-many-instance-attributes
     def __init__(
         self,
@@ -90,12 +181,13 @@ class _ChunkDownloader(object):  # pylint: disable=too-many-instance-attributes
 
         # The destination that we will write to
         self.stream = stream
-        self.stream_lock = threading.Lock() if parallel else None
+        self.positional = isinstance(stream, _FileWriter)
+        self.stream_lock = threading.Lock() if parallel and not self.positional else None
         self.progress_lock = threading.Lock() if parallel else None
 
         # For a parallel download, the stream is always seekable, so we note down the current position
         # in order to seek to the right place when out-of-order chunks come in
-        self.stream_start = stream.tell() if parallel else None
+        self.stream_start = stream.tell() if parallel or self.positional else None
 
         # Download progress so far
         self.progress_total = current_progress
@@ -140,7 +232,9 @@ class _ChunkDownloader(object):  # pylint: disable=too-many-instance-attributes
             self.progress_total += length
 
     def _write_to_stream(self, chunk_data, chunk_start):
-        if self.stream_lock:
+        if self.positional:
+            self.stream.write_at(chunk_data, self.stream_start + (chunk_start - self.start_index))
+        elif self.stream_lock:
             with self.stream_lock:  # pylint: disable=not-context-manager
                 self.stream.seek(self.stream_start + (chunk_start - self.start_index))
                 self.stream.write(chunk_data)
@@ -211,14 +305,21 @@ class _ChunkDownloader(object):  # pylint: disable=too-many-instance-attributes
 
 
 class _ChunkIterator(object):
-    """Async iterator for chunks in blob download stream."""
+    """Iterator for chunks in blob download stream.
+
+    With a max_concurrency above 1, that many chunks are downloaded ahead in parallel,
+    and yielded in order.
+    """
 
-    def __init__(self, size, content, downloader):
+    def __init__(self, size, content, downloader, max_concurrency=1):
         self.size = size
         self._current_content = content
         self._iter_downloader = downloader
         self._iter_chunks = None
         self._complete = (size == 0)
+        self._max_concurrency = max_concurrency
+        self._executor = None
+        self._pending = deque()
 
     def __len__(self):
         return self.size
@@ -238,6 +339,20 @@ class _ChunkIterator(object):
 
         if not self._iter_chunks:
             self._iter_chunks = self._iter_downloader.get_chunk_offsets()
+            if self._max_concurrency > 1:
+                import concurrent.futures
+                self._executor = concurrent.futures.ThreadPoolExecutor(self._max_concurrency)
+                self._read_ahead()
+        elif self._executor:
+            if not self._pending:
+                self.close()
+                raise StopIteration("Download complete")
+            try:
+                self._current_content = self._pending.popleft().result()
+            except BaseException:
+                self.close()
+                raise
+            self._read_ahead()
         else:
             chunk = next(self._iter_chunks)
             self._current_content = self._iter_downloader.yield_chunk(chunk)
@@ -246,6 +361,21 @@ class _ChunkIterator(object):
 
     next = __next__  # Python 2 compatibility.
 
+    def _read_ahead(self):
+        for chunk in islice(self._iter_chunks, self._max_concurrency - len(self._pending)):
+            self._pending.append(
+                self._executor.submit(with_current_context(self._iter_downloader.yield_chunk), chunk))
+
+    def close(self):
+        """Stop downloading the chunks read ahead, when the iteration is abandoned."""
+        self._complete = True
+        for future in self._pending:
+            future.cancel()
+        self._pending.clear()
+        if self._executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
 
 class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attributes
     """A streaming object to download from Azure Storage.
@@ -274,6 +404,7 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
         name=None,
         container=None,
         encoding=None,
+        executor=None,
         **kwargs
     ):
         self.name = name
@@ -286,6 +417,7 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
         self._start_range = start_range
         self._end_range = end_range
         self._max_concurrency = max_concurrency
+        self._executor = executor
         self._encoding = encoding
         self._validate_content = validate_content
         self._encryption_options = encryption_options or {}
@@ -426,6 +558,13 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
         return response
 
     def chunks(self):
+        """Iterate over chunks in the download stream.
+
+        With a max_concurrency above 1, as many chunks are downloaded ahead in parallel,
+        and yielded in order: the memory used is bounded by max_concurrency chunks.
+
+        :rtype: Iterator[bytes]
+        """
         if self.size == 0 or self._download_complete:
             iter_downloader = None
         else:
@@ -451,7 +590,8 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
         return _ChunkIterator(
             size=self.size,
             content=self._current_content,
-            downloader=iter_downloader)
+            downloader=iter_downloader,
+            max_concurrency=self._max_concurrency)
 
     def readall(self):
         """Download the contents of this blob.
@@ -527,7 +667,18 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
         stream.write(self._current_content)
         if self._download_complete:
             return self.size
+        self._download_chunks(stream, parallel)
+        return self.size
+
+    def _readinto_path(self, file_path):
+        """Download the contents of this blob to a file, each chunk written at its offset."""
+        with _FileWriter(file_path, self.size) as writer:
+            writer.write(self._current_content)
+            if not self._download_complete:
+                self._download_chunks(writer, self._max_concurrency > 1)
+        return self.size
 
+    def _download_chunks(self, stream, parallel):
         data_end = self._file_size
         if self._end_range is not None:
             # Use the length unless it is over the end of the file
@@ -549,16 +700,10 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
             **self._request_options
         )
         if parallel:
-            import concurrent.futures
-            executor = concurrent.futures.ThreadPoolExecutor(self._max_concurrency)
-            list(executor.map(
-                    with_current_context(downloader.process_chunk),
-                    downloader.get_chunk_offsets()
-                ))
+            _download_in_parallel(self._executor, self._max_concurrency, downloader)
         else:
             for chunk in downloader.get_chunk_offsets():
                 downloader.process_chunk(chunk)
-        return self.size
 
     def download_to_stream(self, stream, max_concurrency=1):
         """Download the contents of this blob to a stream.
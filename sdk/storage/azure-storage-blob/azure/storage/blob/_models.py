@@ -1293,6 +1293,36 @@ class ObjectReplicationRule(DictMixin):
         self.status = kwargs.pop('status', None)
 
 
+class TransferSummary(DictMixin):
+    """The summary of a directory upload or download, or of a copy of blobs.
+
+    :ivar int files_transferred:
+        The number of files or blobs uploaded, downloaded or copied.
+    :ivar int files_skipped:
+        The number of files skipped because they were unchanged.
+    :ivar int bytes_transferred:
+        The size of the files or blobs uploaded, downloaded or copied, in bytes.
+    :ivar float elapsed:
+        The duration of the transfer so far, in seconds.
+    :ivar dict(str, Exception) failures:
+        The errors of the files which could not be transferred, by local path for uploads
+        and by blob name for downloads and copies.
+    """
+
+    def __init__(self, **kwargs):
+        self.files_transferred = kwargs.pop('files_transferred', 0)
+        self.files_skipped = kwargs.pop('files_skipped', 0)
+        self.bytes_transferred = kwargs.pop('bytes_transferred', 0)
+        self.elapsed = kwargs.pop('elapsed', 0.0)
+        self.failures = kwargs.pop('failures', {})
+
+    @property
+    def throughput(self):
+        # type: () -> float
+        """The average transfer rate, in bytes per second."""
+        return self.bytes_transferred / self.elapsed if self.elapsed else 0.0
+
+
 class BlobQueryError(Exception):
     """The error happened during quick query operation.
 
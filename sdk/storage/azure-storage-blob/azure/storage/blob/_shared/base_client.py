@@ -412,6 +412,9 @@ def create_configuration(**kwargs):
 
     # File uploads
     config.max_range_size = kwargs.get("max_range_size", 4 * 1024 * 1024)
+
+    # Thread pool of the parallel transfers, shared by the sync clients
+    config.executor = kwargs.get("executor")
     return config
 
 
@@ -323,7 +323,7 @@ class StorageContentValidation(SansIOHTTPPolicy):
     @staticmethod
     def get_content_md5(data):
         md5 = hashlib.md5() # nosec
-        if isinstance(data, bytes):
+        if isinstance(data, (bytes, bytearray, memoryview)):
             md5.update(data)
         elif hasattr(data, 'read'):
             pos = 0
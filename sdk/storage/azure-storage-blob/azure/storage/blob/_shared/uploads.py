@@ -10,6 +10,9 @@ from io import (BytesIO, IOBase, SEEK_CUR, SEEK_END, SEEK_SET, UnsupportedOperat
 from threading import Lock
 from itertools import islice
 from math import ceil
+import mmap
+import os
+from stat import S_ISREG
 
 import six
 
@@ -25,18 +28,90 @@ _LARGE_BLOB_UPLOAD_MAX_READ_BUFFER_SIZE = 4 * 1024 * 1024
 _ERROR_VALUE_SHOULD_BE_SEEKABLE_STREAM = "{0} should be a seekable file-like/io.IOBase type stream object."
 
 
+def map_stream(stream, length=None):
+    """Memory-map a region of a file from its current position, as a read-only memoryview.
+
+    Slices of the memoryview are uploaded without reading the file in memory or copying it.
+    The position of the stream is not modified.
+
+    :return: The memoryview, or None if the stream isn't a regular file that can be mapped.
+    """
+    # Same as the private _map_file helper of azure-core 1.8 transports: this package supports
+    # azure-core 1.6 and must not import its private helpers, so the code is vendored here.
+    try:
+        fileno = stream.fileno()
+        position = stream.tell()
+        stat = os.fstat(fileno)
+    except (AttributeError, UnsupportedOperation, OSError, ValueError):
+        return None
+    if not S_ISREG(stat.st_mode):  # pipes, sockets, etc. can't be mapped
+        return None
+    size = stat.st_size
+    available = max(size - position, 0)
+    length = available if length is None else min(length, available)
+    if length <= 0:
+        return memoryview(b"")
+    # The offset of a mapping must be a multiple of the allocation granularity
+    aligned = position - position % mmap.ALLOCATIONGRANULARITY
+    try:
+        mapped = mmap.mmap(fileno, length + position - aligned, access=mmap.ACCESS_READ, offset=aligned)
+    except (mmap.error, ValueError, OverflowError, TypeError):
+        return None
+    return memoryview(mapped)[position - aligned:]
+
+
+def read_into(stream, buffer):
+    """Fill the buffer from the stream, reading each byte into place once.
+
+    Streams with a readinto method are read directly into the buffer, the data of others is
+    copied into it. Short reads are completed until the end of the stream.
+
+    :param stream: The stream to read.
+    :param memoryview buffer: The writable buffer to fill.
+    :return: The number of bytes read, less than the size of the buffer only at the end of the stream.
+    :rtype: int
+    """
+    readinto = getattr(stream, "readinto", None) if isinstance(stream, IOBase) else None
+    filled = 0
+    while filled < len(buffer):
+        count = None
+        if readinto is not None:
+            try:
+                count = readinto(buffer[filled:])
+            except (NotImplementedError, UnsupportedOperation):
+                # io.RawIOBase subclasses implementing read only
+                readinto = None
+        if readinto is None:
+            temp = stream.read(len(buffer) - filled)
+            if not isinstance(temp, six.binary_type):
+                raise TypeError("Blob data should be of type bytes.")
+            count = len(temp)
+            buffer[filled:filled + count] = temp
+        if not count:
+            break
+        filled += count
+    return filled
+
+
 def _parallel_uploads(executor, uploader, pending, running):
     range_ids = []
-    while True:
-        # Wait for some download to finish before adding a new one
-        done, running = futures.wait(running, return_when=futures.FIRST_COMPLETED)
-        range_ids.extend([chunk.result() for chunk in done])
-        try:
-            for _ in range(0, len(done)):
-                next_chunk = next(pending)
-                running.add(executor.submit(with_current_context(uploader), next_chunk))
-        except StopIteration:
-            break
+    try:
+        while True:
+            # Wait for some download to finish before adding a new one
+            done, running = futures.wait(running, return_when=futures.FIRST_COMPLETED)
+            range_ids.extend([chunk.result() for chunk in done])
+            try:
+                for _ in range(0, len(done)):
+                    next_chunk = next(pending)
+                    running.add(executor.submit(with_current_context(uploader), next_chunk))
+            except StopIteration:
+                break
+    except BaseException:
+        # The chunks still running must be done before the caller closes the stream
+        for chunk in running:
+            chunk.cancel()
+        futures.wait(running)
+        raise
 
     # Wait for the remaining uploads to finish
     done, _running = futures.wait(running)
@@ -44,6 +119,28 @@ def _parallel_uploads(executor, uploader, pending, running):
     return range_ids
 
 
+def _upload_in_parallel(executor, max_concurrency, uploader, pending):
+    """Upload the pending chunks, max_concurrency at a time.
+
+    The executor is shared with other transfers: it is left running. Without one, an executor is
+    created for this upload only.
+    """
+    owned = executor is None
+    if owned:
+        executor = futures.ThreadPoolExecutor(max_concurrency)
+    try:
+        running = set(
+            executor.submit(with_current_context(uploader), chunk)
+            for chunk in islice(pending, 0, max_concurrency)
+        )
+        if not running:
+            return []
+        return _parallel_uploads(executor, uploader, pending, running)
+    finally:
+        if owned:
+            executor.shutdown(wait=False)
+
+
 def upload_data_chunks(
         service=None,
         uploader_class=None,
@@ -53,6 +150,7 @@ def upload_data_chunks(
         stream=None,
         validate_content=None,
         encryption_options=None,
+        executor=None,
         **kwargs):
 
     if encryption_options:
@@ -77,13 +175,7 @@ def upload_data_chunks(
         validate_content=validate_content,
         **kwargs)
     if parallel:
-        executor = futures.ThreadPoolExecutor(max_concurrency)
-        upload_tasks = uploader.get_chunk_streams()
-        running_futures = [
-            executor.submit(with_current_context(uploader.process_chunk), u)
-            for u in islice(upload_tasks, 0, max_concurrency)
-        ]
-        range_ids = _parallel_uploads(executor, uploader.process_chunk, upload_tasks, running_futures)
+        range_ids = _upload_in_parallel(executor, max_concurrency, uploader.process_chunk, uploader.get_chunk_streams())
     else:
         range_ids = [uploader.process_chunk(result) for result in uploader.get_chunk_streams()]
     if any(range_ids):
@@ -98,6 +190,7 @@ def upload_substream_blocks(
         chunk_size=None,
         max_concurrency=None,
         stream=None,
+        executor=None,
         **kwargs):
     parallel = max_concurrency > 1
     if parallel and 'modified_access_conditions' in kwargs:
@@ -112,13 +205,8 @@ def upload_substream_blocks(
         **kwargs)
 
     if parallel:
-        executor = futures.ThreadPoolExecutor(max_concurrency)
-        upload_tasks = uploader.get_substream_blocks()
-        running_futures = [
-            executor.submit(with_current_context(uploader.process_substream_block), u)
-            for u in islice(upload_tasks, 0, max_concurrency)
-        ]
-        range_ids = _parallel_uploads(executor, uploader.process_substream_block, upload_tasks, running_futures)
+        range_ids = _upload_in_parallel(
+            executor, max_concurrency, uploader.process_substream_block, uploader.get_substream_blocks())
     else:
         range_ids = [uploader.process_substream_block(b) for b in uploader.get_substream_blocks()]
     return sorted(range_ids)
@@ -150,24 +238,23 @@ class _ChunkUploader(object):  # pylint: disable=too-many-instance-attributes
         self.request_options = kwargs
 
     def get_chunk_streams(self):
+        mapped = self._map_stream()
+        if mapped is not None:
+            # Chunks are slices of the mapping, sent without being read or copied
+            for index in range(0, len(mapped), self.chunk_size):
+                yield index, mapped[index:index + self.chunk_size]
+            return
+
         index = 0
         while True:
-            data = b""
             read_size = self.chunk_size
-
-            # Buffer until we either reach the end of the stream or get a whole chunk.
-            while True:
-                if self.total_size:
-                    read_size = min(self.chunk_size - len(data), self.total_size - (index + len(data)))
-                temp = self.stream.read(read_size)
-                if not isinstance(temp, six.binary_type):
-                    raise TypeError("Blob data should be of type bytes.")
-                data += temp or b""
-
-                # We have read an empty string and so are at the end
-                # of the buffer or we have read a full chunk.
-                if temp == b"" or len(data) == self.chunk_size:
-                    break
+            if self.total_size:
+                read_size = max(min(self.chunk_size, self.total_size - index), 0)
+            # Each chunk gets its own buffer: it is still referenced while it is being uploaded.
+            data = memoryview(bytearray(read_size))
+            length = read_into(self.stream, data)
+            if length < read_size:
+                data = data[:length]
 
             if len(data) == self.chunk_size:
                 if self.padder:
@@ -177,9 +264,9 @@ class _ChunkUploader(object):  # pylint: disable=too-many-instance-attributes
                 yield index, data
             else:
                 if self.padder:
-                    data = self.padder.update(data) + self.padder.finalize()
+                    data = b"".join([self.padder.update(data), self.padder.finalize()])
                 if self.encryptor:
-                    data = self.encryptor.update(data) + self.encryptor.finalize()
+                    data = b"".join([self.encryptor.update(data), self.encryptor.finalize()])
                 if data:
                     yield index, data
                 break
@@ -218,10 +305,23 @@ class _ChunkUploader(object):  # pylint: disable=too-many-instance-attributes
         blocks = int(ceil(blob_length / (self.chunk_size * 1.0)))
         last_block_size = self.chunk_size if blob_length % self.chunk_size == 0 else blob_length % self.chunk_size
 
+        mapped = self._map_stream(blob_length)
         for i in range(blocks):
             index = i * self.chunk_size
             length = last_block_size if i == blocks - 1 else self.chunk_size
-            yield ('BlockId{}'.format("%05d" % i), SubStream(self.stream, index, length, lock))
+            if mapped is not None:
+                block = mapped[index:index + length]
+            else:
+                block = SubStream(self.stream, index, length, lock)
+            yield ('BlockId{}'.format("%05d" % i), block)
+
+    def _map_stream(self, length=None):
+        if self.padder or self.encryptor:
+            return None
+        mapped = map_stream(self.stream, self.total_size if length is None else length)
+        if mapped is not None:
+            self.stream.seek(len(mapped), SEEK_CUR)
+        return mapped
 
     def process_substream_block(self, block_data):
         return self._upload_substream_block_with_progress(block_data[0], block_data[1])
@@ -271,7 +371,8 @@ class BlockBlobChunkUploader(_ChunkUploader):
                 **self.request_options
             )
         finally:
-            block_stream.close()
+            if not isinstance(block_stream, memoryview):
+                block_stream.close()
         return block_id
 
 
@@ -7,18 +7,17 @@
 
 import asyncio
 from asyncio import Lock
+from io import SEEK_CUR
 from itertools import islice
 import threading
 
 from math import ceil
 
-import six
-
 from . import encode_base64, url_quote
 from .request_handlers import get_length
 from .response_handlers import return_response_headers
 from .encryption import get_blob_encryptor_and_padder
-from .uploads import SubStream, IterStreamer  # pylint: disable=unused-import
+from .uploads import SubStream, IterStreamer, map_stream, read_into  # pylint: disable=unused-import
 
 
 _LARGE_BLOB_UPLOAD_MAX_READ_BUFFER_SIZE = 4 * 1024 * 1024
@@ -27,16 +26,24 @@ _ERROR_VALUE_SHOULD_BE_SEEKABLE_STREAM = '{0} should be a seekable file-like/io.
 
 async def _parallel_uploads(uploader, pending, running):
     range_ids = []
-    while True:
-        # Wait for some download to finish before adding a new one
-        done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
-        range_ids.extend([chunk.result() for chunk in done])
-        try:
-            for _ in range(0, len(done)):
-                next_chunk = next(pending)
-                running.add(asyncio.ensure_future(uploader(next_chunk)))
-        except StopIteration:
-            break
+    try:
+        while True:
+            # Wait for some download to finish before adding a new one
+            done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            range_ids.extend([chunk.result() for chunk in done])
+            try:
+                for _ in range(0, len(done)):
+                    next_chunk = next(pending)
+                    running.add(asyncio.ensure_future(uploader(next_chunk)))
+            except StopIteration:
+                break
+    except BaseException:
+        # The chunks still running must be done before the caller closes the stream
+        for chunk in running:
+            chunk.cancel()
+        if running:
+            await asyncio.wait(running)
+        raise
 
     # Wait for the remaining uploads to finish
     if running:
@@ -153,24 +160,23 @@ class _ChunkUploader(object):  # pylint: disable=too-many-instance-attributes
         self.request_options = kwargs
 
     def get_chunk_streams(self):
+        mapped = self._map_stream()
+        if mapped is not None:
+            # Chunks are slices of the mapping, sent without being read or copied
+            for index in range(0, len(mapped), self.chunk_size):
+                yield index, mapped[index:index + self.chunk_size]
+            return
+
         index = 0
         while True:
-            data = b''
             read_size = self.chunk_size
-
-            # Buffer until we either reach the end of the stream or get a whole chunk.
-            while True:
-                if self.total_size:
-                    read_size = min(self.chunk_size - len(data), self.total_size - (index + len(data)))
-                temp = self.stream.read(read_size)
-                if not isinstance(temp, six.binary_type):
-                    raise TypeError('Blob data should be of type bytes.')
-                data += temp or b""
-
-                # We have read an empty string and so are at the end
-                # of the buffer or we have read a full chunk.
-                if temp == b'' or len(data) == self.chunk_size:
-                    break
+            if self.total_size:
+                read_size = max(min(self.chunk_size, self.total_size - index), 0)
+            # Each chunk gets its own buffer: it is still referenced while it is being uploaded.
+            data = memoryview(bytearray(read_size))
+            length = read_into(self.stream, data)
+            if length < read_size:
+                data = data[:length]
 
             if len(data) == self.chunk_size:
                 if self.padder:
@@ -180,9 +186,9 @@ class _ChunkUploader(object):  # pylint: disable=too-many-instance-attributes
                 yield index, data
             else:
                 if self.padder:
-                    data = self.padder.update(data) + self.padder.finalize()
+                    data = b"".join([self.padder.update(data), self.padder.finalize()])
                 if self.encryptor:
-                    data = self.encryptor.update(data) + self.encryptor.finalize()
+                    data = b"".join([self.encryptor.update(data), self.encryptor.finalize()])
                 if data:
                     yield index, data
                 break
@@ -221,10 +227,23 @@ class _ChunkUploader(object):  # pylint: disable=too-many-instance-attributes
         blocks = int(ceil(blob_length / (self.chunk_size * 1.0)))
         last_block_size = self.chunk_size if blob_length % self.chunk_size == 0 else blob_length % self.chunk_size
 
+        mapped = self._map_stream(blob_length)
         for i in range(blocks):
             index = i * self.chunk_size
             length = last_block_size if i == blocks - 1 else self.chunk_size
-            yield ('BlockId{}'.format("%05d" % i), SubStream(self.stream, index, length, lock))
+            if mapped is not None:
+                block = mapped[index:index + length]
+            else:
+                block = SubStream(self.stream, index, length, lock)
+            yield ('BlockId{}'.format("%05d" % i), block)
+
+    def _map_stream(self, length=None):
+        if self.padder or self.encryptor:
+            return None
+        mapped = map_stream(self.stream, self.total_size if length is None else length)
+        if mapped is not None:
+            self.stream.seek(len(mapped), SEEK_CUR)
+        return mapped
 
     async def process_substream_block(self, block_data):
         return await self._upload_substream_block_with_progress(block_data[0], block_data[1])
@@ -272,7 +291,8 @@ class BlockBlobChunkUploader(_ChunkUploader):
                 upload_stream_current=self.progress_total,
                 **self.request_options)
         finally:
-            block_stream.close()
+            if not isinstance(block_stream, memoryview):
+                block_stream.close()
         return block_id
 
 
@@ -5,12 +5,19 @@
 # --------------------------------------------------------------------------
 # pylint: disable=no-self-use
 
-from io import SEEK_SET, UnsupportedOperation
-from typing import Optional, Union, Any, TypeVar, TYPE_CHECKING # pylint: disable=unused-import
+import hashlib
+from io import SEEK_CUR, SEEK_SET, UnsupportedOperation
+import json
+from math import ceil
+import os
+import threading
+from typing import Optional, Union, Any, Dict, Tuple, TypeVar, TYPE_CHECKING # pylint: disable=unused-import
+import uuid
 
 import six
 from azure.core.exceptions import ResourceExistsError, ResourceModifiedError
 
+from ._shared import encode_base64
 from ._shared.response_handlers import (
     process_storage_error,
     return_response_headers)
@@ -18,6 +25,8 @@ from ._shared.models import StorageErrorCode
 from ._shared.uploads import (
     upload_data_chunks,
     upload_substream_blocks,
+    map_stream,
+    _upload_in_parallel,
     BlockBlobChunkUploader,
     PageBlobChunkUploader,
     AppendBlobChunkUploader)
@@ -59,6 +68,154 @@ def _any_conditions(modified_access_conditions=None, **kwargs):  # pylint: disab
     ])
 
 
+class UploadJournal(object):
+    """A local file recording the blocks staged by a resumable upload, so that it can resume after a failure.
+
+    The first line identifies the upload, each following line is a staged block: its index and
+    the MD5 of its content. Lines are appended as the blocks are staged: a line cut by a crash is
+    ignored, as well as a journal of another upload (another blob, length or block size).
+    """
+
+    def __init__(self, path, blob, length, block_size):
+        # type: (str, str, int, int) -> None
+        self.path = path
+        self.header = {'blob': blob, 'length': length, 'block_size': block_size}
+        self.upload_id = None  # type: Optional[str]
+        self.staged = {}  # type: Dict[int, str]
+        self._file = None
+        self._lock = threading.Lock()
+
+    def open(self):
+        # type: () -> None
+        """Load the blocks staged by a previous attempt of this upload, and start the journal of this attempt."""
+        try:
+            with open(self.path, 'r') as journal:
+                lines = journal.read().split('\n')
+            header = json.loads(lines[0])
+            if all(header.get(key) == value for key, value in self.header.items()):
+                self.upload_id = header['upload_id']
+                for line in lines[1:]:
+                    entry = json.loads(line)
+                    self.staged[entry['index']] = entry['md5']
+        except (IOError, OSError, ValueError, KeyError):
+            # Missing, or cut by a crash: the lines read so far are kept
+            pass
+        if self.upload_id is None:
+            self.upload_id = uuid.uuid4().hex
+            self.staged = {}
+        # The journal is written again, without the line a crash may have cut
+        self._file = open(self.path, 'w')
+        self._write(dict(self.header, upload_id=self.upload_id))
+        for index, md5 in sorted(self.staged.items()):
+            self._write({'index': index, 'md5': md5})
+
+    def _write(self, entry):
+        self._file.write(json.dumps(entry, sort_keys=True) + '\n')
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def get_block_id(self, index):
+        # type: (int) -> str
+        # Block IDs are unique to the upload, so that blocks staged by other uploads are not taken for ours
+        return encode_base64('{}-{:05d}'.format(self.upload_id, index))
+
+    def record(self, index, md5):
+        # type: (int, str) -> None
+        with self._lock:
+            self.staged[index] = md5
+            self._write({'index': index, 'md5': md5})
+
+    def close(self):
+        # type: () -> None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def remove(self):
+        # type: () -> None
+        """Delete the journal, once the upload is committed."""
+        self.close()
+        os.remove(self.path)
+
+
+class ResumableBlockUploader(object):
+    """Stage the blocks of a stream, skipping those the journal and the service show as already staged.
+
+    A block is staged again unless an uncommitted block of the blob has its ID and size, and the
+    journal has the MD5 of its local content.
+    """
+
+    def __init__(self, client, journal, stream, length, block_size, **kwargs):
+        self.client = client
+        self.journal = journal
+        self.stream = stream
+        self.stream_start = stream.tell()
+        self.length = length
+        self.block_size = block_size
+        self.uncommitted = {}  # type: Dict[str, int]
+        self._mapped = map_stream(stream, length)
+        self._stream_lock = threading.Lock()
+        kwargs.pop('modified_access_conditions', None)
+        self.request_options = kwargs
+
+    def get_blocks(self):
+        return iter(range(int(ceil(self.length / float(self.block_size)))))
+
+    def read_block(self, index):
+        offset = index * self.block_size
+        size = min(self.block_size, self.length - offset)
+        if self._mapped is not None:
+            return self._mapped[offset:offset + size]
+        with self._stream_lock:
+            self.stream.seek(self.stream_start + offset)
+            data = self.stream.read(size)
+        if len(data) != size:
+            raise ValueError("The stream ended before the length of the upload.")
+        return data
+
+    def get_block_list_options(self):
+        return {
+            'list_type': 'uncommitted',
+            'lease_access_conditions': self.request_options.get('lease_access_conditions'),
+            'timeout': self.request_options.get('timeout'),
+        }
+
+    def set_uncommitted(self, block_list):
+        self.uncommitted = {block.name: block.size for block in block_list.uncommitted_blocks or []}
+
+    def get_block_to_stage(self, index):
+        # type: (int) -> Tuple[str, Any, Optional[str]]
+        """The block ID and the data of the block, with its MD5 if it must be staged, None otherwise."""
+        data = self.read_block(index)
+        block_id = self.journal.get_block_id(index)
+        md5 = hashlib.md5(data).hexdigest()
+        if self.journal.staged.get(index) == md5 and self.uncommitted.get(block_id) == len(data):
+            return block_id, data, None
+        return block_id, data, md5
+
+    def process_block(self, index):
+        block_id, data, md5 = self.get_block_to_stage(index)
+        if md5 is not None:
+            self.client.stage_block(block_id, len(data), data, **self.request_options)
+            self.journal.record(index, md5)
+        return index, block_id
+
+    def upload(self, max_concurrency, executor):
+        """Stage the missing blocks, and return the IDs of all the blocks, in order."""
+        if self.journal.staged:
+            try:
+                self.set_uncommitted(self.client.get_block_list(**self.get_block_list_options()))
+            except StorageErrorException as error:
+                # The blob does not exist yet
+                if error.response.status_code != 404:
+                    raise
+        if max_concurrency > 1:
+            block_ids = _upload_in_parallel(executor, max_concurrency, self.process_block, self.get_blocks())
+        else:
+            block_ids = [self.process_block(index) for index in self.get_blocks()]
+        return [block_id for _, block_id in sorted(block_ids)]
+
+
 def upload_block_blob(  # pylint: disable=too-many-locals
         client=None,
         data=None,
@@ -68,8 +225,10 @@ def upload_block_blob(  # pylint: disable=too-many-locals
         headers=None,
         validate_content=None,
         max_concurrency=None,
+        executor=None,
         blob_settings=None,
         encryption_options=None,
+        journal=None,
         **kwargs):
     try:
         if not overwrite and not _any_conditions(**kwargs):
@@ -83,12 +242,18 @@ def upload_block_blob(  # pylint: disable=too-many-locals
 
         # Do single put if the size is smaller than or equal config.max_single_put_size
         if adjusted_count is not None and (adjusted_count <= blob_settings.max_single_put_size):
-            try:
-                data = data.read(length)
-                if not isinstance(data, six.binary_type):
-                    raise TypeError('Blob data should be of type bytes.')
-            except AttributeError:
-                pass
+            mapped = None if encryption_options.get('key') else map_stream(data, length)
+            if mapped is not None:
+                # Files are sent from a memory mapping instead of being read
+                data.seek(len(mapped), SEEK_CUR)
+                data = mapped
+            else:
+                try:
+                    data = data.read(length)
+                    if not isinstance(data, six.binary_type):
+                        raise TypeError('Blob data should be of type bytes.')
+                except AttributeError:
+                    pass
             if encryption_options.get('key'):
                 encryption_data, data = encrypt_blob(data, encryption_options['key'])
                 headers['x-ms-meta-encryptiondata'] = encryption_data
@@ -111,7 +276,16 @@ def upload_block_blob(  # pylint: disable=too-many-locals
             hasattr(stream, 'seekable') and not stream.seekable() or \
             not hasattr(stream, 'seek') or not hasattr(stream, 'tell')
 
-        if use_original_upload_path:
+        if journal is not None:
+            journal.open()
+            try:
+                uploader = ResumableBlockUploader(
+                    client, journal, stream, length, blob_settings.max_block_size,
+                    validate_content=validate_content, **kwargs)
+                block_ids = uploader.upload(max_concurrency, executor)
+            finally:
+                journal.close()
+        elif use_original_upload_path:
             if encryption_options.get('key'):
                 cek, iv, encryption_data = generate_blob_encryption_data(encryption_options['key'])
                 headers['x-ms-meta-encryptiondata'] = encryption_data
@@ -123,6 +297,7 @@ def upload_block_blob(  # pylint: disable=too-many-locals
                 total_size=length,
                 chunk_size=blob_settings.max_block_size,
                 max_concurrency=max_concurrency,
+                executor=executor,
                 stream=stream,
                 validate_content=validate_content,
                 encryption_options=encryption_options,
@@ -135,6 +310,7 @@ def upload_block_blob(  # pylint: disable=too-many-locals
                 total_size=length,
                 chunk_size=blob_settings.max_block_size,
                 max_concurrency=max_concurrency,
+                executor=executor,
                 stream=stream,
                 validate_content=validate_content,
                 **kwargs
@@ -142,7 +318,7 @@ def upload_block_blob(  # pylint: disable=too-many-locals
 
         block_lookup = BlockLookupList(committed=[], uncommitted=[], latest=[])
         block_lookup.latest = block_ids
-        return client.commit_block_list(
+        response = client.commit_block_list(
             block_lookup,
             blob_http_headers=blob_headers,
             cls=return_response_headers,
@@ -151,6 +327,9 @@ def upload_block_blob(  # pylint: disable=too-many-locals
             tier=tier.value if tier else None,
             blob_tags_string=blob_tags_string,
             **kwargs)
+        if journal is not None:
+            journal.remove()
+        return response
     except StorageErrorException as error:
         try:
             process_storage_error(error)
@@ -168,6 +347,7 @@ def upload_page_blob(
         headers=None,
         validate_content=None,
         max_concurrency=None,
+        executor=None,
         blob_settings=None,
         encryption_options=None,
         **kwargs):
@@ -209,6 +389,7 @@ def upload_page_blob(
             chunk_size=blob_settings.max_page_size,
             stream=stream,
             max_concurrency=max_concurrency,
+            executor=executor,
             validate_content=validate_content,
             encryption_options=encryption_options,
             **kwargs)
@@ -230,6 +411,7 @@ def upload_append_blob(  # pylint: disable=unused-argument
         headers=None,
         validate_content=None,
         max_concurrency=None,
+        executor=None,
         blob_settings=None,
         encryption_options=None,
         **kwargs):
@@ -257,6 +439,7 @@ def upload_append_blob(  # pylint: disable=unused-argument
                 chunk_size=blob_settings.max_block_size,
                 stream=stream,
                 max_concurrency=max_concurrency,
+                executor=executor,
                 validate_content=validate_content,
                 append_position_access_conditions=append_conditions,
                 **kwargs)
@@ -284,6 +467,7 @@ def upload_append_blob(  # pylint: disable=unused-argument
                 chunk_size=blob_settings.max_block_size,
                 stream=stream,
                 max_concurrency=max_concurrency,
+                executor=executor,
                 validate_content=validate_content,
                 append_position_access_conditions=append_conditions,
                 **kwargs)
@@ -0,0 +1,124 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+from collections import deque
+from typing import (  # pylint: disable=unused-import
+    Any, AsyncIterable, Awaitable, Callable, Iterable, List, Optional, Tuple, TypeVar, Union,
+    TYPE_CHECKING
+)
+
+from .._batch_helpers import chunk_blobs, get_retry_indexes
+
+if TYPE_CHECKING:
+    from azure.core.pipeline.transport import AsyncHttpResponse  # pylint: disable=ungrouped-imports
+    T = TypeVar('T')
+
+
+async def send_batch_with_retries(
+        send_batch: "Callable[[List[T]], Awaitable[List[AsyncHttpResponse]]]",
+        chunk: "List[T]",
+        max_retries: int,
+        retry_backoff: float
+    ) -> "List[Tuple[T, AsyncHttpResponse]]":
+    """Send one batch, then send again only the sub-requests that failed with a transient error."""
+    responses = [None] * len(chunk)  # type: List[Any]
+    pending = list(range(len(chunk)))
+    for attempt in range(max_retries + 1):
+        if attempt:
+            await asyncio.sleep(retry_backoff * 2 ** (attempt - 1))
+        sub_responses = await send_batch([chunk[index] for index in pending])
+        for index, response in zip(pending, sub_responses):
+            responses[index] = response
+        pending = get_retry_indexes(pending, sub_responses)
+        if not pending:
+            break
+    return list(zip(chunk, responses))
+
+
+class AsyncBulkBatchIterator(object):
+    """Async iterator sending blobs in batches, up to max_concurrency at a time.
+
+    It yields (blob, sub-response) pairs. The results of a batch are yielded in the order of
+    its blobs, as soon as the batch is done. Batches complete in any order. The blobs are read
+    from an iterable or an async iterable, like a blob listing.
+    """
+
+    def __init__(
+            self, send_batch: "Callable[[List[T]], Awaitable[List[AsyncHttpResponse]]]",
+            blobs: "Union[Iterable[T], AsyncIterable[T]]",
+            batch_size: int,
+            max_concurrency: int,
+            max_retries: int,
+            retry_backoff: float
+        ) -> None:
+        self._send_batch = send_batch
+        if hasattr(blobs, '__aiter__'):
+            self._blobs = blobs.__aiter__()  # type: Any
+            self._chunks = None
+        else:
+            self._chunks = chunk_blobs(blobs, batch_size)
+        self._batch_size = batch_size
+        self._max_concurrency = max_concurrency
+        self._max_retries = max_retries
+        self._retry_backoff = retry_backoff
+        self._running = set()  # type: set
+        self._results = deque()  # type: deque
+        self._started = False
+
+    def __iter__(self):
+        raise TypeError("Async iterator must be iterated asynchronously.")
+
+    def __aiter__(self):
+        return self
+
+    async def _next_chunk(self) -> "Optional[List[T]]":
+        if self._chunks is not None:
+            return next(self._chunks, None)
+        chunk = []  # type: List[T]
+        while len(chunk) < self._batch_size:
+            try:
+                chunk.append(await self._blobs.__anext__())
+            except StopAsyncIteration:
+                break
+        return chunk or None
+
+    async def _schedule(self, count: int) -> None:
+        for _ in range(count):
+            chunk = await self._next_chunk()
+            if chunk is None:
+                break
+            self._running.add(asyncio.ensure_future(
+                send_batch_with_retries(self._send_batch, chunk, self._max_retries, self._retry_backoff)))
+
+    async def __anext__(self) -> "Tuple[T, AsyncHttpResponse]":
+        if not self._started:
+            self._started = True
+            try:
+                await self._schedule(self._max_concurrency)
+            except BaseException:
+                await self.aclose()
+                raise
+        while not self._results:
+            if not self._running:
+                raise StopAsyncIteration("Batches complete")
+            try:
+                done, self._running = await asyncio.wait(self._running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    self._results.extend(task.result())
+                await self._schedule(len(done))
+            except BaseException:
+                await self.aclose()
+                raise
+        return self._results.popleft()
+
+    async def aclose(self) -> None:
+        """Cancel the batches still running."""
+        for task in self._running:
+            task.cancel()
+        if self._running:
+            await asyncio.wait(self._running)
+        self._running = set()
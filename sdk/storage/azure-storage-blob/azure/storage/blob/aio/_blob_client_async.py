@@ -30,6 +30,8 @@ from .._models import BlobType, BlobBlock, BlobProperties
 from .._lease import get_access_conditions
 from ._lease_async import BlobLeaseClient
 from ._download_async import StorageStreamDownloader
+from .._blob_reader import DOWNLOAD_KEYWORDS, READER_KEYWORDS
+from ._blob_reader_async import BlobReader
 
 if TYPE_CHECKING:
     from datetime import datetime
@@ -221,6 +223,12 @@ class BlobClient(AsyncStorageAccountHostsMixin, BlobClientBase):  # pylint: disa
         :keyword int max_concurrency:
             Maximum number of parallel connections to use when the blob size exceeds
             64MB.
+        :keyword str journal_path:
+            Makes the upload of a block blob resumable. The blocks staged are recorded in this local
+            file, with the MD5 of their content. When the upload is started again after a failure, with
+            the same journal, only the blocks which are not staged yet are uploaded. The journal is
+            deleted once the upload is committed. It requires a seekable stream of known length, and is
+            not supported with client side encryption.
         :keyword ~azure.storage.blob.CustomerProvidedEncryptionKey cpk:
             Encrypts the data on the service-side with the given key.
             Use of customer-provided keys must be done over HTTPS.
@@ -348,6 +356,94 @@ class BlobClient(AsyncStorageAccountHostsMixin, BlobClientBase):  # pylint: disa
         await downloader._setup()  # pylint: disable=protected-access
         return downloader
 
+    @distributed_trace_async
+    async def download_blob_to_path(self, file_path, offset=None, length=None, **kwargs):
+        # type: (str, Optional[int], Optional[int], Any) -> BlobProperties
+        """Downloads a blob to a file, created or overwritten.
+
+        The file is first allocated to the size of the download, then each chunk is written at
+        its offset with a positional write. All the keyword arguments of :func:`download_blob`
+        are accepted, except encoding.
+
+        :param str file_path:
+            The path of the file to download to.
+        :param int offset:
+            Start of byte range to use for downloading a section of the blob.
+            Must be set if length is provided.
+        :param int length:
+            Number of bytes to read from the stream. This is optional, but
+            should be supplied for optimal performance.
+        :keyword int max_concurrency:
+            The number of parallel connections with which to download.
+        :returns: The properties of the downloaded blob.
+        :rtype: ~azure.storage.blob.BlobProperties
+        """
+        downloader = await self.download_blob(offset=offset, length=length, **kwargs)
+        await downloader._readinto_path(file_path)  # pylint: disable=protected-access
+        return downloader.properties
+
+    @distributed_trace_async
+    async def open_read(self, **kwargs):
+        # type: (Any) -> BlobReader
+        """Opens the blob as a read-only, seekable file object, which serves reads with
+        ranged downloads of the blob. Only the parts of the blob which are read are downloaded.
+
+        The blocks read are kept in an LRU cache, and sequential reads download the following
+        blocks ahead, on a window which grows with each sequential read. Every download is pinned
+        to the ETag of the blob when it is opened: if the blob is then modified, reads raise
+        :class:`~azure.core.exceptions.ResourceModifiedError`.
+
+        :keyword int block_size:
+            The size of the blocks downloaded and cached. Defaults to max_chunk_get_size
+            of the client configuration.
+        :keyword int cache_size:
+            The size in bytes of the block cache. Defaults to 64 MiB.
+        :keyword int max_read_ahead:
+            The largest number of bytes downloaded ahead of sequential reads. Set to 0 to
+            disable read-ahead. Defaults to 8 blocks.
+        :keyword str version_id:
+            The version id parameter is an opaque DateTime
+            value that, when present, specifies the version of the blob to open.
+        :keyword bool validate_content:
+            If true, calculates an MD5 hash for each range downloaded. This is primarily
+            valuable for detecting bitflips on the wire if using http instead of https,
+            as https (the default), will already validate.
+        :keyword lease:
+            Required if the blob has an active lease. Value can be a BlobLeaseClient object
+            or the lease ID as a string.
+        :paramtype lease: ~azure.storage.blob.BlobLeaseClient or str
+        :keyword ~datetime.datetime if_modified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to open the blob only
+            if the resource has been modified since the specified time.
+        :keyword ~datetime.datetime if_unmodified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to open the blob only if
+            the resource has not been modified since the specified date/time.
+        :keyword str etag:
+            An ETag value, or the wildcard character (*). Used to check if the resource has changed,
+            and act according to the condition specified by the `match_condition` parameter.
+        :keyword ~azure.core.MatchConditions match_condition:
+            The match condition to use upon the etag.
+        :keyword ~azure.storage.blob.CustomerProvidedEncryptionKey cpk:
+            Encrypts the data on the service-side with the given key.
+            Use of customer-provided keys must be done over HTTPS.
+            As the encryption key itself is provided in the request,
+            a secure connection must be established to transfer the key.
+        :keyword int timeout:
+            The timeout parameter is expressed in seconds, for each request.
+        :returns: A seekable file object.
+        :rtype: ~azure.storage.blob.aio.BlobReader
+        """
+        reader_options = {key: kwargs.pop(key) for key in READER_KEYWORDS if key in kwargs}
+        properties = await self.get_blob_properties(**kwargs)
+        reader_options.update((key, kwargs[key]) for key in DOWNLOAD_KEYWORDS if key in kwargs)
+        return BlobReader(self, properties, **reader_options)
+
     @distributed_trace_async
     async def delete_blob(self, delete_snapshots=False, **kwargs):
         # type: (bool, Any) -> None
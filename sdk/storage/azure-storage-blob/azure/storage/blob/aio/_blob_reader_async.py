@@ -0,0 +1,86 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import io
+from typing import (  # pylint: disable=unused-import
+    Any, Optional,
+    TYPE_CHECKING
+)
+
+from .._blob_reader import BlobReaderBase, get_blob_reader_options
+
+if TYPE_CHECKING:
+    from ._blob_client_async import BlobClient
+    from .._models import BlobProperties
+
+
+class BlobReader(BlobReaderBase):
+    """A read-only, seekable async file object over a blob, returned by
+    :func:`~azure.storage.blob.aio.BlobClient.open_read`.
+
+    Reads are served with ranged downloads of the blob, through an LRU cache of blocks.
+    Sequential reads fetch the following blocks ahead. Every download is pinned to the
+    ETag of the blob when it was opened: if the blob is modified, reads raise
+    :class:`~azure.core.exceptions.ResourceModifiedError`.
+    A BlobReader must not be shared between tasks.
+
+    :ivar str name:
+        The name of the blob.
+    :ivar int size:
+        The size of the blob.
+    :ivar str etag:
+        The ETag of the blob the reads are pinned to.
+    """
+
+    def __init__(self, client: "BlobClient", properties: "BlobProperties", **kwargs: Any) -> None:
+        reader_options, download_options = get_blob_reader_options(kwargs, client._config)  # pylint: disable=protected-access
+        super(BlobReader, self).__init__(client, properties, download_options=download_options, **reader_options)
+
+    async def __aenter__(self):
+        self._check_open()
+        return self
+
+    async def __aexit__(self, *args):
+        await self.close()
+
+    def readable(self) -> bool:
+        self._check_open()
+        return True
+
+    def seekable(self) -> bool:
+        self._check_open()
+        return True
+
+    def tell(self) -> int:
+        self._check_open()
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        return self._seek(offset, whence)
+
+    async def readinto(self, buffer: Any) -> int:
+        length = self._get_read_size(len(memoryview(buffer)))
+        if not length:
+            return 0
+        for run in self._plan_fetches(length):
+            offset, count = self._get_range(run)
+            downloader = await self._client.download_blob(offset=offset, length=count, **self._download_options)
+            self._store(run, await downloader.readall())
+        return self._copy_blocks(buffer, length)
+
+    async def read(self, size: Optional[int] = -1) -> bytes:
+        buffer = bytearray(self._get_read_size(size))
+        return bytes(buffer[:await self.readinto(buffer)])
+
+    async def readall(self) -> bytes:
+        return await self.read()
+
+    @property
+    def closed(self) -> bool:
+        return self._closed
+
+    async def close(self) -> None:
+        self._close()
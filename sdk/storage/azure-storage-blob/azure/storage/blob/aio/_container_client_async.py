@@ -7,7 +7,7 @@
 # pylint: disable=invalid-overridden-method
 import functools
 from typing import (  # pylint: disable=unused-import
-    Union, Optional, Any, Iterable, AnyStr, Dict, List, IO, AsyncIterator,
+    Union, Optional, Any, Iterable, AnyStr, Callable, Dict, List, Tuple, IO, AsyncIterator,
     TYPE_CHECKING
 )
 
@@ -33,10 +33,16 @@ from .._deserialize import deserialize_container_properties
 from .._serialize import get_modify_conditions, get_container_cpk_scope_info, get_api_version
 from .._container_client import ContainerClient as ContainerClientBase, _get_blob_name
 from .._lease import get_access_conditions
-from .._models import ContainerProperties, BlobProperties, BlobType  # pylint: disable=unused-import
+from .._batch_helpers import get_bulk_batch_options
+from .._directory_helpers import get_directory_options
+from .._copy_helpers import get_copy_options
+from .._models import ContainerProperties, BlobProperties, BlobType, TransferSummary  # pylint: disable=unused-import
 from ._models import BlobPropertiesPaged, BlobPrefix
 from ._lease_async import BlobLeaseClient
 from ._blob_client_async import BlobClient
+from ._batch_helpers import AsyncBulkBatchIterator
+from ._directory_helpers import AsyncDirectoryTransfer
+from ._copy_helpers import AsyncBulkCopy
 
 if TYPE_CHECKING:
     from .._models import PublicAccess
@@ -850,6 +856,169 @@ class ContainerClient(AsyncStorageAccountHostsMixin, ContainerClientBase):
             length=length,
             **kwargs)
 
+    @distributed_trace_async
+    async def upload_directory(
+            self, source: str,
+            name_starts_with: Optional[str] = None,
+            **kwargs: Any
+        ) -> TransferSummary:
+        """Uploads the files of a local directory tree as block blobs.
+
+        The blob name of a file is its path relative to `source`, with "/" separators, after
+        `name_starts_with`. Existing blobs are overwritten, unless the file is unchanged.
+
+        All the transfers share one budget of `max_concurrency` connections: up to `max_concurrency`
+        files are uploaded at a time, and the files uploaded in chunks use the free connections
+        for their chunks. A file which fails to upload doesn't stop the others, its error is
+        reported in the summary.
+
+        :param str source: The path of the local directory.
+        :param str name_starts_with:
+            The prefix of the blob names, such as "backup/". Defaults to no prefix.
+        :keyword int max_concurrency:
+            The maximum number of connections used at the same time. Defaults to 4.
+        :keyword str skip_unchanged:
+            Which files are skipped because the blob of the same name is unchanged:
+
+             - "last_modified" (default): the sizes are equal and the blob was modified after the file.
+             - "size": the sizes are equal.
+             - "md5": the sizes are equal, and the MD5 of the file is the Content-MD5 of the blob. The MD5
+               of the uploaded files is stored in their Content-MD5, unless `content_settings` is given.
+             - None: all the files are uploaded.
+        :keyword progress_hook:
+            A callable called with the :class:`~azure.storage.blob.TransferSummary` so far, each time
+            a file is uploaded, skipped or fails.
+        :paramtype progress_hook: Callable[[~azure.storage.blob.TransferSummary], None]
+        :keyword int timeout:
+            The timeout parameter is expressed in seconds. It applies to each request.
+
+        Other keyword arguments, such as `metadata`, `content_settings`, `standard_blob_tier` or
+        `validate_content`, are passed to :func:`~azure.storage.blob.aio.BlobClient.upload_blob` for every file.
+
+        :returns: The summary of the upload.
+        :rtype: ~azure.storage.blob.TransferSummary
+        """
+        max_concurrency, skip_unchanged, progress_hook = get_directory_options(kwargs)
+        kwargs.setdefault('overwrite', True)
+        transfer = AsyncDirectoryTransfer(self, max_concurrency, skip_unchanged, progress_hook, **kwargs)
+        return await transfer.upload(source, name_starts_with or '')
+
+    @distributed_trace_async
+    async def download_directory(
+            self, destination: str,
+            name_starts_with: Optional[str] = None,
+            **kwargs: Any
+        ) -> TransferSummary:
+        """Downloads the blobs whose name starts with a prefix to a local directory tree.
+
+        The path of a blob is its name after `name_starts_with`, relative to `destination`, "/" being
+        the separator of the directories. Blob names which would be written outside of `destination`
+        are refused. Existing files are overwritten, unless the blob is unchanged. The modification time
+        of the downloaded files is the last modified time of their blob.
+
+        All the transfers share one budget of `max_concurrency` connections: up to `max_concurrency`
+        blobs are downloaded at a time, and the blobs downloaded in chunks use the free connections
+        for their chunks. A blob which fails to download doesn't stop the others, its error is
+        reported in the summary.
+
+        :param str destination: The path of the local directory.
+        :param str name_starts_with:
+            Downloads only the blobs whose name starts with this prefix. Defaults to all the blobs.
+        :keyword int max_concurrency:
+            The maximum number of connections used at the same time. Defaults to 4.
+        :keyword str skip_unchanged:
+            Which blobs are skipped because the file of the same path is unchanged:
+
+             - "last_modified" (default): the sizes are equal and the file was modified after the blob.
+             - "size": the sizes are equal.
+             - "md5": the sizes are equal, and the MD5 of the file is the Content-MD5 of the blob.
+             - None: all the blobs are downloaded.
+        :keyword progress_hook:
+            A callable called with the :class:`~azure.storage.blob.TransferSummary` so far, each time
+            a blob is downloaded, skipped or fails.
+        :paramtype progress_hook: Callable[[~azure.storage.blob.TransferSummary], None]
+        :keyword int timeout:
+            The timeout parameter is expressed in seconds. It applies to each request.
+
+        Other keyword arguments, such as `validate_content` or `encoding`, are passed to
+        :func:`~azure.storage.blob.aio.BlobClient.download_blob` for every blob.
+
+        :returns: The summary of the download.
+        :rtype: ~azure.storage.blob.TransferSummary
+        """
+        max_concurrency, skip_unchanged, progress_hook = get_directory_options(kwargs)
+        transfer = AsyncDirectoryTransfer(self, max_concurrency, skip_unchanged, progress_hook, **kwargs)
+        return await transfer.download(destination, name_starts_with or '')
+
+    @distributed_trace_async
+    async def copy_blobs(
+            self, source_container: 'ContainerClient',
+            blobs: Optional[Any] = None,
+            destination_name: Optional[Callable[[BlobProperties], str]] = None,
+            **kwargs: Any
+        ) -> TransferSummary:
+        """Copies blobs of a source container to this container, with server side copies.
+
+        The blobs smaller than `block_copy_threshold` are copied with
+        :func:`~azure.storage.blob.aio.BlobClient.start_copy_from_url`, and their copy status is polled
+        for all the pending copies together. The larger blobs are copied by staging their blocks from
+        the URL of the source blob in parallel with
+        :func:`~azure.storage.blob.aio.BlobClient.stage_block_from_url`, then committing the blocks with
+        the content settings and metadata of the source blob. The service reads the source blocks with
+        the SAS of the URL of `source_container` only, even within the same account: when that URL has
+        no SAS, as with a shared key or an OAuth credential, all the blobs are copied with
+        :func:`~azure.storage.blob.aio.BlobClient.start_copy_from_url`.
+
+        All the copies share one budget of `max_concurrency` connections, and each pending copy
+        holds a connection until it completes. Transient errors and the copies reported as failed
+        are retried. A blob which fails to copy doesn't stop the others, its error is reported in
+        the summary.
+
+        :param source_container: The container of the blobs to copy, which may be in another account.
+        :type source_container: ~azure.storage.blob.aio.ContainerClient
+        :param blobs:
+            The blobs to copy, by name or with their properties as returned by
+            :func:`~azure.storage.blob.aio.ContainerClient.list_blobs`, in an iterable or an async
+            iterable. Defaults to all the blobs of `source_container`. The blobs given by name are
+            looked up with one more request.
+        :type blobs: Iterable[str or ~azure.storage.blob.BlobProperties] or
+            AsyncIterable[str or ~azure.storage.blob.BlobProperties]
+        :param destination_name:
+            A callable returning the name of the copy of a source blob, given its properties.
+            Defaults to the name of the source blob.
+        :type destination_name: Callable[[~azure.storage.blob.BlobProperties], str]
+        :keyword int max_concurrency:
+            The maximum number of connections used and copies pending at the same time. Defaults to 16.
+        :keyword int block_copy_threshold:
+            The size from which blobs are copied by blocks, if `source_container` has a SAS.
+            Defaults to 256 MiB.
+        :keyword int block_size:
+            The size of the blocks staged from the source blob. Defaults to 64 MiB.
+        :keyword int max_retries:
+            The maximum number of retries of a copy or of a block. Defaults to 3.
+        :keyword float retry_backoff:
+            The delay before the first retry, in seconds, doubled after each retry. Defaults to 0.8.
+        :keyword float poll_interval:
+            The interval between two polls of the status of the pending copies, in seconds.
+            Defaults to 2.
+        :keyword progress_hook:
+            A callable called with the :class:`~azure.storage.blob.TransferSummary` so far, each time
+            a blob is copied or fails.
+        :paramtype progress_hook: Callable[[~azure.storage.blob.TransferSummary], None]
+        :keyword int timeout:
+            The timeout parameter is expressed in seconds. It applies to each request.
+
+        Other keyword arguments, such as `metadata`, are passed to the copy of every blob.
+
+        :returns: The summary of the copy, whose failures are keyed by destination blob name.
+        :rtype: ~azure.storage.blob.TransferSummary
+        """
+        options = get_copy_options(kwargs)
+        if blobs is None:
+            blobs = source_container.list_blobs(include=['metadata'])
+        copy = AsyncBulkCopy(self, destination_name or (lambda blob: blob.name), **dict(options, **kwargs))
+        return await copy.run(source_container, blobs)
+
     @distributed_trace_async
     async def delete_blobs(  # pylint: disable=arguments-differ
             self, *blobs: List[Union[str, BlobProperties, dict]],
@@ -930,6 +1099,64 @@ class ContainerClient(AsyncStorageAccountHostsMixin, ContainerClientBase):
 
         return await self._batch_send(*reqs, **options)
 
+    def delete_blobs_in_batches(
+            self, blobs: Iterable[Union[str, BlobProperties, dict]],
+            **kwargs: Any
+        ) -> AsyncIterator[Tuple[Any, AsyncHttpResponse]]:
+        """Marks any number of blobs or snapshots for deletion, with concurrent batch requests.
+
+        The blobs are read lazily from the iterable, or async iterable like a blob listing, and sent in
+        batches of up to 256 sub-requests, the limit of the service. Up to `max_concurrency` batches are
+        in flight at a time. Sub-requests failing with a transient error (408, 429, 500, 502, 503 or 504)
+        are sent again after a backoff, in a smaller batch holding only the failed sub-requests of the
+        same batch. Other failures are reported in the results: no exception is raised for a failed
+        sub-request.
+
+        :param blobs:
+            The blobs to delete. Each value is either the name of the blob (str), BlobProperties,
+            or a dict with the keys described in :func:`delete_blobs`.
+        :type blobs: Iterable[str or dict or ~azure.storage.blob.BlobProperties] or AsyncIterable
+        :keyword str delete_snapshots:
+            Required if a blob has associated snapshots. Values include:
+             - "only": Deletes only the blobs snapshots.
+             - "include": Deletes the blob along with all snapshots.
+        :keyword ~datetime.datetime if_modified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only
+            if the resource has been modified since the specified time.
+        :keyword ~datetime.datetime if_unmodified_since:
+            A DateTime value. Azure expects the date value passed in to be UTC.
+            If timezone is included, any non-UTC datetimes will be converted to UTC.
+            If a date is passed in without timezone info, it is assumed to be UTC.
+            Specify this header to perform the operation only if
+            the resource has not been modified since the specified date/time.
+        :keyword int batch_size:
+            The maximum number of sub-requests of a batch, up to 256. Defaults to 256.
+        :keyword int max_concurrency:
+            The maximum number of batches sent at the same time. Defaults to 4.
+        :keyword int max_retries:
+            How many times a sub-request failing with a transient error is sent again. Defaults to 3.
+        :keyword float retry_backoff:
+            Delay before the first retry of a batch, in seconds, doubled on each retry. Defaults to 0.8.
+        :keyword int timeout:
+            The timeout parameter is expressed in seconds. It applies to each batch request.
+        :return: An async iterator of (blob, sub-response) tuples, one for each blob. The blobs of a
+            batch are in order, but batches complete in any order.
+        :rtype: asynciterator[tuple[Any, ~azure.core.pipeline.transport.AsyncHttpResponse]]
+        """
+        batch_size, max_concurrency, max_retries, retry_backoff = get_bulk_batch_options(kwargs)
+
+        async def send_batch(chunk):
+            reqs, options = self._generate_delete_blobs_options(*chunk, **dict(kwargs))
+            parts = []
+            async for part in await self._batch_send(*reqs, **options):
+                parts.append(part)
+            return parts
+
+        return AsyncBulkBatchIterator(send_batch, blobs, batch_size, max_concurrency, max_retries, retry_backoff)
+
     @distributed_trace
     async def set_standard_blob_tier_blobs(
         self,
@@ -988,6 +1215,56 @@ class ContainerClient(AsyncStorageAccountHostsMixin, ContainerClientBase):
 
         return await self._batch_send(*reqs, **options)
 
+    def set_standard_blob_tier_blobs_in_batches(
+        self,
+        standard_blob_tier: Optional[Union[str, 'StandardBlobTier']],
+        blobs: Iterable[Union[str, BlobProperties, dict]],
+        **kwargs: Any
+    ) -> AsyncIterator[Tuple[Any, AsyncHttpResponse]]:
+        """Sets the tier on any number of block blobs, with concurrent batch requests.
+
+        The blobs are read lazily from the iterable, or async iterable like a blob listing, and sent in
+        batches of up to 256 sub-requests, the limit of the service. Up to `max_concurrency` batches are
+        in flight at a time. Sub-requests failing with a transient error (408, 429, 500, 502, 503 or 504)
+        are sent again after a backoff, in a smaller batch holding only the failed sub-requests of the
+        same batch. Other failures are reported in the results: no exception is raised for a failed
+        sub-request.
+
+        :param standard_blob_tier:
+            Indicates the tier to be set on all blobs. Options include 'Hot', 'Cool',
+            'Archive'. If None, the tier of each blob is taken from its 'blob_tier' key.
+        :type standard_blob_tier: str or ~azure.storage.blob.StandardBlobTier
+        :param blobs:
+            The blobs with which to interact. Each value is either the name of the blob (str),
+            BlobProperties, or a dict with the keys described in :func:`set_standard_blob_tier_blobs`.
+        :type blobs: Iterable[str or dict or ~azure.storage.blob.BlobProperties] or AsyncIterable
+        :keyword ~azure.storage.blob.RehydratePriority rehydrate_priority:
+            Indicates the priority with which to rehydrate an archived blob
+        :keyword int batch_size:
+            The maximum number of sub-requests of a batch, up to 256. Defaults to 256.
+        :keyword int max_concurrency:
+            The maximum number of batches sent at the same time. Defaults to 4.
+        :keyword int max_retries:
+            How many times a sub-request failing with a transient error is sent again. Defaults to 3.
+        :keyword float retry_backoff:
+            Delay before the first retry of a batch, in seconds, doubled on each retry. Defaults to 0.8.
+        :keyword int timeout:
+            The timeout parameter is expressed in seconds. It applies to each batch request.
+        :return: An async iterator of (blob, sub-response) tuples, one for each blob. The blobs of a
+            batch are in order, but batches complete in any order.
+        :rtype: asynciterator[tuple[Any, ~azure.core.pipeline.transport.AsyncHttpResponse]]
+        """
+        batch_size, max_concurrency, max_retries, retry_backoff = get_bulk_batch_options(kwargs)
+
+        async def send_batch(chunk):
+            reqs, options = self._generate_set_tiers_options(standard_blob_tier, *chunk, **dict(kwargs))
+            parts = []
+            async for part in await self._batch_send(*reqs, **options):
+                parts.append(part)
+            return parts
+
+        return AsyncBulkBatchIterator(send_batch, blobs, batch_size, max_concurrency, max_retries, retry_backoff)
+
     @distributed_trace
     async def set_premium_page_blob_tier_blobs(
         self,
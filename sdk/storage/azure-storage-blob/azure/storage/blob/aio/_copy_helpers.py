@@ -0,0 +1,226 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+from itertools import islice
+import time
+from typing import (  # pylint: disable=unused-import
+    Any, Dict, List, Optional, Tuple,
+    TYPE_CHECKING
+)
+
+from azure.core.exceptions import ResourceNotFoundError
+
+from .._copy_helpers import MAX_LISTED_PER_COPY, BulkCopy, PendingCopy, get_poll_groups, is_transient
+from .._models import BlobBlock, BlobProperties, TransferSummary
+from .._shared.uploads_async import _parallel_uploads
+from ._directory_helpers import AsyncConcurrencyBudget
+
+if TYPE_CHECKING:
+    from .._models import CopyProperties
+
+
+class AsyncBulkCopy(BulkCopy):
+    """Copy blobs to a container with server side copies, on one concurrency budget.
+
+    The blobs of block_copy_threshold bytes or more are copied by staging their blocks from the
+    URL of the source, in parallel on as many of the free connections as they can use, if that URL
+    has a SAS. The other blobs are copied by the service, and each of their copies holds a connection until it completes,
+    so that the number of copies pending on the service is bounded too. The pending copies are polled
+    together every poll_interval seconds. Transient errors and failed copies are retried.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(AsyncBulkCopy, self).__init__(*args, **kwargs)
+        self.budget = AsyncConcurrencyBudget(self.max_concurrency)
+
+    async def run(self, source_container, blobs) -> TransferSummary:  # pylint: disable=invalid-overridden-method
+        if hasattr(blobs, '__aiter__'):
+            blobs = blobs.__aiter__()
+
+            async def next_blob():
+                try:
+                    return await blobs.__anext__()
+                except StopAsyncIteration:
+                    return None
+        else:
+            blobs = iter(blobs)
+
+            async def next_blob():
+                return next(blobs, None)
+
+        async def submit(count):
+            for _ in range(count):
+                blob = await next_blob()
+                if blob is None:
+                    break
+                running.add(asyncio.ensure_future(self._copy_blob((blob, source_container.get_blob_client(blob)))))
+
+        running = set()  # type: set
+        try:
+            # Keep a bounded number of blobs queued, the listing may be large
+            await submit(self.max_concurrency * 2)
+            last_poll = time.time()
+            while running or self.pending:
+                timeout = self._get_poll_timeout(last_poll)
+                if running:
+                    done, running = await asyncio.wait(
+                        running, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                    for task in done:
+                        task.result()
+                    await submit(len(done))
+                else:
+                    await asyncio.sleep(timeout)
+                if self._get_poll_timeout(last_poll) == 0:
+                    for item, attempt in await self._poll():
+                        running.add(asyncio.ensure_future(self._copy_blob(item, attempt)))
+                    last_poll = time.time()
+        finally:
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.wait(running)
+        self.summary.elapsed = time.time() - self._start
+        return self.summary
+
+    async def _copy_blob(self, item, attempt=0):  # pylint: disable=arguments-differ,invalid-overridden-method
+        blob, source = item
+        name = source.blob_name
+        try:
+            if not isinstance(blob, BlobProperties):
+                blob = await source.get_blob_properties(timeout=self.options.get('timeout'))
+                item = blob, source
+            name = self.destination_name(blob)
+        except Exception as error:  # pylint: disable=broad-except
+            self._update(name, error=error)
+            return
+        while True:
+            try:
+                if await self._start_copy(item, name, attempt):
+                    # The copy is pending on the service, and completed by _poll
+                    return
+            except Exception as error:  # pylint: disable=broad-except
+                delay = self._get_retry_delay(error, attempt)
+                if delay is None:
+                    self._update(name, error=error)
+                    return
+                await asyncio.sleep(delay)
+                attempt += 1
+                continue
+            self._update(name, size=blob.size)
+            return
+
+    async def _start_copy(self, item, name, attempt):  # pylint: disable=arguments-differ,invalid-overridden-method
+        """Copy a blob, return whether the copy is still pending on the service."""
+        blob, source = item
+        connections = await self.budget.acquire(self._get_connections(blob, source.url))
+        try:
+            if self._copies_blocks(blob, source.url):
+                await self._copy_blocks(blob, source.url, name, connections)
+                return False
+            copy = await self.container.get_blob_client(name).start_copy_from_url(source.url, **self.options)
+            if copy['copy_status'] != 'pending':
+                return False
+            self.pending[name] = PendingCopy(item, attempt, copy['copy_id'])
+            # The connection is released once the copy completes
+            connections = 0
+            return True
+        finally:
+            await self.budget.release(connections)
+
+    async def _stage_block(self, client, source_url, block):  # pylint: disable=invalid-overridden-method
+        block_id, offset, length = block
+        attempt = 0
+        while True:
+            try:
+                await client.stage_block_from_url(
+                    block_id, source_url, source_offset=offset, source_length=length,
+                    timeout=self.options.get('timeout'))
+                return block_id
+            except Exception as error:  # pylint: disable=broad-except
+                if attempt >= self.max_retries or not is_transient(error):
+                    raise
+                await asyncio.sleep(self.retry_backoff * 2 ** attempt)
+                attempt += 1
+
+    async def _copy_blocks(self, blob, source_url, name, connections):  # pylint: disable=arguments-differ
+        client = self.container.get_blob_client(name)
+        blocks = self._get_blocks(blob)
+
+        async def stage_block(block):
+            return await self._stage_block(client, source_url, block)
+
+        if connections > 1:
+            pending = iter(blocks)
+            running = [asyncio.ensure_future(stage_block(block)) for block in islice(pending, connections)]
+            await _parallel_uploads(stage_block, pending, running)
+        else:
+            for block in blocks:
+                await stage_block(block)
+        await client.commit_block_list(
+            [BlobBlock(block_id) for block_id, _, _ in blocks], **self._get_commit_options(blob))
+
+    async def _list_copies(self, prefix: str, names: List[str], copies: Dict[str, 'CopyProperties']) -> List[str]:
+        """Add the copies listed under the prefix to copies, return the names left to poll one by one.
+
+        The listing stops once all the copies are found, or after MAX_LISTED_PER_COPY blobs per copy.
+        """
+        wanted = set(names)
+        max_listed = len(names) * MAX_LISTED_PER_COPY
+        listed = 0
+        async for blob in self.container.list_blobs(
+                name_starts_with=prefix, include=['copy'], results_per_page=min(max_listed, 5000),
+                timeout=self.options.get('timeout')):
+            listed += 1
+            if blob.name in wanted:
+                copies[blob.name] = blob.copy
+                wanted.discard(blob.name)
+                if not wanted:
+                    break
+            if listed >= max_listed:
+                return sorted(wanted)
+        # The copies which were not listed have been deleted
+        return []
+
+    async def _get_copies(self, names: List[str]) -> Dict[str, 'CopyProperties']:
+        """The copy properties of the destination blobs, by name. The deleted blobs are missing."""
+        copies = {}  # type: Dict[str, CopyProperties]
+        polled = []
+        for prefix, group in get_poll_groups(names):
+            if prefix is None:
+                polled.extend(group)
+            else:
+                # The blob batch does not support Get Blob Properties, list the blobs under their common prefix
+                polled.extend(await self._list_copies(prefix, group, copies))
+        for name in polled:
+            try:
+                properties = await self.container.get_blob_client(name).get_blob_properties(
+                    timeout=self.options.get('timeout'))
+                copies[name] = properties.copy
+            except ResourceNotFoundError:
+                pass
+        return copies
+
+    async def _poll(self) -> List[Tuple[Any, int]]:  # pylint: disable=invalid-overridden-method
+        """Update the status of the pending copies, return the copies to retry with their attempt."""
+        pending = dict(self.pending)
+        try:
+            copies = await self._get_copies(list(pending))
+        except Exception as error:  # pylint: disable=broad-except
+            if not is_transient(error):
+                raise
+            return []
+        retries = []
+        for name, pending_copy in pending.items():
+            copy = copies.get(name)
+            if copy is not None and copy.id == pending_copy.copy_id and copy.status == 'pending':
+                continue
+            del self.pending[name]
+            await self.budget.release(1)
+            retry = self._complete(name, pending_copy, copy)
+            if retry:
+                retries.append(retry)
+        return retries
@@ -0,0 +1,193 @@
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+import asyncio
+import functools
+import os
+import time
+from typing import (  # pylint: disable=unused-import
+    Any, Awaitable, Callable, Dict, Optional,
+    TYPE_CHECKING
+)
+
+from .._directory_helpers import (
+    DirectoryTransfer,
+    get_chunk_count,
+    get_download_path,
+    get_file_md5,
+    get_timestamp,
+    is_unchanged,
+    iter_directory,
+    make_parent_directory)
+from .._models import ContentSettings, TransferSummary
+
+if TYPE_CHECKING:
+    from .._models import BlobProperties
+
+
+async def run_in_executor(func, *args):
+    """Run a blocking file system call in the default executor, instead of on the event loop."""
+    return await asyncio.get_event_loop().run_in_executor(None, functools.partial(func, *args))
+
+
+class AsyncConcurrencyBudget(object):
+    """The connections shared by the transfers of the files and of their chunks."""
+
+    def __init__(self, size: int) -> None:
+        self._available = size
+        self._condition = asyncio.Condition()
+
+    async def acquire(self, wanted: int) -> int:
+        """Wait for a connection, then take up to wanted of the available ones. Return how many were taken."""
+        async with self._condition:  # pylint: disable=not-async-context-manager
+            while not self._available:
+                await self._condition.wait()
+            granted = min(wanted, self._available)
+            self._available -= granted
+            return granted
+
+    async def release(self, count: int) -> None:
+        async with self._condition:  # pylint: disable=not-async-context-manager
+            self._available += count
+            self._condition.notify_all()
+
+
+class AsyncDirectoryTransfer(DirectoryTransfer):
+    """Upload or download the files of a directory tree, on one concurrency budget.
+
+    Up to max_concurrency files are transferred at a time. A file whose size calls for
+    chunks takes as many of the free connections as it can use, and transfers its chunks
+    in parallel on them.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super(AsyncDirectoryTransfer, self).__init__(*args, **kwargs)
+        self.budget = AsyncConcurrencyBudget(self.max_concurrency)
+
+    async def _run(  # pylint: disable=arguments-differ
+            self, transfer: Callable[[Any], Awaitable[None]],
+            next_item: Callable[[], Awaitable[Any]]
+        ) -> TransferSummary:
+        running = set()  # type: set
+        # Keep a bounded number of files queued, the tree may be large
+        scheduled = self.max_concurrency * 2
+        done = set()  # type: set
+        try:
+            while True:
+                for _ in range(scheduled):
+                    item = await next_item()
+                    if item is None:
+                        break
+                    running.add(asyncio.ensure_future(transfer(item)))
+                if not running:
+                    break
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+                scheduled = len(done)
+        finally:
+            # After an error, e.g. raised by progress_hook, stop the other transfers
+            for task in running:
+                task.cancel()
+            if running:
+                await asyncio.wait(running)
+            # Only the first error is raised, retrieve the others so that asyncio doesn't log them
+            for task in done | running:
+                if not task.cancelled():
+                    task.exception()
+        self.summary.elapsed = time.time() - self._start
+        return self.summary
+
+    async def upload(self, source: str, name_starts_with: str) -> TransferSummary:
+        blobs = {}  # type: Dict[str, BlobProperties]
+        if self.skip_unchanged:
+            async for blob in self.container.list_blobs(name_starts_with=name_starts_with or None):
+                blobs[blob.name] = blob
+        files = iter_directory(source)
+
+        async def next_item():
+            # os.walk lists the directories, which blocks
+            path, name = await run_in_executor(next, files, (None, None))
+            if path is None:
+                return None
+            return path, name_starts_with + name, blobs.get(name_starts_with + name)
+
+        return await self._run(self._upload_file, next_item)
+
+    async def _upload_file(self, item):  # pylint: disable=arguments-differ
+        path, name, blob = item
+        try:
+            # Read the file once, to compare it and to store its MD5
+            file_md5 = await run_in_executor(get_file_md5, path) if self.skip_unchanged == 'md5' else None
+            if await run_in_executor(is_unchanged, path, blob, self.skip_unchanged, 'blob', file_md5):
+                self._update(path, skipped=True)
+                return
+            config = self.container._config  # pylint: disable=protected-access
+            size = await run_in_executor(os.path.getsize, path)
+            options = dict(self.options)
+            if file_md5 and 'content_settings' not in options:
+                # Stored with the blob, so that the next upload can compare it
+                options['content_settings'] = ContentSettings(content_md5=bytearray(file_md5))
+            connections = await self.budget.acquire(
+                get_chunk_count(size, config.max_single_put_size, config.max_block_size))
+            try:
+                data = await run_in_executor(open, path, 'rb')
+                try:
+                    await self.container.get_blob_client(name).upload_blob(
+                        data, length=size, max_concurrency=connections, **options)
+                finally:
+                    data.close()
+            finally:
+                await self.budget.release(connections)
+        except Exception as error:  # pylint: disable=broad-except
+            self._update(path, error=error)
+            return
+        self._update(path, size=size)
+
+    async def download(self, destination: str, name_starts_with: str) -> TransferSummary:
+        blobs = self.container.list_blobs(name_starts_with=name_starts_with or None)
+
+        async def next_item():
+            while True:
+                try:
+                    blob = await blobs.__anext__()
+                except StopAsyncIteration:
+                    return None
+                name = blob.name[len(name_starts_with):].lstrip('/')
+                # Names ending with "/" are directory markers
+                if name and not name.endswith('/'):
+                    return blob, name, destination
+
+        return await self._run(self._download_file, next_item)
+
+    async def _download_file(self, item):  # pylint: disable=arguments-differ
+        blob, name, destination = item
+        try:
+            path = get_download_path(destination, name)
+            if await run_in_executor(is_unchanged, path, blob, self.skip_unchanged, 'file'):
+                self._update(blob.name, skipped=True)
+                return
+            config = self.container._config  # pylint: disable=protected-access
+            await run_in_executor(make_parent_directory, path)
+            connections = await self.budget.acquire(
+                get_chunk_count(blob.size, config.max_single_get_size, config.max_chunk_get_size))
+            try:
+                stream = await run_in_executor(open, path, 'wb')
+                try:
+                    downloader = await self.container.download_blob(
+                        blob, max_concurrency=connections, **self.options)
+                    await downloader.readinto(stream)
+                finally:
+                    stream.close()
+            finally:
+                await self.budget.release(connections)
+            # The next download can compare the modification times
+            timestamp = get_timestamp(blob.last_modified)
+            await run_in_executor(os.utime, path, (timestamp, timestamp))
+        except Exception as error:  # pylint: disable=broad-except
+            self._update(blob.name, error=error)
+            return
+        self._update(blob.name, size=blob.size)
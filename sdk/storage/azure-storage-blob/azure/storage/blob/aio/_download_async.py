@@ -7,6 +7,7 @@
 
 import asyncio
 import sys
+from collections import deque
 from io import BytesIO
 from itertools import islice
 import warnings
@@ -16,7 +17,7 @@ from .._shared.encryption import decrypt_blob
 from .._shared.request_handlers import validate_and_format_range_headers
 from .._shared.response_handlers import process_storage_error, parse_length_from_content_range
 from .._deserialize import get_page_ranges_result
-from .._download import process_range_and_offset, _ChunkDownloader
+from .._download import process_range_and_offset, _ChunkDownloader, _FileWriter
 
 
 async def process_content(data, start_offset, end_offset, encryption):
@@ -47,7 +48,7 @@ async def process_content(data, start_offset, end_offset, encryption):
 class _AsyncChunkDownloader(_ChunkDownloader):
     def __init__(self, **kwargs):
         super(_AsyncChunkDownloader, self).__init__(**kwargs)
-        self.stream_lock = asyncio.Lock() if kwargs.get('parallel') else None
+        self.stream_lock = asyncio.Lock() if kwargs.get('parallel') and not self.positional else None
         self.progress_lock = asyncio.Lock() if kwargs.get('parallel') else None
 
     async def process_chunk(self, chunk_start):
@@ -70,7 +71,9 @@ class _AsyncChunkDownloader(_ChunkDownloader):
             self.progress_total += length
 
     async def _write_to_stream(self, chunk_data, chunk_start):
-        if self.stream_lock:
+        if self.positional:
+            self.stream.write_at(chunk_data, self.stream_start + (chunk_start - self.start_index))
+        elif self.stream_lock:
             async with self.stream_lock:  # pylint: disable=not-async-context-manager
                 self.stream.seek(self.stream_start + (chunk_start - self.start_index))
                 self.stream.write(chunk_data)
@@ -114,14 +117,20 @@ class _AsyncChunkDownloader(_ChunkDownloader):
 
 
 class _AsyncChunkIterator(object):
-    """Async iterator for chunks in blob download stream."""
+    """Async iterator for chunks in blob download stream.
 
-    def __init__(self, size, content, downloader):
+    With a max_concurrency above 1, that many chunks are downloaded ahead in parallel,
+    and yielded in order.
+    """
+
+    def __init__(self, size, content, downloader, max_concurrency=1):
         self.size = size
         self._current_content = content
         self._iter_downloader = downloader
         self._iter_chunks = None
         self._complete = (size == 0)
+        self._max_concurrency = max_concurrency
+        self._pending = deque()
 
     def __len__(self):
         return self.size
@@ -144,6 +153,18 @@ class _AsyncChunkIterator(object):
 
         if not self._iter_chunks:
             self._iter_chunks = self._iter_downloader.get_chunk_offsets()
+            if self._max_concurrency > 1:
+                self._read_ahead()
+        elif self._max_concurrency > 1:
+            if not self._pending:
+                self._complete = True
+                raise StopAsyncIteration("Download complete")
+            try:
+                self._current_content = await self._pending.popleft()
+            except BaseException:
+                await self.aclose()
+                raise
+            self._read_ahead()
         else:
             try:
                 chunk = next(self._iter_chunks)
@@ -153,6 +174,19 @@ class _AsyncChunkIterator(object):
 
         return self._current_content
 
+    def _read_ahead(self):
+        for chunk in islice(self._iter_chunks, self._max_concurrency - len(self._pending)):
+            self._pending.append(asyncio.ensure_future(self._iter_downloader.yield_chunk(chunk)))
+
+    async def aclose(self):
+        """Stop downloading the chunks read ahead, when the iteration is abandoned."""
+        self._complete = True
+        for task in self._pending:
+            task.cancel()
+        if self._pending:
+            await asyncio.wait(self._pending)
+        self._pending.clear()
+
 
 class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attributes
     """A streaming object to download from Azure Storage.
@@ -328,7 +362,10 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
     def chunks(self):
         """Iterate over chunks in the download stream.
 
-        :rtype: Iterable[bytes]
+        With a max_concurrency above 1, as many chunks are downloaded ahead in parallel,
+        and yielded in order: the memory used is bounded by max_concurrency chunks.
+
+        :rtype: AsyncIterator[bytes]
         """
         if self.size == 0 or self._download_complete:
             iter_downloader = None
@@ -354,7 +391,8 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
         return _AsyncChunkIterator(
             size=self.size,
             content=self._current_content,
-            downloader=iter_downloader)
+            downloader=iter_downloader,
+            max_concurrency=self._max_concurrency)
 
     async def readall(self):
         """Download the contents of this blob.
@@ -430,7 +468,18 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
         stream.write(self._current_content)
         if self._download_complete:
             return self.size
+        await self._download_chunks(stream, parallel)
+        return self.size
 
+    async def _readinto_path(self, file_path):
+        """Download the contents of this blob to a file, each chunk written at its offset."""
+        with _FileWriter(file_path, self.size) as writer:
+            writer.write(self._current_content)
+            if not self._download_complete:
+                await self._download_chunks(writer, self._max_concurrency > 1)
+        return self.size
+
+    async def _download_chunks(self, stream, parallel):
         data_end = self._file_size
         if self._end_range is not None:
             # Use the length unless it is over the end of the file
@@ -456,21 +505,21 @@ class StorageStreamDownloader(object):  # pylint: disable=too-many-instance-attr
             asyncio.ensure_future(downloader.process_chunk(d))
             for d in islice(dl_tasks, 0, self._max_concurrency)
         ]
-        while running_futures:
-            # Wait for some download to finish before adding a new one
-            _done, running_futures = await asyncio.wait(
-                running_futures, return_when=asyncio.FIRST_COMPLETED)
-            try:
-                next_chunk = next(dl_tasks)
-            except StopIteration:
-                break
-            else:
-                running_futures.add(asyncio.ensure_future(downloader.process_chunk(next_chunk)))
-
-        if running_futures:
-            # Wait for the remaining downloads to finish
-            await asyncio.wait(running_futures)
-        return self.size
+        try:
+            while running_futures:
+                # Wait for some download to finish before adding a new one
+                done, running_futures = await asyncio.wait(
+                    running_futures, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    task.result()
+                for next_chunk in islice(dl_tasks, len(done)):
+                    running_futures.add(asyncio.ensure_future(downloader.process_chunk(next_chunk)))
+        finally:
+            # On failure, the chunks still running must not write to the stream once it is closed
+            for task in running_futures:
+                task.cancel()
+            if running_futures:
+                await asyncio.wait(running_futures)
 
     async def download_to_stream(self, stream, max_concurrency=1):
         """Download the contents of this blob to a stream.
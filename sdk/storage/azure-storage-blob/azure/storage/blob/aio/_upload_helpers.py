@@ -5,7 +5,9 @@
 # --------------------------------------------------------------------------
 # pylint: disable=no-self-use
 
-from io import SEEK_SET, UnsupportedOperation
+import asyncio
+from io import SEEK_CUR, SEEK_SET, UnsupportedOperation
+from itertools import islice
 from typing import Optional, Union, Any, TypeVar, TYPE_CHECKING # pylint: disable=unused-import
 
 import six
@@ -14,9 +16,11 @@ from azure.core.exceptions import ResourceModifiedError
 from .._shared.response_handlers import (
     process_storage_error,
     return_response_headers)
+from .._shared.uploads import map_stream
 from .._shared.uploads_async import (
     upload_data_chunks,
     upload_substream_blocks,
+    _parallel_uploads,
     BlockBlobChunkUploader,
     PageBlobChunkUploader,
     AppendBlobChunkUploader)
@@ -27,13 +31,46 @@ from .._generated.models import (
     AppendPositionAccessConditions,
     ModifiedAccessConditions,
 )
-from .._upload_helpers import _convert_mod_error, _any_conditions
+from .._upload_helpers import _convert_mod_error, _any_conditions, ResumableBlockUploader
 
 if TYPE_CHECKING:
     from datetime import datetime # pylint: disable=unused-import
     BlobLeaseClient = TypeVar("BlobLeaseClient")
 
 
+class AsyncResumableBlockUploader(ResumableBlockUploader):
+    """Stage the blocks of a stream, skipping those the journal and the service show as already staged."""
+
+    async def process_block(self, index):  # pylint: disable=invalid-overridden-method
+        block_id, data, md5 = self.get_block_to_stage(index)
+        if md5 is not None:
+            await self.client.stage_block(block_id, len(data), data, **self.request_options)
+            self.journal.record(index, md5)
+        return index, block_id
+
+    async def upload(self, max_concurrency):  # pylint: disable=invalid-overridden-method,arguments-differ
+        """Stage the missing blocks, and return the IDs of all the blocks, in order."""
+        if self.journal.staged:
+            try:
+                self.set_uncommitted(await self.client.get_block_list(**self.get_block_list_options()))
+            except StorageErrorException as error:
+                # The blob does not exist yet
+                if error.response.status_code != 404:
+                    raise
+        blocks = self.get_blocks()
+        if max_concurrency > 1:
+            running_futures = [
+                asyncio.ensure_future(self.process_block(index))
+                for index in islice(blocks, 0, max_concurrency)
+            ]
+            block_ids = await _parallel_uploads(self.process_block, blocks, running_futures)
+        else:
+            block_ids = []
+            for index in blocks:
+                block_ids.append(await self.process_block(index))
+        return [block_id for _, block_id in sorted(block_ids)]
+
+
 async def upload_block_blob(  # pylint: disable=too-many-locals
         client=None,
         data=None,
@@ -45,6 +82,7 @@ async def upload_block_blob(  # pylint: disable=too-many-locals
         max_concurrency=None,
         blob_settings=None,
         encryption_options=None,
+        journal=None,
         **kwargs):
     try:
         if not overwrite and not _any_conditions(**kwargs):
@@ -58,12 +96,18 @@ async def upload_block_blob(  # pylint: disable=too-many-locals
 
         # Do single put if the size is smaller than config.max_single_put_size
         if adjusted_count is not None and (adjusted_count <= blob_settings.max_single_put_size):
-            try:
-                data = data.read(length)
-                if not isinstance(data, six.binary_type):
-                    raise TypeError('Blob data should be of type bytes.')
-            except AttributeError:
-                pass
+            mapped = None if encryption_options.get('key') else map_stream(data, length)
+            if mapped is not None:
+                # Files are sent from a memory mapping instead of being read
+                data.seek(len(mapped), SEEK_CUR)
+                data = mapped
+            else:
+                try:
+                    data = data.read(length)
+                    if not isinstance(data, six.binary_type):
+                        raise TypeError('Blob data should be of type bytes.')
+                except AttributeError:
+                    pass
             if encryption_options.get('key'):
                 encryption_data, data = encrypt_blob(data, encryption_options['key'])
                 headers['x-ms-meta-encryptiondata'] = encryption_data
@@ -86,7 +130,16 @@ async def upload_block_blob(  # pylint: disable=too-many-locals
             hasattr(stream, 'seekable') and not stream.seekable() or \
             not hasattr(stream, 'seek') or not hasattr(stream, 'tell')
 
-        if use_original_upload_path:
+        if journal is not None:
+            journal.open()
+            try:
+                uploader = AsyncResumableBlockUploader(
+                    client, journal, stream, length, blob_settings.max_block_size,
+                    validate_content=validate_content, **kwargs)
+                block_ids = await uploader.upload(max_concurrency)
+            finally:
+                journal.close()
+        elif use_original_upload_path:
             if encryption_options.get('key'):
                 cek, iv, encryption_data = generate_blob_encryption_data(encryption_options['key'])
                 headers['x-ms-meta-encryptiondata'] = encryption_data
@@ -117,7 +170,7 @@ async def upload_block_blob(  # pylint: disable=too-many-locals
 
         block_lookup = BlockLookupList(committed=[], uncommitted=[], latest=[])
         block_lookup.latest = block_ids
-        return await client.commit_block_list(
+        response = await client.commit_block_list(
             block_lookup,
             blob_http_headers=blob_headers,
             cls=return_response_headers,
@@ -126,6 +179,9 @@ async def upload_block_blob(  # pylint: disable=too-many-locals
             tier=tier.value if tier else None,
             blob_tags_string=blob_tags_string,
             **kwargs)
+        if journal is not None:
+            journal.remove()
+        return response
     except StorageErrorException as error:
         try:
             process_storage_error(error)
@@ -0,0 +1,564 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""An in-memory Blob service, answering the HTTP requests of the clients through a fake transport.
+
+The clients built with one of its transports run their whole pipeline: the requests, the batch
+multipart bodies and the responses are serialized and deserialized as with the service. It is
+used by the tests which can't run in playback, because their requests are sent concurrently.
+"""
+
+import base64
+import calendar
+import collections
+import datetime
+import hashlib
+import re
+import threading
+import time
+import uuid
+from email.utils import formatdate
+from xml.etree import ElementTree
+from xml.sax.saxutils import escape
+
+from requests.structures import CaseInsensitiveDict
+from six.moves.urllib.parse import parse_qsl, unquote, urlparse
+
+from azure.core.pipeline.transport import HttpResponse, HttpTransport
+from azure.storage.blob import BlobClient, ContainerClient
+
+# ------------------------------------------------------------------------------
+
+ACCOUNT_URL = 'https://account.blob.core.windows.net'
+SAS_TOKEN = 'sv=2019-12-12&sig=fake'
+
+_REASONS = {
+    200: 'OK', 201: 'Created', 202: 'Accepted', 206: 'Partial Content', 400: 'Bad Request', 403: 'Forbidden',
+    404: 'Not Found', 409: 'Conflict', 412: 'Precondition Failed', 416: 'Range Not Satisfiable',
+    500: 'Internal Server Error', 501: 'Not Implemented', 503: 'Service Unavailable',
+}
+
+_ERROR_CODES = {
+    403: 'AuthorizationFailure', 404: 'BlobNotFound', 409: 'BlobAlreadyExists', 412: 'ConditionNotMet',
+    416: 'InvalidRange', 500: 'InternalError', 501: 'NotImplemented', 503: 'ServerBusy',
+}
+
+# The requests which are not counted as running: the polls of copies and the listings
+_NOT_COUNTED = ('get_properties', 'list_blobs')
+
+
+def _format_date(value):
+    return formatdate(calendar.timegm(value.utctimetuple()), usegmt=True)
+
+
+def _parse_range(value):
+    start, end = value[len('bytes='):].split('-')
+    return int(start), int(end)
+
+
+class FakeBlob(object):
+    """A block blob of the fake service."""
+
+    def __init__(self, data=b'', last_modified=None, content_type=None, content_md5=None, metadata=None):
+        self.data = bytes(data)
+        self.blocks = []
+        self.last_modified = last_modified or datetime.datetime.utcnow().replace(microsecond=0)
+        self.etag = '"0x{}"'.format(uuid.uuid4().hex[:15].upper())
+        self.content_type = content_type or 'application/octet-stream'
+        self.content_md5 = content_md5
+        self.metadata = metadata or {}
+        self.tier = 'Hot'
+        self.copy = None
+
+
+class FakeError(object):
+    """Fail the requests of an operation (on a blob name) with a status, after skip of them succeeded.
+
+    count is the number of requests to fail, None to fail all of them.
+    """
+
+    def __init__(self, operation, status, name=None, count=1, skip=0):
+        self.operation = operation
+        self.status = status
+        self.name = name
+        self.count = count
+        self.skip = skip
+
+    def match(self, operation, name):
+        if operation != self.operation or self.name not in (None, name) or self.count == 0:
+            return False
+        if self.skip:
+            self.skip -= 1
+            return False
+        if self.count is not None:
+            self.count -= 1
+        return True
+
+
+class FakeRequest(object):
+    """A request received by the service."""
+
+    def __init__(self, method, url, headers, body):
+        parsed = urlparse(url)
+        self.method = method
+        self.url = url
+        self.headers = CaseInsensitiveDict(headers)
+        self.body = body
+        self.query = dict(parse_qsl(parsed.query))
+        path = unquote(parsed.path).lstrip('/')
+        self.container, _, self.name = path.partition('/')
+        self.operation = self._get_operation()
+
+    def _get_operation(self):  # pylint: disable=too-many-return-statements
+        comp = self.query.get('comp')
+        if comp == 'batch':
+            return 'batch'
+        if self.query.get('restype') == 'container':
+            return 'list_blobs' if comp == 'list' else 'container'
+        if self.method == 'HEAD':
+            return 'get_properties'
+        if self.method == 'DELETE':
+            return 'delete'
+        if self.method == 'GET':
+            return 'get_block_list' if comp == 'blocklist' else 'download'
+        copy_source = 'x-ms-copy-source' in self.headers
+        if comp == 'block':
+            return 'stage_block_from_url' if copy_source else 'stage_block'
+        if comp in ('blocklist', 'tier'):
+            return 'commit_block_list' if comp == 'blocklist' else 'set_tier'
+        if comp is None:
+            return 'start_copy' if copy_source else 'upload'
+        return comp
+
+    def get_detail(self):
+        """What the tests check about the request: the range of a download, the prefix of a listing,
+        the number of sub-requests of a batch, the blob name and block ID of a staged block, the blob
+        name otherwise.
+        """
+        if self.operation == 'download':
+            value = self.headers.get('x-ms-range') or self.headers.get('Range')
+            if value:
+                start, end = _parse_range(value)
+                return start, end - start + 1
+            return None
+        if self.operation == 'list_blobs':
+            return self.query.get('prefix')
+        if self.operation == 'batch':
+            return self.body.count(b'Content-ID: ')
+        if self.operation in ('stage_block', 'stage_block_from_url'):
+            return self.name, self.query['blockid']
+        return self.name
+
+
+class FakeBlobService(object):  # pylint: disable=too-many-instance-attributes
+    """An in-memory Blob service, with blobs in containers.
+
+    The transport of the service answers the requests of the clients. The requests received
+    are recorded, and can be failed with add_error. A copy started with start_copy_from_url is
+    pending until its status is polled once, and fails if its name is in failed_copies. The blobs
+    returned by the listings are counted by container in listed.
+
+    :param float delay: The time each request takes, in seconds.
+    """
+
+    container_client_class = ContainerClient
+    blob_client_class = BlobClient
+
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.containers = {}
+        self.uncommitted = {}
+        self.requests = []
+        self.errors = []
+        self.failed_copies = set()
+        self.listed = collections.Counter()
+        self.running = 0
+        self.max_running = 0
+        self._lock = threading.RLock()
+
+    def get_transport(self):
+        return FakeTransport(self)
+
+    def get_container_client(self, container='container', **kwargs):
+        """A client of a container of the service, without retries; kwargs are passed to the client."""
+        kwargs.setdefault('credential', SAS_TOKEN)
+        return self.container_client_class(
+            ACCOUNT_URL, container, transport=self.get_transport(), retry_total=0, **kwargs)
+
+    def get_blob_client(self, container='container', blob='blob', **kwargs):
+        """A client of a blob of the service, without retries; kwargs are passed to the client."""
+        return self.blob_client_class(
+            ACCOUNT_URL, container, blob, credential=SAS_TOKEN, transport=self.get_transport(), retry_total=0,
+            **kwargs)
+
+    def get_container(self, name):
+        with self._lock:
+            return self.containers.setdefault(name, {})
+
+    def add_blob(self, container, name, data=b'', **kwargs):
+        """Add a blob, kwargs are the properties of FakeBlob."""
+        blob = FakeBlob(data, **kwargs)
+        self.get_container(container)[name] = blob
+        return blob
+
+    def add_error(self, operation, status=500, name=None, count=1, skip=0):
+        self.errors.append(FakeError(operation, status, name=name, count=count, skip=skip))
+
+    def get_requests(self, operation, container=None):
+        """The details of the requests received for an operation (on a container), in order: the ranges
+        of the downloads, the prefixes of the listings, the sizes of the batches, the blob names and block
+        IDs of the staged blocks, and the blob names of the other operations (the sub-requests of the
+        batches included).
+        """
+        with self._lock:
+            return [detail for request_operation, request_container, detail in self.requests
+                    if request_operation == operation and container in (None, request_container)]
+
+    def clear_requests(self):
+        with self._lock:
+            self.requests = []
+
+    def start(self, request):
+        with self._lock:
+            self.requests.append((request.operation, request.container, request.get_detail()))
+            if request.operation not in _NOT_COUNTED:
+                self.running += 1
+                self.max_running = max(self.max_running, self.running)
+
+    def stop(self, request, status, headers):
+        with self._lock:
+            # A pending copy keeps its connection until it is polled
+            if request.operation not in _NOT_COUNTED and headers.get('x-ms-copy-status') != 'pending':
+                self.running -= 1
+
+    def respond(self, request):
+        """Answer a request, return its status, headers and body."""
+        with self._lock:
+            for error in self.errors:
+                if error.match(request.operation, request.name):
+                    return self._error(error.status)
+            handler = getattr(self, '_' + request.operation, None)
+            if handler is None:
+                return self._error(501)
+            return handler(request)
+
+    def _error(self, status, code=None):
+        code = code or _ERROR_CODES.get(status, 'InternalError')
+        body = u'\ufeff<?xml version="1.0" encoding="utf-8"?><Error><Code>{}</Code><Message>{}</Message></Error>'
+        body = body.format(code, _REASONS.get(status, code)).encode('utf-8')
+        return status, {'x-ms-error-code': code, 'Content-Type': 'application/xml'}, body
+
+    def _get_blob(self, container, name):
+        return self.containers.get(container, {}).get(name)
+
+    def _get_source(self, request):
+        source = FakeRequest('GET', request.headers['x-ms-copy-source'], {}, b'')
+        return self._get_blob(source.container, source.name)
+
+    def _blob_headers(self, blob):
+        headers = {
+            'ETag': blob.etag,
+            'Last-Modified': _format_date(blob.last_modified),
+            'x-ms-blob-type': 'BlockBlob',
+            'Content-Type': blob.content_type,
+            'x-ms-access-tier': blob.tier,
+        }
+        for key, value in blob.metadata.items():
+            headers['x-ms-meta-' + key] = value
+        if blob.copy:
+            headers.update({
+                'x-ms-copy-id': blob.copy['id'],
+                'x-ms-copy-status': blob.copy['status'],
+                'x-ms-copy-source': blob.copy['source'],
+            })
+            if blob.copy['status'] == 'failed':
+                headers['x-ms-copy-status-description'] = 'Failed'
+        return headers
+
+    def _poll_copy(self, name, blob):
+        if blob.copy and blob.copy['status'] == 'pending':
+            blob.copy['status'] = 'failed' if name in self.failed_copies else 'success'
+            self.failed_copies.discard(name)
+            self.running -= 1
+
+    def _write_blob(self, request, data, blocks=()):
+        if request.headers.get('If-None-Match') == '*' and self._get_blob(request.container, request.name):
+            return self._error(409)
+        content_md5 = request.headers.get('x-ms-blob-content-md5')
+        metadata = {key[len('x-ms-meta-'):]: value for key, value in request.headers.items()
+                    if key.lower().startswith('x-ms-meta-')}
+        blob = self.add_blob(
+            request.container, request.name, data, content_type=request.headers.get('x-ms-blob-content-type'),
+            content_md5=base64.b64decode(content_md5) if content_md5 else None, metadata=metadata)
+        blob.blocks = list(blocks)
+        if request.headers.get('x-ms-access-tier'):
+            blob.tier = request.headers['x-ms-access-tier']
+        headers = {'ETag': blob.etag, 'Last-Modified': _format_date(blob.last_modified)}
+        headers['Content-MD5'] = base64.b64encode(hashlib.md5(blob.data).digest()).decode('ascii')
+        return 201, headers, b''
+
+    def _container(self, request):
+        if request.method == 'PUT':
+            self.get_container(request.container)
+            return 201, {}, b''
+        return self._error(501)
+
+    def _upload(self, request):
+        return self._write_blob(request, request.body)
+
+    def _stage_block(self, request):
+        blocks = self.uncommitted.setdefault((request.container, request.name), {})
+        blocks[request.query['blockid']] = request.body
+        return 201, {}, b''
+
+    def _stage_block_from_url(self, request):
+        # The service reads the source with the SAS of its URL only, even in the same account
+        if 'sig' not in FakeRequest('GET', request.headers['x-ms-copy-source'], {}, b'').query:
+            return self._error(403, 'CannotVerifyCopySource')
+        source = self._get_source(request)
+        if source is None:
+            return self._error(404, 'CannotVerifyCopySource')
+        start, end = _parse_range(request.headers['x-ms-source-range'])
+        blocks = self.uncommitted.setdefault((request.container, request.name), {})
+        blocks[request.query['blockid']] = source.data[start:end + 1]
+        return 201, {}, b''
+
+    def _commit_block_list(self, request):
+        uncommitted = self.uncommitted.get((request.container, request.name), {})
+        blob = self._get_blob(request.container, request.name)
+        committed = dict(blob.blocks) if blob else {}
+        blocks = []
+        for element in ElementTree.fromstring(request.body):
+            block_id = element.text
+            if element.tag != 'Committed' and block_id in uncommitted:
+                blocks.append((block_id, uncommitted[block_id]))
+            elif element.tag != 'Uncommitted' and block_id in committed:
+                blocks.append((block_id, committed[block_id]))
+            else:
+                return self._error(400, 'InvalidBlockList')
+        response = self._write_blob(request, b''.join(data for _, data in blocks), blocks)
+        if response[0] == 201:
+            self.uncommitted.pop((request.container, request.name), None)
+        return response
+
+    def _get_block_list(self, request):
+        def block_elements(blocks):
+            return ''.join('<Block><Name>{}</Name><Size>{}</Size></Block>'.format(escape(block_id), len(data))
+                           for block_id, data in blocks)
+
+        list_type = request.query.get('blocklisttype', 'committed')
+        blob = self._get_blob(request.container, request.name)
+        uncommitted = self.uncommitted.get((request.container, request.name), {})
+        body = '<?xml version="1.0" encoding="utf-8"?><BlockList>'
+        if list_type in ('committed', 'all'):
+            body += '<CommittedBlocks>{}</CommittedBlocks>'.format(block_elements(blob.blocks if blob else []))
+        if list_type in ('uncommitted', 'all'):
+            body += '<UncommittedBlocks>{}</UncommittedBlocks>'.format(block_elements(sorted(uncommitted.items())))
+        body += '</BlockList>'
+        return 200, {'Content-Type': 'application/xml'}, body.encode('utf-8')
+
+    def _get_properties(self, request):
+        blob = self._get_blob(request.container, request.name)
+        if blob is None:
+            return 404, {'x-ms-error-code': 'BlobNotFound'}, b''
+        if request.headers.get('If-Match') not in (None, blob.etag):
+            return 412, {'x-ms-error-code': 'ConditionNotMet'}, b''
+        self._poll_copy(request.name, blob)
+        headers = self._blob_headers(blob)
+        headers['Content-Length'] = str(len(blob.data))
+        if blob.content_md5:
+            headers['Content-MD5'] = base64.b64encode(blob.content_md5).decode('ascii')
+        return 200, headers, b''
+
+    def _download(self, request):
+        blob = self._get_blob(request.container, request.name)
+        if blob is None:
+            return self._error(404)
+        if request.headers.get('If-Match') not in (None, blob.etag):
+            return self._error(412)
+        headers = self._blob_headers(blob)
+        detail = request.get_detail()
+        if detail is None:
+            if blob.content_md5:
+                headers['Content-MD5'] = base64.b64encode(blob.content_md5).decode('ascii')
+            return 200, headers, blob.data
+        start, length = detail
+        if start >= len(blob.data):
+            status, error_headers, body = self._error(416)
+            error_headers['Content-Range'] = 'bytes */{}'.format(len(blob.data))
+            return status, error_headers, body
+        end = min(start + length, len(blob.data)) - 1
+        headers['Content-Range'] = 'bytes {}-{}/{}'.format(start, end, len(blob.data))
+        if blob.content_md5:
+            headers['x-ms-blob-content-md5'] = base64.b64encode(blob.content_md5).decode('ascii')
+        return 206, headers, blob.data[start:end + 1]
+
+    def _delete(self, request):
+        if self.containers.get(request.container, {}).pop(request.name, None) is None:
+            return self._error(404)
+        return 202, {'x-ms-delete-type-permanent': 'true'}, b''
+
+    def _set_tier(self, request):
+        blob = self._get_blob(request.container, request.name)
+        if blob is None:
+            return self._error(404)
+        blob.tier = request.headers['x-ms-access-tier']
+        return 200, {}, b''
+
+    def _start_copy(self, request):
+        source = self._get_source(request)
+        if source is None:
+            return self._error(404, 'CannotVerifyCopySource')
+        metadata = {key[len('x-ms-meta-'):]: value for key, value in request.headers.items()
+                    if key.lower().startswith('x-ms-meta-')}
+        blob = self.add_blob(
+            request.container, request.name, source.data, content_type=source.content_type,
+            content_md5=source.content_md5, metadata=metadata or dict(source.metadata))
+        blob.copy = {'id': str(uuid.uuid4()), 'status': 'pending', 'source': request.headers['x-ms-copy-source']}
+        headers = {'ETag': blob.etag, 'Last-Modified': _format_date(blob.last_modified),
+                   'x-ms-copy-id': blob.copy['id'], 'x-ms-copy-status': 'pending'}
+        return 202, headers, b''
+
+    def _list_blobs(self, request):
+        prefix = request.query.get('prefix', '')
+        marker = request.query.get('marker', '')
+        max_results = int(request.query.get('maxresults', 5000))
+        include = request.query.get('include', '').split(',')
+        container = self.containers.get(request.container, {})
+        names = [name for name in sorted(container) if name.startswith(prefix) and name >= marker]
+        body = u'<?xml version="1.0" encoding="utf-8"?>'
+        body += u'<EnumerationResults ServiceEndpoint="{}/" ContainerName="{}">'.format(
+            ACCOUNT_URL, escape(request.container))
+        body += u'<Prefix>{}</Prefix><MaxResults>{}</MaxResults><Blobs>'.format(escape(prefix), max_results)
+        for name in names[:max_results]:
+            blob = container[name]
+            self.listed[request.container] += 1
+            if 'copy' in include:
+                self._poll_copy(name, blob)
+            body += u'<Blob><Name>{}</Name><Properties>'.format(escape(name))
+            body += u'<Last-Modified>{}</Last-Modified><Etag>{}</Etag><Content-Length>{}</Content-Length>'.format(
+                _format_date(blob.last_modified), blob.etag.strip('"'), len(blob.data))
+            body += u'<Content-Type>{}</Content-Type>'.format(escape(blob.content_type))
+            if blob.content_md5:
+                body += u'<Content-MD5>{}</Content-MD5>'.format(base64.b64encode(blob.content_md5).decode('ascii'))
+            body += u'<BlobType>BlockBlob</BlobType><AccessTier>{}</AccessTier>'.format(blob.tier)
+            if blob.copy and 'copy' in include:
+                body += u'<CopyId>{}</CopyId><CopySource>{}</CopySource><CopyStatus>{}</CopyStatus>'.format(
+                    blob.copy['id'], escape(blob.copy['source']), blob.copy['status'])
+                if blob.copy['status'] == 'failed':
+                    body += u'<CopyStatusDescription>Failed</CopyStatusDescription>'
+            body += u'</Properties>'
+            if 'metadata' in include:
+                body += u'<Metadata>{}</Metadata>'.format(''.join(
+                    u'<{0}>{1}</{0}>'.format(key, escape(value)) for key, value in blob.metadata.items()))
+            body += u'</Blob>'
+        next_marker = names[max_results] if len(names) > max_results else ''
+        body += u'</Blobs><NextMarker>{}</NextMarker></EnumerationResults>'.format(escape(next_marker))
+        return 200, {'Content-Type': 'application/xml'}, body.encode('utf-8')
+
+    def _batch(self, request):
+        boundary = re.search(r'boundary=(\S+)', request.headers['Content-Type']).group(1).encode('ascii')
+        response_boundary = 'batchresponse_' + str(uuid.uuid4())
+        parts = []
+        for part in request.body.split(b'--' + boundary)[1:-1]:
+            part_headers, _, payload = part.strip(b'\r\n').partition(b'\r\n\r\n')
+            content_id = re.search(br'Content-ID: (\d+)', part_headers).group(1).decode('ascii')
+            head, _, body = payload.partition(b'\r\n\r\n')
+            lines = head.decode('utf-8').split('\r\n')
+            method, path, _ = lines[0].split(' ')
+            headers = dict(line.split(': ', 1) for line in lines[1:] if line)
+            sub_request = FakeRequest(method, ACCOUNT_URL + path, headers, body.strip(b'\r\n'))
+            self.requests.append((sub_request.operation, sub_request.container, sub_request.get_detail()))
+            status, sub_headers, sub_body = self.respond(sub_request)
+            response_part = 'Content-Type: application/http\r\nContent-ID: {}\r\n\r\nHTTP/1.1 {} {}\r\n'.format(
+                content_id, status, _REASONS.get(status, ''))
+            sub_headers['Content-Length'] = str(len(sub_body))
+            response_part += ''.join('{}: {}\r\n'.format(key, value) for key, value in sub_headers.items())
+            parts.append(response_part.encode('utf-8') + b'\r\n' + sub_body)
+        body = b''.join(b'--' + response_boundary.encode('ascii') + b'\r\n' + part + b'\r\n' for part in parts)
+        body += b'--' + response_boundary.encode('ascii') + b'--'
+        return 202, {'Content-Type': 'multipart/mixed; boundary=' + response_boundary}, body
+
+
+def read_body(data):
+    """The bytes of the body of a request, sent by the clients as bytes, a memoryview, a stream or an iterable."""
+    if data is None:
+        return b''
+    if isinstance(data, (bytes, bytearray, memoryview)):
+        return bytes(data)
+    if hasattr(data, 'read'):
+        return data.read()
+    if hasattr(data, 'encode'):
+        return data.encode('utf-8')
+    return b''.join(data)
+
+
+class FakeStreamDownload(object):
+    def __init__(self, response):
+        self.response = response
+        body = response.body()
+        self._chunks = iter([body[i:i + response.block_size] for i in range(0, len(body), response.block_size)])
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        return next(self._chunks)
+
+    next = __next__  # Python 2 compatibility.
+
+
+class FakeResponse(HttpResponse):
+    def __init__(self, request, status, headers, body, block_size=None):
+        super(FakeResponse, self).__init__(request, None, block_size=block_size)
+        self.status_code = status
+        headers.setdefault('Content-Length', str(len(body)))
+        headers.setdefault('x-ms-request-id', str(uuid.uuid4()))
+        headers.setdefault('x-ms-version', '2019-12-12')
+        headers.setdefault('Date', formatdate(time.time(), usegmt=True))
+        self.headers = CaseInsensitiveDict(headers)
+        self.reason = _REASONS.get(status)
+        self.content_type = self.headers.get('Content-Type')
+        self._body = body
+
+    def body(self):
+        return self._body
+
+    def stream_download(self, pipeline):
+        return FakeStreamDownload(self)
+
+
+class FakeTransport(HttpTransport):
+    """Send the requests to a FakeBlobService. It may be used from several threads."""
+
+    thread_safe = True
+
+    def __init__(self, service):
+        self.service = service
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send(self, request, **kwargs):
+        fake_request = FakeRequest(request.method, request.url, request.headers, read_body(request.data))
+        self.service.start(fake_request)
+        status, headers = None, {}
+        try:
+            time.sleep(self.service.delay)
+            status, headers, body = self.service.respond(fake_request)
+            return FakeResponse(request, status, headers, body, block_size=kwargs.get('connection_data_block_size'))
+        finally:
+            self.service.stop(fake_request, status, headers)
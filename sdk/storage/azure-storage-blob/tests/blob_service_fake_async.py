@@ -0,0 +1,96 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+"""The async transport of the in-memory Blob service of blob_service_fake."""
+
+import asyncio
+
+from azure.core.pipeline.transport import AsyncHttpResponse, AsyncHttpTransport
+from azure.storage.blob.aio import BlobClient, ContainerClient
+
+from blob_service_fake import ACCOUNT_URL, SAS_TOKEN, FakeBlobService, FakeRequest, FakeResponse, read_body
+
+__all__ = ['ACCOUNT_URL', 'SAS_TOKEN', 'AsyncFakeBlobService']
+
+# ------------------------------------------------------------------------------
+
+
+async def read_body_async(data):
+    """The bytes of the body of a request, which may also be an async stream or an async iterable."""
+    if hasattr(data, '__aiter__'):
+        chunks = []
+        async for chunk in data:
+            chunks.append(chunk)
+        return b''.join(chunks)
+    if hasattr(data, 'read') and asyncio.iscoroutinefunction(data.read):
+        return await data.read()
+    return read_body(data)
+
+
+class AsyncFakeStreamDownload(object):
+    def __init__(self, response):
+        self.response = response
+        body = response.body()
+        self._chunks = iter([body[i:i + response.block_size] for i in range(0, len(body), response.block_size)])
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration
+
+
+class AsyncFakeResponse(AsyncHttpResponse, FakeResponse):  # pylint: disable=abstract-method
+    async def load_body(self):
+        pass
+
+    def stream_download(self, pipeline):
+        return AsyncFakeStreamDownload(self)
+
+
+class AsyncFakeBlobService(FakeBlobService):
+    """The in-memory Blob service of blob_service_fake, for the async clients."""
+
+    container_client_class = ContainerClient
+    blob_client_class = BlobClient
+
+    def get_transport(self):
+        return AsyncFakeTransport(self)
+
+
+class AsyncFakeTransport(AsyncHttpTransport):
+    """Send the requests of the async clients to a FakeBlobService."""
+
+    def __init__(self, service):
+        self.service = service
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def open(self):
+        pass
+
+    async def close(self):
+        pass
+
+    async def send(self, request, **kwargs):
+        fake_request = FakeRequest(request.method, request.url, request.headers, await read_body_async(request.data))
+        self.service.start(fake_request)
+        status, headers = None, {}
+        try:
+            await asyncio.sleep(self.service.delay)
+            status, headers, body = self.service.respond(fake_request)
+            return AsyncFakeResponse(
+                request, status, headers, body, block_size=kwargs.get('connection_data_block_size'))
+        finally:
+            self.service.stop(fake_request, status, headers)
@@ -0,0 +1,122 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import io
+import os
+
+import pytest
+
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceModifiedError
+from azure.storage.blob import BlobReader
+
+from blob_service_fake import FakeBlobService
+
+# ------------------------------------------------------------------------------
+
+
+def test_open_read_random_access():
+    data = os.urandom(1000)
+    service = FakeBlobService()
+    blob = service.add_blob('container', 'blob', data)
+    client = service.get_blob_client()
+    with client.open_read(block_size=100, max_read_ahead=0) as reader:
+        assert isinstance(reader, BlobReader)
+        assert reader.size == 1000
+        assert reader.etag == blob.etag
+        assert reader.seekable() and reader.readable()
+
+        assert reader.seek(-10, io.SEEK_END) == 990
+        assert reader.read() == data[990:]
+        assert reader.read() == b''
+        reader.seek(150)
+        assert reader.read(120) == data[150:270]
+        assert reader.tell() == 270
+        reader.seek(-70, io.SEEK_CUR)
+        assert reader.read(10) == data[200:210]
+    # Only the blocks read were downloaded, the adjacent ones in a single request
+    assert service.get_requests('download') == [(900, 100), (100, 200)]
+    assert reader.closed
+    with pytest.raises(ValueError):
+        reader.read()
+
+
+def test_open_read_sequential_read_ahead():
+    data = os.urandom(2000)
+    service = FakeBlobService()
+    blob = service.add_blob('container', 'blob', data)
+    client = service.get_blob_client()
+    reader = client.open_read(block_size=100, max_read_ahead=400)
+    assert reader.read(50) == data[:50]
+    # Small sequential reads are served from the cache, the read-ahead window doubles
+    # each time the reads leave the cached blocks
+    read = data[:50] + b''.join(iter(lambda: reader.read(30), b''))
+    assert read == data
+    assert service.get_requests('download') == [(0, 100), (100, 200), (300, 300), (600, 500), (1100, 500), (1600, 400)]
+
+
+def test_open_read_lru_cache():
+    data = os.urandom(1000)
+    service = FakeBlobService()
+    blob = service.add_blob('container', 'blob', data)
+    client = service.get_blob_client()
+    reader = client.open_read(block_size=100, cache_size=200, max_read_ahead=0)
+    for offset in (0, 500, 0, 800, 0, 500):
+        reader.seek(offset)
+        assert reader.read(10) == data[offset:offset + 10]
+    # Block 0 stays cached as the most recently used, block 5 is evicted by block 8
+    assert service.get_requests('download') == [(0, 100), (500, 100), (800, 100), (500, 100)]
+
+
+def test_open_read_buffered_reader():
+    data = os.urandom(1000)
+    service = FakeBlobService()
+    blob = service.add_blob('container', 'blob', data)
+    client = service.get_blob_client()
+    reader = io.BufferedReader(client.open_read(block_size=256), buffer_size=64)
+    assert reader.read(3) == data[:3]
+    reader.seek(-4, io.SEEK_END)
+    assert reader.read() == data[-4:]
+    reader.seek(0)
+    assert reader.readline() + reader.read() == data
+
+
+def test_open_read_etag_pinning():
+    service = FakeBlobService()
+    blob = service.add_blob('container', 'blob', os.urandom(1000))
+    client = service.get_blob_client()
+    with pytest.raises(ResourceModifiedError):
+        client.open_read(etag='"other"', match_condition=MatchConditions.IfNotModified)
+    reader = client.open_read(block_size=100, max_read_ahead=0, etag=blob.etag,
+                              match_condition=MatchConditions.IfNotModified)
+    reader.read(10)
+    blob.etag = '"modified"'
+    # Cached blocks are still served, but the blob is not mixed with its new version
+    reader.seek(0)
+    reader.read(10)
+    with pytest.raises(ResourceModifiedError):
+        reader.read(100)
+
+
+def test_open_read_empty_blob():
+    service = FakeBlobService()
+    service.add_blob('container', 'blob', b'')
+    client = service.get_blob_client()
+    reader = client.open_read()
+    assert reader.read() == b''
+    assert reader.readinto(bytearray(10)) == 0
+    assert service.get_requests('download') == []
+
+
+def test_open_read_invalid_options():
+    service = FakeBlobService()
+    service.add_blob('container', 'blob', b'data')
+    client = service.get_blob_client()
+    with pytest.raises(ValueError):
+        client.open_read(block_size=0)
+    with pytest.raises(ValueError):
+        client.open_read().seek(-1)
@@ -0,0 +1,77 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import io
+import os
+
+import pytest
+
+from azure.core import MatchConditions
+from azure.core.exceptions import ResourceModifiedError
+from azure.storage.blob.aio import BlobReader
+
+from blob_service_fake_async import AsyncFakeBlobService
+
+# ------------------------------------------------------------------------------
+
+
+@pytest.mark.asyncio
+async def test_open_read_random_access():
+    data = os.urandom(1000)
+    service = AsyncFakeBlobService()
+    service.add_blob('container', 'blob', data)
+    client = service.get_blob_client()
+    async with await client.open_read(block_size=100, max_read_ahead=0) as reader:
+        assert isinstance(reader, BlobReader)
+        assert reader.size == 1000
+
+        assert reader.seek(-10, io.SEEK_END) == 990
+        assert await reader.read() == data[990:]
+        assert await reader.read() == b''
+        reader.seek(150)
+        buffer = bytearray(120)
+        assert await reader.readinto(buffer) == 120
+        assert buffer == data[150:270]
+        reader.seek(-70, io.SEEK_CUR)
+        assert await reader.read(10) == data[200:210]
+    assert service.get_requests('download') == [(900, 100), (100, 200)]
+    assert reader.closed
+    with pytest.raises(ValueError):
+        await reader.read()
+
+
+@pytest.mark.asyncio
+async def test_open_read_sequential_read_ahead():
+    data = os.urandom(2000)
+    service = AsyncFakeBlobService()
+    service.add_blob('container', 'blob', data)
+    client = service.get_blob_client()
+    reader = await client.open_read(block_size=100, max_read_ahead=400)
+    read = b''
+    while True:
+        chunk = await reader.read(30)
+        if not chunk:
+            break
+        read += chunk
+    assert read == data
+    assert service.get_requests('download') == [(0, 100), (100, 200), (300, 300), (600, 500), (1100, 500), (1600, 400)]
+
+
+@pytest.mark.asyncio
+async def test_open_read_etag_pinning():
+    service = AsyncFakeBlobService()
+    blob = service.add_blob('container', 'blob', os.urandom(1000))
+    client = service.get_blob_client()
+    with pytest.raises(ResourceModifiedError):
+        await client.open_read(etag='"other"', match_condition=MatchConditions.IfNotModified)
+    reader = await client.open_read(block_size=100, max_read_ahead=0)
+    await reader.read(10)
+    blob.etag = '"modified"'
+    reader.seek(0)
+    await reader.read(10)
+    with pytest.raises(ResourceModifiedError):
+        await reader.read(100)
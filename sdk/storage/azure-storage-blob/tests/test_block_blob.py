@@ -6,6 +6,7 @@
 # license information.
 # --------------------------------------------------------------------------
 import os
+from io import BytesIO
 import unittest
 import pytest
 import uuid
@@ -78,6 +79,18 @@ class StorageBlockBlobTest(StorageTestCase):
         def read(self, count):
             return self.wrapped_file.read(count)
 
+    class FailingStream(BytesIO):
+        """Fails to read past fail_after, like a connection reset in the middle of an upload."""
+
+        def __init__(self, data, fail_after):
+            super(StorageBlockBlobTest.FailingStream, self).__init__(data)
+            self.fail_after = fail_after
+
+        def read(self, size=-1):
+            if self.tell() >= self.fail_after:
+                raise IOError("Connection reset.")
+            return super(StorageBlockBlobTest.FailingStream, self).read(size)
+
     #--Test cases for block blobs --------------------------------------------
 
     @GlobalStorageAccountPreparer()
@@ -1005,4 +1018,27 @@ class StorageBlockBlobTest(StorageTestCase):
 
         # Assert
 
+    @pytest.mark.live_test_only
+    @GlobalStorageAccountPreparer()
+    def test_upload_blob_with_journal_resumes(self, resource_group, location, storage_account, storage_account_key):
+        # parallel tests introduce random order of requests, can only run live
+
+        self._setup(storage_account, storage_account_key)
+        blob_name = self._get_blob_reference()
+        blob = self.bsc.get_blob_client(self.container_name, blob_name)
+        data = self.get_random_bytes(LARGE_BLOB_SIZE)
+        JOURNAL_PATH = 'upload_blob_journal.temp.{}.json'.format(str(uuid.uuid4()))
+
+        # Act
+        with self.assertRaises(IOError):
+            blob.upload_blob(self.FailingStream(data, 16 * 1024), journal_path=JOURNAL_PATH)
+        _, uncommitted = blob.get_block_list('uncommitted')
+        blob.upload_blob(BytesIO(data), journal_path=JOURNAL_PATH)
+
+        # Assert
+        self.assertEqual(len(uncommitted), 4)
+        self.assertBlobEqual(self.container_name, blob_name, data)
+        self.assertFalse(os.path.exists(JOURNAL_PATH))
+        self._teardown(JOURNAL_PATH)
+
 #------------------------------------------------------------------------------
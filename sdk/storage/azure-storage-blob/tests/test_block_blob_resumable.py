@@ -0,0 +1,122 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import os
+from io import BytesIO
+
+import pytest
+
+from azure.core.exceptions import HttpResponseError
+from azure.storage.blob import BlobType
+
+from blob_service_fake import FakeBlobService
+
+# ------------------------------------------------------------------------------
+
+
+_BLOCK_SIZES = dict(max_single_put_size=1024, max_block_size=1024)
+
+
+def get_staged(service):
+    """The IDs of the blocks staged since the last call."""
+    staged = [block_id for _, block_id in service.get_requests('stage_block')]
+    service.clear_requests()
+    return staged
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+def test_upload_blob_resume(tmpdir, max_concurrency):
+    service = FakeBlobService()
+    client = service.get_blob_client(**_BLOCK_SIZES)
+    journal_path = str(tmpdir.join('journal'))
+    data = os.urandom(10 * 1024 + 10)
+
+    service.add_error('stage_block', skip=5)
+    with pytest.raises(HttpResponseError):
+        client.upload_blob(BytesIO(data), journal_path=journal_path, max_concurrency=max_concurrency)
+    assert 'blob' not in service.get_container('container')
+    assert os.path.exists(journal_path)
+
+    staged = set(service.uncommitted[('container', 'blob')])
+    get_staged(service)
+    client.upload_blob(BytesIO(data), journal_path=journal_path, max_concurrency=max_concurrency)
+
+    assert service.containers['container']['blob'].data == data
+    # Only the blocks missing from the first attempt were uploaded
+    restaged = get_staged(service)
+    assert len(staged) >= 5
+    assert not staged & set(restaged)
+    assert len(staged | set(restaged)) == 11
+    assert not os.path.exists(journal_path)
+
+
+def test_upload_blob_resume_changed_data(tmpdir):
+    service = FakeBlobService()
+    client = service.get_blob_client(**_BLOCK_SIZES)
+    journal_path = str(tmpdir.join('journal'))
+    data = bytearray(os.urandom(4 * 1024))
+
+    service.add_error('stage_block', skip=3)
+    with pytest.raises(HttpResponseError):
+        client.upload_blob(BytesIO(data), journal_path=journal_path)
+    data[1024] ^= 1
+    get_staged(service)
+    client.upload_blob(BytesIO(data), journal_path=journal_path)
+
+    assert service.containers['container']['blob'].data == data
+    # The block which changed since the first attempt is staged again
+    assert len(get_staged(service)) == 2
+
+
+def test_upload_blob_resume_from_file(tmpdir):
+    service = FakeBlobService()
+    client = service.get_blob_client(**_BLOCK_SIZES)
+    journal_path = str(tmpdir.join('journal'))
+    file_path = str(tmpdir.join('data'))
+    data = os.urandom(5 * 1024)
+    with open(file_path, 'wb') as stream:
+        stream.write(data)
+
+    service.add_error('stage_block', skip=2)
+    with open(file_path, 'rb') as stream:
+        with pytest.raises(HttpResponseError):
+            client.upload_blob(stream, journal_path=journal_path)
+    # A crash may have cut the last line of the journal
+    with open(journal_path, 'a') as journal:
+        journal.write('{"index": 4, "md')
+    get_staged(service)
+    with open(file_path, 'rb') as stream:
+        client.upload_blob(stream, journal_path=journal_path)
+
+    assert service.containers['container']['blob'].data == data
+    assert len(get_staged(service)) == 3
+
+
+def test_upload_blob_resume_other_upload(tmpdir):
+    service = FakeBlobService()
+    client = service.get_blob_client(**_BLOCK_SIZES)
+    journal_path = str(tmpdir.join('journal'))
+
+    service.add_error('stage_block', skip=2)
+    with pytest.raises(HttpResponseError):
+        client.upload_blob(BytesIO(os.urandom(5 * 1024)), journal_path=journal_path)
+    # The journal of an upload of another length is not used
+    data = os.urandom(6 * 1024)
+    get_staged(service)
+    client.upload_blob(BytesIO(data), journal_path=journal_path)
+
+    assert service.containers['container']['blob'].data == data
+    assert len(get_staged(service)) == 6
+
+
+def test_upload_blob_resume_unsupported(tmpdir):
+    client = FakeBlobService().get_blob_client(**_BLOCK_SIZES)
+    journal_path = str(tmpdir.join('journal'))
+    with pytest.raises(ValueError):
+        client.upload_blob(BytesIO(b'data'), blob_type=BlobType.AppendBlob, journal_path=journal_path)
+    with pytest.raises(ValueError):
+        client.upload_blob(iter([b'data']), journal_path=journal_path)
@@ -0,0 +1,46 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import os
+from io import BytesIO
+
+import pytest
+
+from azure.core.exceptions import HttpResponseError
+
+from blob_service_fake_async import AsyncFakeBlobService
+
+# ------------------------------------------------------------------------------
+
+
+_BLOCK_SIZES = dict(max_single_put_size=1024, max_block_size=1024)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+async def test_upload_blob_resume(tmpdir, max_concurrency):
+    service = AsyncFakeBlobService()
+    client = service.get_blob_client(**_BLOCK_SIZES)
+    journal_path = str(tmpdir.join('journal'))
+    data = os.urandom(10 * 1024 + 10)
+
+    service.add_error('stage_block', skip=5)
+    with pytest.raises(HttpResponseError):
+        await client.upload_blob(BytesIO(data), journal_path=journal_path, max_concurrency=max_concurrency)
+    assert 'blob' not in service.get_container('container')
+    assert os.path.exists(journal_path)
+
+    staged = set(service.uncommitted[('container', 'blob')])
+    service.clear_requests()
+    await client.upload_blob(BytesIO(data), journal_path=journal_path, max_concurrency=max_concurrency)
+
+    assert service.containers['container']['blob'].data == data
+    # Only the blocks missing from the first attempt were uploaded
+    restaged = [block_id for _, block_id in service.get_requests('stage_block')]
+    assert not staged & set(restaged)
+    assert len(staged | set(restaged)) == 11
+    assert not os.path.exists(journal_path)
@@ -5,6 +5,10 @@
 # Licensed under the MIT License. See License.txt in the project root for
 # license information.
 # --------------------------------------------------------------------------
+import os
+import shutil
+import tempfile
+
 import pytest
 import unittest
 import asyncio
@@ -1548,4 +1552,133 @@ class StorageContainerTestAsync(AsyncStorageTestCase):
         downloaded = await container.download_blob(blob_name)
         raw = await downloaded.readall()
         assert raw == data
+
+    @pytest.mark.live_test_only
+    @GlobalStorageAccountPreparer()
+    @AsyncStorageTestCase.await_prepared_test
+    async def test_delete_blobs_in_batches(self, resource_group, location, storage_account, storage_account_key):
+        # parallel tests introduce random order of requests, can only run live
+        bsc = BlobServiceClient(self.account_url(storage_account, "blob"), storage_account_key, transport=AiohttpTestTransport())
+        container = await self._create_container(bsc)
+        for blob_name in ('blob1', 'blob2', 'blob3'):
+            await container.get_blob_client(blob_name).upload_blob(b'hello world')
+
+        # Act
+        results = await self._to_list(container.delete_blobs_in_batches(
+            ['blob1', 'blob2', 'blob3', 'missing'], batch_size=2, max_concurrency=2))
+
+        # Assert
+        statuses = {blob_name: response.status_code for blob_name, response in results}
+        self.assertEqual(statuses, {'blob1': 202, 'blob2': 202, 'blob3': 202, 'missing': 404})
+        self.assertEqual(await self._to_list(container.list_blobs()), [])
+
+    @pytest.mark.live_test_only
+    @GlobalStorageAccountPreparer()
+    @AsyncStorageTestCase.await_prepared_test
+    async def test_set_standard_blob_tier_blobs_in_batches(self, resource_group, location, storage_account, storage_account_key):
+        # parallel tests introduce random order of requests, can only run live
+        bsc = BlobServiceClient(self.account_url(storage_account, "blob"), storage_account_key, transport=AiohttpTestTransport())
+        container = await self._create_container(bsc)
+        for blob_name in ('blob1', 'blob2', 'blob3'):
+            await container.get_blob_client(blob_name).upload_blob(b'hello world')
+
+        # Act
+        results = await self._to_list(container.set_standard_blob_tier_blobs_in_batches(
+            StandardBlobTier.Cool, ['blob1', 'blob2', 'blob3'], batch_size=2, max_concurrency=2))
+
+        # Assert
+        self.assertEqual(sorted(response.status_code for _, response in results), [200, 200, 200])
+        for blob in await self._to_list(container.list_blobs()):
+            self.assertEqual(blob.blob_tier, StandardBlobTier.Cool)
+
+    @pytest.mark.live_test_only
+    @GlobalStorageAccountPreparer()
+    @AsyncStorageTestCase.await_prepared_test
+    async def test_upload_directory(self, resource_group, location, storage_account, storage_account_key):
+        # parallel tests introduce random order of requests, can only run live
+        bsc = BlobServiceClient(self.account_url(storage_account, "blob"), storage_account_key, transport=AiohttpTestTransport())
+        container = await self._create_container(bsc)
+        source = tempfile.mkdtemp()
+        try:
+            os.makedirs(os.path.join(source, 'sub'))
+            with open(os.path.join(source, 'a.txt'), 'wb') as stream:
+                stream.write(b'hello world')
+            with open(os.path.join(source, 'sub', 'b.txt'), 'wb') as stream:
+                stream.write(b'hello sub world')
+
+            # Act
+            summary = await container.upload_directory(source, name_starts_with='backup/', max_concurrency=2)
+            unchanged = await container.upload_directory(source, name_starts_with='backup/')
+        finally:
+            shutil.rmtree(source)
+
+        # Assert
+        self.assertEqual(summary.failures, {})
+        self.assertEqual(summary.files_transferred, 2)
+        self.assertEqual(unchanged.files_skipped, 2)
+        blobs = await self._to_list(container.list_blobs())
+        self.assertEqual([blob.name for blob in blobs], ['backup/a.txt', 'backup/sub/b.txt'])
+        downloaded = await container.download_blob('backup/sub/b.txt')
+        self.assertEqual(await downloaded.readall(), b'hello sub world')
+
+    @pytest.mark.live_test_only
+    @GlobalStorageAccountPreparer()
+    @AsyncStorageTestCase.await_prepared_test
+    async def test_download_directory(self, resource_group, location, storage_account, storage_account_key):
+        # parallel tests introduce random order of requests, can only run live
+        bsc = BlobServiceClient(self.account_url(storage_account, "blob"), storage_account_key, transport=AiohttpTestTransport())
+        container = await self._create_container(bsc)
+        await container.upload_blob('backup/a.txt', b'hello world')
+        await container.upload_blob('backup/sub/b.txt', b'hello sub world')
+        await container.upload_blob('other/c.txt', b'hello other world')
+        destination = tempfile.mkdtemp()
+        try:
+            # Act
+            summary = await container.download_directory(destination, name_starts_with='backup/', max_concurrency=2)
+
+            # Assert
+            self.assertEqual(summary.failures, {})
+            self.assertEqual(summary.files_transferred, 2)
+            with open(os.path.join(destination, 'sub', 'b.txt'), 'rb') as stream:
+                self.assertEqual(stream.read(), b'hello sub world')
+            self.assertEqual(sorted(os.listdir(destination)), ['a.txt', 'sub'])
+        finally:
+            shutil.rmtree(destination)
+
+    @pytest.mark.live_test_only
+    @GlobalStorageAccountPreparer()
+    @AsyncStorageTestCase.await_prepared_test
+    async def test_copy_blobs(self, resource_group, location, storage_account, storage_account_key):
+        # SAS URL is calculated from storage key, so this test runs live only
+        bsc = BlobServiceClient(self.account_url(storage_account, "blob"), storage_account_key, transport=AiohttpTestTransport())
+        container = await self._create_container(bsc)
+        source = await self._create_container(bsc, prefix='source')
+        small_data = self.get_random_bytes(100)
+        large_data = self.get_random_bytes(4 * 1024)
+        await source.upload_blob('small', small_data, metadata={'name': 'small'})
+        await source.upload_blob('large', large_data, metadata={'name': 'large'})
+        token = generate_container_sas(
+            source.account_name,
+            source.container_name,
+            account_key=source.credential.account_key,
+            expiry=datetime.utcnow() + timedelta(hours=1),
+            permission=ContainerSasPermissions(read=True, list=True),
+        )
+        source_with_sas = ContainerClient.from_container_url(
+            source.url, credential=token, transport=AiohttpTestTransport())
+
+        # Act
+        summary = await container.copy_blobs(
+            source_with_sas, block_copy_threshold=1024, block_size=1024, max_concurrency=2, poll_interval=1)
+
+        # Assert
+        self.assertEqual(summary.failures, {})
+        self.assertEqual(summary.files_transferred, 2)
+        small = await container.download_blob('small')
+        self.assertEqual(await small.readall(), small_data)
+        large = await container.download_blob('large')
+        self.assertEqual(await large.readall(), large_data)
+        props = await container.get_blob_client('large').get_blob_properties()
+        self.assertEqual(props.metadata, {'name': 'large'})
+
 #------------------------------------------------------------------------------
@@ -0,0 +1,80 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import sys
+
+import pytest
+
+from azure.storage.blob import StandardBlobTier
+
+from blob_service_fake import FakeBlobService
+
+# ------------------------------------------------------------------------------
+
+def _add_blobs(service, names):
+    for name in names:
+        service.add_blob('container', name, b'data')
+
+
+@pytest.mark.skipif(sys.version_info < (3, 0), reason="Batch not supported on Python 2.7")
+def test_delete_blobs_in_batches_chunks_lazily():
+    service = FakeBlobService(delay=0.05)
+    _add_blobs(service, ['blob{}'.format(i) for i in range(600)])
+    container = service.get_container_client()
+    names = ('blob{}'.format(i) for i in range(600))
+
+    results = list(container.delete_blobs_in_batches(names, max_concurrency=2))
+
+    assert sorted(service.get_requests('batch')) == [88, 256, 256]
+    assert service.max_running == 2
+    assert sorted(name for name, _ in results) == sorted('blob{}'.format(i) for i in range(600))
+    assert all(response.status_code == 202 for _, response in results)
+    assert all(response.request.method == 'DELETE' for _, response in results)
+    assert service.containers['container'] == {}
+
+
+@pytest.mark.skipif(sys.version_info < (3, 0), reason="Batch not supported on Python 2.7")
+def test_delete_blobs_in_batches_retries_failed_sub_requests():
+    service = FakeBlobService()
+    _add_blobs(service, ['a', 'b', 'd'])
+    container = service.get_container_client()
+    service.add_error('delete', 503, name='b')
+    service.add_error('delete', 500, name='b')
+    service.add_error('delete', 503, name='d', count=None)
+
+    results = dict(container.delete_blobs_in_batches(
+        ['a', 'b', 'c', 'd'], max_retries=2, retry_backoff=0, max_concurrency=1))
+
+    assert service.get_requests('batch') == [4, 2, 2]
+    assert service.get_requests('delete') == ['a', 'b', 'c', 'd', 'b', 'd', 'b', 'd']
+    assert {name: response.status_code for name, response in results.items()} == {
+        'a': 202, 'b': 202, 'c': 404, 'd': 503}
+    assert list(service.containers['container']) == ['d']
+
+
+@pytest.mark.skipif(sys.version_info < (3, 0), reason="Batch not supported on Python 2.7")
+def test_set_standard_blob_tier_blobs_in_batches():
+    service = FakeBlobService()
+    _add_blobs(service, ['a', 'b'])
+    container = service.get_container_client()
+    blobs = [{'name': 'a', 'blob_tier': StandardBlobTier.Cool}, {'name': 'b', 'blob_tier': StandardBlobTier.Archive}]
+
+    results = list(container.set_standard_blob_tier_blobs_in_batches(None, blobs, batch_size=1))
+
+    assert service.get_requests('batch') == [1, 1]
+    tiers = {blob['name']: response.request.headers['x-ms-access-tier'] for blob, response in results}
+    assert tiers == {'a': 'Cool', 'b': 'Archive'}
+    assert {name: blob.tier for name, blob in service.containers['container'].items()} == {
+        'a': 'Cool', 'b': 'Archive'}
+
+
+def test_blobs_in_batches_options():
+    container = FakeBlobService().get_container_client()
+    with pytest.raises(ValueError):
+        container.delete_blobs_in_batches(['a'], batch_size=257)
+    with pytest.raises(ValueError):
+        container.delete_blobs_in_batches(['a'], max_concurrency=0)
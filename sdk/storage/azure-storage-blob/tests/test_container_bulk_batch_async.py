@@ -0,0 +1,86 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import pytest
+
+from azure.storage.blob import StandardBlobTier
+
+from blob_service_fake_async import AsyncFakeBlobService
+
+# ------------------------------------------------------------------------------
+
+
+def _add_blobs(service, names):
+    for name in names:
+        service.add_blob('container', name, b'data')
+
+
+@pytest.mark.asyncio
+async def test_delete_blobs_in_batches_chunks_lazily():
+    service = AsyncFakeBlobService(delay=0.01)
+    _add_blobs(service, ['blob{}'.format(i) for i in range(600)])
+    container = service.get_container_client()
+    names = ('blob{}'.format(i) for i in range(600))
+
+    results = []
+    async for result in container.delete_blobs_in_batches(names, max_concurrency=2):
+        results.append(result)
+
+    assert sorted(service.get_requests('batch')) == [88, 256, 256]
+    assert service.max_running == 2
+    assert sorted(name for name, _ in results) == sorted('blob{}'.format(i) for i in range(600))
+    assert all(response.status_code == 202 for _, response in results)
+    assert service.containers['container'] == {}
+
+
+@pytest.mark.asyncio
+async def test_delete_blobs_in_batches_retries_failed_sub_requests():
+    service = AsyncFakeBlobService()
+    _add_blobs(service, ['a', 'b', 'd'])
+    container = service.get_container_client()
+    service.add_error('delete', 503, name='b')
+    service.add_error('delete', 500, name='b')
+    service.add_error('delete', 503, name='d', count=None)
+
+    results = {}
+    async for name, response in container.delete_blobs_in_batches(
+            ['a', 'b', 'c', 'd'], max_retries=2, retry_backoff=0, max_concurrency=1):
+        results[name] = response.status_code
+
+    assert service.get_requests('batch') == [4, 2, 2]
+    assert service.get_requests('delete') == ['a', 'b', 'c', 'd', 'b', 'd', 'b', 'd']
+    assert results == {'a': 202, 'b': 202, 'c': 404, 'd': 503}
+
+
+@pytest.mark.asyncio
+async def test_set_standard_blob_tier_blobs_in_batches():
+    service = AsyncFakeBlobService()
+    _add_blobs(service, ['a', 'b'])
+    container = service.get_container_client()
+    blobs = [{'name': 'a', 'blob_tier': StandardBlobTier.Cool}, {'name': 'b', 'blob_tier': StandardBlobTier.Archive}]
+
+    tiers = {}
+    async for blob, response in container.set_standard_blob_tier_blobs_in_batches(None, blobs, batch_size=1):
+        tiers[blob['name']] = response.request.headers['x-ms-access-tier']
+
+    assert service.get_requests('batch') == [1, 1]
+    assert tiers == {'a': 'Cool', 'b': 'Archive'}
+
+
+@pytest.mark.asyncio
+async def test_delete_blobs_in_batches_from_listing():
+    service = AsyncFakeBlobService()
+    _add_blobs(service, ['blob{}'.format(i) for i in range(5)])
+    container = service.get_container_client()
+
+    results = []
+    async for blob, response in container.delete_blobs_in_batches(container.list_blobs(), batch_size=2):
+        results.append((blob.name, response.status_code))
+
+    assert sorted(service.get_requests('batch')) == [1, 2, 2]
+    assert sorted(results) == [('blob{}'.format(i), 202) for i in range(5)]
+    assert service.containers['container'] == {}
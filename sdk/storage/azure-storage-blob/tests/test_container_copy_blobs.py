@@ -0,0 +1,159 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import base64
+import os
+
+import pytest
+
+from azure.core.exceptions import ResourceNotFoundError
+
+from blob_service_fake import FakeBlobService
+
+# ------------------------------------------------------------------------------
+
+
+def _get_containers(service, sizes):
+    """The destination and source containers, with a source blob of each size."""
+    for name, size in sorted(sizes.items()):
+        service.add_blob('source', name, os.urandom(size), content_type='text/plain', metadata={'source': name})
+    return service.get_container_client('container'), service.get_container_client('source')
+
+
+def test_copy_blobs():
+    service = FakeBlobService(delay=0.01)
+    container, source = _get_containers(service, {'a': 10, 'b': 100, 'c': 5})
+    summaries = []
+
+    summary = container.copy_blobs(
+        source, destination_name=lambda blob: 'copies/' + blob.name, max_concurrency=3, block_copy_threshold=50,
+        block_size=30, poll_interval=0.01, progress_hook=lambda s: summaries.append(s.files_transferred))
+
+    assert summary.failures == {}
+    assert summary.files_transferred == 3
+    assert summary.bytes_transferred == 115
+    assert sorted(summaries) == [1, 2, 3]
+    assert sorted(service.get_requests('start_copy')) == ['copies/a', 'copies/c']
+    blobs = service.containers['container']
+    assert all(blobs[name].copy['status'] == 'success' for name in ('copies/a', 'copies/c'))
+    assert blobs['copies/a'].copy['source'] == source.get_blob_client('a').url
+    # The large blob is copied by blocks, committed in order with the properties of the source
+    assert [len(data) for _, data in blobs['copies/b'].blocks] == [30, 30, 30, 10]
+    assert blobs['copies/b'].data == service.containers['source']['b'].data
+    assert blobs['copies/b'].content_type == 'text/plain'
+    assert blobs['copies/b'].metadata == {'source': 'b'}
+    # The pending copies and the staged blocks share the budget
+    assert service.max_running <= 3
+    assert service.running == 0
+
+
+def test_copy_blobs_without_source_sas():
+    service = FakeBlobService()
+    service.add_blob('source', 'a', os.urandom(100))
+    container = service.get_container_client()
+    # Put Block From URL can't read a source authorized with a shared key, even in the same account
+    source = service.get_container_client(
+        'source', credential={'account_name': 'account', 'account_key': base64.b64encode(b'key').decode()})
+
+    summary = container.copy_blobs(source, block_copy_threshold=50, block_size=30, poll_interval=0.01)
+
+    assert summary.failures == {}
+    assert summary.files_transferred == 1
+    assert service.get_requests('stage_block_from_url') == []
+    assert service.get_requests('start_copy') == ['a']
+    assert service.containers['container']['a'].data == service.containers['source']['a'].data
+
+
+def test_copy_blobs_by_name():
+    service = FakeBlobService()
+    container, source = _get_containers(service, {'a': 10, 'b': 20})
+
+    summary = container.copy_blobs(source, ['b', 'missing'], poll_interval=0.01)
+
+    assert summary.files_transferred == 1
+    assert summary.bytes_transferred == 20
+    assert list(service.containers['container']) == ['b']
+    assert isinstance(summary.failures['missing'], ResourceNotFoundError)
+
+
+def test_copy_blobs_retries():
+    service = FakeBlobService()
+    container, source = _get_containers(service, {'a': 10, 'b': 10, 'c': 10, 'd': 100})
+    service.add_error('start_copy', 503, name='a')
+    service.add_error('start_copy', 500, name='a')
+    service.add_error('start_copy', 403, name='b')
+    service.add_error('stage_block_from_url', 503, name='d', skip=1)
+    service.failed_copies.add('c')
+
+    summary = container.copy_blobs(
+        source, max_concurrency=2, block_copy_threshold=50, block_size=50, retry_backoff=0.01, poll_interval=0.01)
+
+    assert summary.files_transferred == 3
+    assert list(summary.failures) == ['b']
+    assert summary.failures['b'].status_code == 403
+    # The failed copy was started again
+    assert service.get_requests('start_copy').count('c') == 2
+    assert service.containers['container']['c'].copy['status'] == 'success'
+    assert len(service.containers['container']['d'].blocks) == 2
+
+
+def test_copy_blobs_max_retries():
+    service = FakeBlobService()
+    container, source = _get_containers(service, {'a': 10})
+    service.add_error('start_copy', 503, name='a', count=3)
+
+    summary = container.copy_blobs(source, max_retries=2, retry_backoff=0.01)
+
+    assert summary.files_transferred == 0
+    assert summary.failures['a'].status_code == 503
+
+
+def test_copy_blobs_polls_together():
+    service = FakeBlobService()
+    container, source = _get_containers(service, {'logs/{:02d}'.format(index): 1 for index in range(40)})
+
+    summary = container.copy_blobs(source, max_concurrency=40, poll_interval=0.05)
+
+    assert summary.files_transferred == 40
+    # Many pending copies are polled with a listing of their common prefix, instead of one request each
+    listings = service.get_requests('list_blobs', 'container')
+    assert 'logs/' in listings
+    assert len(listings + service.get_requests('get_properties', 'container')) < 40
+
+
+def test_copy_blobs_polls_with_bounded_listings():
+    sizes = {'blob-{:02d}'.format(index): 1 for index in range(20)}
+    sizes.update({'logs/b{:02d}'.format(index): 1 for index in range(20)})
+    sizes.update({name: 1 for name in ('docs/a', 'docs/b', 'docs/c')})
+    service = FakeBlobService()
+    container, source = _get_containers(service, sizes)
+    # Other blobs listed before the copies under their prefix
+    for index in range(300):
+        service.add_blob('container', 'logs/b-{:03d}'.format(index))
+
+    summary = container.copy_blobs(source, max_concurrency=43, poll_interval=0.5)
+
+    assert summary.files_transferred == 43
+    listings = service.get_requests('list_blobs', 'container')
+    polls = service.get_requests('get_properties', 'container')
+    # The blobs are listed under the common prefix of their directory, never the whole container
+    assert 'blob-' in listings
+    assert 'logs/b' in listings
+    assert None not in listings
+    # A few copies in a directory are polled one by one
+    assert 'docs/a' in polls
+    # The listing stops after 10 blobs per copy, the copies not listed are polled one by one
+    assert 'logs/b00' in polls
+    assert service.listed['container'] < 300
+
+
+def test_copy_blobs_invalid_options():
+    container, source = _get_containers(FakeBlobService(), {})
+    with pytest.raises(ValueError):
+        container.copy_blobs(source, max_concurrency=0)
+    with pytest.raises(ValueError):
+        container.copy_blobs(source, block_size=0)
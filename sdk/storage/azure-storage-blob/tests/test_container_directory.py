@@ -0,0 +1,129 @@
+# coding: utf-8
+
+# -------------------------------------------------------------------------
+# Copyright (c) Microsoft Corporation. All rights reserved.
+# Licensed under the MIT License. See License.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+import calendar
+import datetime
+import hashlib
+import os
+
+import pytest
+
+try:
+    from unittest import mock
+except ImportError:
+    import mock
+
+from azure.storage.blob._directory_helpers import get_file_md5
+
+from blob_service_fake import FakeBlobService
+
+# ------------------------------------------------------------------------------
+
+
+_TRANSFER_SIZES = dict(max_single_put_size=10, max_block_size=4, max_single_get_size=10, max_chunk_get_size=4)
+
+
+def _write(path, data):
+    if not os.path.isdir(os.path.dirname(path)):
+        os.makedirs(os.path.dirname(path))
+    with open(path, 'wb') as stream:
+        stream.write(data)
+
+
+def test_upload_directory(tmpdir):
+    source = str(tmpdir.mkdir('source'))
+    _write(os.path.join(source, 'a.txt'), b'a')
+    _write(os.path.join(source, 'sub', 'b.txt'), b'b' * 20)
+    _write(os.path.join(source, 'sub', 'deeper', 'c.txt'), b'c' * 5)
+    service = FakeBlobService(delay=0.01)
+    container = service.get_container_client(**_TRANSFER_SIZES)
+    summaries = []
+
+    summary = container.upload_directory(
+        source, name_starts_with='backup/', max_concurrency=3, progress_hook=lambda s: summaries.append(s.files_transferred))
+
+    blobs = service.containers['container']
+    assert sorted(blobs) == ['backup/a.txt', 'backup/sub/b.txt', 'backup/sub/deeper/c.txt']
+    assert blobs['backup/sub/b.txt'].data == b'b' * 20
+    assert summary.files_transferred == 3
+    assert summary.bytes_transferred == 26
+    assert summary.failures == {}
+    assert sorted(summaries) == [1, 2, 3]
+    assert summary.throughput > 0
+    # The large file may use several connections, but they are taken from the budget
+    assert service.max_running <= 3
+    # Only the large file is uploaded in blocks
+    assert sorted(service.get_requests('upload')) == ['backup/a.txt', 'backup/sub/deeper/c.txt']
+    assert [name for name, _ in service.get_requests('stage_block')] == ['backup/sub/b.txt'] * 5
+
+    # Nothing changed
+    summary = container.upload_directory(source, name_starts_with='backup/')
+    assert summary.files_skipped == 3
+    assert summary.files_transferred == 0
+    assert len(service.get_requests('commit_block_list') + service.get_requests('upload')) == 3
+
+    # The size changed
+    _write(os.path.join(source, 'a.txt'), b'aa')
+    summary = container.upload_directory(source, name_starts_with='backup/', skip_unchanged='size')
+    assert (summary.files_transferred, summary.files_skipped) == (1, 2)
+    assert blobs['backup/a.txt'].data == b'aa'
+
+    summary = container.upload_directory(source, name_starts_with='backup/', skip_unchanged=None)
+    assert (summary.files_transferred, summary.files_skipped) == (3, 0)
+
+
+def test_upload_directory_md5(tmpdir):
+    source = str(tmpdir.mkdir('source'))
+    _write(os.path.join(source, 'a.txt'), b'a')
+    service = FakeBlobService()
+    container = service.get_container_client(**_TRANSFER_SIZES)
+
+    container.upload_directory(source, skip_unchanged='md5')
+    assert service.containers['container']['a.txt'].content_md5 == hashlib.md5(b'a').digest()
+    assert container.upload_directory(source, skip_unchanged='md5').files_skipped == 1
+
+    _write(os.path.join(source, 'a.txt'), b'b')
+    with mock.patch('azure.storage.blob._directory_helpers.get_file_md5', wraps=get_file_md5) as file_md5:
+        assert container.upload_directory(source, skip_unchanged='md5').files_transferred == 1
+    # The file is read once, to compare it and to store its MD5
+    assert file_md5.call_count == 1
+
+
+def test_download_directory(tmpdir):
+    last_modified = datetime.datetime(2020, 7, 1)
+    service = FakeBlobService()
+    service.add_blob('container', 'backup/a.txt', b'a', last_modified=last_modified)
+    service.add_blob('container', 'backup/sub/', b'', last_modified=last_modified)
+    service.add_blob('container', 'backup/sub/b.txt', b'b' * 20, last_modified=last_modified)
+    service.add_blob('container', 'backup/../escape.txt', b'x', last_modified=last_modified)
+    service.add_blob('container', 'other/c.txt', b'c', last_modified=last_modified)
+    container = service.get_container_client(**_TRANSFER_SIZES)
+    destination = str(tmpdir.join('destination'))
+
+    summary = container.download_directory(destination, name_starts_with='backup/', max_concurrency=2)
+
+    assert summary.files_transferred == 2
+    assert summary.bytes_transferred == 21
+    assert list(summary.failures) == ['backup/../escape.txt']
+    with open(os.path.join(destination, 'sub', 'b.txt'), 'rb') as stream:
+        assert stream.read() == b'b' * 20
+    assert not os.path.exists(str(tmpdir.join('escape.txt')))
+    assert os.path.getmtime(os.path.join(destination, 'a.txt')) == calendar.timegm(last_modified.utctimetuple())
+    # The large blob is downloaded in chunks
+    assert sorted(service.get_requests('download')) == [(0, 10), (0, 10), (10, 4), (14, 4), (18, 2)]
+
+    # The modification times are those of the blobs: nothing to download again
+    summary = container.download_directory(destination, name_starts_with='backup/')
+    assert (summary.files_transferred, summary.files_skipped) == (0, 2)
+
+
+def test_directory_options(tmpdir):
+    container = FakeBlobService().get_container_client(**_TRANSFER_SIZES)
+    with pytest.raises(ValueError):
+        container.upload_directory(str(tmpdir), skip_unchanged='etag')
+    with pytest.raises(ValueError):
+        container.download_directory(str(tmpdir), max_concurrency=0)
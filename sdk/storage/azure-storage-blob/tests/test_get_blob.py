@@ -7,6 +7,9 @@
 # --------------------------------------------------------------------------
 import pytest
 import base64
+import io
+import threading
+import time
 import unittest
 import uuid
 from os import path, remove, sys, urandom
@@ -20,6 +23,7 @@ from azure.storage.blob import (
     StorageErrorCode,
     BlobProperties
 )
+from azure.storage.blob._download import _ChunkDownloader, _ChunkIterator, _FileWriter, _download_in_parallel
 from _shared.testcase import StorageTestCase, GlobalStorageAccountPreparer
 
 # ------------------------------------------------------------------------------
@@ -927,5 +931,166 @@ class StorageGetBlobTest(StorageTestCase):
         self.assertIsNotNone(content.properties.content_settings.content_type)
         self.assertIsNone(content.properties.content_settings.content_md5)
 
+    @pytest.mark.live_test_only
+    @GlobalStorageAccountPreparer()
+    def test_download_blob_to_path(self, resource_group, location, storage_account, storage_account_key):
+        # parallel tests introduce random order of requests, can only run live
+
+        self._setup(storage_account, storage_account_key)
+        blob = self.bsc.get_blob_client(self.container_name, self.byte_blob)
+        FILE_PATH = 'download_blob_to_path.temp.{}.dat'.format(str(uuid.uuid4()))
+
+        # Act
+        props = blob.download_blob_to_path(FILE_PATH, max_concurrency=2)
+
+        # Assert
+        self.assertEqual(props.size, len(self.byte_data))
+        with open(FILE_PATH, 'rb') as stream:
+            actual = stream.read()
+            self.assertEqual(self.byte_data, actual)
+        self._teardown(FILE_PATH)
+
+    @pytest.mark.live_test_only
+    @GlobalStorageAccountPreparer()
+    def test_open_read(self, resource_group, location, storage_account, storage_account_key):
+        # parallel tests introduce random order of requests, can only run live
+
+        self._setup(storage_account, storage_account_key)
+        blob = self.bsc.get_blob_client(self.container_name, self.byte_blob)
+
+        # Act
+        with blob.open_read(block_size=1024) as reader:
+            reader.seek(-5, io.SEEK_END)
+            end = reader.read()
+            reader.seek(1000)
+            middle = reader.read(100)
+            reader.seek(0)
+            content = reader.read()
+
+        # Assert
+        self.assertEqual(reader.size, len(self.byte_data))
+        self.assertEqual(end, self.byte_data[-5:])
+        self.assertEqual(middle, self.byte_data[1000:1100])
+        self.assertEqual(content, self.byte_data)
+
 
 # ------------------------------------------------------------------------------
+
+
+class _FakeChunkDownloader(object):
+    """Serves the chunks of a _ChunkIterator slowly, recording how many are downloaded at the same time."""
+
+    def __init__(self, chunk_count):
+        self.chunk_count = chunk_count
+        self.running = 0
+        self.max_running = 0
+        self.lock = threading.Lock()
+
+    def get_chunk_offsets(self):
+        return iter(range(1, self.chunk_count + 1))
+
+    def yield_chunk(self, chunk_start):
+        with self.lock:
+            self.running += 1
+            self.max_running = max(self.max_running, self.running)
+        # later chunks are faster, they still have to be yielded in order
+        time.sleep(0.01 * (self.chunk_count - chunk_start))
+        with self.lock:
+            self.running -= 1
+        return str(chunk_start).encode()
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+def test_chunks_read_ahead(max_concurrency):
+    downloader = _FakeChunkDownloader(chunk_count=8)
+    chunks = _ChunkIterator(size=9, content=b"0", downloader=downloader, max_concurrency=max_concurrency)
+
+    assert list(chunks) == [str(i).encode() for i in range(9)]
+    assert downloader.max_running == max_concurrency
+
+
+def test_chunks_read_ahead_close():
+    downloader = _FakeChunkDownloader(chunk_count=8)
+    chunks = _ChunkIterator(size=9, content=b"0", downloader=downloader, max_concurrency=3)
+
+    assert next(chunks) == b"0"
+    assert next(chunks) == b"1"
+    chunks.close()
+    assert list(chunks) == []
+
+
+class _FakeResponse(list):
+    def __init__(self, data):
+        super(_FakeResponse, self).__init__([data])
+        self.properties = None
+
+
+class _FakeBlobOperations(object):
+    """Serves the ranges of data like the generated blob operations, failing on the chunk at fail_at."""
+
+    def __init__(self, data, fail_at=None):
+        self.data = data
+        self.fail_at = fail_at
+
+    def download(self, range=None, **kwargs):  # pylint: disable=redefined-builtin
+        start, end = [int(i) for i in range[len('bytes='):].split('-')]
+        if start == self.fail_at:
+            raise ValueError("Download failed.")
+        # later chunks are faster, they are written out of order
+        time.sleep(0.001 * (len(self.data) - start) / 1024)
+        return None, _FakeResponse(self.data[start:end + 1])
+
+
+def _get_file_chunk_downloader(client, writer, parallel):
+    return _ChunkDownloader(
+        client=client, total_size=len(client.data), chunk_size=1024, current_progress=1024,
+        start_range=1024, end_range=len(client.data), stream=writer, parallel=parallel, validate_content=False,
+        encryption_options={})
+
+
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+def test_download_chunks_to_file(tmpdir, max_concurrency):
+    data = urandom(10 * 1024 + 7)
+    file_path = str(tmpdir.join('blob'))
+    with open(file_path, 'wb') as stream:
+        stream.write(b'previous content, longer than the blob' * 1024)
+
+    with _FileWriter(file_path, len(data)) as writer:
+        writer.write(data[:1024])
+        downloader = _get_file_chunk_downloader(_FakeBlobOperations(data), writer, max_concurrency > 1)
+        # Chunks are written at their offset, without a lock
+        assert downloader.stream_lock is None
+        _download_in_parallel(None, max_concurrency, downloader)
+
+    with open(file_path, 'rb') as stream:
+        assert stream.read() == data
+
+
+def test_download_chunks_to_file_mmap(tmpdir, monkeypatch):
+    monkeypatch.delattr('os.pwrite', raising=False)
+    data = urandom(10 * 1024 + 7)
+    file_path = str(tmpdir.join('blob'))
+    with _FileWriter(file_path, len(data)) as writer:
+        writer.write(data[:1024])
+        _download_in_parallel(None, 4, _get_file_chunk_downloader(_FakeBlobOperations(data), writer, True))
+        # Empty page blob chunks are longer than the end of the blob
+        writer.write_at(b'\x00' * 1024, len(data) - 7)
+
+    with open(file_path, 'rb') as stream:
+        assert stream.read() == data[:-7] + b'\x00' * 7
+
+
+def test_download_chunks_shared_executor_failure(tmpdir):
+    from concurrent import futures
+    data = urandom(10 * 1024)
+    file_path = str(tmpdir.join('blob'))
+    executor = futures.ThreadPoolExecutor(8)
+    try:
+        with _FileWriter(file_path, len(data)) as writer:
+            downloader = _get_file_chunk_downloader(_FakeBlobOperations(data, fail_at=3 * 1024), writer, True)
+            with pytest.raises(ValueError):
+                _download_in_parallel(executor, 2, downloader)
+        # The executor shared by the client is left running
+        assert executor.submit(lambda: 1).result() == 1
+    finally:
+        executor.shutdown()
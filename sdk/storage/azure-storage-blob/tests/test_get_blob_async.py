@@ -7,6 +7,7 @@
 # --------------------------------------------------------------------------
 import pytest
 import base64
+import io
 from os import path, remove, sys, urandom
 import unittest
 import asyncio
@@ -27,6 +28,7 @@ from azure.storage.blob.aio import (
     ContainerClient,
     BlobClient,
 )
+from azure.storage.blob.aio._download_async import _AsyncChunkIterator, StorageStreamDownloader as _Downloader
 from _shared.testcase import GlobalStorageAccountPreparer
 from _shared.asynctestcase import AsyncStorageTestCase
 
@@ -1013,4 +1015,168 @@ class StorageGetBlobTestAsync(AsyncStorageTestCase):
         self.assertIsNone(content.properties.content_settings.content_md5)
         self.assertEqual(content.properties.size, 1024)
 
-# ------------------------------------------------------------------------------
\ No newline at end of file
+    @pytest.mark.live_test_only
+    @GlobalStorageAccountPreparer()
+    @AsyncStorageTestCase.await_prepared_test
+    async def test_download_blob_to_path_async(self, resource_group, location, storage_account, storage_account_key):
+        # parallel tests introduce random order of requests, can only run live
+
+        await self._setup(storage_account, storage_account_key)
+        blob = self.bsc.get_blob_client(self.container_name, self.byte_blob)
+        FILE_PATH = 'download_blob_to_path_async.temp.{}.dat'.format(str(uuid.uuid4()))
+
+        # Act
+        props = await blob.download_blob_to_path(FILE_PATH, max_concurrency=2)
+
+        # Assert
+        self.assertEqual(props.size, len(self.byte_data))
+        with open(FILE_PATH, 'rb') as stream:
+            actual = stream.read()
+            self.assertEqual(self.byte_data, actual)
+        self._teardown(FILE_PATH)
+
+    @pytest.mark.live_test_only
+    @GlobalStorageAccountPreparer()
+    @AsyncStorageTestCase.await_prepared_test
+    async def test_open_read_async(self, resource_group, location, storage_account, storage_account_key):
+        # parallel tests introduce random order of requests, can only run live
+
+        await self._setup(storage_account, storage_account_key)
+        blob = self.bsc.get_blob_client(self.container_name, self.byte_blob)
+
+        # Act
+        async with await blob.open_read(block_size=1024) as reader:
+            reader.seek(-5, io.SEEK_END)
+            end = await reader.read()
+            reader.seek(1000)
+            middle = await reader.read(100)
+            reader.seek(0)
+            content = await reader.read()
+
+        # Assert
+        self.assertEqual(reader.size, len(self.byte_data))
+        self.assertEqual(end, self.byte_data[-5:])
+        self.assertEqual(middle, self.byte_data[1000:1100])
+        self.assertEqual(content, self.byte_data)
+
+
+# ------------------------------------------------------------------------------
+
+class _FakeChunkDownloader(object):
+    """Serves the chunks of an _AsyncChunkIterator slowly, recording how many are downloaded at the same time."""
+
+    def __init__(self, chunk_count):
+        self.chunk_count = chunk_count
+        self.running = 0
+        self.max_running = 0
+
+    def get_chunk_offsets(self):
+        return iter(range(1, self.chunk_count + 1))
+
+    async def yield_chunk(self, chunk_start):
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        # later chunks are faster, they still have to be yielded in order
+        await asyncio.sleep(0.01 * (self.chunk_count - chunk_start))
+        self.running -= 1
+        return str(chunk_start).encode()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", [1, 3])
+async def test_chunks_read_ahead(max_concurrency):
+    downloader = _FakeChunkDownloader(chunk_count=8)
+    chunks = _AsyncChunkIterator(size=9, content=b"0", downloader=downloader, max_concurrency=max_concurrency)
+
+    content = []
+    async for chunk in chunks:
+        content.append(chunk)
+    assert content == [str(i).encode() for i in range(9)]
+    assert downloader.max_running == max_concurrency
+
+
+@pytest.mark.asyncio
+async def test_chunks_read_ahead_close():
+    downloader = _FakeChunkDownloader(chunk_count=8)
+    chunks = _AsyncChunkIterator(size=9, content=b"0", downloader=downloader, max_concurrency=3)
+
+    assert await chunks.__anext__() == b"0"
+    assert await chunks.__anext__() == b"1"
+    await chunks.aclose()
+    assert downloader.running == 0
+    with pytest.raises(StopAsyncIteration):
+        await chunks.__anext__()
+
+
+class _FakeResponse(object):
+    def __init__(self, data):
+        self.response = self
+        self.properties = None
+        self._data = data
+
+    def body(self):
+        return self._data
+
+
+class _FakeBlobOperations(object):
+    """Serves the ranges of data like the generated blob operations, failing on the chunk at fail_at."""
+
+    def __init__(self, data, fail_at=None):
+        self.data = data
+        self.fail_at = fail_at
+        self.running = 0
+
+    async def download(self, range=None, **kwargs):  # pylint: disable=redefined-builtin
+        start, end = [int(i) for i in range[len('bytes='):].split('-')]
+        self.running += 1
+        try:
+            # later chunks are faster, they are written out of order
+            await asyncio.sleep(0.001 * (len(self.data) - start) / 1024)
+        finally:
+            self.running -= 1
+        if start == self.fail_at:
+            raise ValueError("Download failed.")
+        return None, _FakeResponse(self.data[start:end + 1])
+
+
+def _get_downloader(data, max_concurrency, fail_at=None):
+    """A downloader of data, as it is once the first chunk is downloaded."""
+    downloader = _Downloader.__new__(_Downloader)
+    downloader.__dict__.update(
+        size=len(data), _file_size=len(data), _end_range=None, _clients=_FakeClients(data, fail_at),
+        _non_empty_ranges=None, _config=_FakeConfig(), _first_get_size=1024, _initial_range=(0, 1023),
+        _current_content=data[:1024], _download_complete=False, _validate_content=False,
+        _encryption_options={}, _location_mode=None, _request_options={}, _max_concurrency=max_concurrency)
+    return downloader
+
+
+class _FakeClients(object):
+    def __init__(self, data, fail_at):
+        self.blob = _FakeBlobOperations(data, fail_at)
+
+
+class _FakeConfig(object):
+    max_chunk_get_size = 1024
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("max_concurrency", [1, 4])
+async def test_download_to_path(tmpdir, max_concurrency):
+    data = urandom(10 * 1024 + 7)
+    file_path = str(tmpdir.join('blob'))
+    with open(file_path, 'wb') as stream:
+        stream.write(b'previous content, longer than the blob' * 1024)
+
+    assert await _get_downloader(data, max_concurrency)._readinto_path(file_path) == len(data)
+    with open(file_path, 'rb') as stream:
+        assert stream.read() == data
+
+
+@pytest.mark.asyncio
+async def test_download_to_path_failure(tmpdir):
+    data = urandom(10 * 1024)
+    downloader = _get_downloader(data, 4, fail_at=3 * 1024)
+    with pytest.raises(ValueError):
+        await downloader._readinto_path(str(tmpdir.join('blob')))
+    # The chunks still running are cancelled before the file is closed
+    assert downloader._clients.blob.running == 0
@@ -10,9 +10,14 @@ import pytest
 
 import os
 from devtools_testutils import ResourceGroupPreparer, StorageAccountPreparer
-from azure.storage.blob._shared.uploads import SubStream
+from azure.storage.blob._shared.uploads import (
+    BlockBlobChunkUploader,
+    SubStream,
+    read_into,
+    upload_data_chunks)
+from concurrent import futures
 from threading import Lock
-from io import (BytesIO, SEEK_SET)
+from io import (BytesIO, RawIOBase, SEEK_SET, StringIO)
 
 from _shared.testcase import StorageTestCase, GlobalStorageAccountPreparer
 
@@ -112,3 +117,67 @@ class StorageBlobUploadChunkingTest(StorageTestCase):
         finally:
             wrapped_stream.close()
             substream.close()
+
+    def test_chunk_streams_with_short_reads(self):
+        data = os.urandom(10 * 1024)
+
+        class ShortReadStream(object):
+            def __init__(self):
+                self._stream = BytesIO(data)
+
+            def read(self, size=-1):
+                return self._stream.read(min(size, 1000))
+
+        for stream, total_size in ((ShortReadStream(), None), (ShortReadStream(), len(data)), (BytesIO(data), None)):
+            uploader = BlockBlobChunkUploader(
+                service=None, total_size=total_size, chunk_size=4 * 1024, stream=stream, parallel=False)
+            chunks = list(uploader.get_chunk_streams())
+
+            # every chunk but the last one is full, whatever the size of the reads
+            self.assertEqual([index for index, _ in chunks], [0, 4 * 1024, 8 * 1024])
+            self.assertEqual([len(chunk) for _, chunk in chunks], [4 * 1024, 4 * 1024, 2 * 1024])
+            self.assertEqual(b"".join(bytes(chunk) for _, chunk in chunks), data)
+
+    def test_read_into(self):
+        class RawStream(RawIOBase):
+            def __init__(self):
+                self._stream = BytesIO(b"abcdef")
+
+            def read(self, size=-1):
+                return self._stream.read(min(size, 4))
+
+        buffer = memoryview(bytearray(8))
+        self.assertEqual(read_into(RawStream(), buffer), 6)
+        self.assertEqual(bytes(buffer[:6]), b"abcdef")
+
+        with self.assertRaises(TypeError):
+            read_into(StringIO(u"abc"), memoryview(bytearray(3)))
+
+    def test_upload_with_shared_executor(self):
+        class Service(object):
+            def __init__(self):
+                self.blocks = []
+
+            def stage_block(self, block_id, length, body, **kwargs):
+                self.blocks.append(bytes(body))
+
+        data = os.urandom(10 * 1024)
+        service = Service()
+        executor = futures.ThreadPoolExecutor(2)
+        try:
+            for _ in range(2):
+                block_ids = upload_data_chunks(
+                    service=service,
+                    uploader_class=BlockBlobChunkUploader,
+                    total_size=len(data),
+                    chunk_size=1024,
+                    max_concurrency=4,
+                    stream=BytesIO(data),
+                    executor=executor)
+                self.assertEqual(len(block_ids), 10)
+
+            # the executor isn't shut down by the uploads
+            self.assertEqual(executor.submit(len, data).result(), len(data))
+        finally:
+            executor.shutdown()
+        self.assertEqual(sorted(service.blocks), sorted([data[i:i + 1024] for i in range(0, len(data), 1024)] * 2))